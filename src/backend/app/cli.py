@@ -4,6 +4,8 @@ Usage examples:
     uv run python -m backend.app.cli greet                # → Hello, Example!
     uv run python -m backend.app.cli greet "Example User" # → Hello, Example User!
     uv run python -m backend.app.cli summarize https://example.com/article
+    uv run python -m backend.app.cli summarize-batch --file urls.txt
+    uv run python -m backend.app.cli benchmark-pipeline https://example.com/article
 """
 
 from __future__ import annotations
@@ -11,11 +13,31 @@ from __future__ import annotations
 import asyncio
 import sys
 from pathlib import Path
+from typing import Any, get_args
 
 import typer
 from rich import print
 
+from backend.app.custom_agents.article_summarizer.benchmark import (
+    benchmark_pipeline_modes,
+    summarize_benchmark,
+)
 from backend.app.custom_agents.article_summarizer.manager import ArticleSummarizerManager
+from backend.app.custom_agents.article_summarizer.run_metrics import (
+    summarize_run_metrics,
+    write_batch_metrics,
+)
+from backend.app.types.article_summarizer.analysis_types import CorpusSettings
+from backend.app.types.article_summarizer.cache_types import (
+    AgentMemoSettings,
+    AudioCacheSettings,
+    DuplicateIndexSettings,
+    FetchCacheSettings,
+)
+from backend.app.types.article_summarizer.job_types import JobStoreSettings
+from backend.app.types.article_summarizer.manager_types import StageConcurrencyLimits
+from backend.app.types.article_summarizer.parser_types import ParseSettings
+from backend.app.types.article_summarizer.pipeline_types import PipelineMode, PipelineSettings
 from backend.app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -53,6 +75,12 @@ def summarize(
         "-v",
         help="Enable verbose output",
     ),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk caches"),
+    pipeline: str = typer.Option(
+        "sequential",
+        "--pipeline",
+        help="Pipeline mode: sequential, streamed (overlap stages) or combined (one agent call)",
+    ),
 ) -> None:
     """
     Summarize an article from a URL and generate an audio file.
@@ -61,11 +89,13 @@ def summarize(
     --------
     uv run python -m backend.app.cli summarize https://example.com/article
     uv run python -m backend.app.cli summarize https://example.com/article --verbose
+    uv run python -m backend.app.cli summarize https://example.com/article --pipeline streamed
     """
     if verbose:
         print(f"[bold blue]Summarizing article from URL:[/] {url}")
 
-    audio_path = asyncio.run(_summarize_article(url))
+    pipeline_settings = _pipeline_settings(pipeline)
+    audio_path = asyncio.run(_summarize_article(url, pipeline_settings, use_cache=not no_cache))
 
     if not audio_path:
         print("[bold red]Failed to summarize article.[/]")
@@ -74,10 +104,14 @@ def summarize(
     print(f"[bold green]Summary audio generated:[/] {audio_path}")
 
 
-async def _summarize_article(url: str) -> Path:
+async def _summarize_article(
+    url: str, pipeline_settings: PipelineSettings, use_cache: bool = True
+) -> Path:
     """Run the article summarization process."""
-    manager = ArticleSummarizerManager()
-    result = await manager.summarize_article(url)
+    async with ArticleSummarizerManager(
+        pipeline_settings=pipeline_settings, **_cache_settings(use_cache)
+    ) as manager:
+        result = await manager.summarize_article(url)
     if not result:
         print("[bold red]Failed to summarize article.[/]")
         sys.exit(1)
@@ -87,5 +121,196 @@ async def _summarize_article(url: str) -> Path:
     return audio_path
 
 
+@app.command("summarize-batch")
+def summarize_batch(
+    urls: list[str] | None = typer.Argument(None, help="URLs of the articles to summarize"),  # noqa: B008
+    url_file: Path | None = typer.Option(  # noqa: B008
+        None,
+        "--file",
+        "-f",
+        help="File with one URL per line (blank lines and # comments are ignored)",
+    ),
+    fetch_concurrency: int = typer.Option(16, "--fetch-concurrency", help="Concurrent fetches"),
+    parse_concurrency: int = typer.Option(4, "--parse-concurrency", help="Concurrent parses"),
+    llm_concurrency: int = typer.Option(8, "--llm-concurrency", help="Concurrent agent runs"),
+    tts_concurrency: int = typer.Option(4, "--tts-concurrency", help="Concurrent TTS requests"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the on-disk caches"),
+    stream_parse: bool = typer.Option(
+        False, "--stream-parse", help="Parse pages incrementally while they download"
+    ),
+    pipeline: str = typer.Option(
+        "sequential", "--pipeline", help="Pipeline mode: sequential, streamed or combined"
+    ),
+    no_llm_fallback: bool = typer.Option(
+        False,
+        "--no-llm-fallback",
+        help="Never clean up pages with the LLM, even when the local extraction is unsure",
+    ),
+    metrics_file: Path = typer.Option(  # noqa: B008
+        Path("outputs/batch_metrics.json"),
+        "--metrics-file",
+        help="Where to save the p50/p95/p99 latency of each stage across the batch",
+    ),
+) -> None:
+    """
+    Summarize many articles in one process, printing each result as it finishes.
+
+    Examples
+    --------
+    uv run python -m backend.app.cli summarize-batch https://example.com/a https://example.com/b
+    uv run python -m backend.app.cli summarize-batch --file urls.txt --tts-concurrency 2
+    uv run python -m backend.app.cli summarize-batch --file urls.txt --stream-parse
+    uv run python -m backend.app.cli summarize-batch --file urls.txt --pipeline combined
+    uv run python -m backend.app.cli summarize-batch --file urls.txt --metrics-file m.json
+    """
+    all_urls = list(urls or [])
+    if url_file:
+        all_urls.extend(_load_urls(url_file))
+
+    if not all_urls:
+        print("[bold red]No URLs given. Pass URLs as arguments or use --file.[/]")
+        sys.exit(1)
+
+    limits = StageConcurrencyLimits(
+        fetch=fetch_concurrency,
+        parse=parse_concurrency,
+        llm=llm_concurrency,
+        tts=tts_concurrency,
+    )
+    parse_settings = ParseSettings(
+        max_workers=parse_concurrency, streaming=stream_parse, llm_fallback=not no_llm_fallback
+    )
+    pipeline_settings = _pipeline_settings(pipeline)
+    failures = asyncio.run(
+        _summarize_batch(
+            all_urls,
+            limits,
+            parse_settings,
+            pipeline_settings,
+            metrics_file,
+            use_cache=not no_cache,
+        )
+    )
+
+    print(f"[bold blue]Summarized {len(all_urls) - failures}/{len(all_urls)} articles.[/]")
+    if failures:
+        sys.exit(1)
+
+
+def _load_urls(url_file: Path) -> list[str]:
+    """Read URLs from a file, one per line, skipping blank lines and comments."""
+    lines = url_file.read_text(encoding="utf-8").splitlines()
+    stripped = (line.strip() for line in lines)
+    return [line for line in stripped if line and not line.startswith("#")]
+
+
+async def _summarize_batch(
+    urls: list[str],
+    limits: StageConcurrencyLimits,
+    parse_settings: ParseSettings,
+    pipeline_settings: PipelineSettings,
+    metrics_file: Path,
+    use_cache: bool = True,
+) -> int:
+    """Run batch summarization, save its stage metrics and return the number of failed URLs."""
+    failures = 0
+    run_metrics = []
+    async with ArticleSummarizerManager(
+        limits=limits,
+        parse_settings=parse_settings,
+        pipeline_settings=pipeline_settings,
+        **_cache_settings(use_cache),
+    ) as manager:
+        async for result in manager.summarize_many(urls):
+            if result.metrics:
+                run_metrics.append(result.metrics)
+            if result.succeeded:
+                print(f"[bold green]✔[/] {result.url} → {result.audio_path}")
+            else:
+                failures += 1
+                print(f"[bold red]✘[/] {result.url}: {result.error}")
+
+        stats = manager.fetch_cache_stats
+        print(
+            f"[bold blue]Fetch cache:[/] {stats.hits} hits, "
+            f"{stats.revalidated} revalidated, {stats.misses} misses"
+        )
+
+    summary = summarize_run_metrics(run_metrics)
+    for stage in summary.stages:
+        print(
+            f"[bold blue]{stage.stage}:[/] p50 {stage.p50:.2f}s, "
+            f"p95 {stage.p95:.2f}s, p99 {stage.p99:.2f}s ({stage.count} articles)"
+        )
+    write_batch_metrics(summary, metrics_file)
+    print(f"[bold blue]Stage metrics saved to:[/] {metrics_file}")
+    return failures
+
+
+@app.command("benchmark-pipeline")
+def benchmark_pipeline(
+    urls: list[str] | None = typer.Argument(None, help="URLs of the articles to benchmark"),  # noqa: B008
+    url_file: Path | None = typer.Option(  # noqa: B008
+        None,
+        "--file",
+        "-f",
+        help="File with one URL per line (blank lines and # comments are ignored)",
+    ),
+    repeat: int = typer.Option(3, "--repeat", "-r", min=1, help="Runs per article and mode"),
+) -> None:
+    """
+    Compare latency and token use of the two-stage and combined agent pipelines.
+
+    Only the agent calls are timed; no audio is generated and the memo store is bypassed.
+
+    Examples
+    --------
+    uv run python -m backend.app.cli benchmark-pipeline https://example.com/article
+    uv run python -m backend.app.cli benchmark-pipeline --file urls.txt --repeat 5
+    """
+    all_urls = list(urls or [])
+    if url_file:
+        all_urls.extend(_load_urls(url_file))
+
+    if not all_urls:
+        print("[bold red]No URLs given. Pass URLs as arguments or use --file.[/]")
+        sys.exit(1)
+
+    results = asyncio.run(benchmark_pipeline_modes(all_urls, repeat=repeat))
+    for result in results:
+        if result.error:
+            print(f"[bold red]✘[/] {result.mode} {result.url}: {result.error}")
+
+    for summary in summarize_benchmark(results):
+        print(
+            f"[bold blue]{summary.mode}:[/] {summary.runs} runs, "
+            f"median {summary.median_seconds:.2f}s, "
+            f"{summary.mean_input_tokens:.0f} input / "
+            f"{summary.mean_output_tokens:.0f} output tokens per article"
+            + (f", {summary.failures} failed" if summary.failures else "")
+        )
+
+
+def _pipeline_settings(pipeline: str) -> PipelineSettings:
+    """Build the manager's pipeline settings for the --pipeline option."""
+    modes = get_args(PipelineMode)
+    if pipeline not in modes:
+        print(f"[bold red]Unknown pipeline {pipeline!r}; choose one of {', '.join(modes)}.[/]")
+        sys.exit(1)
+    return PipelineSettings.model_validate({"mode": pipeline})
+
+
+def _cache_settings(use_cache: bool) -> dict[str, Any]:
+    """Build the manager's cache, duplicate index, checkpoint and corpus settings for --no-cache."""
+    return {
+        "fetch_cache_settings": FetchCacheSettings(enabled=use_cache),
+        "memo_settings": AgentMemoSettings(enabled=use_cache),
+        "audio_cache_settings": AudioCacheSettings(enabled=use_cache),
+        "duplicate_index_settings": DuplicateIndexSettings(enabled=use_cache),
+        "job_store_settings": JobStoreSettings(enabled=use_cache),
+        "corpus_settings": CorpusSettings(enabled=use_cache),
+    }
+
+
 if __name__ == "__main__":
     app()
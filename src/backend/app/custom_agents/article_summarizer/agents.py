@@ -61,6 +61,16 @@ class ArticleContent(BaseModel):
     """Structural elements of the article."""
 
 
+class CleanedArticle(BaseModel):
+    """Data structure for the article text the content extractor agent recovers from a page."""
+
+    title: str
+    """The title of the article."""
+
+    content: str
+    """The main content of the article, without navigation, ads or other page chrome."""
+
+
 class SummaryData(BaseModel):
     """Data structure for article summary."""
 
@@ -77,6 +87,16 @@ class SummaryData(BaseModel):
     """Key points from the article."""
 
 
+class ChunkSummary(BaseModel):
+    """Data structure for the summary of one chunk of a long article."""
+
+    summary: str
+    """A summary of the chunk in a few sentences."""
+
+    key_points: list[str]
+    """Key points from the chunk."""
+
+
 class AudioFormat(BaseModel):
     """Data structure for audio formatting."""
 
@@ -90,6 +110,23 @@ class AudioFormat(BaseModel):
     """The suggested filename for the audio file (without extension)."""
 
 
+class SummaryWithNarration(BaseModel):
+    """Data structure for a summary and its narration produced in a single call."""
+
+    summary: SummaryData
+    """The article summary."""
+
+    audio_format: AudioFormat
+    """The narration of the summary."""
+
+
+class NarrationSegment(BaseModel):
+    """Data structure for the narration of one part of a summary."""
+
+    narration_text: str
+    """The narration of the part, continuing from the narration before it."""
+
+
 content_extractor_agent = Agent(
     name="ContentExtractorAgent",
     instructions=(
@@ -100,7 +137,8 @@ content_extractor_agent = Agent(
         "artifacts that might interfere with summarization."
     ),
     model="gpt-4o",
-    output_type=ArticleContent,
+    # ArticleContent has free-form dict fields, which a strict output schema cannot express
+    output_type=CleanedArticle,
 )
 
 summarizer_agent = Agent(
@@ -116,6 +154,30 @@ summarizer_agent = Agent(
     output_type=SummaryData,
 )
 
+chunk_summarizer_agent = Agent(
+    name="ChunkSummarizerAgent",
+    instructions=(
+        "You are an expert article summarizer. You will receive one part of a longer article. "
+        "Summarize only that part in a few sentences and list its key points. Keep names, "
+        "figures and conclusions exact, and do not speculate about the parts you cannot see."
+    ),
+    model="gpt-4o",
+    output_type=ChunkSummary,
+)
+
+summary_reducer_agent = Agent(
+    name="SummaryReducerAgent",
+    instructions=(
+        "You are an expert article summarizer. You will receive summaries and key points of "
+        "consecutive parts of one article, in order. Merge them into a single summary of the "
+        "whole article: a short summary (2-3 sentences), a more detailed summary in markdown "
+        "format, and a list of key points. Remove repetition between parts and keep the "
+        "article's overall line of argument."
+    ),
+    model="gpt-4o",
+    output_type=SummaryData,
+)
+
 audio_formatter_agent = Agent(
     name="AudioFormatterAgent",
     instructions=(
@@ -129,6 +191,35 @@ audio_formatter_agent = Agent(
     output_type=AudioFormat,
 )
 
+narration_segment_agent = Agent(
+    name="NarrationSegmentAgent",
+    instructions=(
+        "You are an expert audio content formatter. You will receive the title of an article, "
+        "the end of the narration written so far, and the next part of the article's summary. "
+        "Turn only that part into narration that continues naturally from the narration so far. "
+        "Introduce the article only if there is no narration yet, and do not add a closing "
+        "remark, since more parts may follow. Avoid complex sentence structures, markdown, and "
+        "references that don't work well in audio format."
+    ),
+    model="gpt-4o",
+    output_type=NarrationSegment,
+)
+
+summary_narrator_agent = Agent(
+    name="SummaryNarratorAgent",
+    instructions=(
+        "You are an expert article summarizer and audio content formatter. You will receive "
+        "an article, or summaries of its consecutive parts in order. Summarize the whole "
+        "article: a short summary (2-3 sentences), a more detailed summary in markdown format, "
+        "and a list of key points. Then turn that summary into a narration script that flows "
+        "naturally when spoken, with appropriate transitions and pacing, avoiding complex "
+        "sentence structures and references that don't work well in audio format. Also suggest "
+        "a descriptive filename based on the article title (without extension)."
+    ),
+    model="gpt-4o",
+    output_type=SummaryWithNarration,
+)
+
 
 def generate_trace_id() -> str:
     """Generate a trace ID that starts with 'trace_'."""
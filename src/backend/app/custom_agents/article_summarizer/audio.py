@@ -1,10 +1,35 @@
 """Audio generation utilities."""
 
+import asyncio
 import os
+import shutil
+import tempfile
+import time
+import uuid
+from collections.abc import Callable
 from pathlib import Path
 
 from openai import AsyncOpenAI
 
+from backend.app.custom_agents.article_summarizer.agents import ArticleContent, SummaryData
+from backend.app.custom_agents.article_summarizer.audio_cache import AudioCache
+from backend.app.custom_agents.article_summarizer.live_audio import LiveAudio
+from backend.app.custom_agents.article_summarizer.progress import (
+    emit_progress,
+    emit_summary_ready,
+)
+from backend.app.custom_agents.article_summarizer.run_metrics import measure_stage
+from backend.app.helpers.article_summarizer.audio_helpers import (
+    concat_mp3_files,
+    split_narration,
+)
+from backend.app.helpers.article_summarizer.cache_helpers import (
+    atomic_write_bytes,
+    link_or_copy,
+    temporary_sibling,
+)
+from backend.app.types.article_summarizer.audio_types import SpeechStreamStats, TtsSettings
+from backend.app.types.article_summarizer.cache_types import DuplicateMatch
 from backend.app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -13,10 +38,19 @@ OUTPUTS_DIR = Path("outputs")
 OUTPUTS_DIR.mkdir(exist_ok=True)
 
 DEFAULT_VOICE = "alloy"
+SUMMARY_NAME = "summary.json"
+# Separates the narration from the source URL in a run's final text.
+GENERATED_FROM = "\n\nGenerated from: "
 
 
 async def generate_audio(
-    text: str, output_filename: str, article_title: str, article_content: str, formatted_text: str
+    text: str,
+    output_filename: str,
+    article_title: str,
+    article_content: str,
+    formatted_text: str,
+    settings: TtsSettings | None = None,
+    cache: AudioCache | None = None,
 ) -> tuple[Path, Path, Path]:
     """
     Generate audio from text using OpenAI's text-to-speech API and save output files.
@@ -27,46 +61,308 @@ async def generate_audio(
         article_title: The title of the article.
         article_content: The raw text content of the article.
         formatted_text: The formatted text ready for audio processing.
+        settings: The TTS model and voice.
+        cache: An optional audio store. Narrations synthesized before with the same model
+            and voice are linked into the run directory instead of being synthesized again.
+
+    While a narration is synthesized, its audio is published in the run directory's
+    live.mp3 as it arrives (see `LiveAudio`), so it can be played before it is complete.
 
     Returns:
         A tuple containing the paths to the generated audio file, raw text file, and final text file.
     """
+    logger.info(f"Generating audio for text ({len(text)} chars)")
+
+    with measure_stage("write") as write_metric:
+        run_dir = create_run_directory(article_title)
+        audio_path = run_dir / "final.mp3"
+        raw_text_path = write_raw_text(run_dir, article_content)
+        final_text_path = write_final_text(run_dir, formatted_text)
+        write_metric.bytes = len(article_content.encode("utf-8")) + len(
+            formatted_text.encode("utf-8")
+        )
+
+    settings = settings or TtsSettings(voice=DEFAULT_VOICE)
+    with measure_stage("tts") as tts_metric:
+        cached_path = cache.lookup(settings.model, settings.voice, text) if cache else None
+        if cache and cached_path:
+            cache.link(cached_path, audio_path)
+            tts_metric.bytes = file_size(audio_path)
+            emit_progress("audio_ready", bytes=tts_metric.bytes, cached=True)
+            logger.info(f"Reused cached audio {cached_path.name} for {audio_path}")
+            return audio_path, raw_text_path, final_text_path
+
+        # Generate audio
+        client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        target_path = cache.path_for(settings.model, settings.voice, text) if cache else audio_path
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+
+        chunks = split_narration(text, settings.max_chunk_chars)
+        live = LiveAudio(run_dir)
+        try:
+            if len(chunks) > 1:
+                await synthesize_chunks(client, chunks, target_path, settings, live)
+            else:
+                await synthesize_to_file(client, text, target_path, settings, live.writer(0))
+                live.finish(0)
+                emit_progress("audio_chunk", index=0, count=1, bytes=file_size(target_path))
+
+            if cache:
+                # Linked first, so the run keeps its audio whatever eviction removes
+                cache.link(target_path, audio_path)
+                cache.evict(keep=target_path)
+            live.close()
+        finally:
+            live.abort()
+        tts_metric.bytes = file_size(audio_path)
+        emit_progress("audio_ready", bytes=tts_metric.bytes, cached=False)
+
+    logger.info(f"Audio saved to {audio_path}")
+    return audio_path, raw_text_path, final_text_path
+
+
+def file_size(path: Path) -> int:
+    """Return the size of a file in bytes, or 0 if it does not exist."""
+    return path.stat().st_size if path.exists() else 0
+
+
+def create_run_directory(article_title: str) -> Path:
+    """
+    Create the output directory of one summarization run.
+
+    The name ends in a random suffix and the directory must not exist yet, so runs of
+    articles with the same title started in the same second never share a directory.
+
+    Args:
+        article_title: The title of the article, used in the directory name.
+
+    Returns:
+        The path of the new directory.
+    """
     import datetime
     import re
 
-    logger.info(f"Generating audio for text ({len(text)} chars)")
-
     safe_title = re.sub(r"[^\w\-_]", "_", article_title)
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    run_dir_name = f"{safe_title}_{timestamp}"
+    run_dir = OUTPUTS_DIR / f"{safe_title}_{timestamp}_{uuid.uuid4().hex[:8]}"
+    run_dir.mkdir(exist_ok=False)
+    return run_dir
 
-    run_dir = OUTPUTS_DIR / run_dir_name
-    run_dir.mkdir(exist_ok=True)
 
-    audio_path = run_dir / "final.mp3"
+def write_raw_text(run_dir: Path, article_content: str) -> Path:
+    """Save the raw article text to a run directory and return its path."""
     raw_text_path = run_dir / "raw.txt"
-    final_text_path = run_dir / "final.txt"
-
     with open(raw_text_path, "w", encoding="utf-8") as f:
         f.write(article_content)
     logger.info(f"Raw text content saved to {raw_text_path}")
+    return raw_text_path
 
+
+def write_final_text(run_dir: Path, formatted_text: str) -> Path:
+    """Save the formatted narration text to a run directory and return its path."""
+    final_text_path = run_dir / "final.txt"
     with open(final_text_path, "w", encoding="utf-8") as f:
         f.write(formatted_text)
     logger.info(f"Final text content saved to {final_text_path}")
+    return final_text_path
+
+
+def write_summary(run_dir: Path, summary: SummaryData) -> Path:
+    """Save the article summary to a run directory as JSON and return its path."""
+    summary_path = run_dir / SUMMARY_NAME
+    summary_path.write_text(summary.model_dump_json(), encoding="utf-8")
+    return summary_path
+
+
+def read_summary(run_dir: Path) -> SummaryData | None:
+    """Return the article summary saved in a run directory, or None if there is none."""
+    summary_path = run_dir / SUMMARY_NAME
+    try:
+        return SummaryData.model_validate_json(summary_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"No readable summary in {run_dir}: {e}")
+        return None
+
+
+async def reuse_narration(
+    url: str, article_content: ArticleContent, match: DuplicateMatch
+) -> tuple[Path, Path, Path]:
+    """
+    Give a near-duplicate article its own run directory holding an earlier narration.
+
+    The earlier summary is reused too, and reported as if it had just been written. The
+    files are linked, copied and written in a worker thread.
+
+    Args:
+        url: The URL of the new article.
+        article_content: The extracted content of the new article.
+        match: The earlier article it duplicates.
+
+    Returns:
+        The paths to the audio file, raw text file, and final text file.
+    """
+
+    def copy_run() -> tuple[Path, Path, Path, str, SummaryData | None]:
+        run_dir = create_run_directory(article_content.title)
+        raw_text_path = write_raw_text(run_dir, article_content.content)
+        audio_path = run_dir / "final.mp3"
+        link_or_copy(match.audio_path, audio_path)
+        narration = match.final_text_path.read_text(encoding="utf-8")
+        narration = narration.rsplit(GENERATED_FROM, 1)[0]
+        final_text_path = write_final_text(run_dir, f"{narration}{GENERATED_FROM}{url}")
+        summary = read_summary(match.final_text_path.parent)
+        if summary:
+            write_summary(run_dir, summary)
+        return audio_path, raw_text_path, final_text_path, narration, summary
+
+    audio_path, raw_text_path, final_text_path, narration, summary = await asyncio.to_thread(
+        copy_run
+    )
+    if summary:
+        emit_summary_ready(summary)
+    emit_progress("narration_ready", text=narration.split("\n\n", 1)[-1])
+    return audio_path, raw_text_path, final_text_path
+
+
+async def synthesize_to_file(
+    client: AsyncOpenAI,
+    text: str,
+    destination: Path,
+    settings: TtsSettings,
+    on_audio: Callable[[bytes], None] | None = None,
+) -> None:
+    """
+    Synthesize speech with a single TTS request and save it to a file.
+
+    Args:
+        client: The OpenAI client.
+        text: The text to convert to speech.
+        destination: The path of the MP3 file.
+        settings: The TTS settings; `stream` selects streaming or buffered download.
+        on_audio: An optional callback that also receives the audio as it arrives.
+    """
+    if settings.stream:
+        await stream_speech_to_file(client, text, destination, settings, on_audio)
+        return
 
-    # Generate audio
-    client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
     response = await client.audio.speech.create(
-        model="tts-1",
-        voice=DEFAULT_VOICE,
+        model=settings.model,
+        voice=settings.voice,
         input=text,
         response_format="mp3",
     )
 
     audio_data = response.content
-    with open(audio_path, "wb") as f:
-        f.write(audio_data)
+    atomic_write_bytes(destination, audio_data)
+    if on_audio:
+        on_audio(audio_data)
 
-    logger.info(f"Audio saved to {audio_path}")
-    return audio_path, raw_text_path, final_text_path
+
+async def synthesize_chunks(
+    client: AsyncOpenAI,
+    chunks: list[str],
+    destination: Path,
+    settings: TtsSettings,
+    live: LiveAudio | None = None,
+) -> None:
+    """
+    Synthesize narration chunks in parallel and join them, in order, into one MP3 file.
+
+    Args:
+        client: The OpenAI client.
+        chunks: The narration chunks, in order.
+        destination: The path of the joined MP3 file.
+        settings: The TTS settings; `chunk_concurrency` bounds the parallel requests.
+        live: An optional live file that publishes the chunks' audio as it arrives.
+    """
+    # Unique per call: concurrent runs may synthesize the same cached narration
+    parts_dir = Path(
+        tempfile.mkdtemp(prefix=f"{destination.stem}.", suffix=".chunks", dir=destination.parent)
+    )
+    semaphore = asyncio.Semaphore(settings.chunk_concurrency)
+
+    async def synthesize_part(index: int, chunk: str) -> Path:
+        part_path = parts_dir / f"{index:04d}.mp3"
+        async with semaphore:
+            await synthesize_to_file(
+                client, chunk, part_path, settings, live.writer(index) if live else None
+            )
+        if live:
+            live.finish(index)
+        emit_progress("audio_chunk", index=index, count=len(chunks), bytes=file_size(part_path))
+        return part_path
+
+    logger.info(
+        f"Synthesizing {len(chunks)} narration chunks, {settings.chunk_concurrency} at a time"
+    )
+    tasks = [asyncio.create_task(synthesize_part(i, chunk)) for i, chunk in enumerate(chunks)]
+    try:
+        part_paths = await asyncio.gather(*tasks)
+        concat_mp3_files(list(part_paths), destination)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        shutil.rmtree(parts_dir, ignore_errors=True)
+
+
+async def stream_speech_to_file(
+    client: AsyncOpenAI,
+    text: str,
+    destination: Path,
+    settings: TtsSettings,
+    on_audio: Callable[[bytes], None] | None = None,
+) -> SpeechStreamStats:
+    """
+    Synthesize speech and write it to disk chunk by chunk as it arrives.
+
+    Audio is written to a uniquely named `.part` file next to the destination and renamed
+    into place once complete, so memory use stays flat regardless of narration length and readers
+    never observe a truncated file at the destination path.
+
+    Args:
+        client: The OpenAI client.
+        text: The text to convert to speech.
+        destination: The path of the finished MP3 file.
+        settings: The TTS model, voice and chunk size.
+        on_audio: An optional callback that also receives each chunk as it arrives.
+
+    Returns:
+        Timing and size measurements for the synthesized audio.
+    """
+    tmp_path = temporary_sibling(destination)
+    started = time.monotonic()
+    first_byte_at: float | None = None
+    bytes_written = 0
+
+    try:
+        async with client.audio.speech.with_streaming_response.create(
+            model=settings.model,
+            voice=settings.voice,
+            input=text,
+            response_format="mp3",
+        ) as response:
+            with open(tmp_path, "wb") as f:
+                async for chunk in response.iter_bytes(settings.stream_chunk_size):
+                    if first_byte_at is None:
+                        first_byte_at = time.monotonic()
+                    f.write(chunk)
+                    if on_audio:
+                        on_audio(chunk)
+                    bytes_written += len(chunk)
+        os.replace(tmp_path, destination)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    finished = time.monotonic()
+    stats = SpeechStreamStats(
+        bytes_written=bytes_written,
+        time_to_first_byte=(first_byte_at or finished) - started,
+        duration=finished - started,
+    )
+    logger.info(
+        f"Streamed {stats.bytes_written} bytes of audio "
+        f"(first byte after {stats.time_to_first_byte:.2f}s, total {stats.duration:.2f}s)"
+    )
+    return stats
@@ -0,0 +1,104 @@
+"""Content-addressed store of synthesized narration audio."""
+
+from pathlib import Path
+
+from backend.app.custom_agents.article_summarizer.run_metrics import record_cache_result
+from backend.app.helpers.article_summarizer.cache_helpers import (
+    content_key,
+    link_or_copy,
+)
+from backend.app.types.article_summarizer.cache_types import AudioCacheSettings
+from backend.app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Touched when a stored file is reused; the file itself is left alone because run
+# directories link to it, and its mtime is their audio's Last-Modified.
+LAST_USED_SUFFIX = ".used"
+
+
+class AudioCache:
+    """A size-bounded store of MP3 files keyed by (model, voice, narration text).
+
+    Run directories receive a hard link to the stored file, so reusing a narration costs
+    neither a TTS request nor extra disk space. Evicting a stored file never affects run
+    directories that already link to it.
+
+    Recency is tracked in an empty marker file next to each reused entry, so a cache hit
+    never changes the modification time the linked run files share.
+    """
+
+    def __init__(self, settings: AudioCacheSettings | None = None) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            settings: Store location and size settings.
+        """
+        self.settings = settings or AudioCacheSettings()
+
+    def path_for(self, model: str, voice: str, text: str) -> Path:
+        """Return the path where the narration's audio is (or would be) stored."""
+        return self.settings.directory / f"{content_key(model, voice, text)}.mp3"
+
+    def lookup(self, model: str, voice: str, text: str) -> Path | None:
+        """
+        Find previously synthesized audio for a narration.
+
+        Args:
+            model: The TTS model.
+            voice: The TTS voice.
+            text: The narration text.
+
+        Returns:
+            The path to the stored audio, or None if the narration was never synthesized.
+        """
+        path = self.path_for(model, voice, text)
+        if not path.exists():
+            record_cache_result("miss")
+            return None
+
+        path.with_suffix(LAST_USED_SUFFIX).touch()
+        record_cache_result("hit")
+        return path
+
+    def link(self, stored_path: Path, destination: Path) -> None:
+        """
+        Place stored audio at a destination, hard-linking when the filesystem allows it.
+
+        Args:
+            stored_path: The path returned by `lookup` or `store`.
+            destination: Where the audio should appear, e.g. a run directory's final.mp3.
+        """
+        link_or_copy(stored_path, destination)
+
+    def evict(self, keep: Path | None = None) -> None:
+        """
+        Remove least recently used files until the store fits in its size budget.
+
+        Args:
+            keep: A stored file never to remove, e.g. the one just synthesized, even if
+                it alone exceeds the budget.
+        """
+        files = [
+            (path, path.stat(), self._last_used(path))
+            for path in self.settings.directory.glob("*.mp3")
+        ]
+        total = sum(stat.st_size for _, stat, _ in files)
+        for path, stat, _ in sorted(files, key=lambda item: item[2]):
+            if total <= self.settings.max_bytes:
+                break
+            if keep is not None and path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            path.with_suffix(LAST_USED_SUFFIX).unlink(missing_ok=True)
+            total -= stat.st_size
+            logger.debug(f"Evicted cached audio {path.name}")
+
+    @staticmethod
+    def _last_used(path: Path) -> float:
+        """Return when a stored file was last reused, or else stored."""
+        try:
+            return path.with_suffix(LAST_USED_SUFFIX).stat().st_mtime
+        except FileNotFoundError:
+            return path.stat().st_mtime
@@ -0,0 +1,168 @@
+"""Benchmark of the two-stage and combined summarize-and-narrate pipelines."""
+
+import statistics
+import time
+from collections.abc import Iterable, Sequence
+
+from backend.app.custom_agents.article_summarizer.agents import ArticleContent
+from backend.app.custom_agents.article_summarizer.http_client import PooledHttpClient
+from backend.app.custom_agents.article_summarizer.parser import (
+    extract_article_text,
+    fetch_article_content,
+)
+from backend.app.custom_agents.article_summarizer.pipeline import (
+    run_audio_formatter,
+    run_summarizer,
+    run_summary_narrator,
+)
+from backend.app.custom_agents.article_summarizer.token_ledger import track_tokens
+from backend.app.helpers.article_summarizer.parser_helpers import (
+    convert_to_article_content,
+    extract_title_from_html,
+)
+from backend.app.types.article_summarizer.pipeline_types import (
+    PipelineBenchmarkResult,
+    PipelineBenchmarkSummary,
+    PipelineMode,
+)
+from backend.app.types.article_summarizer.summary_types import SummarizationSettings
+from backend.app.types.article_summarizer.token_types import TokenBudgetSettings
+from backend.app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+BENCHMARK_MODES: tuple[PipelineMode, ...] = ("sequential", "combined")
+
+
+async def benchmark_pipeline_modes(
+    urls: Iterable[str],
+    modes: Sequence[PipelineMode] = BENCHMARK_MODES,
+    repeat: int = 1,
+    settings: SummarizationSettings | None = None,
+    token_budgets: TokenBudgetSettings | None = None,
+) -> list[PipelineBenchmarkResult]:
+    """
+    Measure the latency and provider-reported token use of the agent stages in each mode.
+
+    Each article is fetched and extracted once, then summarized and narrated in every
+    mode, alternating modes on each repetition so drifting API latency affects them
+    equally. Only the agent stages are timed: fetching, extraction and TTS are the same
+    in every mode. The memo store is not used, so every run makes real agent calls.
+
+    Args:
+        urls: The URLs of the articles to benchmark.
+        modes: The pipeline modes to compare. "streamed" is not supported, since its
+            stages overlap with TTS.
+        repeat: The number of runs per article and mode.
+        settings: Chooses between single-call and map-reduce summarization.
+        token_budgets: Input token budgets of the agent stages.
+
+    Returns:
+        A result per article, mode and repetition, in run order.
+    """
+    if "streamed" in modes:
+        raise ValueError("The streamed pipeline cannot be benchmarked without TTS")
+    settings = settings or SummarizationSettings()
+    token_budgets = token_budgets or TokenBudgetSettings()
+
+    results: list[PipelineBenchmarkResult] = []
+    client = PooledHttpClient()
+    try:
+        for url in urls:
+            article_content = await _load_article(url, client)
+            if not article_content:
+                results.extend(
+                    PipelineBenchmarkResult(url=url, mode=mode, error="Failed to fetch article")
+                    for mode in modes
+                )
+                continue
+
+            for _ in range(repeat):
+                for mode in modes:
+                    result = await _measure(article_content, mode, settings, token_budgets)
+                    logger.info(
+                        f"{mode} run of {url}: {result.seconds:.2f}s, "
+                        f"{result.input_tokens} input and {result.output_tokens} output tokens"
+                    )
+                    results.append(result)
+    finally:
+        await client.aclose()
+    return results
+
+
+def summarize_benchmark(
+    results: Iterable[PipelineBenchmarkResult],
+) -> list[PipelineBenchmarkSummary]:
+    """
+    Aggregate benchmark results per pipeline mode.
+
+    Args:
+        results: The results returned by `benchmark_pipeline_modes`.
+
+    Returns:
+        A summary per mode, in the order the modes first appear.
+    """
+    by_mode: dict[PipelineMode, list[PipelineBenchmarkResult]] = {}
+    for result in results:
+        by_mode.setdefault(result.mode, []).append(result)
+
+    summaries = []
+    for mode, mode_results in by_mode.items():
+        succeeded = [result for result in mode_results if not result.error]
+        summary = PipelineBenchmarkSummary(
+            mode=mode, runs=len(succeeded), failures=len(mode_results) - len(succeeded)
+        )
+        if succeeded:
+            summary.median_seconds = statistics.median(result.seconds for result in succeeded)
+            summary.mean_input_tokens = statistics.mean(r.input_tokens for r in succeeded)
+            summary.mean_output_tokens = statistics.mean(r.output_tokens for r in succeeded)
+        summaries.append(summary)
+    return summaries
+
+
+async def _load_article(url: str, client: PooledHttpClient) -> ArticleContent | None:
+    """Fetch and extract an article, or return None if the fetch failed."""
+    html_content = await fetch_article_content(url, client)
+    if not html_content:
+        return None
+    extracted_content = extract_article_text(html_content)
+    if not extracted_content.metadata.title:
+        extracted_content.metadata.title = extract_title_from_html(html_content)
+    return convert_to_article_content(extracted_content, url)
+
+
+async def _measure(
+    article_content: ArticleContent,
+    mode: PipelineMode,
+    settings: SummarizationSettings,
+    token_budgets: TokenBudgetSettings,
+) -> PipelineBenchmarkResult:
+    """Time one run of the agent stages in a pipeline mode and sum its provider-reported tokens."""
+    started = time.perf_counter()
+    with track_tokens() as token_ledger:
+        if mode == "combined":
+            combined = await run_summary_narrator(
+                article_content, None, settings, token_budgets.summarizer
+            )
+            narrated = combined is not None
+        else:
+            summary = await run_summarizer(
+                article_content, None, settings, token_budgets.summarizer
+            )
+            audio_format = (
+                await run_audio_formatter(summary, None, token_budgets.audio_formatter)
+                if summary
+                else None
+            )
+            narrated = audio_format is not None
+    seconds = time.perf_counter() - started
+
+    return PipelineBenchmarkResult(
+        url=article_content.url,
+        mode=mode,
+        seconds=seconds,
+        llm_calls=len(token_ledger.calls),
+        input_tokens=token_ledger.provider_input_tokens,
+        output_tokens=token_ledger.provider_output_tokens,
+        error="" if narrated else "Failed to summarize and narrate article",
+    )
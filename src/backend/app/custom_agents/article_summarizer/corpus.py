@@ -0,0 +1,93 @@
+"""Word document frequencies of the articles analyzed across runs."""
+
+from collections import Counter
+from collections.abc import Iterable
+
+from pydantic import ValidationError
+
+from backend.app.helpers.article_summarizer.cache_helpers import atomic_write_bytes
+from backend.app.types.article_summarizer.analysis_types import (
+    CorpusSettings,
+    DocumentFrequencies,
+)
+from backend.app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DocumentCorpus:
+    """The document frequencies that weight key topics, kept across batches and runs.
+
+    Articles are usually analyzed one at a time, so the IDF of a batch of one would be
+    the same for every word. Each analyzed article is added here instead, and later
+    articles are weighted against all of them: words that appear in most articles, such
+    as a site's name or its section labels, stop ranking as topics.
+
+    The frequencies are loaded on first use and saved with `save()`.
+    """
+
+    def __init__(self, settings: CorpusSettings | None = None) -> None:
+        """
+        Initialize the corpus.
+
+        Args:
+            settings: Location and vocabulary size settings.
+        """
+        self.settings = settings or CorpusSettings()
+        self._documents = 0
+        self._words: Counter[str] = Counter()
+        self._loaded = False
+
+    def frequencies(self, words: Iterable[str] | None = None) -> DocumentFrequencies:
+        """
+        Return a copy of the document frequencies, safe to hand to another thread or process.
+
+        Args:
+            words: The only words to copy, e.g. those of the articles about to be analyzed,
+                whose IDF is all the analysis needs; every word if None.
+
+        Returns:
+            The document count and the frequencies of the words.
+        """
+        self._load()
+        if words is None:
+            counts = dict(self._words)
+        else:
+            counts = {word: self._words[word] for word in words if word in self._words}
+        return DocumentFrequencies(documents=self._documents, words=counts)
+
+    def add(self, words: set[str]) -> None:
+        """
+        Count an analyzed article.
+
+        Args:
+            words: The article's distinct words, from `document_words`.
+        """
+        self._load()
+        self._documents += 1
+        self._words.update(words)
+        # Pruned in batches, since finding the rarest words sorts the whole vocabulary
+        if len(self._words) > self.settings.max_words * 1.1:
+            self._words = Counter(dict(self._words.most_common(self.settings.max_words)))
+
+    def save(self) -> None:
+        """Save the document frequencies, if any were loaded or counted."""
+        if not self._loaded:
+            return
+        self.settings.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(self.settings.path, self.frequencies().model_dump_json().encode("utf-8"))
+
+    def _load(self) -> None:
+        """Read the saved document frequencies on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            saved = DocumentFrequencies.model_validate_json(self.settings.path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, ValidationError) as e:
+            logger.warning(f"Ignoring unreadable document frequencies: {e}")
+            return
+        self._documents = saved.documents
+        self._words = Counter(saved.words)
@@ -0,0 +1,297 @@
+"""Persistent index of summarized articles for near-duplicate detection."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import NamedTuple
+
+from backend.app.helpers.article_summarizer.dedup_helpers import (
+    estimate_similarity,
+    lsh_band_keys,
+    minhash_signature,
+)
+from backend.app.types.article_summarizer.cache_types import (
+    DuplicateIndexSettings,
+    DuplicateMatch,
+)
+from backend.app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class InFlightArticle(NamedTuple):
+    """An article being summarized, which near-duplicates arriving meanwhile wait for."""
+
+    url: str
+    """The URL of the article."""
+
+    signature: list[int]
+    """The MinHash signature of the article's content."""
+
+    outputs: "asyncio.Future[tuple[Path, Path, Path] | None]"
+    """Resolves to the article's output files, or None if its run failed."""
+
+
+class DuplicateIndex:
+    """A SQLite-backed MinHash LSH index of summarized articles.
+
+    Each article is stored with its MinHash signature, the paths of its narration and
+    the TTS model and voice that spoke it, so audio is only reused in the same voice.
+    Lookups only compare signatures that share an LSH band with the new article, so a
+    lookup stays fast as the index grows, and inserts are a single transaction. The
+    methods block on disk, so async callers run them with `asyncio.to_thread`; a lock
+    serializes the threads' use of the one connection.
+    """
+
+    def __init__(self, settings: DuplicateIndexSettings | None = None) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            settings: Database location, similarity threshold and size settings.
+        """
+        self.settings = settings or DuplicateIndexSettings()
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def find(self, signature: list[int], voice: str) -> DuplicateMatch | None:
+        """
+        Find the most similar indexed article whose narration still exists.
+
+        Args:
+            signature: The MinHash signature of the new article.
+            voice: The TTS model and voice the narration must have been spoken with.
+
+        Returns:
+            The best match above the similarity threshold, or None.
+        """
+        with self._lock:
+            keys = lsh_band_keys(signature)
+            if not keys:
+                return None
+
+            connection = self._connect()
+            clauses = " OR ".join("(band = ? AND key = ?)" for _ in keys)
+            params = [value for band, key in keys.items() for value in (band, key)]
+            rows = connection.execute(
+                "SELECT id, url, signature, audio_path, final_text_path FROM articles "
+                f"WHERE voice = ? AND id IN (SELECT article_id FROM bands WHERE {clauses})",
+                [voice, *params],
+            ).fetchall()
+
+            best: DuplicateMatch | None = None
+            for article_id, url, stored_signature, audio_path, final_text_path in rows:
+                similarity = estimate_similarity(signature, list(array("Q", stored_signature)))
+                if similarity < self.settings.min_similarity:
+                    continue
+                if not (Path(audio_path).exists() and Path(final_text_path).exists()):
+                    logger.debug(f"Dropping indexed article {url}: its narration is gone")
+                    self._delete(connection, article_id)
+                    continue
+                if best is None or similarity > best.similarity:
+                    best = DuplicateMatch(
+                        url=url,
+                        audio_path=Path(audio_path),
+                        final_text_path=Path(final_text_path),
+                        similarity=similarity,
+                    )
+            connection.commit()
+            return best
+
+    def add(
+        self,
+        signature: list[int],
+        url: str,
+        audio_path: Path,
+        final_text_path: Path,
+        voice: str,
+    ) -> None:
+        """
+        Index a summarized article.
+
+        Args:
+            signature: The MinHash signature of the article.
+            url: The URL the article was summarized from.
+            audio_path: The narration audio of the article.
+            final_text_path: The narration text of the article.
+            voice: The TTS model and voice the narration was spoken with.
+        """
+        with self._lock:
+            connection = self._connect()
+            cursor = connection.execute(
+                "INSERT INTO articles "
+                "(url, signature, audio_path, final_text_path, voice, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    array("Q", signature).tobytes(),
+                    str(audio_path),
+                    str(final_text_path),
+                    voice,
+                    time.time(),
+                ),
+            )
+            connection.executemany(
+                "INSERT INTO bands (band, key, article_id) VALUES (?, ?, ?)",
+                [(band, key, cursor.lastrowid) for band, key in lsh_band_keys(signature).items()],
+            )
+            for (article_id,) in connection.execute(
+                "SELECT id FROM articles ORDER BY id DESC LIMIT -1 OFFSET ?",
+                (self.settings.max_entries,),
+            ).fetchall():
+                self._delete(connection, article_id)
+            connection.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    @staticmethod
+    def _delete(connection: sqlite3.Connection, article_id: int) -> None:
+        """Remove an article and its bands from the index."""
+        connection.execute("DELETE FROM bands WHERE article_id = ?", (article_id,))
+        connection.execute("DELETE FROM articles WHERE id = ?", (article_id,))
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the database connection, creating the database on first use."""
+        if self._connection is None:
+            self.settings.path.parent.mkdir(parents=True, exist_ok=True)
+            # Used from worker threads, one at a time under the lock
+            self._connection = sqlite3.connect(self.settings.path, check_same_thread=False)
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(articles)")}
+            if columns and "voice" not in columns:
+                # Indexes from before voices were recorded cannot tell which voice spoke
+                # an entry, so they are rebuilt from scratch
+                self._connection.execute("DROP TABLE articles")
+                self._connection.execute("DROP TABLE IF EXISTS bands")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS articles ("
+                "id INTEGER PRIMARY KEY, url TEXT NOT NULL, signature BLOB NOT NULL, "
+                "audio_path TEXT NOT NULL, final_text_path TEXT NOT NULL, "
+                "voice TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS bands ("
+                "band INTEGER NOT NULL, key INTEGER NOT NULL, article_id INTEGER NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS bands_key ON bands (band, key)")
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS bands_article_id ON bands (article_id)"
+            )
+        return self._connection
+
+
+class DuplicateTracker:
+    """Finds the near-duplicates of new articles among indexed and in-flight articles.
+
+    An article that has no near-duplicate is claimed as in flight until its run
+    finishes, so a near-duplicate checked meanwhile, e.g. later in the same batch, waits
+    for that narration instead of making its own. The index is only used from worker
+    threads, so lookups never block the event loop.
+    """
+
+    def __init__(self, index: DuplicateIndex, voice: str) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            index: The index of summarized articles.
+            voice: The TTS model and voice new narrations are spoken with.
+        """
+        self.index = index
+        self.voice = voice
+        self._in_flight: list[InFlightArticle] = []
+
+    async def find(self, url: str, content: str) -> DuplicateMatch | InFlightArticle:
+        """
+        Find a near-duplicate of an article, or claim the article as in flight.
+
+        Args:
+            url: The URL of the article.
+            content: The article's text.
+
+        Returns:
+            A match on an earlier narration, or the claim on the article, which must be
+            passed to `finish` once its run ends.
+        """
+        signature = await asyncio.to_thread(minhash_signature, content)
+        match = await asyncio.to_thread(self.index.find, signature, self.voice)
+        if not match:
+            match = await self._wait_for_in_flight(signature)
+        if match:
+            return match
+
+        # Claimed without awaiting after the check, so no near-duplicate slips in between
+        article = InFlightArticle(url, signature, asyncio.get_running_loop().create_future())
+        self._in_flight.append(article)
+        return article
+
+    async def finish(
+        self, article: InFlightArticle, result: tuple[Path, Path, Path] | None
+    ) -> None:
+        """
+        Index a claimed article's narration, if its run succeeded, and release the claim.
+
+        Args:
+            article: The claim returned by `find`.
+            result: The article's output files, or None if its run failed.
+        """
+        try:
+            if result:
+                audio_path, _, final_text_path = result
+                await asyncio.to_thread(
+                    self.index.add,
+                    article.signature,
+                    article.url,
+                    audio_path,
+                    final_text_path,
+                    self.voice,
+                )
+        finally:
+            # Released only once indexed, so a later near-duplicate finds one or the other
+            self._in_flight.remove(article)
+            article.outputs.set_result(result)
+
+    def close(self) -> None:
+        """Close the index."""
+        self.index.close()
+
+    async def _wait_for_in_flight(self, signature: list[int]) -> DuplicateMatch | None:
+        """
+        Wait for the most similar article still being summarized, if one is similar enough.
+
+        If that article's run fails, the next most similar one is waited for instead.
+
+        Args:
+            signature: The MinHash signature of the new article.
+
+        Returns:
+            A match on the finished article's narration, or None if no in-flight article
+            is a near-duplicate or none of them succeeded.
+        """
+        while True:
+            candidates = [
+                (estimate_similarity(signature, article.signature), article)
+                for article in self._in_flight
+            ]
+            similarity, article = max(candidates, key=lambda c: c[0], default=(0.0, None))
+            if not article or similarity < self.index.settings.min_similarity:
+                return None
+
+            logger.info(f"Waiting for {article.url}, a near-duplicate being summarized")
+            # Shielded so that cancelling this article does not cancel the other's future
+            outputs = await asyncio.shield(article.outputs)
+            if outputs:
+                audio_path, _, final_text_path = outputs
+                return DuplicateMatch(
+                    url=article.url,
+                    audio_path=audio_path,
+                    final_text_path=final_text_path,
+                    similarity=similarity,
+                )
@@ -0,0 +1,505 @@
+"""Single-pass article extraction engine."""
+
+import html
+from collections import Counter
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup
+from bs4.builder import HTMLTreeBuilder
+from bs4.dammit import EntitySubstitution
+from bs4.element import CData, NavigableString, PageElement, Tag
+
+from backend.app.helpers.article_summarizer.parser_helpers import extraction_confidence
+from backend.app.types.article_summarizer.parser_types import (
+    ArticleHeading,
+    ArticleImage,
+    ArticleLink,
+    ArticleMetadataResult,
+    ArticleStructureResult,
+    ArticleSubsection,
+    ArticleTable,
+    ExtractedArticleContent,
+    ExtractionQuality,
+)
+
+SKIPPED_TAGS = frozenset({"script", "style", "nav", "footer", "header"})
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+FALLBACK_CONTAINERS = ("main", "article", "body")
+
+# (attribute, value) pairs identifying the meta tags read for each metadata field, in
+# order of preference.
+META_SOURCES: dict[str, tuple[tuple[str, str], ...]] = {
+    "title": (("property", "og:title"), ("property", "twitter:title")),
+    "author": (("name", "author"), ("property", "article:author")),
+    "published_date": (("property", "article:published_time"), ("name", "date")),
+    "source": (("property", "og:site_name"),),
+    "tags": (("name", "keywords"),),
+}
+META_KEYS = frozenset(key for sources in META_SOURCES.values() for key in sources)
+
+# String types whose text is part of Tag.get_text(); others (comments, script bodies,
+# ruby annotations, template contents) are ignored.
+TEXT_TYPES = (NavigableString, CData)
+
+# Tree-building rules of BeautifulSoup's html.parser builder, mirrored by the streaming
+# parser so that both produce the same events.
+VOID_ELEMENTS = frozenset(HTMLTreeBuilder.DEFAULT_EMPTY_ELEMENT_TAGS or ())
+NON_TEXT_CONTAINERS = frozenset(HTMLTreeBuilder.DEFAULT_STRING_CONTAINERS)
+PRESERVE_WHITESPACE_TAGS = frozenset(HTMLTreeBuilder.DEFAULT_PRESERVE_WHITESPACE_TAGS)
+ASCII_SPACES = frozenset(" \n\t\x0c\r")
+
+
+@dataclass
+class _OpenElement:
+    """Book-keeping for an element whose end tag has not been seen yet."""
+
+    tag: str
+    parent_id: int
+    element_id: int
+    text_parts: list[str] | None = None
+    slot: int = -1
+    href: str = ""
+    caption_targets: list[int] = field(default_factory=list)
+    table_rows: list[list[str | None]] | None = None
+    row_refs: list[list[str | None]] = field(default_factory=list)
+    cell_refs: list[tuple[list[str | None], int]] = field(default_factory=list)
+
+
+class ArticleEventCollector:
+    """Builds an ExtractedArticleContent from a stream of start-tag, end-tag and text events.
+
+    Metadata, structure, paragraphs and subsections are all gathered in the same pass,
+    and the text of every element is assembled exactly once. Events must be properly
+    nested (every `start` matched by an `end`), which both the tree walker and the
+    streaming parser guarantee.
+
+    Subsections group the paragraphs that follow a heading among its siblings, up to the
+    next heading at the same level of the tree.
+
+    Readability signals (text and link density, and how concentrated the paragraphs are
+    in one container and at one depth) are counted along the way and scored into the
+    result's `quality`.
+    """
+
+    def __init__(self) -> None:
+        self._skip_depth = 0
+        self._stack: list[_OpenElement] = []
+        self._next_id = 0
+        self._text_buffers: list[list[str]] = []
+        self._meta: dict[tuple[str, str], str] = {}
+        self._fallback_text: dict[str, str] = {}
+        self._open_fallbacks: set[str] = set()
+
+        self._headings: list[ArticleHeading | None] = []
+        self._images: list[ArticleImage] = []
+        self._uncaptioned_images: list[int] = []
+        self._links: list[ArticleLink | None] = []
+        self._tables: list[ArticleTable | None] = []
+        self._open_rows: list[list[list[str | None]]] = []
+        self._paragraphs: list[str | None] = []
+        self._subsections: list[tuple[str, list[str]]] = []
+        self._active_subsection: dict[int, int | None] = {}
+
+        self._text_chars = 0
+        self._open_links = 0
+        self._open_paragraphs = 0
+        self._paragraph_link_chars = 0
+        self._paragraph_chars_by_parent: Counter[int] = Counter()
+        self._paragraph_chars_by_depth: Counter[int] = Counter()
+
+    def start(self, tag: str, attrs: Mapping[str, str]) -> None:
+        """Handle the start of an element."""
+        if self._skip_depth:
+            self._skip_depth += 1
+            return
+        if tag in SKIPPED_TAGS:
+            self._skip_depth = 1
+            return
+
+        parent_id = self._stack[-1].element_id if self._stack else -1
+        element = _OpenElement(tag=tag, parent_id=parent_id, element_id=self._next_id)
+        self._next_id += 1
+
+        if tag in HEADING_TAGS:
+            element.slot = len(self._headings)
+            self._headings.append(None)
+            self._capture(element)
+        elif tag == "p":
+            element.slot = len(self._paragraphs)
+            self._paragraphs.append(None)
+            self._open_paragraphs += 1
+            self._capture(element)
+        elif tag == "a":
+            self._open_links += 1
+            element.slot = len(self._links)
+            element.href = attrs.get("href", "")
+            self._links.append(None)
+            self._capture(element)
+        elif tag == "img":
+            self._uncaptioned_images.append(len(self._images))
+            self._images.append(
+                ArticleImage(url=attrs.get("src", ""), alt=attrs.get("alt", ""), caption="")
+            )
+        elif tag == "figcaption":
+            element.caption_targets = self._uncaptioned_images
+            self._uncaptioned_images = []
+            self._capture(element)
+        elif tag == "meta":
+            self._record_meta(attrs)
+        elif tag == "table":
+            element.slot = len(self._tables)
+            element.table_rows = []
+            self._tables.append(None)
+        elif tag == "tr":
+            for open_element in self._stack:
+                if open_element.table_rows is not None:
+                    row: list[str | None] = []
+                    open_element.table_rows.append(row)
+                    element.row_refs.append(row)
+            self._open_rows.append(element.row_refs)
+        elif tag in ("td", "th"):
+            for rows in self._open_rows:
+                for row in rows:
+                    element.cell_refs.append((row, len(row)))
+                    row.append(None)
+            self._capture(element)
+        elif tag in FALLBACK_CONTAINERS and tag not in self._fallback_text:
+            if tag not in self._open_fallbacks:
+                self._open_fallbacks.add(tag)
+                self._capture(element)
+
+        self._stack.append(element)
+
+    def end(self, tag: str) -> None:
+        """Handle the end of an element."""
+        if self._skip_depth:
+            self._skip_depth -= 1
+            return
+
+        element = self._stack.pop()
+        text = ""
+        if element.text_parts is not None:
+            self._text_buffers.pop()
+            text = "".join(element.text_parts).strip()
+
+        tag = element.tag
+        if tag in HEADING_TAGS:
+            self._headings[element.slot] = ArticleHeading(text=text, level=int(tag[1]))
+            if text:
+                self._active_subsection[element.parent_id] = len(self._subsections)
+                self._subsections.append((text, []))
+            else:
+                self._active_subsection[element.parent_id] = None
+        elif tag == "p":
+            self._paragraphs[element.slot] = text
+            self._open_paragraphs -= 1
+            self._paragraph_chars_by_parent[element.parent_id] += len(text)
+            self._paragraph_chars_by_depth[len(self._stack)] += len(text)
+            subsection = self._active_subsection.get(element.parent_id)
+            if text and subsection is not None:
+                self._subsections[subsection][1].append(text)
+        elif tag == "a":
+            self._open_links -= 1
+            self._links[element.slot] = ArticleLink(url=element.href, text=text, context="")
+        elif tag == "figcaption":
+            for index in element.caption_targets:
+                self._images[index].caption = text
+        elif tag in ("td", "th"):
+            for row, index in element.cell_refs:
+                row[index] = text
+        elif tag == "tr":
+            self._open_rows.pop()
+        elif tag == "table" and element.table_rows is not None:
+            rows = [[cell or "" for cell in row] for row in element.table_rows if row]
+            if rows:
+                content = ", ".join(" ".join(row) for row in rows)
+                self._tables[element.slot] = ArticleTable(content=content)
+        elif tag in self._open_fallbacks and element.text_parts is not None:
+            self._open_fallbacks.discard(tag)
+            self._fallback_text[tag] = text
+
+    def text(self, data: str) -> None:
+        """Handle character data."""
+        if self._skip_depth:
+            return
+        chars = len(data.strip())
+        self._text_chars += chars
+        if self._open_links and self._open_paragraphs:
+            self._paragraph_link_chars += chars
+        for buffer in self._text_buffers:
+            buffer.append(data)
+
+    def result(self) -> ExtractedArticleContent:
+        """Return the extracted article content."""
+        article_text = "\n\n".join(paragraph for paragraph in self._paragraphs if paragraph)
+        if not article_text:
+            for container in FALLBACK_CONTAINERS:
+                if container in self._fallback_text:
+                    article_text = self._fallback_text[container]
+                    break
+
+        return ExtractedArticleContent(
+            text=article_text,
+            subsections=[
+                ArticleSubsection(heading=heading, content="\n\n".join(content))
+                for heading, content in self._subsections
+                if content
+            ],
+            metadata=self.metadata,
+            structure=ArticleStructureResult(
+                headings=[heading for heading in self._headings if heading is not None],
+                images=self._images,
+                links=[link for link in self._links if link is not None],
+                tables=[table for table in self._tables if table is not None],
+            ),
+            quality=self.quality,
+        )
+
+    @property
+    def paragraphs(self) -> list[str]:
+        """The non-empty paragraphs completed so far."""
+        return [paragraph for paragraph in self._paragraphs if paragraph]
+
+    @property
+    def quality(self) -> ExtractionQuality:
+        """The readability signals of the paragraphs completed so far."""
+        paragraphs = self.paragraphs
+        paragraph_chars = sum(len(paragraph) for paragraph in paragraphs)
+        if not paragraph_chars:
+            return ExtractionQuality(text_chars=self._text_chars)
+
+        text_density = min(1.0, paragraph_chars / max(self._text_chars, 1))
+        link_density = min(1.0, self._paragraph_link_chars / paragraph_chars)
+        container_share = max(self._paragraph_chars_by_parent.values()) / paragraph_chars
+        depth_share = max(self._paragraph_chars_by_depth.values()) / paragraph_chars
+        return ExtractionQuality(
+            text_chars=self._text_chars,
+            paragraph_chars=paragraph_chars,
+            paragraph_count=len(paragraphs),
+            text_density=round(text_density, 3),
+            link_density=round(link_density, 3),
+            container_share=round(container_share, 3),
+            depth_share=round(depth_share, 3),
+            confidence=extraction_confidence(
+                paragraph_chars, text_density, link_density, container_share, depth_share
+            ),
+        )
+
+    def _capture(self, element: _OpenElement) -> None:
+        """Start collecting the text of an element."""
+        element.text_parts = []
+        self._text_buffers.append(element.text_parts)
+
+    def _record_meta(self, attrs: Mapping[str, str]) -> None:
+        """Remember the content of the first meta tag matching each known key."""
+        for attribute in ("property", "name"):
+            key = (attribute, attrs.get(attribute, ""))
+            if key in META_KEYS and key not in self._meta:
+                self._meta[key] = attrs.get("content", "") or ""
+
+    @property
+    def metadata(self) -> ArticleMetadataResult:
+        """The metadata resolved from the meta tags seen so far."""
+        values: dict[str, str] = {}
+        for name, sources in META_SOURCES.items():
+            values[name] = next(
+                (self._meta[source] for source in sources if source in self._meta), ""
+            )
+
+        keywords = values.pop("tags")
+        tags = [tag.strip() for tag in keywords.split(",")] if keywords else []
+        return ArticleMetadataResult(tags=tags, **values)
+
+
+def walk_tree(root: Tag, collector: ArticleEventCollector) -> None:
+    """
+    Feed a parsed document to a collector in a single depth-first traversal.
+
+    Args:
+        root: The root of the parsed document.
+        collector: The collector receiving the events.
+    """
+    # Entries are (node, None) to visit a node and (None, tag) to close an element.
+    stack: list[tuple[PageElement | None, str | None]] = [
+        (child, None) for child in reversed(root.contents)
+    ]
+    while stack:
+        node, closing_tag = stack.pop()
+        if closing_tag is not None:
+            collector.end(closing_tag)
+        elif isinstance(node, Tag):
+            if node.name in SKIPPED_TAGS:
+                continue
+            attrs = {
+                key: value if isinstance(value, str) else " ".join(value)
+                for key, value in node.attrs.items()
+            }
+            collector.start(node.name, attrs)
+            stack.append((None, node.name))
+            stack.extend((child, None) for child in reversed(node.contents))
+        elif type(node) in TEXT_TYPES:
+            collector.text(str(node))
+
+
+def extract_single_pass(html_content: str, parser_backend: str) -> ExtractedArticleContent:
+    """
+    Parse HTML and extract the article in one traversal of the document.
+
+    Args:
+        html_content: The HTML content of the article.
+        parser_backend: The BeautifulSoup tree builder, e.g. "lxml" or "html.parser".
+
+    Returns:
+        The extracted article content.
+    """
+    soup = BeautifulSoup(html_content, parser_backend)
+    collector = ArticleEventCollector()
+    walk_tree(soup, collector)
+    return collector.result()
+
+
+class StreamingArticleParser(HTMLParser):
+    """An incremental HTML parser that feeds an ArticleEventCollector as data arrives.
+
+    Chunks can be passed to `feed` while a page is still downloading. Metadata is
+    reported through `on_metadata` as soon as the document head has been read, and
+    completed paragraphs are available from `collector.paragraphs` before the rest of
+    the body arrives.
+
+    Elements are opened and closed the way BeautifulSoup's html.parser builder does it
+    (void elements close immediately, stray end tags are ignored, an end tag closes every
+    element opened after its match), so the result equals
+    `extract_single_pass(html, "html.parser")`.
+    """
+
+    def __init__(
+        self,
+        collector: ArticleEventCollector | None = None,
+        on_metadata: Callable[[ArticleMetadataResult], None] | None = None,
+    ) -> None:
+        """
+        Initialize the parser.
+
+        Args:
+            collector: The collector receiving the events. A new one is used by default.
+            on_metadata: Called once with the page metadata when the head is complete.
+        """
+        super().__init__(convert_charrefs=False)
+        self.collector = collector or ArticleEventCollector()
+        self._on_metadata = on_metadata
+        self._metadata_reported = False
+        self._open: list[str] = []
+        self._open_counts: Counter[str] = Counter()
+        self._closed_void_elements: list[str] = []
+        self._non_text_depths: list[int] = []
+        self._preserve_depths: list[int] = []
+        self._pending_text: list[str] = []
+
+    def close(self) -> None:
+        """Finish parsing, closing any elements that are still open."""
+        super().close()
+        self._end_data()
+        while self._open:
+            self._pop()
+        self._report_metadata()
+
+    def result(self) -> ExtractedArticleContent:
+        """Return the extracted article content. Call after `close`."""
+        return self.collector.result()
+
+    def handle_starttag(
+        self,
+        tag: str,
+        attrs: list[tuple[str, str | None]],
+        handle_empty_element: bool = True,
+    ) -> None:
+        self._end_data()
+        self._push(tag, {key: value or "" for key, value in attrs})
+        if handle_empty_element and tag in VOID_ELEMENTS:
+            self.handle_endtag(tag, check_already_closed=False)
+            self._closed_void_elements.append(tag)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs, handle_empty_element=False)
+        self.handle_endtag(tag, check_already_closed=False)
+
+    def handle_endtag(self, tag: str, check_already_closed: bool = True) -> None:
+        if check_already_closed and tag in self._closed_void_elements:
+            self._closed_void_elements.remove(tag)
+            return
+
+        self._end_data()
+        if not self._open_counts[tag]:
+            return
+        while self._pop() != tag:
+            pass
+
+    def handle_data(self, data: str) -> None:
+        self._pending_text.append(data)
+
+    def handle_charref(self, name: str) -> None:
+        self._pending_text.append(html.unescape(f"&#{name};"))
+
+    def handle_entityref(self, name: str) -> None:
+        self._pending_text.append(EntitySubstitution.HTML_ENTITY_TO_CHARACTER.get(name, f"&{name}"))
+
+    def handle_comment(self, data: str) -> None:
+        self._end_data()
+
+    def handle_decl(self, decl: str) -> None:
+        self._end_data()
+
+    def handle_pi(self, data: str) -> None:
+        self._end_data()
+
+    def unknown_decl(self, data: str) -> None:
+        self._end_data()
+        if data.upper().startswith("CDATA["):
+            self._pending_text.append(data[len("CDATA[") :])
+            self._end_data(force_text=True)
+
+    def _push(self, tag: str, attrs: Mapping[str, str]) -> None:
+        """Open an element."""
+        self._open.append(tag)
+        self._open_counts[tag] += 1
+        if tag in NON_TEXT_CONTAINERS:
+            self._non_text_depths.append(len(self._open))
+        if tag in PRESERVE_WHITESPACE_TAGS:
+            self._preserve_depths.append(len(self._open))
+        if tag == "body":
+            self._report_metadata()
+        self.collector.start(tag, attrs)
+
+    def _pop(self) -> str:
+        """Close the innermost open element and return its tag."""
+        depth = len(self._open)
+        tag = self._open.pop()
+        self._open_counts[tag] -= 1
+        if self._non_text_depths and self._non_text_depths[-1] == depth:
+            self._non_text_depths.pop()
+        if self._preserve_depths and self._preserve_depths[-1] == depth:
+            self._preserve_depths.pop()
+        self.collector.end(tag)
+        if tag == "head":
+            self._report_metadata()
+        return tag
+
+    def _end_data(self, force_text: bool = False) -> None:
+        """Emit the text collected since the last markup event as one string."""
+        if not self._pending_text:
+            return
+        data = "".join(self._pending_text)
+        self._pending_text = []
+        if not self._preserve_depths and all(char in ASCII_SPACES for char in data):
+            data = "\n" if "\n" in data else " "
+        # Text inside ruby annotations, templates, scripts and styles is not page text.
+        if force_text or not self._non_text_depths:
+            self.collector.text(data)
+
+    def _report_metadata(self) -> None:
+        """Report the metadata to the callback, once."""
+        if self._on_metadata and not self._metadata_reported:
+            self._metadata_reported = True
+            self._on_metadata(self.collector.metadata)
@@ -0,0 +1,158 @@
+"""On-disk cache of fetched article HTML with HTTP revalidation support."""
+
+import gzip
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from backend.app.helpers.article_summarizer.cache_helpers import (
+    atomic_write_bytes,
+    content_key,
+    normalize_url,
+)
+from backend.app.types.article_summarizer.cache_types import (
+    CachedPage,
+    FetchCacheSettings,
+    FetchCacheStats,
+)
+from backend.app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class FetchCache:
+    """A size-bounded LRU cache of fetched pages, keyed by normalized URL.
+
+    Each entry is stored as a gzip-compressed body plus a small JSON file holding the
+    validators (ETag / Last-Modified). The metadata file's modification time doubles as
+    the entry's last access time for LRU eviction.
+
+    The methods read, compress and write files, so async callers run them with
+    `asyncio.to_thread`; a lock keeps the size accounting consistent across threads.
+    """
+
+    def __init__(self, settings: FetchCacheSettings | None = None) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            settings: Cache location, size and freshness settings.
+        """
+        self.settings = settings or FetchCacheSettings()
+        self.stats = FetchCacheStats()
+        self._total_bytes: int | None = None
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> CachedPage | None:
+        """
+        Look up a cached page.
+
+        Args:
+            url: The URL of the page.
+
+        Returns:
+            The cached page, or None if the URL is not cached.
+        """
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = gzip.decompress(body_path.read_bytes()).decode("utf-8")
+        except (OSError, ValueError) as e:
+            if meta_path.exists():
+                logger.warning(f"Discarding unreadable cache entry for {url}: {e}")
+                with self._lock:
+                    self._remove(meta_path, body_path)
+            return None
+
+        os.utime(meta_path)
+        return CachedPage(body=body, **meta)
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        """Whether a cached page can be served without revalidating it."""
+        return time.time() - page.validated_at < self.settings.max_age
+
+    def put(self, url: str, body: str, etag: str = "", last_modified: str = "") -> None:
+        """
+        Store a freshly downloaded page.
+
+        Args:
+            url: The URL of the page.
+            body: The HTML content of the page.
+            etag: The ETag response header, if any.
+            last_modified: The Last-Modified response header, if any.
+        """
+        meta_path, body_path = self._paths(url)
+        self.settings.directory.mkdir(parents=True, exist_ok=True)
+        page = CachedPage(
+            url=normalize_url(url),
+            body="",
+            etag=etag,
+            last_modified=last_modified,
+            validated_at=time.time(),
+        )
+        compressed = gzip.compress(body.encode("utf-8"))
+
+        with self._lock:
+            total_before = self._current_total() - self._size(meta_path) - self._size(body_path)
+            atomic_write_bytes(body_path, compressed)
+            atomic_write_bytes(meta_path, page.model_dump_json(exclude={"body"}).encode("utf-8"))
+            self._total_bytes = total_before + self._size(meta_path) + self._size(body_path)
+            self._evict()
+
+    def mark_revalidated(self, url: str, page: CachedPage) -> None:
+        """
+        Record that the server confirmed a cached page is still current.
+
+        Args:
+            url: The URL of the page.
+            page: The cached page.
+        """
+        meta_path, _ = self._paths(url)
+        page = page.model_copy(update={"validated_at": time.time()})
+        atomic_write_bytes(meta_path, page.model_dump_json(exclude={"body"}).encode("utf-8"))
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        """Return the metadata and body paths for a URL."""
+        key = content_key(normalize_url(url))
+        return self.settings.directory / f"{key}.json", self.settings.directory / f"{key}.html.gz"
+
+    def _current_total(self) -> int:
+        """Return the total size of the cache, scanning the directory on first use."""
+        if self._total_bytes is None:
+            self._total_bytes = sum(
+                self._size(path) for path in self.settings.directory.glob("*") if path.is_file()
+            )
+        return self._total_bytes
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits in its size budget."""
+        if self._current_total() <= self.settings.max_bytes:
+            return
+
+        entries = sorted(
+            self.settings.directory.glob("*.json"), key=lambda path: path.stat().st_mtime
+        )
+        for meta_path in entries:
+            if self._current_total() <= self.settings.max_bytes:
+                break
+            body_path = meta_path.with_name(meta_path.name.replace(".json", ".html.gz"))
+            self._remove(meta_path, body_path)
+            logger.debug(f"Evicted cached page {meta_path.stem}")
+
+    def _remove(self, *paths: Path) -> None:
+        """Delete cache files and update the size accounting."""
+        for path in paths:
+            size = self._size(path)
+            path.unlink(missing_ok=True)
+            if self._total_bytes is not None:
+                self._total_bytes -= size
+
+    @staticmethod
+    def _size(path: Path) -> int:
+        """Return the size of a file, or 0 if it does not exist."""
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
@@ -0,0 +1,251 @@
+"""In-process queue of summarization jobs served by a fixed pool of workers."""
+
+import asyncio
+import time
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator
+
+from backend.app.custom_agents.article_summarizer.manager import ArticleSummarizerManager
+from backend.app.custom_agents.article_summarizer.progress import emit_progress, track_progress
+from backend.app.custom_agents.article_summarizer.run_metrics import track_metrics
+from backend.app.types.article_summarizer.job_types import Job, JobQueueSettings
+from backend.app.types.article_summarizer.progress_types import TERMINAL_EVENTS, ProgressEvent
+from backend.app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at its maximum depth."""
+
+
+class JobEventLog:
+    """The progress events of one job, which any number of clients can follow."""
+
+    def __init__(self) -> None:
+        """Initialize an empty log."""
+        self.events: list[ProgressEvent] = []
+        self._changed = asyncio.Event()
+
+    def append(self, event: ProgressEvent) -> None:
+        """Add an event and wake the clients following the log."""
+        self.events.append(event)
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def follow(self, start: int = 0) -> AsyncIterator[tuple[int, ProgressEvent]]:
+        """
+        Yield the logged events from an index on, then new events as they are added.
+
+        Args:
+            start: The index of the first event to yield, e.g. to resume after a reconnect.
+
+        Yields:
+            Each event with its index, until the job's final event.
+        """
+        index = start
+        while True:
+            changed = self._changed
+            while index < len(self.events):
+                event = self.events[index]
+                yield index, event
+                if event.type in TERMINAL_EVENTS:
+                    return
+                index += 1
+            await changed.wait()
+
+
+class JobQueue:
+    """A bounded queue of summarization jobs and the workers that run them.
+
+    All workers share one manager, so its HTTP pool, parse pool, caches and per-stage
+    concurrency limits apply across every job. The queue must be started before jobs run
+    and closed when no longer needed, either with `aclose()` or as an async context
+    manager.
+
+    When the manager has a job store, every job is saved in it as it changes, off the
+    event loop and in the order of the changes. Jobs that were queued or running when
+    the process stopped are queued again on start, and resume from the stage
+    checkpoints of their URL.
+    """
+
+    def __init__(
+        self,
+        settings: JobQueueSettings | None = None,
+        manager: ArticleSummarizerManager | None = None,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            settings: Worker count, queue depth and job retention settings.
+            manager: The manager that runs the jobs. The queue owns it and closes it
+                with the queue; by default one with default settings is created.
+        """
+        self.settings = settings or JobQueueSettings()
+        self.manager = manager or ArticleSummarizerManager()
+        self._queue: asyncio.Queue[Job] = asyncio.Queue(maxsize=self.settings.max_queue_depth)
+        self._jobs: dict[str, Job] = {}
+        self._event_logs: dict[str, JobEventLog] = {}
+        self._finished: deque[str] = deque()
+        self._workers: list[asyncio.Task[None]] = []
+        self._store = self.manager.job_store
+        # Held while a job is saved, so saves land in the order they were made
+        self._save_lock = asyncio.Lock()
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize()
+
+    async def start(self) -> None:
+        """Start the workers, first queueing again the saved jobs that never finished."""
+        if not self._workers:
+            await self._recover_jobs()
+            self._workers = [
+                asyncio.create_task(self._work(), name=f"summarizer-worker-{index}")
+                for index in range(self.settings.workers)
+            ]
+            logger.info(f"Started {len(self._workers)} summarization workers")
+
+    async def submit(self, url: str) -> Job:
+        """
+        Queue an article for summarization.
+
+        Args:
+            url: The URL of the article.
+
+        Returns:
+            The queued job.
+
+        Raises:
+            QueueFullError: If the queue is at its maximum depth.
+        """
+        job = Job(id=uuid.uuid4().hex, url=url, created_at=time.time())
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFullError(
+                f"{self.depth} jobs are already waiting; try again later"
+            ) from None
+        await self._track(job)
+        logger.info(f"Queued job {job.id} for {url} ({self.depth} waiting)")
+        return job
+
+    async def get(self, job_id: str) -> Job | None:
+        """
+        Return a job by its identifier.
+
+        Jobs forgotten by this process, or finished before it started, are looked up in
+        the job store.
+
+        Args:
+            job_id: The job's identifier.
+
+        Returns:
+            The job, or None if it is unknown.
+        """
+        job = self._jobs.get(job_id)
+        if job is None and self._store:
+            job = await asyncio.to_thread(self._store.get_job, job_id)
+        return job
+
+    def events(self, job_id: str) -> JobEventLog | None:
+        """Return a job's progress events, or None if the job is unknown or was forgotten."""
+        return self._event_logs.get(job_id)
+
+    async def aclose(self) -> None:
+        """Stop the workers, abandoning queued and running jobs, and close the manager."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await self.manager.aclose()
+
+    async def __aenter__(self) -> "JobQueue":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _work(self) -> None:
+        """Run queued jobs one at a time until cancelled."""
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _track(self, job: Job, **queued_data: object) -> None:
+        """Start the event log of a queued job and save the job."""
+        self._jobs[job.id] = job
+        self._event_logs[job.id] = JobEventLog()
+        self._event_logs[job.id].append(
+            ProgressEvent(type="queued", data={"url": job.url, **queued_data})
+        )
+        await self._save(job)
+
+    async def _recover_jobs(self) -> None:
+        """Queue again the saved jobs that were queued or running when the process stopped."""
+        if not self._store:
+            return
+        for job in await asyncio.to_thread(self._store.unfinished_jobs):
+            if job.id in self._jobs:
+                continue
+            job.status, job.started_at = "queued", None
+            try:
+                self._queue.put_nowait(job)
+            except asyncio.QueueFull:
+                job.status, job.finished_at = "failed", time.time()
+                job.error = "The queue was full when the job was recovered; submit it again"
+                await self._save(job)
+                continue
+            await self._track(job, resumed=True)
+            logger.info(f"Recovered job {job.id} for {job.url}")
+
+    async def _save(self, job: Job) -> None:
+        """Save a job in the job store, if the manager has one."""
+        if self._store:
+            # A copy, since the job may change while the thread saves it
+            saved = job.model_copy()
+            async with self._save_lock:
+                await asyncio.to_thread(self._store.save_job, saved)
+
+    async def _run(self, job: Job) -> None:
+        """Summarize a job's article and record the outcome on the job."""
+        job.status = "running"
+        job.started_at = time.time()
+        await self._save(job)
+        event_log = self._event_logs[job.id]
+        with track_metrics(job.url) as metrics, track_progress(event_log.append):
+            emit_progress("started")
+            try:
+                result = await self.manager.summarize_article(job.url)
+                job.error = "" if result else "Summarization failed"
+            except Exception as e:
+                logger.error(f"Job {job.id} for {job.url} failed: {e}")
+                result, job.error = None, str(e)
+
+        job.metrics = metrics
+        job.finished_at = time.time()
+        if result:
+            job.audio_path, job.raw_text_path, job.final_text_path = result
+            job.status = "succeeded"
+            event_log.append(ProgressEvent(type="succeeded"))
+        else:
+            job.status = "failed"
+            event_log.append(ProgressEvent(type="failed", data={"error": job.error}))
+        await self._save(job)
+        logger.info(f"Job {job.id} {job.status} in {job.finished_at - job.started_at:.1f}s")
+        self._forget_old_jobs(job)
+
+    def _forget_old_jobs(self, job: Job) -> None:
+        """Remember a finished job, forgetting the oldest beyond the retention limit."""
+        self._finished.append(job.id)
+        while len(self._finished) > self.settings.max_finished_jobs:
+            job_id = self._finished.popleft()
+            self._jobs.pop(job_id, None)
+            self._event_logs.pop(job_id, None)
@@ -0,0 +1,280 @@
+"""Persistent store of summarization jobs and the stage outputs of unfinished runs."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from backend.app.types.article_summarizer.job_types import (
+    AudioCheckpoint,
+    CheckpointStage,
+    Job,
+    JobStoreSettings,
+)
+from backend.app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+OutputT = TypeVar("OutputT", bound=BaseModel)
+
+
+class JobStore:
+    """A SQLite-backed store of jobs and stage checkpoints.
+
+    A checkpoint is the output of one pipeline stage of a URL (its content, summary,
+    narration or audio files), saved as soon as the stage completes and removed once the
+    run succeeds. A run that fails or dies part way is retried from its last completed
+    stage, whether the job queue resubmits it after a restart or the URL is summarized
+    again, so fetches and agent calls are not paid for twice. Checkpoints are also keyed
+    by a variant, such as the pipeline mode and TTS voice, so a run never resumes from
+    the outputs of a differently configured one.
+
+    The database is in WAL mode: each commit is a short append to the log that survives
+    a process crash, and readers are never blocked by a writer. The methods block on
+    disk, so async callers run them with `asyncio.to_thread`; a lock serializes the
+    threads' use of the one connection.
+    """
+
+    def __init__(self, settings: JobStoreSettings | None = None) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            settings: Database location, checkpoint TTL and retention settings.
+        """
+        self.settings = settings or JobStoreSettings()
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def load_checkpoint(
+        self, url: str, variant: str, stage: CheckpointStage, output_type: type[OutputT]
+    ) -> OutputT | None:
+        """
+        Look up the saved output of a stage.
+
+        Args:
+            url: The URL of the article.
+            variant: The settings the run's outputs depend on.
+            stage: The pipeline stage.
+            output_type: The model to parse the saved output into.
+
+        Returns:
+            The saved output, or None if there is no valid checkpoint.
+        """
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT output, created_at FROM checkpoints "
+                "WHERE url = ? AND variant = ? AND stage = ?",
+                (url, variant, stage),
+            ).fetchone()
+            if row is None:
+                return None
+
+            output, created_at = row
+            if time.time() - created_at > self.settings.checkpoint_ttl:
+                self._delete_checkpoint(connection, url, variant, stage)
+                return None
+
+            try:
+                return output_type.model_validate_json(output)
+            except ValidationError as e:
+                logger.warning(f"Discarding unreadable {stage} checkpoint of {url}: {e}")
+                self._delete_checkpoint(connection, url, variant, stage)
+                return None
+
+    def save_checkpoint(
+        self, url: str, variant: str, stage: CheckpointStage, output: BaseModel
+    ) -> None:
+        """
+        Save the output of a completed stage.
+
+        Args:
+            url: The URL of the article.
+            variant: The settings the run's outputs depend on.
+            stage: The pipeline stage.
+            output: The stage's output.
+        """
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (url, variant, stage, output, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, variant, stage, output.model_dump_json(), now),
+            )
+            connection.execute(
+                "DELETE FROM checkpoints WHERE created_at < ?",
+                (now - self.settings.checkpoint_ttl,),
+            )
+            connection.commit()
+
+    def clear_checkpoints(self, url: str, variant: str) -> None:
+        """Remove every checkpoint of a URL's variant, e.g. once its run succeeded."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "DELETE FROM checkpoints WHERE url = ? AND variant = ?", (url, variant)
+            )
+            connection.commit()
+
+    def save_job(self, job: Job) -> None:
+        """
+        Save a job in its current state, removing the oldest finished jobs beyond the limit.
+
+        Args:
+            job: The job.
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO jobs (id, status, created_at, job) VALUES (?, ?, ?, ?)",
+                (job.id, job.status, job.created_at, job.model_dump_json()),
+            )
+            connection.execute(
+                "DELETE FROM jobs WHERE id IN (SELECT id FROM jobs "
+                "WHERE status IN ('succeeded', 'failed') "
+                "ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.settings.max_finished_jobs,),
+            )
+            connection.commit()
+
+    def get_job(self, job_id: str) -> Job | None:
+        """Return a saved job by its identifier, or None if it is unknown."""
+        with self._lock:
+            row = self._connect().execute("SELECT job FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job.model_validate_json(row[0]) if row else None
+
+    def unfinished_jobs(self) -> list[Job]:
+        """Return the saved jobs that were queued or running, oldest first."""
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT job FROM jobs WHERE status IN ('queued', 'running') ORDER BY created_at"
+                )
+                .fetchall()
+            )
+        return [Job.model_validate_json(job) for (job,) in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    @staticmethod
+    def _delete_checkpoint(
+        connection: sqlite3.Connection, url: str, variant: str, stage: str
+    ) -> None:
+        """Remove one checkpoint."""
+        connection.execute(
+            "DELETE FROM checkpoints WHERE url = ? AND variant = ? AND stage = ?",
+            (url, variant, stage),
+        )
+        connection.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the database connection, creating the database on first use."""
+        if self._connection is None:
+            self.settings.path.parent.mkdir(parents=True, exist_ok=True)
+            # Used from worker threads, one at a time under the lock
+            self._connection = sqlite3.connect(self.settings.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            # Commits survive a process crash; only a power loss can undo the last few
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(checkpoints)")}
+            if columns and "variant" not in columns:
+                # Checkpoints from before variants were recorded cannot tell which
+                # settings produced them, so those runs start over
+                self._connection.execute("DROP TABLE checkpoints")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                "url TEXT NOT NULL, variant TEXT NOT NULL, stage TEXT NOT NULL, "
+                "output TEXT NOT NULL, created_at REAL NOT NULL, "
+                "PRIMARY KEY (url, variant, stage))"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, status TEXT NOT NULL, created_at REAL NOT NULL, "
+                "job TEXT NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status)")
+        return self._connection
+
+
+class RunCheckpoints:
+    """The stage checkpoints of the runs of one pipeline configuration.
+
+    Runs of the same URL may overlap, e.g. when it is submitted twice, and then share
+    its checkpoints, so they are only cleared by the last run in progress. The store is
+    used from worker threads, so the event loop never waits on the database.
+    """
+
+    def __init__(self, store: JobStore | None, variant: str) -> None:
+        """
+        Initialize the checkpoints.
+
+        Args:
+            store: The store holding the checkpoints, or None to disable checkpointing.
+            variant: The settings the runs' outputs depend on, such as the pipeline mode
+                and TTS voice.
+        """
+        self.store = store
+        self.variant = variant
+        # Runs in progress per URL, which share the URL's checkpoints
+        self._active_runs: Counter[str] = Counter()
+
+    @contextmanager
+    def active_run(self, url: str) -> Iterator[None]:
+        """Count a run of a URL as in progress while the block runs."""
+        self._active_runs[url] += 1
+        try:
+            yield
+        finally:
+            self._active_runs[url] -= 1
+            if not self._active_runs[url]:
+                del self._active_runs[url]
+
+    async def load(
+        self, url: str, stage: CheckpointStage, output_type: type[OutputT]
+    ) -> OutputT | None:
+        """Return the checkpointed output of a stage, if the store has one."""
+        if not self.store:
+            return None
+        output = await asyncio.to_thread(
+            self.store.load_checkpoint, url, self.variant, stage, output_type
+        )
+        if output:
+            logger.info(f"Resuming {url} from its {stage} checkpoint")
+        return output
+
+    async def save(self, url: str, stage: CheckpointStage, output: BaseModel) -> None:
+        """Checkpoint the output of a completed stage, if the store is enabled."""
+        if self.store:
+            await asyncio.to_thread(self.store.save_checkpoint, url, self.variant, stage, output)
+
+    async def clear(self, url: str) -> None:
+        """Remove the checkpoints of a run that succeeded, unless another run still uses them."""
+        if self.store and self._active_runs[url] == 1:
+            await asyncio.to_thread(self.store.clear_checkpoints, url, self.variant)
+
+    async def resume_audio(self, url: str) -> tuple[Path, Path, Path] | None:
+        """Return the output files of a run whose audio was generated before it stopped."""
+        checkpoint = await self.load(url, "audio", AudioCheckpoint)
+        if not checkpoint:
+            return None
+        paths = (checkpoint.audio_path, checkpoint.raw_text_path, checkpoint.final_text_path)
+        if not all(path.exists() for path in paths):
+            logger.info(f"The checkpointed audio of {url} is gone; generating it again")
+            return None
+        logger.info(f"Resuming {url} after its audio was generated")
+        return paths
@@ -0,0 +1,164 @@
+"""Publishing and tailing narration audio while it is synthesized."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+
+from backend.app.custom_agents.article_summarizer.progress import emit_progress
+from backend.app.helpers.article_summarizer.audio_helpers import (
+    ID3V1_SIZE,
+    mp3_frames,
+    mp3_header_length,
+)
+from backend.app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LIVE_AUDIO_NAME = "live.mp3"
+# Left in the run directory when synthesis fails, so readers know the audio is incomplete.
+LIVE_FAILED_NAME = "live.failed"
+# Seconds a reader waits before looking for more audio in the live file.
+POLL_INTERVAL = 0.1
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class LiveAudioFailed(Exception):
+    """Raised to a reader when the narration it is tailing stopped before it was complete."""
+
+
+class LiveAudio:
+    """The narration MP3 of a run in progress, published in the run directory as it arrives.
+
+    A narration may be synthesized as several parts in parallel, but must be heard in
+    order. Bytes of the earliest unfinished part are appended to the live file as soon
+    as they arrive; bytes of later parts are held in memory until every part before them
+    is finished. MP3 frames are self-contained, so a player can start on the first bytes.
+    Like `concat_mp3_files`, only the audio frames of each part are published: its ID3
+    tags and Xing header frame describe the part alone and are left out.
+
+    Once the finished audio is in place, `close()` removes the live file. Readers that
+    opened it keep their handle and read it to the end, so removal marks the end of the
+    audio. If synthesis fails, `abort()` leaves a failure marker before removing it, and
+    readers stop with an error instead of ending the audio early.
+    """
+
+    def __init__(self, run_dir: Path) -> None:
+        """
+        Create the live file of a run and announce it with an "audio_started" event.
+
+        Args:
+            run_dir: The run directory.
+        """
+        self.path = run_dir / LIVE_AUDIO_NAME
+        self._failed_path = run_dir / LIVE_FAILED_NAME
+        self._file = open(self.path, "wb")  # noqa: SIM115 - open until close()
+        self._current = 0
+        self._pending: dict[int, list[bytes]] = {}
+        self._finished: set[int] = set()
+        # Parts whose header was skipped, the start of those whose header is still
+        # arriving, and the last bytes of each part, which may be an ID3v1 tag
+        self._started: set[int] = set()
+        self._heads: dict[int, bytes] = {}
+        self._tails: dict[int, bytes] = {}
+        emit_progress("audio_started", run=run_dir.name)
+
+    def writer(self, index: int) -> Callable[[bytes], None]:
+        """Return the callback that receives the audio of one part as it is synthesized."""
+
+        def write(data: bytes) -> None:
+            if index not in self._started:
+                head = self._heads.pop(index, b"") + data
+                header_length = mp3_header_length(head)
+                if header_length is None:
+                    self._heads[index] = head
+                    return
+                self._started.add(index)
+                data = head[header_length:]
+
+            held = self._tails.get(index, b"") + data
+            self._tails[index] = held[-ID3V1_SIZE:]
+            self._publish(index, held[:-ID3V1_SIZE])
+
+        return write
+
+    def finish(self, index: int) -> None:
+        """Mark a part as complete and publish the held audio of the parts that follow it."""
+        if index in self._started:
+            tail = self._tails.pop(index, b"")
+            if len(tail) == ID3V1_SIZE and tail.startswith(b"TAG"):
+                tail = b""
+        else:
+            tail = mp3_frames(self._heads.pop(index, b""))
+        self._publish(index, tail)
+
+        self._finished.add(index)
+        while self._current in self._finished:
+            self._current += 1
+            for data in self._pending.pop(self._current, []):
+                self._append(data)
+
+    def close(self) -> None:
+        """Stop publishing the complete audio and remove the live file."""
+        if not self._file.closed:
+            self._file.close()
+            self.path.unlink(missing_ok=True)
+
+    def abort(self) -> None:
+        """Stop publishing incomplete audio; does nothing once the live file is closed."""
+        if not self._file.closed:
+            self._failed_path.touch()
+            self.close()
+
+    def _publish(self, index: int, data: bytes) -> None:
+        """Append the audio of a part now if it is the earliest unfinished one, else hold it."""
+        if not data:
+            return
+        if index == self._current:
+            self._append(data)
+        else:
+            self._pending.setdefault(index, []).append(data)
+
+    def _append(self, data: bytes) -> None:
+        """Append audio to the live file and make it visible to readers."""
+        self._file.write(data)
+        self._file.flush()
+
+
+async def tail_audio(run_dir: Path) -> AsyncIterator[bytes]:
+    """
+    Yield a run's narration audio while it is synthesized, until it is complete.
+
+    Reads the live file as it grows and stops once the writer has removed it. If the
+    run already finished, its final.mp3 is read instead.
+
+    Args:
+        run_dir: The run directory.
+
+    Yields:
+        The audio, in chunks of at most 64 KiB.
+
+    Raises:
+        LiveAudioFailed: If synthesis failed, after the audio published until then.
+    """
+    live_path: Path | None = run_dir / LIVE_AUDIO_NAME
+    # The live file may be removed between any check and the open, so try it first.
+    try:
+        file = open(run_dir / LIVE_AUDIO_NAME, "rb")  # noqa: SIM115 - closed below
+    except FileNotFoundError:
+        file = open(run_dir / "final.mp3", "rb")  # noqa: SIM115 - closed below
+        live_path = None
+
+    with file:
+        while True:
+            data = await asyncio.to_thread(file.read, READ_CHUNK_SIZE)
+            if data:
+                yield data
+            elif live_path is None or not live_path.exists():
+                # Everything was written before the live file was removed.
+                while data := await asyncio.to_thread(file.read, READ_CHUNK_SIZE):
+                    yield data
+                if live_path and (run_dir / LIVE_FAILED_NAME).exists():
+                    raise LiveAudioFailed(f"Synthesis of the audio in {run_dir} failed")
+                return
+            else:
+                await asyncio.sleep(POLL_INTERVAL)
@@ -1,6 +1,9 @@
 """Manager for article summarization process."""
 
+import asyncio
+import itertools
 import re
+from collections.abc import AsyncIterator, Iterable
 from pathlib import Path
 
 from agents import Runner, trace
@@ -9,35 +12,285 @@ from backend.app.custom_agents.article_summarizer.agents import (
     ArticleContent,
     AudioFormat,
     SummaryData,
+    SummaryWithNarration,
     audio_formatter_agent,
     generate_trace_id,
     summarizer_agent,
 )
-from backend.app.custom_agents.article_summarizer.audio import generate_audio
+from backend.app.custom_agents.article_summarizer.audio import (
+    GENERATED_FROM,
+    generate_audio,
+    reuse_narration,
+    write_summary,
+)
+from backend.app.custom_agents.article_summarizer.audio_cache import AudioCache
+from backend.app.custom_agents.article_summarizer.corpus import DocumentCorpus
+from backend.app.custom_agents.article_summarizer.duplicate_index import (
+    DuplicateIndex,
+    DuplicateTracker,
+)
+from backend.app.custom_agents.article_summarizer.fetch_cache import FetchCache
+from backend.app.custom_agents.article_summarizer.http_client import PooledHttpClient
+from backend.app.custom_agents.article_summarizer.job_store import JobStore, RunCheckpoints
+from backend.app.custom_agents.article_summarizer.memo_store import AgentMemoStore
+from backend.app.custom_agents.article_summarizer.parse_pool import ParsePool
 from backend.app.custom_agents.article_summarizer.parser import (
-    extract_article_text,
     fetch_article_content,
+    stream_article_content,
 )
 from backend.app.custom_agents.article_summarizer.pipeline import (
+    analyze_content,
     run_audio_formatter,
+    run_content_extractor,
     run_summarizer,
+    run_summary_narrator,
+)
+from backend.app.custom_agents.article_summarizer.progress import (
+    emit_progress,
+    emit_summary_ready,
+    is_tracking_progress,
+    summary_delta_emitter,
+)
+from backend.app.custom_agents.article_summarizer.run_metrics import (
+    measure_stage,
+    record_cache_result,
+    track_metrics,
+    write_run_metrics,
+)
+from backend.app.custom_agents.article_summarizer.streamed_pipeline import run_streamed_pipeline
+from backend.app.custom_agents.article_summarizer.token_ledger import (
+    track_tokens,
+    write_token_ledger,
 )
 from backend.app.helpers.article_summarizer.parser_helpers import (
     convert_to_article_content,
     extract_title_from_html,
 )
+from backend.app.types.article_summarizer.analysis_types import (
+    ContentAnalysisResult,
+    CorpusSettings,
+)
+from backend.app.types.article_summarizer.audio_types import TtsSettings
+from backend.app.types.article_summarizer.cache_types import (
+    AgentMemoSettings,
+    AudioCacheSettings,
+    DuplicateIndexSettings,
+    DuplicateMatch,
+    FetchCacheSettings,
+    FetchCacheStats,
+)
+from backend.app.types.article_summarizer.http_types import HttpClientSettings
+from backend.app.types.article_summarizer.job_types import (
+    AudioCheckpoint,
+    JobStoreSettings,
+)
+from backend.app.types.article_summarizer.manager_types import (
+    StageConcurrencyLimits,
+    SummarizationResult,
+)
+from backend.app.types.article_summarizer.parser_types import (
+    ArticleMetadataResult,
+    ExtractedArticleContent,
+    ParseSettings,
+)
+from backend.app.types.article_summarizer.pipeline_types import PipelineSettings
+from backend.app.types.article_summarizer.summary_types import SummarizationSettings
+from backend.app.types.article_summarizer.token_types import TokenBudgetSettings
 from backend.app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class ArticleSummarizerManager:
-    """Manager for the article summarization process."""
+    """Manager for the article summarization process.
+
+    The manager owns long-lived resources such as the HTTP connection pool, so it should
+    be closed when no longer needed, either with `aclose()` or by using it as an async
+    context manager.
+    """
+
+    def __init__(
+        self,
+        limits: StageConcurrencyLimits | None = None,
+        http_settings: HttpClientSettings | None = None,
+        fetch_cache_settings: FetchCacheSettings | None = None,
+        memo_settings: AgentMemoSettings | None = None,
+        tts_settings: TtsSettings | None = None,
+        audio_cache_settings: AudioCacheSettings | None = None,
+        parse_settings: ParseSettings | None = None,
+        summarization_settings: SummarizationSettings | None = None,
+        token_budgets: TokenBudgetSettings | None = None,
+        pipeline_settings: PipelineSettings | None = None,
+        duplicate_index_settings: DuplicateIndexSettings | None = None,
+        job_store_settings: JobStoreSettings | None = None,
+        corpus_settings: CorpusSettings | None = None,
+    ) -> None:
+        """
+        Initialize the manager.
+
+        Args:
+            limits: Per-stage concurrency limits shared by every article this manager processes.
+            http_settings: Connection pool settings for fetching articles.
+            fetch_cache_settings: Settings for the on-disk cache of fetched pages.
+            memo_settings: Settings for the memo store of summarizer and formatter outputs.
+            tts_settings: The TTS model and voice used for narration.
+            audio_cache_settings: Settings for the store of synthesized narrations.
+            parse_settings: Settings for the extraction worker pool. By default the pool
+                has one worker process per allowed concurrent parse.
+            summarization_settings: When to summarize long articles chunk by chunk.
+            token_budgets: Input token budgets of the agent stages.
+            pipeline_settings: Whether the summarizer, formatter and TTS stages run one
+                after another, overlap as the summary streams in, or whether one agent
+                call summarizes and narrates.
+            duplicate_index_settings: Settings for the index that lets near-duplicate
+                articles, such as syndicated copies of a story, reuse an earlier narration.
+            job_store_settings: Settings for the store of jobs and stage checkpoints, from
+                which a run that failed or was interrupted resumes at its last completed
+                stage.
+            corpus_settings: Settings for the word document frequencies of the articles
+                analyzed across runs, which weight the key topics of each new article.
+        """
+        self.limits = limits or StageConcurrencyLimits()
+        self._http_client = PooledHttpClient(http_settings)
+        fetch_cache_settings = fetch_cache_settings or FetchCacheSettings()
+        self._fetch_cache = (
+            FetchCache(fetch_cache_settings) if fetch_cache_settings.enabled else None
+        )
+        memo_settings = memo_settings or AgentMemoSettings()
+        self._memo = AgentMemoStore(memo_settings) if memo_settings.enabled else None
+        self.tts_settings = tts_settings or TtsSettings()
+        self.summarization_settings = summarization_settings or SummarizationSettings()
+        self.token_budgets = token_budgets or TokenBudgetSettings()
+        self.pipeline_settings = pipeline_settings or PipelineSettings()
+        audio_cache_settings = audio_cache_settings or AudioCacheSettings()
+        self._audio_cache = (
+            AudioCache(audio_cache_settings) if audio_cache_settings.enabled else None
+        )
+        duplicate_index_settings = duplicate_index_settings or DuplicateIndexSettings()
+        self._duplicates = (
+            DuplicateTracker(DuplicateIndex(duplicate_index_settings), self._voice)
+            if duplicate_index_settings.enabled
+            else None
+        )
+        job_store_settings = job_store_settings or JobStoreSettings()
+        self.job_store = JobStore(job_store_settings) if job_store_settings.enabled else None
+        corpus_settings = corpus_settings or CorpusSettings()
+        self._corpus = DocumentCorpus(corpus_settings) if corpus_settings.enabled else None
+        self._checkpoints = RunCheckpoints(
+            self.job_store, f"{self.pipeline_settings.mode}:{self._voice}"
+        )
+        self._parse_pool = ParsePool(parse_settings or ParseSettings(max_workers=self.limits.parse))
+        self._fetch_semaphore = asyncio.Semaphore(self.limits.fetch)
+        self._parse_semaphore = asyncio.Semaphore(self.limits.parse)
+        self._llm_semaphore = asyncio.Semaphore(self.limits.llm)
+        self._tts_semaphore = asyncio.Semaphore(self.limits.tts)
+
+    @property
+    def _voice(self) -> str:
+        """The TTS model and voice narrations are spoken with, which key the duplicate index."""
+        return f"{self.tts_settings.model}:{self.tts_settings.voice}"
+
+    @property
+    def fetch_cache_stats(self) -> FetchCacheStats:
+        """Hit, revalidation and miss counters of the fetch cache."""
+        return self._fetch_cache.stats if self._fetch_cache else FetchCacheStats()
+
+    async def aclose(self) -> None:
+        """Release the resources owned by the manager."""
+        await self._http_client.aclose()
+        await self._parse_pool.aclose()
+        if self._memo:
+            await asyncio.to_thread(self._memo.close)
+        if self._duplicates:
+            await asyncio.to_thread(self._duplicates.close)
+        if self.job_store:
+            self.job_store.close()
+        if self._corpus:
+            await asyncio.to_thread(self._corpus.save)
+
+    async def __aenter__(self) -> "ArticleSummarizerManager":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def summarize_many(self, urls: Iterable[str]) -> AsyncIterator[SummarizationResult]:
+        """
+        Summarize many articles concurrently, yielding each result as soon as it finishes.
+
+        Every URL runs through the full pipeline independently, so one article can be
+        fetching while another is summarized and a third is being synthesized. The
+        per-stage limits passed to the constructor bound how many articles occupy each
+        stage at once, and the `articles` limit how many are started: URLs are read from
+        `urls` only as earlier articles finish, so a long or lazy iterable is fine.
+
+        Args:
+            urls: The URLs of the articles to summarize.
+
+        Yields:
+            A SummarizationResult per URL, in completion order.
+        """
+        remaining = iter(urls)
+        logger.info(
+            f"Starting batch summarization of up to {self.limits.articles} articles at a time"
+        )
+        running = {
+            asyncio.create_task(self._summarize_one(url))
+            for url in itertools.islice(remaining, self.limits.articles)
+        }
+        try:
+            while running:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    # Start the next article before handing out the result, so a slow
+                    # consumer does not leave a slot idle
+                    for url in itertools.islice(remaining, 1):
+                        running.add(asyncio.create_task(self._summarize_one(url)))
+                    yield task.result()
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def _summarize_one(self, url: str) -> SummarizationResult:
+        """
+        Summarize a single article for a batch run, capturing failures in the result.
+
+        Args:
+            url: The URL of the article to summarize.
+
+        Returns:
+            The SummarizationResult for the URL.
+        """
+        with track_metrics(url) as metrics:
+            try:
+                result = await self.summarize_article(url)
+                error = "" if result else "Summarization failed"
+            except Exception as e:
+                logger.error(f"Error summarizing {url}: {e}")
+                result, error = None, str(e)
+
+        if not result:
+            return SummarizationResult(url=url, error=error, metrics=metrics)
+
+        audio_path, raw_text_path, final_text_path = result
+        return SummarizationResult(
+            url=url,
+            audio_path=audio_path,
+            raw_text_path=raw_text_path,
+            final_text_path=final_text_path,
+            metrics=metrics,
+        )
 
     async def summarize_article(self, url: str) -> tuple[Path, Path, Path] | None:
         """
         Summarize an article from a URL and generate audio.
 
+        The time, bytes, tokens and cache results of each stage are saved as metrics.json
+        next to the output files. The output of each stage is checkpointed in the job
+        store until the run succeeds, so a run that failed or was interrupted resumes
+        after its last completed stage. Checkpoints are kept while another run of the
+        same URL is still in progress.
+
         Args:
             url: The URL of the article to summarize.
 
@@ -47,42 +300,220 @@ class ArticleSummarizerManager:
         """
         trace_id = generate_trace_id()
 
-        with trace("Article Summarization", trace_id=trace_id):
+        with (
+            trace("Article Summarization", trace_id=trace_id),
+            track_tokens() as token_ledger,
+            track_metrics(url) as metrics,
+            self._checkpoints.active_run(url),
+        ):
             logger.info(f"Starting article summarization for {url}")
             logger.info(f"Trace ID: {trace_id}")
 
             # Extract content - first step of the pipeline
-            article_content = await self._extract_content(url)
+            article_content = await self._checkpoints.load(url, "content", ArticleContent)
             if not article_content:
-                logger.error("Failed to extract article content")
-                return None
+                article_content = await self._extract_content(url)
+                if not article_content:
+                    logger.error("Failed to extract article content")
+                    return None
+                await self._checkpoints.save(url, "content", article_content)
+            emit_progress(
+                "parsed", title=article_content.title, characters=len(article_content.content)
+            )
 
-            summary = await run_summarizer(article_content)
-            if not summary:
-                logger.error("Failed to summarize article")
-                return None
+            result = await self._checkpoints.resume_audio(url)
+            claim = None
+            if not result and self._duplicates:
+                with measure_stage("dedup"):
+                    found = await self._duplicates.find(url, article_content.content)
+                    record_cache_result("hit" if isinstance(found, DuplicateMatch) else "miss")
+                if isinstance(found, DuplicateMatch):
+                    logger.info(
+                        f"{url} is a near-duplicate of {found.url} "
+                        f"(similarity {found.similarity:.2f}); reusing its narration"
+                    )
+                    reused = await reuse_narration(url, article_content, found)
+                    write_run_metrics(metrics, reused[0].parent)
+                    await self._checkpoints.clear(url)
+                    return reused
+                claim = found
+
+            try:
+                if not result:
+                    result = await self._generate(url, article_content)
+                if result:
+                    write_token_ledger(token_ledger, result[0].parent)
+                    write_run_metrics(metrics, result[0].parent)
+                    await self._checkpoints.clear(url)
+                    logger.info(
+                        f"Article summarization complete. Files saved to {result[0].parent}"
+                    )
+                return result
+            finally:
+                if claim and self._duplicates:
+                    await self._duplicates.finish(claim, result)
+
+    async def _generate(
+        self, url: str, article_content: ArticleContent
+    ) -> tuple[Path, Path, Path] | None:
+        """
+        Summarize and narrate an article, synthesize the narration and checkpoint the files.
 
-            audio_format = await run_audio_formatter(summary)
-            if not audio_format:
-                logger.error("Failed to format for audio")
-                return None
+        Args:
+            url: The URL of the article.
+            article_content: The extracted article content.
 
-            # Format the final text that will be saved along with the audio
-            formatted_text = (
-                f"# {audio_format.title}\n\n{audio_format.narration_text}\n\nGenerated from: {url}"
+        Returns:
+            The paths to the audio file, raw text file, and final text file, or None if
+            the run failed.
+        """
+        # Topic, tone and entity hints for the summarizer, computed off the event loop
+        async with self._parse_semaphore:
+            with measure_stage("analysis"):
+                analysis = await analyze_content(article_content, self._parse_pool, self._corpus)
+
+        if self.pipeline_settings.mode == "streamed":
+            # The stages overlap, so the pipeline takes a slot per agent run and TTS request
+            result = await run_streamed_pipeline(
+                article_content,
+                self._memo,
+                self.pipeline_settings,
+                self.summarization_settings,
+                self.token_budgets,
+                self.tts_settings,
+                self._audio_cache,
+                analysis,
+                llm_slots=self._llm_semaphore,
+                tts_slots=self._tts_semaphore,
             )
+        else:
+            result = await self._narrate(url, article_content, analysis)
+        if not result:
+            return None
+        audio_path, raw_text_path, final_text_path = result
+        await self._checkpoints.save(
+            url,
+            "audio",
+            AudioCheckpoint(
+                audio_path=audio_path,
+                raw_text_path=raw_text_path,
+                final_text_path=final_text_path,
+            ),
+        )
+        return result
+
+    async def _narrate(
+        self, url: str, article_content: ArticleContent, analysis: ContentAnalysisResult | None
+    ) -> tuple[Path, Path, Path] | None:
+        """
+        Summarize and narrate an article, then synthesize the narration.
+
+        Args:
+            url: The URL of the article.
+            article_content: The extracted article content.
+            analysis: The article's content analysis, if it succeeded.
+
+        Returns:
+            The paths to the audio file, raw text file, and final text file, or None if
+            the summary or narration failed.
+        """
+        narrated = await self._summarize_and_format(url, article_content, analysis)
+        if not narrated:
+            return None
+        audio_format = narrated.audio_format
 
-            # Pass the article title, content, and formatted text to generate_audio
-            audio_path, raw_text_path, final_text_path = await generate_audio(
+        # Format the final text that will be saved along with the audio
+        formatted_text = (
+            f"# {audio_format.title}\n\n{audio_format.narration_text}{GENERATED_FROM}{url}"
+        )
+
+        # Pass the article title, content, and formatted text to generate_audio
+        async with self._tts_semaphore:
+            result = await generate_audio(
                 audio_format.narration_text,
                 audio_format.filename,
                 article_content.title,
                 article_content.content,
                 formatted_text,
+                settings=self.tts_settings,
+                cache=self._audio_cache,
             )
+        write_summary(result[0].parent, narrated.summary)
+        return result
+
+    async def _summarize_and_format(
+        self,
+        url: str,
+        article_content: ArticleContent,
+        analysis: ContentAnalysisResult | None = None,
+    ) -> SummaryWithNarration | None:
+        """
+        Summarize an article and format the summary for narration.
+
+        In "combined" mode one agent call does both; otherwise the summarizer and the
+        audio formatter run one after the other. Checkpointed summaries and narrations
+        of the URL are used instead of running their agents again.
 
-            logger.info(f"Article summarization complete. Files saved to {audio_path.parent}")
-            return audio_path, raw_text_path, final_text_path
+        Args:
+            url: The URL of the article, which keys its checkpoints.
+            article_content: The extracted article content.
+            analysis: The article's content analysis, if it succeeded.
+
+        Returns:
+            The summary and its narration, or None if either step failed.
+        """
+        summary = await self._checkpoints.load(url, "summary", SummaryData)
+        audio_format = await self._checkpoints.load(url, "audio_format", AudioFormat)
+        if summary and audio_format:
+            emit_summary_ready(summary)
+            emit_progress("narration_ready", text=audio_format.narration_text)
+            return SummaryWithNarration(summary=summary, audio_format=audio_format)
+
+        if self.pipeline_settings.mode == "combined":
+            async with self._llm_semaphore:
+                combined = await run_summary_narrator(
+                    article_content,
+                    self._memo,
+                    self.summarization_settings,
+                    self.token_budgets.summarizer,
+                    analysis=analysis,
+                )
+            if not combined:
+                logger.error("Failed to summarize and narrate article")
+                return None
+            await self._checkpoints.save(url, "summary", combined.summary)
+            await self._checkpoints.save(url, "audio_format", combined.audio_format)
+            emit_summary_ready(combined.summary)
+            emit_progress("narration_ready", text=combined.audio_format.narration_text)
+            return combined
+
+        if not summary:
+            async with self._llm_semaphore:
+                summary = await run_summarizer(
+                    article_content,
+                    self._memo,
+                    self.summarization_settings,
+                    self.token_budgets.summarizer,
+                    # Streaming the final call costs nothing extra, so do it when someone watches
+                    on_detailed_summary=summary_delta_emitter() if is_tracking_progress() else None,
+                    analysis=analysis,
+                )
+            if not summary:
+                logger.error("Failed to summarize article")
+                return None
+            await self._checkpoints.save(url, "summary", summary)
+        emit_summary_ready(summary)
+
+        async with self._llm_semaphore:
+            audio_format = await run_audio_formatter(
+                summary, self._memo, self.token_budgets.audio_formatter
+            )
+        if not audio_format:
+            logger.error("Failed to format for audio")
+            return None
+        await self._checkpoints.save(url, "audio_format", audio_format)
+        emit_progress("narration_ready", text=audio_format.narration_text)
+        return SummaryWithNarration(summary=summary, audio_format=audio_format)
 
     async def _extract_content(self, url: str) -> ArticleContent | None:
         """
@@ -96,23 +527,102 @@ class ArticleSummarizerManager:
         """
         try:
             logger.info(f"Extracting content from {url}")
-            html_content = await fetch_article_content(url)
-            if not html_content:
+            if self._parse_pool.settings.streaming:
+                fetched = await self._stream_and_extract(url)
+            else:
+                fetched = await self._fetch_and_extract(url)
+            if not fetched:
                 logger.error("Failed to fetch article content")
                 return None
 
-            # Extract article content
-            extracted_content = extract_article_text(html_content)
-
+            html_content, extracted_content = fetched
             if not extracted_content.metadata.title:
                 extracted_content.metadata.title = extract_title_from_html(html_content)
 
-            return convert_to_article_content(extracted_content, url)
+            article_content = convert_to_article_content(extracted_content, url)
+            confidence = extracted_content.quality.confidence
+            settings = self._parse_pool.settings
+            if not settings.llm_fallback or confidence >= settings.min_confidence:
+                logger.info(f"Local extraction confidence {confidence:.2f}; skipping LLM cleanup")
+                return article_content
+
+            logger.info(
+                f"Local extraction confidence {confidence:.2f} is below "
+                f"{settings.min_confidence:.2f}; falling back to the content extractor agent"
+            )
+            async with self._llm_semaphore:
+                cleaned = await run_content_extractor(
+                    html_content, url, self._memo, self.token_budgets.extractor
+                )
+            if not cleaned or not cleaned.content:
+                logger.warning("Content extractor agent failed; using the local extraction")
+                return article_content
+
+            cleaned.title = cleaned.title or article_content.title
+            return cleaned
 
         except Exception as e:
             logger.error(f"Error extracting content: {e}")
             return None
 
+    async def _fetch_and_extract(self, url: str) -> tuple[str, ExtractedArticleContent] | None:
+        """
+        Download a page, then extract it on the parse pool.
+
+        Args:
+            url: The URL of the article.
+
+        Returns:
+            The HTML and the extracted content, or None if the fetch failed.
+        """
+        async with self._fetch_semaphore:
+            with measure_stage("fetch") as fetch_metric:
+                html_content = await fetch_article_content(
+                    url, self._http_client, self._fetch_cache
+                )
+                fetch_metric.bytes = len(html_content.encode("utf-8")) if html_content else 0
+        if not html_content:
+            return None
+        emit_progress("fetched", bytes=fetch_metric.bytes)
+
+        # Extract article content on the parse pool so other articles keep moving; the
+        # semaphore caps how many pages wait on the pool at once
+        async with self._parse_semaphore:
+            with measure_stage("parse") as parse_metric:
+                extracted_content = await self._parse_pool.extract(html_content)
+                parse_metric.bytes = fetch_metric.bytes
+        return html_content, extracted_content
+
+    async def _stream_and_extract(self, url: str) -> tuple[str, ExtractedArticleContent] | None:
+        """
+        Extract a page incrementally while it downloads.
+
+        Args:
+            url: The URL of the article.
+
+        Returns:
+            The HTML and the extracted content, or None if the fetch failed.
+        """
+
+        def log_metadata(metadata: ArticleMetadataResult) -> None:
+            logger.info(f"Read metadata of {url} before the body: title={metadata.title!r}")
+
+        # Parsing overlaps the download, so both are measured as the fetch stage
+        async with self._fetch_semaphore:
+            with measure_stage("fetch") as fetch_metric:
+                streamed = await stream_article_content(
+                    url,
+                    self._http_client,
+                    self._fetch_cache,
+                    max_bytes=self._parse_pool.settings.max_html_bytes,
+                    on_metadata=log_metadata,
+                )
+                fetch_metric.bytes = len(streamed.html.encode("utf-8")) if streamed else 0
+        if not streamed:
+            return None
+        emit_progress("fetched", bytes=fetch_metric.bytes)
+        return streamed.html, streamed.content
+
     async def _summarize_article(self, article_content: ArticleContent) -> SummaryData | None:
         """
         Summarize the article content.
@@ -0,0 +1,180 @@
+"""Persistent memo store for agent outputs."""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, TypeVar
+
+from agents import Agent
+from pydantic import BaseModel, ValidationError
+
+from backend.app.helpers.article_summarizer.cache_helpers import content_key
+from backend.app.types.article_summarizer.cache_types import AgentMemoSettings
+from backend.app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+OutputT = TypeVar("OutputT", bound=BaseModel)
+
+
+class AgentMemoStore:
+    """A SQLite-backed memo of agent outputs.
+
+    Entries are keyed on a hash of the prompt input together with everything about the
+    agent that can change its answer: name, model, instructions and output schema.
+    Editing an agent's instructions or output type therefore invalidates its entries
+    automatically.
+
+    Lookups do not write: the access times of hits are kept in memory and saved with the
+    next `put` or on `close`. Expired and least recently used entries are removed every
+    tenth of `max_entries` puts, so the store may briefly hold up to 10% more entries.
+    The methods block on disk, so async callers run them with `asyncio.to_thread`; a
+    lock serializes the threads' use of the one connection.
+    """
+
+    def __init__(self, settings: AgentMemoSettings | None = None) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            settings: Database location, TTL and size settings.
+        """
+        self.settings = settings or AgentMemoSettings()
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        # Access times of hits not yet saved, by key
+        self._accessed: dict[str, float] = {}
+        # The first put of a process evicts, then every tenth of max_entries puts
+        self._evict_every = max(1, self.settings.max_entries // 10)
+        self._puts_until_evict = 1
+
+    def get(self, agent: Agent[Any], input_data: str, output_type: type[OutputT]) -> OutputT | None:
+        """
+        Look up a memoized agent output.
+
+        Args:
+            agent: The agent that would be run.
+            input_data: The prompt input for the agent.
+            output_type: The model to parse the memoized output into.
+
+        Returns:
+            The memoized output, or None if there is no valid entry.
+        """
+        key = memo_key(agent, input_data)
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT output, created_at FROM memo WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            output, created_at = row
+            if time.time() - created_at > self.settings.ttl:
+                connection.execute("DELETE FROM memo WHERE key = ?", (key,))
+                connection.commit()
+                return None
+
+            try:
+                parsed = output_type.model_validate_json(output)
+            except ValidationError as e:
+                logger.warning(f"Discarding unreadable memo entry for {agent.name}: {e}")
+                connection.execute("DELETE FROM memo WHERE key = ?", (key,))
+                connection.commit()
+                return None
+
+            self._accessed[key] = time.time()
+            return parsed
+
+    def put(self, agent: Agent[Any], input_data: str, output: BaseModel) -> None:
+        """
+        Memoize an agent output.
+
+        Args:
+            agent: The agent that was run.
+            input_data: The prompt input for the agent.
+            output: The agent's structured output.
+        """
+        key = memo_key(agent, input_data)
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            self._save_accessed(connection)
+            connection.execute(
+                "INSERT OR REPLACE INTO memo (key, agent, output, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, agent.name, output.model_dump_json(), now, now),
+            )
+            self._puts_until_evict -= 1
+            if self._puts_until_evict <= 0:
+                self._puts_until_evict = self._evict_every
+                connection.execute(
+                    "DELETE FROM memo WHERE created_at < ?", (now - self.settings.ttl,)
+                )
+                connection.execute(
+                    "DELETE FROM memo WHERE key IN ("
+                    "SELECT key FROM memo ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.settings.max_entries,),
+                )
+            connection.commit()
+
+    def close(self) -> None:
+        """Save the pending access times and close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._save_accessed(self._connection)
+                self._connection.commit()
+                self._connection.close()
+                self._connection = None
+
+    def _save_accessed(self, connection: sqlite3.Connection) -> None:
+        """Write the pending access times of hits, uncommitted."""
+        if self._accessed:
+            connection.executemany(
+                "UPDATE memo SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the database connection, creating the database on first use."""
+        if self._connection is None:
+            self.settings.path.parent.mkdir(parents=True, exist_ok=True)
+            # Used from worker threads, one at a time under the lock
+            self._connection = sqlite3.connect(self.settings.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS memo ("
+                "key TEXT PRIMARY KEY, agent TEXT NOT NULL, output TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS memo_accessed_at ON memo (accessed_at)"
+            )
+        return self._connection
+
+
+def memo_key(agent: Agent[Any], input_data: str) -> str:
+    """
+    Build the memo key for running an agent on an input.
+
+    Args:
+        agent: The agent to run.
+        input_data: The prompt input for the agent.
+
+    Returns:
+        A hex digest identifying the agent configuration and input.
+    """
+    output_type = agent.output_type
+    if isinstance(output_type, type) and issubclass(output_type, BaseModel):
+        schema = json.dumps(output_type.model_json_schema(), sort_keys=True)
+    else:
+        schema = repr(output_type)
+
+    instructions = agent.instructions
+    if not isinstance(instructions, str):
+        instructions = getattr(instructions, "__qualname__", repr(instructions))
+
+    return content_key(agent.name, str(agent.model), instructions, schema, input_data)
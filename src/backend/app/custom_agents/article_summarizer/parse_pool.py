@@ -0,0 +1,137 @@
+"""Worker pool that runs article extraction off the event loop."""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+from backend.app.custom_agents.article_summarizer.parser import (
+    extract_article_payload,
+    extract_article_text,
+)
+from backend.app.helpers.article_summarizer.analysis_helpers import analyze_texts
+from backend.app.helpers.article_summarizer.parser_helpers import decode_extracted_content
+from backend.app.types.article_summarizer.analysis_types import (
+    ContentAnalysisResult,
+    DocumentFrequencies,
+)
+from backend.app.types.article_summarizer.parser_types import (
+    ExtractedArticleContent,
+    ParseSettings,
+)
+from backend.app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ParsePool:
+    """A bounded pool of extraction and content analysis workers.
+
+    In process mode each worker is a separate interpreter, so parsing a large page uses
+    its own core and never holds the event loop's GIL. Results come back as compressed
+    JSON payloads rather than pickled object graphs. The pool does not queue work on its
+    own; callers bound the number of in-flight extractions (the manager does so with its
+    parse semaphore), which keeps memory flat when fetches outpace parsing.
+
+    The executor is created lazily on first use and must be released with `aclose()`.
+    """
+
+    def __init__(self, settings: ParseSettings | None = None) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            settings: Executor type, pool size and parser backend.
+        """
+        self.settings = settings or ParseSettings()
+        self._executor: Executor | None = None
+
+    async def extract(self, html_content: str) -> ExtractedArticleContent:
+        """
+        Extract an article on a pool worker.
+
+        Args:
+            html_content: The HTML content of the article.
+
+        Returns:
+            The extracted article content.
+        """
+        loop = asyncio.get_running_loop()
+        if self.settings.executor == "thread":
+            return await loop.run_in_executor(
+                self._get_executor(),
+                extract_article_text,
+                html_content,
+                self.settings.parser_backend,
+            )
+
+        try:
+            payload = await loop.run_in_executor(
+                self._get_executor(),
+                extract_article_payload,
+                html_content,
+                self.settings.parser_backend,
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a fresh pool for later calls.
+            logger.error("Parse worker pool broke; it will be restarted on next use")
+            self._discard_executor()
+            raise
+        return decode_extracted_content(payload)
+
+    async def analyze(
+        self, texts: list[str], corpus: DocumentFrequencies | None = None
+    ) -> list[ContentAnalysisResult]:
+        """
+        Analyze a batch of article texts on a pool worker.
+
+        Args:
+            texts: The article texts. Key topics are weighted across the whole batch.
+            corpus: Document frequencies of earlier articles, also used for weighting. Only
+                those of the texts' words are needed, which keeps the pickled payload small.
+
+        Returns:
+            An analysis per text, in order.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._get_executor(), partial(analyze_texts, texts, corpus=corpus)
+            )
+        except BrokenProcessPool:
+            logger.error("Parse worker pool broke; it will be restarted on next use")
+            self._discard_executor()
+            raise
+
+    async def aclose(self) -> None:
+        """Shut down the workers, cancelling extractions that have not started."""
+        executor = self._executor
+        self._executor = None
+        if executor is not None:
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    def _get_executor(self) -> Executor:
+        """Return the executor, creating it on first use."""
+        if self._executor is None:
+            if self.settings.executor == "process":
+                # Spawned workers do not inherit the parent's threads or event loop state.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.settings.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.settings.max_workers, thread_name_prefix="parse"
+                )
+            logger.info(
+                f"Started {self.settings.executor} parse pool with "
+                f"{self.settings.max_workers} workers"
+            )
+        return self._executor
+
+    def _discard_executor(self) -> None:
+        """Drop a broken executor without waiting for its workers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -1,224 +1,285 @@
 """Article parsing utilities."""
 
+import asyncio
+import codecs
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+
 import httpx
-from bs4 import BeautifulSoup
 
+from backend.app.custom_agents.article_summarizer.extractor import (
+    StreamingArticleParser,
+    extract_single_pass,
+)
+from backend.app.custom_agents.article_summarizer.fetch_cache import FetchCache
+from backend.app.custom_agents.article_summarizer.http_client import PooledHttpClient
+from backend.app.custom_agents.article_summarizer.run_metrics import record_cache_result
+from backend.app.helpers.article_summarizer.parser_helpers import (
+    encode_extracted_content,
+    resolve_parser_backend,
+)
+from backend.app.types.article_summarizer.cache_types import CachedPage
 from backend.app.types.article_summarizer.parser_types import (
-    ArticleHeading,
-    ArticleImage,
-    ArticleLink,
     ArticleMetadataResult,
-    ArticleStructureResult,
-    ArticleSubsection,
-    ArticleTable,
     ExtractedArticleContent,
+    ParserBackend,
+    StreamedArticle,
 )
 from backend.app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-async def fetch_article_content(url: str) -> str | None:
+async def fetch_article_content(
+    url: str,
+    client: PooledHttpClient | None = None,
+    cache: FetchCache | None = None,
+) -> str | None:
     """
     Fetch article content from a URL.
 
     Args:
         url: The URL of the article to fetch.
+        client: A shared pooled client to send the request through. When omitted, a
+            one-off client is opened and closed for this request.
+        cache: An optional fetch cache. Fresh entries are served without a request and
+            stale entries are revalidated with a conditional GET.
 
     Returns:
         The HTML content of the article or None if the request failed.
     """
     logger.info(f"Fetching article from: {url}")
+    cached_page = await asyncio.to_thread(cache.get, url) if cache else None
+    if cache and cached_page and cache.is_fresh(cached_page):
+        cache.stats.hits += 1
+        record_cache_result("hit")
+        logger.info(f"Serving {url} from the fetch cache")
+        return cached_page.body
+
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.text
+        response = await _send_get(url, client, _conditional_headers(cached_page))
+        if cache and cached_page and response.status_code == httpx.codes.NOT_MODIFIED:
+            cache.stats.revalidated += 1
+            record_cache_result("revalidated")
+            await asyncio.to_thread(cache.mark_revalidated, url, cached_page)
+            logger.info(f"Cached copy of {url} is still current")
+            return cached_page.body
+        response.raise_for_status()
     except httpx.HTTPError as e:
         logger.error(f"Error fetching article: {e}")
         return None
 
+    if cache:
+        cache.stats.misses += 1
+        record_cache_result("miss")
+        await asyncio.to_thread(
+            cache.put,
+            url,
+            response.text,
+            etag=response.headers.get("etag", ""),
+            last_modified=response.headers.get("last-modified", ""),
+        )
+    return response.text
+
 
-def extract_article_text(html_content: str) -> ExtractedArticleContent:
+async def stream_article_content(
+    url: str,
+    client: PooledHttpClient | None = None,
+    cache: FetchCache | None = None,
+    max_bytes: int = 5 * 1024 * 1024,
+    on_metadata: Callable[[ArticleMetadataResult], None] | None = None,
+) -> StreamedArticle | None:
     """
-    Extract the main article text and metadata from HTML content.
+    Fetch an article and extract it incrementally while the response downloads.
+
+    Response chunks are decoded and fed to a StreamingArticleParser as they arrive, so
+    parsing overlaps with the download and the head metadata is known before the body
+    completes. The parser runs in a worker thread, one chunk at a time and in order,
+    while the next chunk downloads, so it never blocks the event loop. Pages larger than
+    `max_bytes` are cut off and parsed as far as they got.
 
     Args:
-        html_content: The HTML content of the article.
+        url: The URL of the article to fetch.
+        client: A shared pooled client to send the request through. When omitted, a
+            one-off client is opened and closed for this request.
+        cache: An optional fetch cache, used as in `fetch_article_content`. Truncated
+            pages are not stored.
+        max_bytes: The maximum number of HTML bytes to read.
+        on_metadata: Called with the page metadata as soon as the head has been parsed,
+            from the parser's worker thread.
 
     Returns:
-        An ExtractedArticleContent object containing the article text, subsections,
-        metadata, and structure.
+        The HTML and the extracted content, or None if the request failed.
     """
-    logger.info("Extracting article text, subsections, and metadata from HTML content")
-    soup = BeautifulSoup(html_content, "html.parser")
+    logger.info(f"Streaming article from: {url}")
+    parser = StreamingArticleParser(on_metadata=on_metadata)
+    cached_page = await asyncio.to_thread(cache.get, url) if cache else None
+    if cache and cached_page and cache.is_fresh(cached_page):
+        cache.stats.hits += 1
+        record_cache_result("hit")
+        logger.info(f"Serving {url} from the fetch cache")
+        return await _parse_complete_page(parser, cached_page.body)
+
+    html_parts: list[str] = []
+    bytes_read = 0
+    truncated = False
+    feeding: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+    feeding.set_result(None)
+
+    async def feed(text: str) -> None:
+        # Wait for the previous chunk only now, so it was parsed while this one downloaded
+        nonlocal feeding
+        await feeding
+        feeding = asyncio.ensure_future(asyncio.to_thread(parser.feed, text))
+
+    try:
+        async with _open_stream(url, client, _conditional_headers(cached_page)) as response:
+            if cache and cached_page and response.status_code == httpx.codes.NOT_MODIFIED:
+                cache.stats.revalidated += 1
+                record_cache_result("revalidated")
+                await asyncio.to_thread(cache.mark_revalidated, url, cached_page)
+                logger.info(f"Cached copy of {url} is still current")
+                return await _parse_complete_page(parser, cached_page.body)
+            response.raise_for_status()
 
-    for script in soup(["script", "style", "nav", "footer", "header"]):
-        script.extract()
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+            async for chunk in response.aiter_bytes():
+                if bytes_read + len(chunk) > max_bytes:
+                    chunk = chunk[: max_bytes - bytes_read]
+                    truncated = True
+                bytes_read += len(chunk)
+                text = decoder.decode(chunk)
+                html_parts.append(text)
+                await feed(text)
+                if truncated:
+                    break
+            text = decoder.decode(b"", final=True)
+            html_parts.append(text)
+            await feed(text)
+            await feeding
+    except httpx.HTTPError as e:
+        logger.error(f"Error streaming article: {e}")
+        await asyncio.gather(feeding, return_exceptions=True)
+        return None
 
-    metadata: dict[str, str | list[str]] = {
-        "title": "",
-        "author": "",
-        "published_date": "",
-        "source": "",
-        "tags": [],
-    }
+    await asyncio.to_thread(parser.close)
+    html_content = "".join(html_parts)
+    if truncated:
+        logger.warning(f"Cut off {url} after {bytes_read} bytes")
+    elif cache:
+        cache.stats.misses += 1
+        record_cache_result("miss")
+        await asyncio.to_thread(
+            cache.put,
+            url,
+            html_content,
+            etag=response.headers.get("etag", ""),
+            last_modified=response.headers.get("last-modified", ""),
+        )
 
-    title_meta = soup.find("meta", property="og:title") or soup.find(
-        "meta", property="twitter:title"
+    return StreamedArticle(
+        html=html_content,
+        content=parser.result(),
+        bytes_read=bytes_read,
+        truncated=truncated,
     )
-    if title_meta and hasattr(title_meta, "get") and title_meta.get("content"):
-        content = title_meta.get("content")
-        metadata["title"] = str(content) if content is not None else ""
 
-    author_meta = soup.find("meta", attrs={"name": "author"}) or soup.find(
-        "meta", property="article:author"
-    )
-    if author_meta and hasattr(author_meta, "get") and author_meta.get("content"):
-        content = author_meta.get("content")
-        metadata["author"] = str(content) if content is not None else ""
 
-    date_meta = soup.find("meta", property="article:published_time") or soup.find(
-        "meta", attrs={"name": "date"}
+async def _parse_complete_page(
+    parser: StreamingArticleParser, html_content: str
+) -> StreamedArticle:
+    """Run an already downloaded page through the streaming parser in a worker thread."""
+
+    def parse() -> None:
+        parser.feed(html_content)
+        parser.close()
+
+    await asyncio.to_thread(parse)
+    return StreamedArticle(
+        html=html_content,
+        content=parser.result(),
+        bytes_read=len(html_content.encode("utf-8")),
     )
-    if date_meta and hasattr(date_meta, "get") and date_meta.get("content"):
-        content = date_meta.get("content")
-        metadata["published_date"] = str(content) if content is not None else ""
-
-    source_meta = soup.find("meta", property="og:site_name")
-    if source_meta and hasattr(source_meta, "get") and source_meta.get("content"):
-        content = source_meta.get("content")
-        metadata["source"] = str(content) if content is not None else ""
-
-    tags: list[str] = []
-    keywords_meta = soup.find("meta", attrs={"name": "keywords"})
-    if keywords_meta and hasattr(keywords_meta, "get") and keywords_meta.get("content"):
-        content = keywords_meta.get("content")
-        if isinstance(content, str):
-            tags = [tag.strip() for tag in content.split(",")]
-    metadata["tags"] = tags
-
-    structure: dict[str, list[dict[str, str | int | list[str]]]] = {
-        "headings": [],
-        "images": [],
-        "links": [],
-        "tables": [],
-    }
-
-    headings = soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])
-    for heading in headings:
-        heading_level = int(heading.name[1])
-        structure["headings"].append({"text": heading.get_text().strip(), "level": heading_level})
-
-    images = soup.find_all("img")
-    for img in images:
-        image_data = {"url": img.get("src", ""), "alt": img.get("alt", ""), "caption": ""}
-        caption = img.find_next("figcaption")
-        if caption:
-            image_data["caption"] = caption.get_text().strip()
-        structure["images"].append(image_data)
-
-    links = soup.find_all("a")
-    for link in links:
-        link_data = {"url": link.get("href", ""), "text": link.get_text().strip(), "context": ""}
-        structure["links"].append(link_data)
-
-    tables = soup.find_all("table")
-    for table in tables:
-        rows = []
-        for tr in table.find_all("tr"):
-            cells = []
-            for td in tr.find_all(["td", "th"]):
-                cells.append(td.get_text().strip())
-            if cells:
-                rows.append(cells)
-        if rows:
-            row_text = ", ".join([" ".join([str(cell) for cell in row]) for row in rows])
-            structure["tables"].append({"content": row_text})
-
-    paragraphs = soup.find_all("p")
-    article_text = "\n\n".join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
-
-    if not article_text:
-        main_content = soup.find("main") or soup.find("article") or soup.find("body")
-        if main_content:
-            article_text = main_content.get_text().strip()
-
-    subsections = []
-    for i, heading in enumerate(headings):
-        heading_text = heading.get_text().strip()
-        if heading_text:
-            content = []
-            next_element = heading.find_next_sibling()
-            while next_element and (i == len(headings) - 1 or next_element != headings[i + 1]):
-                if next_element.name == "p" and next_element.get_text().strip():
-                    content.append(next_element.get_text().strip())
-                next_element = next_element.find_next_sibling()
-
-            if content:
-                subsections.append({"heading": heading_text, "content": "\n\n".join(content)})
 
+
+@asynccontextmanager
+async def _open_stream(
+    url: str, client: PooledHttpClient | None, headers: dict[str, str]
+) -> AsyncIterator[httpx.Response]:
+    """Open a streaming GET through the shared client, or a one-off client if there is none."""
+    if client is not None:
+        async with client.stream(url, headers=headers) as response:
+            yield response
+        return
+
+    async with (
+        httpx.AsyncClient(timeout=30.0) as one_off_client,
+        one_off_client.stream("GET", url, headers=headers) as response,
+    ):
+        yield response
+
+
+async def _send_get(
+    url: str, client: PooledHttpClient | None, headers: dict[str, str]
+) -> httpx.Response:
+    """Send a GET request through the shared client, or a one-off client if there is none."""
+    if client is not None:
+        return await client.get(url, headers=headers) if headers else await client.get(url)
+
+    async with httpx.AsyncClient(timeout=30.0) as one_off_client:
+        if headers:
+            return await one_off_client.get(url, headers=headers)
+        return await one_off_client.get(url)
+
+
+def _conditional_headers(cached_page: CachedPage | None) -> dict[str, str]:
+    """Build conditional request headers from a cached page's validators."""
+    headers: dict[str, str] = {}
+    if cached_page and cached_page.etag:
+        headers["If-None-Match"] = cached_page.etag
+    if cached_page and cached_page.last_modified:
+        headers["If-Modified-Since"] = cached_page.last_modified
+    return headers
+
+
+def extract_article_text(
+    html_content: str, parser_backend: ParserBackend = "auto"
+) -> ExtractedArticleContent:
+    """
+    Extract the main article text and metadata from HTML content.
+
+    The document is parsed once and traversed once; metadata, structure, paragraphs and
+    subsections are collected in the same pass.
+
+    Args:
+        html_content: The HTML content of the article.
+        parser_backend: The HTML parser to use. "auto" picks lxml when it is installed
+            and falls back to Python's built-in html.parser.
+
+    Returns:
+        An ExtractedArticleContent object containing the article text, subsections,
+        metadata, and structure.
+    """
+    logger.info("Extracting article text, subsections, and metadata from HTML content")
+    result = extract_single_pass(html_content, resolve_parser_backend(parser_backend))
     logger.info(
-        f"Extracted {len(article_text)} characters of text, {len(subsections)} subsections, and {len(structure['headings'])} headings"
+        f"Extracted {len(result.text)} characters of text, {len(result.subsections)} subsections, and {len(result.structure.headings)} headings"
     )
+    return result
 
-    article_subsections = []
-    for subsection in subsections:
-        article_subsections.append(
-            ArticleSubsection(heading=subsection["heading"], content=subsection["content"])
-        )
 
-    title = str(metadata["title"]) if isinstance(metadata["title"], str) else ""
-    author = str(metadata["author"]) if isinstance(metadata["author"], str) else ""
-    published_date = (
-        str(metadata["published_date"]) if isinstance(metadata["published_date"], str) else ""
-    )
-    source = str(metadata["source"]) if isinstance(metadata["source"], str) else ""
-    tags = metadata["tags"] if isinstance(metadata["tags"], list) else []
-
-    metadata_result = ArticleMetadataResult(
-        title=title,
-        author=author,
-        published_date=published_date,
-        source=source,
-        tags=tags,
-    )
+def extract_article_payload(html_content: str, parser_backend: ParserBackend = "auto") -> bytes:
+    """
+    Extract an article and return it as a compact payload.
 
-    heading_objects = []
-    for h in structure["headings"]:
-        text = str(h["text"]) if isinstance(h["text"], str) else ""
-        level = int(h["level"]) if isinstance(h["level"], int) else 1
-        heading_objects.append(ArticleHeading(text=text, level=level))
-
-    image_objects = []
-    for img in structure["images"]:
-        url = str(img["url"]) if isinstance(img["url"], str) else ""
-        alt = str(img["alt"]) if isinstance(img["alt"], str) else ""
-        caption = str(img["caption"]) if isinstance(img["caption"], str) else ""
-        image_objects.append(ArticleImage(url=url, alt=alt, caption=caption))
-
-    link_objects = []
-    for link in structure["links"]:
-        url = str(link["url"]) if isinstance(link["url"], str) else ""
-        text = str(link["text"]) if isinstance(link["text"], str) else ""
-        context = str(link["context"]) if isinstance(link["context"], str) else ""
-        link_objects.append(ArticleLink(url=url, text=text, context=context))
-
-    table_objects = []
-    for table in structure["tables"]:
-        content = str(table["content"]) if isinstance(table["content"], str) else ""
-        table_objects.append(ArticleTable(content=content))
-
-    structure_result = ArticleStructureResult(
-        headings=heading_objects,
-        images=image_objects,
-        links=link_objects,
-        tables=table_objects,
-    )
+    This is the entry point of the parse worker processes: the result crosses the process
+    boundary as compressed JSON rather than a pickled object graph.
 
-    return ExtractedArticleContent(
-        text=article_text,
-        subsections=article_subsections,
-        metadata=metadata_result,
-        structure=structure_result,
-    )
+    Args:
+        html_content: The HTML content of the article.
+        parser_backend: The HTML parser to use.
+
+    Returns:
+        The extracted content, encoded with `encode_extracted_content`.
+    """
+    return encode_extracted_content(extract_article_text(html_content, parser_backend))
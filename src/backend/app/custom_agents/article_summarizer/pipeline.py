@@ -1,21 +1,73 @@
 """Agent-native pipeline for article summarization."""
 
+import asyncio
 import re
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple, TypeVar
 
-from agents import Runner, custom_span
+from agents import Agent, Runner, RunResult, RunResultStreaming, Usage, custom_span
+from openai.types.responses import ResponseTextDeltaEvent
 from pydantic import BaseModel
 
 from backend.app.custom_agents.article_summarizer.agents import (
     ArticleContent,
     AudioFormat,
+    ChunkSummary,
+    CleanedArticle,
+    NarrationSegment,
     SummaryData,
+    SummaryWithNarration,
     audio_formatter_agent,
+    chunk_summarizer_agent,
+    content_extractor_agent,
+    narration_segment_agent,
     summarizer_agent,
+    summary_narrator_agent,
+    summary_reducer_agent,
+)
+from backend.app.custom_agents.article_summarizer.corpus import DocumentCorpus
+from backend.app.custom_agents.article_summarizer.memo_store import AgentMemoStore
+from backend.app.custom_agents.article_summarizer.parse_pool import ParsePool
+from backend.app.custom_agents.article_summarizer.run_metrics import (
+    measure_stage,
+    record_cache_result,
+    record_stage_tokens,
+)
+from backend.app.custom_agents.article_summarizer.token_ledger import record_token_usage
+from backend.app.helpers.article_summarizer.analysis_helpers import analyze_texts, document_words
+from backend.app.helpers.article_summarizer.parser_helpers import strip_non_content_markup
+from backend.app.helpers.article_summarizer.prompt_helpers import (
+    build_summarizer_prompt,
+    compact_article,
+    uncompacted_prompt_tokens,
+)
+from backend.app.helpers.article_summarizer.stream_helpers import partial_json_string
+from backend.app.helpers.article_summarizer.summary_helpers import chunk_article
+from backend.app.helpers.article_summarizer.token_helpers import (
+    DEFAULT_MODEL,
+    count_tokens,
+    truncate_to_tokens,
+)
+from backend.app.types.article_summarizer.analysis_types import ContentAnalysisResult
+from backend.app.types.article_summarizer.summary_types import (
+    ArticleChunk,
+    CompactedArticle,
+    SummarizationSettings,
+)
+from backend.app.types.article_summarizer.token_types import (
+    StageTokenBudget,
+    TokenBudgetSettings,
+    TokenUsage,
 )
 from backend.app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+OutputT = TypeVar("OutputT", bound=BaseModel)
+
+# Receives the text of a streamed output field so far, and whether it is complete.
+FieldCallback = Callable[[str, bool], Awaitable[None]]
+
 
 class ArticleAnalysisInput(BaseModel):
     """Input data for the article analysis step."""
@@ -36,96 +88,361 @@ class ArticleAnalysisInput(BaseModel):
     """Structural elements of the article."""
 
 
-class ContentAnalysisResult(BaseModel):
-    """Result of the content analysis step."""
-
-    key_topics: list[str] = []
-    """Key topics identified in the article."""
+async def analyze_content(
+    article_content: ArticleContent,
+    pool: ParsePool | None = None,
+    corpus: DocumentCorpus | None = None,
+) -> ContentAnalysisResult | None:
+    """
+    Analyze the article content locally to give the summarizer topic, tone and entity hints.
 
-    sentiment: str = ""
-    """Overall sentiment of the article."""
+    The analysis makes no model calls. It runs on the worker pool when one is given, and
+    otherwise on a thread, so it never blocks the event loop.
 
-    complexity_score: float = 0.0
-    """Readability/complexity score of the article."""
+    Args:
+        article_content: The extracted article content.
+        pool: An optional worker pool.
+        corpus: Document frequencies of the articles analyzed before. Key topics are
+            weighted against them, and the article is added to them.
 
-    main_entities: list[str] = []
-    """Main entities mentioned in the article."""
+    Returns:
+        Analysis results or None if analysis failed.
+    """
+    try:
+        logger.info("Analyzing article content...")
+        texts = [article_content.content]
+        frequencies = None
+        if corpus:
+            words = await asyncio.to_thread(document_words, article_content.content)
+            # Only the article's own words, rather than the whole corpus, go to the worker
+            frequencies = corpus.frequencies(words)
+        if pool:
+            results = await pool.analyze(texts, frequencies)
+        else:
+            results = await asyncio.to_thread(analyze_texts, texts, corpus=frequencies)
+        if corpus:
+            corpus.add(words)
+        return results[0]
+    except Exception as e:
+        logger.error(f"Error in content analysis: {e}")
+        return None
 
 
-async def analyze_content(article_content: ArticleContent) -> ContentAnalysisResult | None:
+async def run_content_extractor(
+    html_content: str,
+    url: str,
+    memo: AgentMemoStore | None = None,
+    budget: StageTokenBudget | None = None,
+) -> ArticleContent | None:
     """
-    Analyze the article content to extract additional insights.
+    Run the content extractor agent to clean up a page the local extraction was unsure of.
+
+    Scripts, styles and comments are removed before the HTML is sent, and the rest is
+    held to the extractor's token budget.
 
     Args:
-        article_content: The extracted article content.
+        html_content: The HTML content of the page.
+        url: The URL of the page.
+        memo: An optional memo store; a memoized extraction of the same page is reused.
+        budget: The extractor's input token budget.
 
     Returns:
-        Analysis results or None if analysis failed.
+        The extracted article content or None if extraction failed.
     """
     try:
-        logger.info("Analyzing article content...")
-        return ContentAnalysisResult(
-            key_topics=["placeholder topic"],
-            sentiment="neutral",
-            complexity_score=0.5,
-            main_entities=["placeholder entity"],
-        )
+        logger.info("Running content extractor agent...")
+        with custom_span("Extract article content"):
+            input_data = f"URL: {url}\n\nHTML:\n{strip_non_content_markup(html_content)}"
+            cleaned = await _run_agent(
+                content_extractor_agent,
+                input_data,
+                CleanedArticle,
+                memo,
+                "extractor",
+                budget or TokenBudgetSettings().extractor,
+            )
+        return ArticleContent(title=cleaned.title, content=cleaned.content, url=url)
     except Exception as e:
-        logger.error(f"Error in content analysis: {e}")
+        logger.error(f"Error in content extractor agent: {e}")
         return None
 
 
-async def run_summarizer(article_content: ArticleContent) -> SummaryData | None:
+class _SummaryInput(NamedTuple):
+    """The compacted article and the prompt for summarizing it in one call."""
+
+    article: CompactedArticle
+    """The article with boilerplate and repeated paragraphs removed."""
+
+    context: str
+    """The content analysis and byline that follow the article."""
+
+    prompt: str | None
+    """The single-call prompt, or None if the article is summarized with map-reduce."""
+
+
+async def run_summarizer(
+    article_content: ArticleContent,
+    memo: AgentMemoStore | None = None,
+    settings: SummarizationSettings | None = None,
+    budget: StageTokenBudget | None = None,
+    on_detailed_summary: FieldCallback | None = None,
+    analysis: ContentAnalysisResult | None = None,
+) -> SummaryData | None:
     """
     Run the summarizer agent to create article summaries.
 
+    Long articles (or every article, in "map_reduce" mode) are split into token-budgeted
+    chunks along their subsections; the chunks are summarized concurrently and the
+    partial summaries merged into one in a final reduce step.
+
+    With `on_detailed_summary`, the final summarizer call is streamed and the detailed
+    summary is reported as it is written, so later stages can start before it ends.
+
     Args:
         article_content: The extracted article content.
+        memo: An optional memo store; a memoized summary for the same prompt is reused.
+        settings: Chooses between single-call and map-reduce summarization.
+        budget: The summarizer's input token budget. With the "chunk" action, prompts over
+            the budget are summarized with map-reduce.
+        on_detailed_summary: Called with the detailed summary written so far, and once
+            more with the complete text.
+        analysis: The article's content analysis, if already computed.
 
     Returns:
         The summary data or None if summarization failed.
     """
+    settings = settings or SummarizationSettings()
+    budget = budget or TokenBudgetSettings().summarizer
     try:
         logger.info("Running summarizer agent...")
+        summary_input = await _prepare_summary_input(article_content, settings, budget, analysis)
+        if summary_input.prompt is None:
+            input_data = await _summarize_chunks(
+                article_content.title, summary_input, settings, budget, memo
+            )
+            agent, stage, span_name = (
+                summary_reducer_agent,
+                "summarizer_reduce",
+                "Merge chunk summaries",
+            )
+        else:
+            input_data = summary_input.prompt
+            agent, stage, span_name = summarizer_agent, "summarizer", "Summarize article"
+
+        with custom_span(span_name):
+            if on_detailed_summary:
+                return await _run_agent_streamed(
+                    agent,
+                    input_data,
+                    SummaryData,
+                    memo,
+                    stage,
+                    budget,
+                    "detailed_summary",
+                    on_detailed_summary,
+                )
+            return await _run_agent(agent, input_data, SummaryData, memo, stage, budget)
+    except Exception as e:
+        logger.error(f"Error in summarizer agent: {e}")
+        return None
 
-        analysis_result = await analyze_content(article_content)
-        if not analysis_result:
-            logger.warning("Content analysis failed, proceeding with basic summarization")
 
-        with custom_span("Summarize article"):
-            input_data = (
-                f"Title: {article_content.title}\n\nArticle text:\n\n{article_content.content}"
-            )
+async def run_summary_narrator(
+    article_content: ArticleContent,
+    memo: AgentMemoStore | None = None,
+    settings: SummarizationSettings | None = None,
+    budget: StageTokenBudget | None = None,
+    analysis: ContentAnalysisResult | None = None,
+) -> SummaryWithNarration | None:
+    """
+    Summarize an article and write its narration with a single agent call.
+
+    This replaces the summarizer and audio formatter round trips with one. The article
+    is compacted and, when long, summarized chunk by chunk exactly as in `run_summarizer`;
+    only the final call differs.
 
-            if article_content.subsections:
-                input_data += "\n\nArticle subsections:\n"
-                for section in article_content.subsections:
-                    input_data += f"\n## {section['heading']}\n{section['content']}\n"
+    Args:
+        article_content: The extracted article content.
+        memo: An optional memo store; a memoized result for the same prompt is reused.
+        settings: Chooses between single-call and map-reduce summarization.
+        budget: The input token budget, shared with the summarizer stage.
+        analysis: The article's content analysis, if already computed.
 
-            if analysis_result:
-                input_data += "\n\nContent Analysis:\n"
-                input_data += f"- Key Topics: {', '.join(analysis_result.key_topics)}\n"
-                input_data += f"- Sentiment: {analysis_result.sentiment}\n"
-                input_data += f"- Main Entities: {', '.join(analysis_result.main_entities)}\n"
+    Returns:
+        The summary and narration, or None if the call failed.
+    """
+    settings = settings or SummarizationSettings()
+    budget = budget or TokenBudgetSettings().summarizer
+    try:
+        logger.info("Running combined summarizer and narrator agent...")
+        summary_input = await _prepare_summary_input(article_content, settings, budget, analysis)
+        input_data = summary_input.prompt
+        if input_data is None:
+            input_data = await _summarize_chunks(
+                article_content.title, summary_input, settings, budget, memo
+            )
 
-            if article_content.metadata and article_content.metadata.author:
-                input_data += f"\n\nArticle by: {article_content.metadata.author}"
-                if article_content.metadata.published_date:
-                    input_data += f" (Published: {article_content.metadata.published_date})"
+        with custom_span("Summarize and narrate article"):
+            result = await _run_agent(
+                summary_narrator_agent,
+                input_data,
+                SummaryWithNarration,
+                memo,
+                "summary_narrator",
+                budget,
+            )
 
-            result = await Runner.run(summarizer_agent, input_data)
-            return result.final_output_as(SummaryData)
+        result.audio_format.filename = re.sub(r"[^\w\-_]", "_", result.audio_format.filename)
+        return result
     except Exception as e:
-        logger.error(f"Error in summarizer agent: {e}")
+        logger.error(f"Error in combined summarizer and narrator agent: {e}")
         return None
 
 
-async def run_audio_formatter(summary: SummaryData) -> AudioFormat | None:
+async def _prepare_summary_input(
+    article_content: ArticleContent,
+    settings: SummarizationSettings,
+    budget: StageTokenBudget,
+    analysis: ContentAnalysisResult | None = None,
+) -> _SummaryInput:
+    """
+    Compact an article and decide between single-call and map-reduce summarization.
+
+    Args:
+        article_content: The extracted article content.
+        settings: The summarization mode and thresholds.
+        budget: The summarizer's input token budget. With the "chunk" action, prompts over
+            the budget are summarized with map-reduce.
+        analysis: The article's content analysis; computed here if not given.
+
+    Returns:
+        The compacted article, its context, and the single-call prompt if one is used.
+    """
+    if analysis is None:
+        analysis = await analyze_content(article_content)
+    if not analysis:
+        logger.warning("Content analysis failed, proceeding with basic summarization")
+
+    context = _article_context(article_content, analysis)
+    compacted = compact_article(
+        article_content.content, article_content.subsections, settings.remove_boilerplate
+    )
+    if compacted.boilerplate_removed or compacted.duplicates_removed:
+        logger.info(
+            f"Removed {compacted.boilerplate_removed} boilerplate and "
+            f"{compacted.duplicates_removed} repeated paragraphs"
+        )
+
+    article_tokens = count_tokens(compacted.content)
+    if settings.mode == "map_reduce" or (
+        settings.mode == "auto" and article_tokens > settings.map_reduce_threshold_tokens
+    ):
+        logger.info(f"Summarizing ~{article_tokens} tokens with map-reduce")
+        return _SummaryInput(compacted, context, None)
+
+    prompt = build_summarizer_prompt(
+        article_content.title,
+        compacted,
+        context,
+        settings.prompt_max_tokens,
+        original_tokens=uncompacted_prompt_tokens(
+            article_content.title,
+            article_content.content,
+            article_content.subsections,
+            context,
+        ),
+    )
+    truncation_note = " (truncated to budget)" if prompt.truncated else ""
+    logger.info(
+        f"Summarizer prompt: ~{prompt.tokens} tokens, "
+        f"~{prompt.tokens_saved} saved by compaction{truncation_note}"
+    )
+
+    prompt_tokens = count_tokens(prompt.text, _agent_model(summarizer_agent))
+    if budget.action == "chunk" and prompt_tokens > budget.max_input_tokens:
+        logger.info(f"Prompt of {prompt_tokens} tokens is over budget; using map-reduce")
+        return _SummaryInput(compacted, context, None)
+    return _SummaryInput(compacted, context, prompt.text)
+
+
+async def _summarize_chunks(
+    title: str,
+    summary_input: _SummaryInput,
+    settings: SummarizationSettings,
+    budget: StageTokenBudget,
+    memo: AgentMemoStore | None,
+) -> str:
+    """
+    Summarize an article chunk by chunk and build the input of the reduce step.
+
+    Args:
+        title: The article title.
+        summary_input: The compacted article and its context; the context is added to the
+            reduce step's input.
+        settings: Chunk size and map concurrency.
+        budget: The summarizer's input token budget, applied to every call.
+        memo: An optional memo store, used for every chunk.
+
+    Returns:
+        The chunk summaries and key points, in article order, followed by the context.
+    """
+    article = summary_input.article
+    chunk_tokens = min(settings.chunk_tokens, budget.max_input_tokens)
+    chunks = chunk_article(article.content, article.subsections, chunk_tokens)
+    semaphore = asyncio.Semaphore(settings.map_concurrency)
+
+    async def summarize_chunk(index: int, chunk: ArticleChunk) -> ChunkSummary:
+        input_data = f"Title: {title}\n\nPart {index + 1} of {len(chunks)}:\n\n{chunk.text}"
+        async with semaphore:
+            return await _run_agent(
+                chunk_summarizer_agent, input_data, ChunkSummary, memo, "summarizer_map", budget
+            )
+
+    with custom_span("Summarize article chunks", data={"chunks": len(chunks)}):
+        logger.info(f"Summarizing {len(chunks)} chunks of {title!r}")
+        chunk_summaries = await asyncio.gather(
+            *(summarize_chunk(index, chunk) for index, chunk in enumerate(chunks))
+        )
+
+    input_data = f"Title: {title}\n\nSummaries of the article's parts:\n"
+    for index, (chunk, chunk_summary) in enumerate(zip(chunks, chunk_summaries, strict=True)):
+        headings = f" ({', '.join(chunk.headings)})" if chunk.headings else ""
+        input_data += f"\n## Part {index + 1}{headings}\n{chunk_summary.summary}\n"
+        input_data += "".join(f"- {point}\n" for point in chunk_summary.key_points)
+    return input_data + summary_input.context
+
+
+def _article_context(
+    article_content: ArticleContent, analysis_result: ContentAnalysisResult | None
+) -> str:
+    """Format the content analysis and byline that follow the article in summarizer input."""
+    context = ""
+    if analysis_result:
+        context += "\n\nContent Analysis:\n"
+        context += f"- Key Topics: {', '.join(analysis_result.key_topics)}\n"
+        context += f"- Sentiment: {analysis_result.sentiment}\n"
+        context += f"- Main Entities: {', '.join(analysis_result.main_entities)}\n"
+        context += f"- Complexity: {analysis_result.complexity_score:.2f}\n"
+
+    if article_content.metadata and article_content.metadata.author:
+        context += f"\n\nArticle by: {article_content.metadata.author}"
+        if article_content.metadata.published_date:
+            context += f" (Published: {article_content.metadata.published_date})"
+    return context
+
+
+async def run_audio_formatter(
+    summary: SummaryData,
+    memo: AgentMemoStore | None = None,
+    budget: StageTokenBudget | None = None,
+) -> AudioFormat | None:
     """
     Run the audio formatter agent to format the summary for audio.
 
     Args:
         summary: The article summary.
+        memo: An optional memo store; a memoized narration for the same summary is reused.
+        budget: The formatter's input token budget.
 
     Returns:
         The audio format data or None if formatting failed.
@@ -140,8 +457,14 @@ async def run_audio_formatter(summary: SummaryData) -> AudioFormat | None:
                 f"Key Points: {', '.join(summary.key_points)}"
             )
 
-            result = await Runner.run(audio_formatter_agent, input_data)
-            audio_format = result.final_output_as(AudioFormat)
+            audio_format = await _run_agent(
+                audio_formatter_agent,
+                input_data,
+                AudioFormat,
+                memo,
+                "audio_formatter",
+                budget or TokenBudgetSettings().audio_formatter,
+            )
 
             safe_filename = re.sub(r"[^\w\-_]", "_", audio_format.filename)
             audio_format.filename = safe_filename
@@ -150,3 +473,239 @@ async def run_audio_formatter(summary: SummaryData) -> AudioFormat | None:
     except Exception as e:
         logger.error(f"Error in audio formatter agent: {e}")
         return None
+
+
+async def run_narration_segment(
+    title: str,
+    segment: str,
+    previous_narration: str,
+    memo: AgentMemoStore | None = None,
+    budget: StageTokenBudget | None = None,
+    on_narration: FieldCallback | None = None,
+) -> NarrationSegment | None:
+    """
+    Narrate one part of a summary, streaming the narration as it is written.
+
+    Args:
+        title: The article title.
+        segment: The part of the detailed summary to narrate.
+        previous_narration: The end of the narration of the earlier parts, so the new
+            narration continues from it. Empty for the first part.
+        memo: An optional memo store; a memoized narration for the same input is reused.
+        budget: The formatter's input token budget.
+        on_narration: Called with the narration written so far, and once more with the
+            complete text.
+
+    Returns:
+        The narration of the part or None if formatting failed.
+    """
+
+    async def ignore(text: str, done: bool) -> None:
+        pass
+
+    try:
+        with custom_span("Narrate summary segment"):
+            input_data = (
+                f"Title: {title}\n\n"
+                f"Narration so far:\n{previous_narration or '(none yet)'}\n\n"
+                f"Next part of the summary:\n{segment}"
+            )
+            return await _run_agent_streamed(
+                narration_segment_agent,
+                input_data,
+                NarrationSegment,
+                memo,
+                "audio_formatter",
+                budget or TokenBudgetSettings().audio_formatter,
+                "narration_text",
+                on_narration or ignore,
+            )
+    except Exception as e:
+        logger.error(f"Error narrating summary segment: {e}")
+        return None
+
+
+async def _run_agent(
+    agent: Agent[Any],
+    input_data: str,
+    output_type: type[OutputT],
+    memo: AgentMemoStore | None,
+    stage: str,
+    budget: StageTokenBudget | None = None,
+) -> OutputT:
+    """
+    Run an agent, reusing a memoized output for the same agent configuration and input.
+
+    The input is held to the stage's token budget, the call's token counts are added to
+    the current token ledger, and its time, tokens and memo hit or miss to the current
+    stage metrics.
+
+    Args:
+        agent: The agent to run.
+        input_data: The prompt input for the agent.
+        output_type: The agent's structured output type.
+        memo: An optional memo store.
+        stage: The pipeline stage, recorded in the token ledger and stage metrics.
+        budget: The stage's input token budget. Inputs over budget are truncated, or
+            rejected with a ValueError when the action is "reject".
+
+    Returns:
+        The agent's structured output.
+    """
+    with measure_stage(stage):
+        model = _agent_model(agent)
+        input_data, input_tokens, truncated = _fit_to_budget(input_data, stage, budget, model)
+
+        if memo:
+            cached = await asyncio.to_thread(memo.get, agent, input_data, output_type)
+            record_cache_result("miss" if cached is None else "hit")
+            if cached is not None:
+                logger.info(f"Reusing memoized output of {agent.name}")
+                _record_call(
+                    agent, stage, input_tokens, cached, model, memoized=True, truncated=truncated
+                )
+                return cached
+
+        result = await Runner.run(agent, input_data)
+        output = result.final_output_as(output_type)
+        if memo:
+            await asyncio.to_thread(memo.put, agent, input_data, output)
+        _record_call(agent, stage, input_tokens, output, model, truncated=truncated, result=result)
+        return output
+
+
+async def _run_agent_streamed(
+    agent: Agent[Any],
+    input_data: str,
+    output_type: type[OutputT],
+    memo: AgentMemoStore | None,
+    stage: str,
+    budget: StageTokenBudget | None,
+    field: str,
+    on_field: FieldCallback,
+) -> OutputT:
+    """
+    Run an agent with streaming, reporting one string field of its output as it is written.
+
+    Memoization, token budgets, the token ledger and stage metrics work as in
+    `_run_agent`. A memoized output is reported once, complete.
+
+    Args:
+        agent: The agent to run.
+        input_data: The prompt input for the agent.
+        output_type: The agent's structured output type.
+        memo: An optional memo store.
+        stage: The pipeline stage, recorded in the token ledger.
+        budget: The stage's input token budget.
+        field: The string field of the output to report.
+        on_field: Called with the field's text whenever it grows, and once more with the
+            complete text from the validated output.
+
+    Returns:
+        The agent's structured output.
+    """
+    with measure_stage(stage):
+        model = _agent_model(agent)
+        input_data, input_tokens, truncated = _fit_to_budget(input_data, stage, budget, model)
+
+        if memo:
+            cached = await asyncio.to_thread(memo.get, agent, input_data, output_type)
+            record_cache_result("miss" if cached is None else "hit")
+            if cached is not None:
+                logger.info(f"Reusing memoized output of {agent.name}")
+                _record_call(
+                    agent, stage, input_tokens, cached, model, memoized=True, truncated=truncated
+                )
+                await on_field(getattr(cached, field), True)
+                return cached
+
+        result = Runner.run_streamed(agent, input_data)
+        received = ""
+        reported = ""
+        async for event in result.stream_events():
+            if event.type != "raw_response_event" or not isinstance(
+                event.data, ResponseTextDeltaEvent
+            ):
+                continue
+            received += event.data.delta
+            partial = partial_json_string(received, field)
+            if partial and partial[0] != reported:
+                reported = partial[0]
+                await on_field(reported, False)
+
+        output = result.final_output_as(output_type)
+        if memo:
+            await asyncio.to_thread(memo.put, agent, input_data, output)
+        _record_call(agent, stage, input_tokens, output, model, truncated=truncated, result=result)
+        await on_field(getattr(output, field), True)
+        return output
+
+
+def _fit_to_budget(
+    input_data: str, stage: str, budget: StageTokenBudget | None, model: str
+) -> tuple[str, int, bool]:
+    """
+    Hold an agent input to its stage's token budget.
+
+    Args:
+        input_data: The prompt input.
+        stage: The pipeline stage, used in messages.
+        budget: The stage's input token budget. Inputs over budget are truncated, or
+            rejected with a ValueError when the action is "reject".
+        model: The model whose tokenizer counts the input.
+
+    Returns:
+        The input, its token count, and whether it was truncated.
+    """
+    input_tokens = count_tokens(input_data, model)
+    if not budget or input_tokens <= budget.max_input_tokens:
+        return input_data, input_tokens, False
+
+    if budget.action == "reject":
+        raise ValueError(
+            f"{stage} input of {input_tokens} tokens exceeds its budget of "
+            f"{budget.max_input_tokens}"
+        )
+    logger.warning(
+        f"Truncating {stage} input from {input_tokens} to {budget.max_input_tokens} tokens"
+    )
+    input_data = truncate_to_tokens(input_data, budget.max_input_tokens, model)
+    return input_data, count_tokens(input_data, model), True
+
+
+def _record_call(
+    agent: Agent[Any],
+    stage: str,
+    input_tokens: int,
+    output: BaseModel,
+    model: str,
+    memoized: bool = False,
+    truncated: bool = False,
+    result: RunResult | RunResultStreaming | None = None,
+) -> None:
+    """
+    Add an agent call to the current token ledger and stage metrics.
+
+    Token counts are estimated locally for every call, memoized or not; the usage the
+    provider reported for a model call is recorded next to them when `result` has it.
+    """
+    provider_usage = result.context_wrapper.usage if result else None
+    if not isinstance(provider_usage, Usage):
+        provider_usage = None
+    usage = TokenUsage(
+        stage=stage,
+        agent=agent.name,
+        input_tokens=input_tokens,
+        output_tokens=count_tokens(output.model_dump_json(), model),
+        provider_input_tokens=provider_usage.input_tokens if provider_usage else None,
+        provider_output_tokens=provider_usage.output_tokens if provider_usage else None,
+        memoized=memoized,
+        truncated=truncated,
+    )
+    record_token_usage(usage)
+    record_stage_tokens(usage.input_tokens + usage.output_tokens)
+
+
+def _agent_model(agent: Agent[Any]) -> str:
+    """Return the name of an agent's model, for choosing a tokenizer."""
+    return agent.model if isinstance(agent.model, str) else DEFAULT_MODEL
@@ -0,0 +1,80 @@
+"""Progress events of a summarization run, for clients following it live."""
+
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from backend.app.custom_agents.article_summarizer.agents import SummaryData
+from backend.app.types.article_summarizer.progress_types import ProgressEvent, ProgressEventType
+
+ProgressListener = Callable[[ProgressEvent], None]
+
+_current_listener: ContextVar[ProgressListener | None] = ContextVar(
+    "progress_listener", default=None
+)
+
+
+@contextmanager
+def track_progress(listener: ProgressListener) -> Iterator[None]:
+    """
+    Send the progress events emitted inside the block to a listener.
+
+    Like the token ledger, the listener is bound to the current context, so events from
+    spawned tasks (such as TTS chunks) reach it and concurrent articles stay separate.
+
+    Args:
+        listener: Called with each event, synchronously; it must not block.
+    """
+    token = _current_listener.set(listener)
+    try:
+        yield
+    finally:
+        _current_listener.reset(token)
+
+
+def is_tracking_progress() -> bool:
+    """Return whether anyone is listening for progress events."""
+    return _current_listener.get() is not None
+
+
+def emit_progress(event_type: ProgressEventType, **data: Any) -> None:
+    """
+    Send a progress event to the current listener, if there is one.
+
+    Args:
+        event_type: What happened.
+        **data: Details of the event; they must be JSON serializable.
+    """
+    listener = _current_listener.get()
+    if listener is not None:
+        listener(ProgressEvent(type=event_type, data=data))
+
+
+def summary_delta_emitter() -> Callable[[str, bool], Awaitable[None]]:
+    """
+    Build a callback for a streamed summary field that emits only the newly written text.
+
+    Returns:
+        A callback taking the text so far and whether it is complete, which emits a
+        "summary_delta" event with the text added since its previous call.
+    """
+    sent = ""
+
+    async def on_summary(text: str, done: bool) -> None:
+        nonlocal sent
+        if text.startswith(sent) and len(text) > len(sent):
+            emit_progress("summary_delta", text=text[len(sent) :])
+            sent = text
+
+    return on_summary
+
+
+def emit_summary_ready(summary: SummaryData) -> None:
+    """Emit a "summary_ready" event carrying the parts of a summary a client can show."""
+    emit_progress(
+        "summary_ready",
+        title=summary.title,
+        short_summary=summary.short_summary,
+        key_points=summary.key_points,
+    )
@@ -0,0 +1,166 @@
+"""Per-article stage timing, byte, token and cache metrics."""
+
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from backend.app.helpers.article_summarizer.cache_helpers import atomic_write_bytes
+from backend.app.helpers.article_summarizer.metrics_helpers import percentile
+from backend.app.types.article_summarizer.metrics_types import (
+    BatchMetricsSummary,
+    CacheResult,
+    RunMetrics,
+    StageMetric,
+    StagePercentiles,
+)
+from backend.app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+METRICS_FILENAME = "metrics.json"
+
+_current_metrics: ContextVar[RunMetrics | None] = ContextVar("run_metrics", default=None)
+_current_stage: ContextVar[StageMetric | None] = ContextVar("stage_metric", default=None)
+
+
+@contextmanager
+def track_metrics(url: str) -> Iterator[RunMetrics]:
+    """
+    Collect the stage metrics of every stage measured inside the block.
+
+    Like the token ledger, the metrics are bound to the current context, so stages run
+    by spawned tasks are included and concurrent articles stay separate. A nested block
+    for the same URL shares the enclosing collector, which lets a batch keep the metrics
+    of each article it summarizes.
+
+    Args:
+        url: The URL of the article.
+
+    Yields:
+        The metrics being filled.
+    """
+    current = _current_metrics.get()
+    if current is not None and current.url == url:
+        yield current
+        return
+
+    metrics = RunMetrics(url=url)
+    token = _current_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        metrics.seconds = time.perf_counter() - metrics.started
+        _current_metrics.reset(token)
+
+
+@contextmanager
+def measure_stage(stage: str) -> Iterator[StageMetric]:
+    """
+    Time a pipeline stage and add it to the current metrics, if any are being collected.
+
+    The stage is recorded even when the block raises.
+
+    Args:
+        stage: The pipeline stage.
+
+    Yields:
+        The stage's metric, for the caller to add byte counts to.
+    """
+    metric = StageMetric(stage=stage)
+    started = time.perf_counter()
+    token = _current_stage.set(metric)
+    try:
+        yield metric
+    finally:
+        metric.seconds = time.perf_counter() - started
+        _current_stage.reset(token)
+        metrics = _current_metrics.get()
+        if metrics is not None:
+            metrics.stages.append(metric)
+
+
+def record_cache_result(result: CacheResult) -> None:
+    """Note how a cache answered for the stage being measured, if any."""
+    metric = _current_stage.get()
+    if metric is not None:
+        metric.cache = result
+
+
+def record_stage_tokens(tokens: int) -> None:
+    """Add agent tokens to the stage being measured, if any."""
+    metric = _current_stage.get()
+    if metric is not None:
+        metric.tokens += tokens
+
+
+def write_run_metrics(metrics: RunMetrics, directory: Path) -> Path:
+    """
+    Save run metrics as metrics.json in an article's output directory.
+
+    Args:
+        metrics: The metrics to save; their total time is brought up to date first.
+        directory: The directory holding the article's output files.
+
+    Returns:
+        The path of the written file.
+    """
+    metrics.seconds = time.perf_counter() - metrics.started
+    path = directory / METRICS_FILENAME
+    atomic_write_bytes(path, metrics.model_dump_json(indent=2).encode("utf-8"))
+    stages = ", ".join(
+        f"{stage} {seconds:.2f}s" for stage, seconds in metrics.stage_seconds.items()
+    )
+    logger.info(f"Article took {metrics.seconds:.2f}s: {stages}")
+    return path
+
+
+def summarize_run_metrics(runs: Iterable[RunMetrics]) -> BatchMetricsSummary:
+    """
+    Compute per-stage latency percentiles over a batch of runs.
+
+    Each article contributes its total time per stage, so repeated stages such as TTS
+    parts count once per article.
+
+    Args:
+        runs: The metrics of each article.
+
+    Returns:
+        The p50, p95 and p99 seconds of whole runs and of each stage.
+    """
+    runs = list(runs)
+    samples: dict[str, list[float]] = {"total": [run.seconds for run in runs]}
+    for run in runs:
+        for stage, seconds in run.stage_seconds.items():
+            samples.setdefault(stage, []).append(seconds)
+
+    return BatchMetricsSummary(
+        runs=len(runs),
+        stages=[
+            StagePercentiles(
+                stage=stage,
+                count=len(values),
+                p50=percentile(values, 0.5),
+                p95=percentile(values, 0.95),
+                p99=percentile(values, 0.99),
+            )
+            for stage, values in samples.items()
+        ],
+    )
+
+
+def write_batch_metrics(summary: BatchMetricsSummary, path: Path) -> Path:
+    """
+    Save a batch summary as JSON.
+
+    Args:
+        summary: The summary returned by `summarize_run_metrics`.
+        path: Where to write it.
+
+    Returns:
+        The path of the written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(path, summary.model_dump_json(indent=2).encode("utf-8"))
+    return path
@@ -0,0 +1,227 @@
+"""Summarization pipeline with overlapping summarizer, formatter and TTS stages."""
+
+import asyncio
+import os
+import shutil
+from contextlib import AbstractAsyncContextManager, nullcontext
+from pathlib import Path
+
+from agents import custom_span
+from openai import AsyncOpenAI
+
+from backend.app.custom_agents.article_summarizer.agents import ArticleContent
+from backend.app.custom_agents.article_summarizer.audio import (
+    create_run_directory,
+    file_size,
+    synthesize_to_file,
+    write_final_text,
+    write_raw_text,
+    write_summary,
+)
+from backend.app.custom_agents.article_summarizer.audio_cache import AudioCache
+from backend.app.custom_agents.article_summarizer.live_audio import LiveAudio
+from backend.app.custom_agents.article_summarizer.memo_store import AgentMemoStore
+from backend.app.custom_agents.article_summarizer.pipeline import (
+    FieldCallback,
+    run_narration_segment,
+    run_summarizer,
+)
+from backend.app.custom_agents.article_summarizer.progress import (
+    emit_progress,
+    emit_summary_ready,
+    summary_delta_emitter,
+)
+from backend.app.custom_agents.article_summarizer.run_metrics import measure_stage
+from backend.app.helpers.article_summarizer.audio_helpers import (
+    concat_mp3_files,
+    split_narration,
+)
+from backend.app.helpers.article_summarizer.stream_helpers import (
+    IncrementalSplitter,
+    paragraph_splitter,
+    sentence_splitter,
+)
+from backend.app.types.article_summarizer.analysis_types import ContentAnalysisResult
+from backend.app.types.article_summarizer.audio_types import TtsSettings
+from backend.app.types.article_summarizer.pipeline_types import PipelineSettings
+from backend.app.types.article_summarizer.summary_types import SummarizationSettings
+from backend.app.types.article_summarizer.token_types import TokenBudgetSettings
+from backend.app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _slot(semaphore: asyncio.Semaphore | None) -> AbstractAsyncContextManager[object]:
+    """Hold a slot of a shared limit, or nothing if there is no limit."""
+    return semaphore if semaphore else nullcontext()
+
+
+async def run_streamed_pipeline(
+    article_content: ArticleContent,
+    memo: AgentMemoStore | None = None,
+    settings: PipelineSettings | None = None,
+    summarization_settings: SummarizationSettings | None = None,
+    token_budgets: TokenBudgetSettings | None = None,
+    tts_settings: TtsSettings | None = None,
+    cache: AudioCache | None = None,
+    analysis: ContentAnalysisResult | None = None,
+    llm_slots: asyncio.Semaphore | None = None,
+    tts_slots: asyncio.Semaphore | None = None,
+) -> tuple[Path, Path, Path] | None:
+    """
+    Summarize an article, narrate the summary and synthesize the narration as one stream.
+
+    The summarizer's detailed summary is read while it is generated. Each finished group
+    of paragraphs is narrated by the formatter, also streamed, and each finished group of
+    narration sentences is sent to TTS right away. The formatter and TTS therefore work
+    on the start of the summary while its end is still being written, and the run takes
+    roughly as long as its slowest stage instead of the sum of all three. The audio of
+    the sentence groups is published in the run directory's live.mp3 as it arrives and
+    finally joined, in order, into its final.mp3.
+
+    Args:
+        article_content: The extracted article content.
+        memo: An optional memo store for the summarizer and formatter outputs.
+        settings: How summary paragraphs and narration sentences are grouped.
+        summarization_settings: When to summarize long articles chunk by chunk.
+        token_budgets: Input token budgets of the agent stages.
+        tts_settings: The TTS model and voice; `chunk_concurrency` bounds the parallel
+            TTS requests.
+        cache: An optional audio store that receives the finished narration.
+        analysis: The article's content analysis, if already computed.
+        llm_slots: An optional limit on agent runs shared with other articles. The
+            summarizer stream and each narration segment hold one slot while they run.
+        tts_slots: An optional limit on TTS requests shared with other articles, of
+            which each sentence group holds one slot while it is synthesized.
+
+    Returns:
+        A tuple containing the paths to the generated audio file, raw text file, and final text file,
+        or None if the process failed.
+    """
+    settings = settings or PipelineSettings()
+    token_budgets = token_budgets or TokenBudgetSettings()
+    tts_settings = tts_settings or TtsSettings()
+
+    with measure_stage("write") as write_metric:
+        run_dir = create_run_directory(article_content.title)
+        audio_path = run_dir / "final.mp3"
+        raw_text_path = write_raw_text(run_dir, article_content.content)
+        write_metric.bytes = file_size(raw_text_path)
+    parts_dir = run_dir / "final.chunks"
+    parts_dir.mkdir(exist_ok=True)
+    live = LiveAudio(run_dir)
+
+    client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+    chunk_slots = asyncio.Semaphore(tts_settings.chunk_concurrency)
+    speech_tasks: list[asyncio.Task[Path]] = []
+
+    async def synthesize_part(text: str, index: int) -> Path:
+        part_path = parts_dir / f"{index:04d}.mp3"
+        async with chunk_slots, _slot(tts_slots):
+            with measure_stage("tts") as tts_metric:
+                await synthesize_to_file(client, text, part_path, tts_settings, live.writer(index))
+                tts_metric.bytes = file_size(part_path)
+        live.finish(index)
+        # The number of parts is unknown until the narration is complete
+        emit_progress("audio_chunk", index=index, count=None, bytes=tts_metric.bytes)
+        return part_path
+
+    def speak(text: str) -> None:
+        for chunk in split_narration(text, tts_settings.max_chunk_chars):
+            index = len(speech_tasks)
+            speech_tasks.append(asyncio.create_task(synthesize_part(chunk, index)))
+
+    # Summary segments flow from the summarizer to the narrator; None ends the stream.
+    segments: asyncio.Queue[str | None] = asyncio.Queue()
+    paragraphs = paragraph_splitter(settings.min_segment_chars)
+
+    emit_summary_delta = summary_delta_emitter()
+
+    async def on_detailed_summary(text: str, done: bool) -> None:
+        await emit_summary_delta(text, done)
+        for segment in paragraphs.flush(text) if done else paragraphs.feed(text):
+            segments.put_nowait(segment)
+
+    def speak_as_written(sentences: IncrementalSplitter) -> FieldCallback:
+        async def on_narration(text: str, done: bool) -> None:
+            for piece in sentences.flush(text) if done else sentences.feed(text):
+                speak(piece)
+
+        return on_narration
+
+    narration: list[str] = []
+
+    async def narrate() -> bool:
+        while (segment := await segments.get()) is not None:
+            async with _slot(llm_slots):
+                narrated = await run_narration_segment(
+                    article_content.title,
+                    segment,
+                    narration[-1] if narration else "",
+                    memo,
+                    token_budgets.audio_formatter,
+                    speak_as_written(sentence_splitter(settings.min_speech_chars)),
+                )
+            if not narrated:
+                return False
+            narration.append(narrated.narration_text)
+        return True
+
+    narrator = asyncio.create_task(narrate())
+    try:
+        with custom_span("Streamed summarization"):
+            async with _slot(llm_slots):
+                summary = await run_summarizer(
+                    article_content,
+                    memo,
+                    summarization_settings,
+                    token_budgets.summarizer,
+                    on_detailed_summary,
+                    analysis,
+                )
+            segments.put_nowait(None)
+            if not summary:
+                logger.error("Failed to summarize article")
+                return None
+            emit_summary_ready(summary)
+            if not await narrator:
+                logger.error("Failed to format for audio")
+                return None
+            narration_text = "\n\n".join(narration)
+            emit_progress("narration_ready", text=narration_text)
+
+            logger.info(
+                f"Narrated {len(narration)} segments; waiting for {len(speech_tasks)} parts"
+            )
+            part_paths = await asyncio.gather(*speech_tasks)
+
+        target_path = (
+            cache.path_for(tts_settings.model, tts_settings.voice, narration_text)
+            if cache
+            else audio_path
+        )
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        concat_mp3_files(list(part_paths), target_path)
+        emit_progress("audio_ready", bytes=file_size(target_path), cached=False)
+        if cache:
+            # Linked first, so the run keeps its audio whatever eviction removes
+            cache.link(target_path, audio_path)
+            cache.evict(keep=target_path)
+        live.close()
+    finally:
+        for task in [narrator, *speech_tasks]:
+            task.cancel()
+        await asyncio.gather(narrator, *speech_tasks, return_exceptions=True)
+        live.abort()
+        shutil.rmtree(parts_dir, ignore_errors=True)
+
+    formatted_text = (
+        f"# {summary.title}\n\n{narration_text}\n\nGenerated from: {article_content.url}"
+    )
+    with measure_stage("write") as write_metric:
+        final_text_path = write_final_text(run_dir, formatted_text)
+        write_summary(run_dir, summary)
+        write_metric.bytes = file_size(final_text_path)
+
+    logger.info(f"Audio saved to {audio_path}")
+    return audio_path, raw_text_path, final_text_path
@@ -0,0 +1,68 @@
+"""Per-article token accounting across pipeline stages."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from backend.app.helpers.article_summarizer.cache_helpers import atomic_write_bytes
+from backend.app.helpers.article_summarizer.token_helpers import tokenizer_name
+from backend.app.types.article_summarizer.token_types import TokenLedger, TokenUsage
+from backend.app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TOKEN_LEDGER_FILENAME = "tokens.json"
+
+_current_ledger: ContextVar[TokenLedger | None] = ContextVar("token_ledger", default=None)
+
+
+@contextmanager
+def track_tokens() -> Iterator[TokenLedger]:
+    """
+    Collect the token usage of every agent call made inside the block.
+
+    The ledger is bound to the current context, so calls made by tasks spawned inside
+    the block (such as concurrent map-reduce chunks) are recorded too, while articles
+    processed concurrently in other tasks keep separate ledgers.
+
+    Yields:
+        The ledger being filled.
+    """
+    ledger = TokenLedger(tokenizer=tokenizer_name())
+    token = _current_ledger.set(ledger)
+    try:
+        yield ledger
+    finally:
+        _current_ledger.reset(token)
+
+
+def record_token_usage(usage: TokenUsage) -> None:
+    """
+    Add an agent call to the current ledger, if one is being collected.
+
+    Args:
+        usage: The token counts of the call.
+    """
+    ledger = _current_ledger.get()
+    if ledger is not None:
+        ledger.calls.append(usage)
+
+
+def write_token_ledger(ledger: TokenLedger, directory: Path) -> Path:
+    """
+    Save a ledger as tokens.json in an article's output directory.
+
+    Args:
+        ledger: The ledger to save.
+        directory: The directory holding the article's output files.
+
+    Returns:
+        The path of the written file.
+    """
+    path = directory / TOKEN_LEDGER_FILENAME
+    atomic_write_bytes(path, ledger.model_dump_json(indent=2).encode("utf-8"))
+    logger.info(
+        f"Article used {ledger.input_tokens} input and {ledger.output_tokens} output tokens"
+    )
+    return path
@@ -0,0 +1,290 @@
+"""Helper functions for local content analysis."""
+
+import math
+import re
+from collections import Counter
+from collections.abc import Callable, Sequence
+
+from backend.app.types.article_summarizer.analysis_types import (
+    ContentAnalysisResult,
+    DocumentFrequencies,
+)
+
+WORD = re.compile(r"[A-Za-z][A-Za-z'-]*")
+SENTENCE_END = re.compile(r"[.!?]+(?=\s|$)")
+PHRASE_DELIMITERS = re.compile(r"[.,;:!?()\[\]{}\"“”‘’—–/\n]+")
+VOWEL_GROUPS = re.compile(r"[aeiouy]+")
+# Runs of capitalized words, optionally joined by "of"/"for"/"and"/"the" (e.g. "Bank of England").
+ENTITY = re.compile(
+    r"\b[A-Z][\w'&-]*(?:\s+(?:(?:of|for|and|the|de)\s+)?[A-Z][\w'&-]*)*",
+)
+
+
+def _word_set(words: str) -> frozenset[str]:
+    """Build a word set from whitespace-separated words."""
+    return frozenset(words.split())
+
+
+STOPWORDS = _word_set(
+    """
+    a about above after again against all also am an and any are aren't as at be because
+    been before being below between both but by can can't could couldn't did didn't do does
+    doesn't doing don't down during each even few for from further get gets got had hadn't
+    has hasn't have haven't having he he'd he'll he's her here here's hers herself him
+    himself his how how's however i i'd i'll i'm i've if in into is isn't it it's its itself
+    just let's like made make many may me might more most much must mustn't my myself new no
+    nor not now of off on once one only or other ought our ours ourselves out over own per
+    said same say says she she'd she'll she's should shouldn't since so some still such than
+    that that's the their theirs them themselves then there there's these they they'd
+    they'll they're they've this those though through to too two under until up upon us very
+    was wasn't we we'd we'll we're we've were weren't what what's when when's where where's
+    whether which while who who's whom why why's will with within without won't would
+    wouldn't year years yet you you'd you'll you're you've your yours yourself yourselves
+    """
+)
+
+POSITIVE_WORDS = _word_set(
+    """
+    advance advantage agree amazing beneficial benefit best better boost breakthrough calm
+    celebrate clear comfortable confident success successful effective efficient encouraging
+    enjoy excellent exciting favorable gain gains good great grow growth happy healthy help
+    helpful hope hopeful improve improved improvement innovative win wins winning positive
+    progress promising prosper protect recover recovery relief reliable rise robust safe
+    secure solution strong stronger support thrive upbeat valuable welcome wonderful
+    """
+)
+
+NEGATIVE_WORDS = _word_set(
+    """
+    abuse alarming anger angry attack bad collapse concern concerns conflict crash crisis
+    critical damage danger dangerous death decline declining defeat deficit delay difficult
+    disaster disease drop fail failed failure fall fear fears fell fraud harm harmful hurt
+    illegal injury lose loss losses problem problems recession risk risks scandal severe
+    shortage slump struggle suffer threat threatens tragic trouble unemployment unsafe
+    violence volatile vulnerable war warn warning weak worse worst wrong
+    """
+)
+
+# Characters after which a capitalized word starts a sentence.
+SENTENCE_OPENERS = frozenset(".!?\"'“”:")
+
+NEGATIONS = frozenset({"not", "no", "never", "without", "hardly", "isn't", "don't", "didn't"})
+NEGATION_WINDOW = 3
+# Normalization constant for the sentiment score, as in VADER's compound score.
+SENTIMENT_ALPHA = 15
+SENTIMENT_THRESHOLD = 0.1
+
+
+def analyze_texts(
+    texts: Sequence[str],
+    max_topics: int = 8,
+    max_entities: int = 8,
+    corpus: DocumentFrequencies | None = None,
+) -> list[ContentAnalysisResult]:
+    """
+    Analyze a batch of article texts without any model calls.
+
+    Key topics are RAKE candidate phrases ranked by term frequency and by the inverse
+    document frequency of their words across the batch and the corpus of articles
+    analyzed before, so phrases common to many articles rank lower. For a single text
+    without a corpus only term frequency matters.
+
+    Args:
+        texts: The article texts.
+        max_topics: The maximum number of key topics per article.
+        max_entities: The maximum number of entities per article.
+        corpus: Document frequencies of earlier articles, counted with the batch's.
+
+    Returns:
+        An analysis per text, in order.
+    """
+    tokenized = [[word.lower() for word in WORD.findall(text)] for text in texts]
+    document_frequency = Counter(word for words in tokenized for word in set(words))
+    documents = len(texts)
+    if corpus:
+        document_frequency.update(corpus.words)
+        documents += corpus.documents
+
+    def idf(word: str) -> float:
+        return math.log((1 + documents) / (1 + document_frequency[word])) + 1
+
+    results = []
+    for text, words in zip(texts, tokenized, strict=True):
+        score = sentiment_score(words)
+        ease = reading_ease(text, words)
+        results.append(
+            ContentAnalysisResult(
+                key_topics=key_topics(text, idf, max_topics),
+                sentiment=sentiment_label(score),
+                complexity_score=round(min(1.0, max(0.0, 1 - ease / 100)), 3),
+                main_entities=entity_candidates(text, max_entities),
+                sentiment_score=round(score, 3),
+                reading_ease=round(ease, 1),
+            )
+        )
+    return results
+
+
+def document_words(text: str) -> set[str]:
+    """Return the distinct lowercase words of a text, as counted for document frequencies."""
+    return {word.lower() for word in WORD.findall(text)}
+
+
+def candidate_phrases(text: str) -> list[tuple[str, ...]]:
+    """
+    Split text into RAKE candidate phrases: runs of content words between stopwords and punctuation.
+
+    Args:
+        text: The text to split.
+
+    Returns:
+        The candidate phrases as tuples of lowercase words, in text order.
+    """
+    phrases: list[tuple[str, ...]] = []
+    for fragment in PHRASE_DELIMITERS.split(text):
+        run: list[str] = []
+        for word in WORD.findall(fragment):
+            word = word.lower()
+            if word not in STOPWORDS and len(word) >= 3:
+                run.append(word)
+            elif run:
+                phrases.append(tuple(run))
+                run = []
+        if run:
+            phrases.append(tuple(run))
+    return phrases
+
+
+def key_topics(text: str, idf: Callable[[str], float], limit: int, max_words: int = 3) -> list[str]:
+    """
+    Rank the phrases of a text by frequency, length and the IDF of their words.
+
+    Every phrase of up to `max_words` words inside a RAKE candidate run is counted.
+    Phrases that recur rank above phrases seen once, and among those seen once, whole
+    runs ("clear guidance") rank above fragments of longer runs.
+
+    Args:
+        text: The text to analyze.
+        idf: The inverse document frequency of a word across the batch and corpus.
+        limit: The maximum number of topics.
+        max_words: The maximum number of words in a topic.
+
+    Returns:
+        The top phrases, best first, skipping phrases that are mostly words of better ones.
+    """
+    counts: Counter[tuple[str, ...]] = Counter()
+    whole_runs: set[tuple[str, ...]] = set()
+    for run in candidate_phrases(text):
+        if len(run) <= max_words:
+            whole_runs.add(run)
+        for size in range(1, min(max_words, len(run)) + 1):
+            counts.update(run[start : start + size] for start in range(len(run) - size + 1))
+
+    def rank(phrase: tuple[str, ...]) -> tuple[bool, bool, float]:
+        # Term frequency times length times mean IDF, which is the IDF summed over the words
+        weight = counts[phrase] * sum(map(idf, phrase))
+        recurring = counts[phrase] > 1
+        return recurring, not recurring and phrase in whole_runs, weight
+
+    topics: list[str] = []
+    covered: set[str] = set()
+    # Phrases are in order of first appearance, which the stable sort keeps for ties.
+    for phrase in sorted(counts, key=rank, reverse=True):
+        words = set(phrase)
+        if 2 * len(words & covered) >= len(words):
+            continue
+        topics.append(" ".join(phrase))
+        covered |= words
+        if len(topics) == limit:
+            break
+    return topics
+
+
+def sentiment_score(words: Sequence[str]) -> float:
+    """
+    Score sentiment with a word lexicon, flipping words shortly after a negation.
+
+    Args:
+        words: The lowercase words of the text.
+
+    Returns:
+        The sentiment from -1 (negative) to 1 (positive).
+    """
+    total = 0
+    for index, word in enumerate(words):
+        polarity = (word in POSITIVE_WORDS) - (word in NEGATIVE_WORDS)
+        if not polarity:
+            continue
+        if any(w in NEGATIONS for w in words[max(0, index - NEGATION_WINDOW) : index]):
+            polarity = -polarity
+        total += polarity
+    return total / math.sqrt(total * total + SENTIMENT_ALPHA)
+
+
+def sentiment_label(score: float) -> str:
+    """Return "positive", "negative" or "neutral" for a sentiment score."""
+    if score >= SENTIMENT_THRESHOLD:
+        return "positive"
+    if score <= -SENTIMENT_THRESHOLD:
+        return "negative"
+    return "neutral"
+
+
+def count_syllables(word: str) -> int:
+    """Estimate the syllables of a word from its vowel groups."""
+    word = word.lower()
+    syllables = len(VOWEL_GROUPS.findall(word))
+    if word.endswith("e") and not word.endswith(("le", "ee")) and syllables > 1:
+        syllables -= 1
+    return max(1, syllables)
+
+
+def reading_ease(text: str, words: Sequence[str]) -> float:
+    """
+    Compute the Flesch reading ease of a text.
+
+    Args:
+        text: The text, used to count sentences.
+        words: The words of the text.
+
+    Returns:
+        The reading ease; most prose falls between 0 (very hard) and 100 (very easy).
+    """
+    if not words:
+        return 100.0
+    sentences = max(1, len(SENTENCE_END.findall(text)))
+    syllables = sum(count_syllables(word) for word in words)
+    return 206.835 - 1.015 * len(words) / sentences - 84.6 * syllables / len(words)
+
+
+def entity_candidates(text: str, limit: int) -> list[str]:
+    """
+    Find named-entity candidates: runs of capitalized words, most frequent first.
+
+    Leading stopwords (a capitalized "The" at the start of a sentence) are dropped, and
+    single words seen only at the start of sentences ("Economists said...") are ignored,
+    since their capital letter says nothing about them.
+
+    Args:
+        text: The text to analyze.
+        limit: The maximum number of candidates.
+
+    Returns:
+        The candidates, by frequency and then by first appearance.
+    """
+    counts: Counter[str] = Counter()
+    mid_sentence: set[str] = set()
+    for match in ENTITY.finditer(text):
+        words = match.group().split()
+        while words and words[0].lower() in STOPWORDS:
+            words.pop(0)
+        entity = " ".join(words).rstrip(".'-")
+        if not entity:
+            continue
+        counts[entity] += 1
+        index = match.start() - 1
+        while index >= 0 and text[index].isspace():
+            index -= 1
+        if len(words) > 1 or (index >= 0 and text[index] not in SENTENCE_OPENERS):
+            mid_sentence.add(entity)
+    return [entity for entity, _ in counts.most_common() if entity in mid_sentence][:limit]
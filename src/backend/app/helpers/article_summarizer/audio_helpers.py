@@ -0,0 +1,175 @@
+"""Helper functions for audio generation."""
+
+import os
+import re
+from pathlib import Path
+
+from backend.app.helpers.article_summarizer.cache_helpers import temporary_sibling
+
+PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# MPEG audio Layer III bitrates (kbit/s) and sample rates (Hz), indexed by header fields.
+MPEG1_BITRATES = [0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320]
+MPEG2_BITRATES = [0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160]
+SAMPLE_RATES = {3: [44100, 48000, 32000], 2: [22050, 24000, 16000], 0: [11025, 12000, 8000]}
+VBR_HEADER_TAGS = (b"Xing", b"Info", b"VBRI")
+# An ID3v1 tag is the last 128 bytes of a file and starts with b"TAG".
+ID3V1_SIZE = 128
+
+
+def split_narration(text: str, max_chars: int) -> list[str]:
+    """
+    Split narration text into chunks of at most `max_chars` characters.
+
+    Paragraphs are kept whole when they fit; longer paragraphs are split at sentence
+    boundaries, and sentences that are still too long are split between words.
+
+    Args:
+        text: The narration text.
+        max_chars: The maximum length of a chunk.
+
+    Returns:
+        The chunks, in narration order.
+    """
+    # Each piece carries the separator that joins it to the piece before it.
+    pieces: list[tuple[str, str]] = []
+    for paragraph in PARAGRAPH_BREAK.split(text.strip()):
+        paragraph = paragraph.strip()
+        if len(paragraph) <= max_chars:
+            sentences = [paragraph]
+        else:
+            sentences = [
+                piece
+                for sentence in SENTENCE_END.split(paragraph)
+                for piece in _split_words(sentence, max_chars)
+            ]
+        pieces.extend(
+            (sentence, "\n\n" if index == 0 else " ")
+            for index, sentence in enumerate(filter(None, sentences))
+        )
+
+    chunks: list[str] = []
+    for piece, separator in pieces:
+        if chunks and len(chunks[-1]) + len(separator) + len(piece) <= max_chars:
+            chunks[-1] = f"{chunks[-1]}{separator}{piece}"
+        else:
+            chunks.append(piece)
+    return chunks
+
+
+def _split_words(sentence: str, max_chars: int) -> list[str]:
+    """Split a sentence between words into pieces of at most `max_chars` characters."""
+    pieces: list[str] = []
+    current = ""
+    for word in sentence.split():
+        while len(word) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(word[:max_chars])
+            word = word[max_chars:]
+        if current and len(current) + 1 + len(word) > max_chars:
+            pieces.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def mp3_frames(data: bytes) -> bytes:
+    """
+    Return the raw MPEG audio frames of an MP3 file.
+
+    ID3v2/ID3v1 tags and a leading Xing/Info/VBRI header frame are removed, since they
+    describe a single file and would be wrong in the middle of a concatenation.
+
+    Args:
+        data: The contents of an MP3 file.
+
+    Returns:
+        The audio frames.
+    """
+    start = mp3_header_length(data)
+    if start is None:
+        # The file ends inside its header, so it holds no audio
+        return b""
+
+    end = len(data)
+    if end - start >= ID3V1_SIZE and data[end - ID3V1_SIZE : end - ID3V1_SIZE + 3] == b"TAG":
+        end -= ID3V1_SIZE
+    return data[start:end]
+
+
+def mp3_header_length(data: bytes) -> int | None:
+    """
+    Return the length of the ID3v2 tag and Xing/Info/VBRI header frame starting an MP3.
+
+    Args:
+        data: The contents of an MP3 file, or the first bytes of an MP3 stream.
+
+    Returns:
+        The number of bytes before the first audio frame, or None if `data` ends before
+        that can be told.
+    """
+    start = 0
+    if data[:3] == b"ID3":
+        if len(data) < 10:
+            return None
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        footer = 10 if data[5] & 0x10 else 0
+        start = 10 + size + footer
+    elif len(data) < 3 and b"ID3".startswith(data):
+        return None
+
+    if len(data) < start + 4:
+        return None
+    frame_length = _frame_length(data[start : start + 4])
+    if not frame_length:
+        return start
+    if len(data) < start + frame_length:
+        return None
+    if any(tag in data[start : start + frame_length] for tag in VBR_HEADER_TAGS):
+        start += frame_length
+    return start
+
+
+def _frame_length(header: bytes) -> int | None:
+    """Return the length of an MPEG Layer III frame from its 4-byte header."""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+
+    version = (header[1] >> 3) & 0x3
+    layer = (header[1] >> 1) & 0x3
+    bitrate_index = (header[2] >> 4) & 0xF
+    sample_rate_index = (header[2] >> 2) & 0x3
+    padding = (header[2] >> 1) & 0x1
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    bitrates = MPEG1_BITRATES if version == 3 else MPEG2_BITRATES
+    coefficient = 144_000 if version == 3 else 72_000
+    sample_rate = SAMPLE_RATES[version][sample_rate_index]
+    return coefficient * bitrates[bitrate_index] // sample_rate + padding
+
+
+def concat_mp3_files(parts: list[Path], destination: Path) -> None:
+    """
+    Join MP3 files into one by concatenating their audio frames, without re-encoding.
+
+    Args:
+        parts: The MP3 files, in playback order.
+        destination: The path of the joined file. It is written through a temporary
+            file and renamed into place once complete.
+    """
+    tmp_path = temporary_sibling(destination)
+    try:
+        with open(tmp_path, "wb") as f:
+            for part in parts:
+                f.write(mp3_frames(part.read_bytes()))
+        os.replace(tmp_path, destination)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,98 @@
+"""Helper functions for the article summarizer caches."""
+
+import hashlib
+import os
+import shutil
+import uuid
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL so that equivalent spellings map to the same cache entry.
+
+    The scheme and host are lowercased, default ports and fragments are dropped,
+    query parameters are sorted and an empty path becomes "/".
+
+    Args:
+        url: The URL to normalize.
+
+    Returns:
+        The normalized URL.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def content_key(*parts: str) -> str:
+    """
+    Build a stable cache key from one or more strings.
+
+    Args:
+        parts: The strings identifying the cached content.
+
+    Returns:
+        A hex SHA-256 digest of the parts.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write a file through a temporary sibling so readers never see a partial file.
+
+    Args:
+        path: The destination path.
+        data: The bytes to write.
+    """
+    tmp_path = temporary_sibling(path)
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def temporary_sibling(path: Path, suffix: str = ".part") -> Path:
+    """
+    Return a unique path next to a file, to write it through before renaming it into place.
+
+    The name is unique per call, so concurrent writers of the same destination, such as
+    two runs synthesizing the same narration into the audio cache, never share one.
+
+    Args:
+        path: The destination path.
+        suffix: The suffix of the temporary name.
+
+    Returns:
+        A path in the destination's directory that does not exist yet.
+    """
+    return path.with_name(f"{path.name}.{uuid.uuid4().hex}{suffix}")
+
+
+def link_or_copy(source: Path, destination: Path) -> None:
+    """
+    Place a file at a destination, hard-linking when the filesystem allows it.
+
+    Args:
+        source: The existing file.
+        destination: Where the file should appear; an existing file there is replaced.
+    """
+    destination.unlink(missing_ok=True)
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
@@ -1,6 +1,8 @@
 """Helper functions for article parsing operations."""
 
+import importlib.util
 import re
+import zlib
 
 from backend.app.custom_agents.article_summarizer.agents import (
     ArticleContent,
@@ -9,6 +11,7 @@ from backend.app.custom_agents.article_summarizer.agents import (
 )
 from backend.app.types.article_summarizer.parser_types import (
     ExtractedArticleContent,
+    ParserBackend,
 )
 
 
@@ -81,3 +84,100 @@ def extract_title_from_html(html_content: str) -> str:
     title_match = re.search(r"<title>(.*?)</title>", html_content, re.IGNORECASE)
     title = title_match.group(1) if title_match else "Untitled Article"
     return re.sub(r"\s*[-–|]\s*.*$", "", title).strip()
+
+
+def resolve_parser_backend(parser_backend: ParserBackend) -> str:
+    """
+    Resolve the requested parser backend to one that is installed.
+
+    Args:
+        parser_backend: The requested backend. "auto" prefers lxml.
+
+    Returns:
+        "lxml" when it is requested (or "auto") and installed, otherwise "html.parser".
+    """
+    if parser_backend == "html.parser":
+        return "html.parser"
+    if importlib.util.find_spec("lxml") is not None:
+        return "lxml"
+    return "html.parser"
+
+
+def encode_extracted_content(extracted_content: ExtractedArticleContent) -> bytes:
+    """
+    Serialize extracted content into a compact payload for passing between processes.
+
+    Args:
+        extracted_content: The extracted article content.
+
+    Returns:
+        The zlib-compressed JSON encoding of the content.
+    """
+    return zlib.compress(extracted_content.model_dump_json().encode("utf-8"))
+
+
+def decode_extracted_content(payload: bytes) -> ExtractedArticleContent:
+    """
+    Restore extracted content from a payload made by `encode_extracted_content`.
+
+    Args:
+        payload: The compressed payload.
+
+    Returns:
+        The extracted article content.
+    """
+    return ExtractedArticleContent.model_validate_json(zlib.decompress(payload))
+
+
+# Paragraph text at which an extraction counts as article-length.
+ARTICLE_LENGTH_CHARS = 1500
+
+NON_CONTENT_MARKUP = re.compile(
+    r"<(script|style|noscript|svg|template)\b.*?</\1\s*>|<!--.*?-->", re.IGNORECASE | re.DOTALL
+)
+
+
+def extraction_confidence(
+    paragraph_chars: int,
+    text_density: float,
+    link_density: float,
+    container_share: float,
+    depth_share: float,
+) -> float:
+    """
+    Score how likely the extracted paragraphs are an article's main content.
+
+    Like readability-style extractors, the score rewards a substantial amount of
+    paragraph text that makes up most of the page and sits together in one part of the
+    DOM rather than scattered across teasers and sidebars. Link text scales it down.
+
+    Args:
+        paragraph_chars: Characters of paragraph text.
+        text_density: The share of the page's visible text that is in paragraphs.
+        link_density: The share of paragraph text that is link text.
+        container_share: The share of paragraph text inside the element holding the most.
+        depth_share: The share of paragraph text at the DOM depth holding the most.
+
+    Returns:
+        The confidence, from 0 to 1.
+    """
+    if paragraph_chars == 0:
+        return 0.0
+    length_score = min(1.0, paragraph_chars / ARTICLE_LENGTH_CHARS)
+    locality_score = (container_share + depth_share) / 2
+    score = 0.45 * length_score + 0.25 * text_density + 0.3 * locality_score
+    # Paragraphs made of links (teaser lists, related-article blocks) are not an article.
+    return round(min(1.0, score * (1.0 - link_density)), 3)
+
+
+def strip_non_content_markup(html_content: str) -> str:
+    """
+    Remove scripts, styles, inline SVG and comments from HTML before sending it to a model.
+
+    Args:
+        html_content: The HTML content of the page.
+
+    Returns:
+        The HTML without markup that never holds article text.
+    """
+    return NON_CONTENT_MARKUP.sub("", html_content)
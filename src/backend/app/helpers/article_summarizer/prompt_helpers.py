@@ -0,0 +1,173 @@
+"""Helper functions for building compact summarizer prompts."""
+
+import re
+
+from backend.app.helpers.article_summarizer.summary_helpers import split_article_sections
+from backend.app.helpers.article_summarizer.token_helpers import count_tokens
+from backend.app.types.article_summarizer.summary_types import CompactedArticle, SummarizerPrompt
+
+# Paragraphs longer than this are treated as article content even if they match a pattern.
+BOILERPLATE_MAX_CHARS = 300
+# Share of a paragraph's characters that must be in boilerplate sentences for it to be dropped.
+BOILERPLATE_MIN_COVERAGE = 0.8
+
+# Each pattern must match a whole sentence, so a phrase like "share prices" or "subscribers"
+# inside an ordinary sentence does not make it boilerplate.
+BOILERPLATE_SENTENCE_PATTERNS = [
+    re.compile(r"(we|this (site|website)|our (site|website)) uses? cookies\b.*", re.I),
+    re.compile(r"(accept|reject|manage)( all)? cookies\W*", re.I),
+    re.compile(r"(see|read) our (cookie|privacy) policy\W*", re.I),
+    re.compile(r"cookie (settings|preferences)\W*", re.I),
+    re.compile(r"(subscribe|sign up)( now| today)?( to our newsletter)?\b.*", re.I),
+    re.compile(r"(create an account|log in|already a subscriber)\b.*", re.I),
+    re.compile(r"share (this|on)( \w+)?\W*", re.I),
+    re.compile(r"follow us( on \w+)?\W*", re.I),
+    re.compile(
+        r"(read more|related (articles|stories)|advertisement|sponsored( content)?)\W*", re.I
+    ),
+    re.compile(r"(©|\(c\)|copyright)\s*\d{4}.*", re.I),
+    re.compile(r"all rights reserved\W*", re.I),
+]
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def is_boilerplate(paragraph: str) -> bool:
+    """
+    Check whether a paragraph is site boilerplate rather than article content.
+
+    Args:
+        paragraph: The paragraph text.
+
+    Returns:
+        True for short paragraphs made up of cookie, subscription, sharing and copyright
+        notices.
+    """
+    text = paragraph.strip()
+    if not text or len(text) > BOILERPLATE_MAX_CHARS:
+        return False
+    covered = sum(
+        len(sentence)
+        for sentence in SENTENCE_END.split(text)
+        if any(pattern.fullmatch(sentence) for pattern in BOILERPLATE_SENTENCE_PATTERNS)
+    )
+    return covered >= BOILERPLATE_MIN_COVERAGE * len(text)
+
+
+def compact_article(
+    content: str, subsections: list[dict[str, str]], remove_boilerplate: bool = True
+) -> CompactedArticle:
+    """
+    Remove repeated and boilerplate paragraphs from an article.
+
+    Args:
+        content: The article text, with paragraphs separated by blank lines.
+        subsections: The article's subsections, each with a heading and content.
+        remove_boilerplate: Whether to drop boilerplate paragraphs.
+
+    Returns:
+        The compacted article and counts of what was removed.
+    """
+    seen: set[str] = set()
+    paragraphs: list[str] = []
+    compacted_subsections: list[dict[str, str]] = []
+    boilerplate_removed = 0
+    duplicates_removed = 0
+
+    for heading, text in split_article_sections(content, subsections):
+        kept: list[str] = []
+        for paragraph in text.split("\n\n"):
+            normalized = " ".join(paragraph.lower().split())
+            if normalized in seen:
+                duplicates_removed += 1
+            elif remove_boilerplate and is_boilerplate(paragraph):
+                boilerplate_removed += 1
+            else:
+                seen.add(normalized)
+                kept.append(paragraph)
+        paragraphs.extend(kept)
+        if heading and kept:
+            compacted_subsections.append({"heading": heading, "content": "\n\n".join(kept)})
+
+    return CompactedArticle(
+        content="\n\n".join(paragraphs),
+        subsections=compacted_subsections,
+        boilerplate_removed=boilerplate_removed,
+        duplicates_removed=duplicates_removed,
+    )
+
+
+def build_summarizer_prompt(
+    title: str,
+    article: CompactedArticle,
+    context: str,
+    max_tokens: int,
+    original_tokens: int = 0,
+) -> SummarizerPrompt:
+    """
+    Build the summarizer prompt, presenting each paragraph once under its heading.
+
+    Paragraphs are added in article order until the token budget is reached; the title
+    and the trailing context are always included. Each paragraph and heading is counted
+    once and added to a running total, rather than recounting the prompt so far.
+
+    Args:
+        title: The article title.
+        article: The compacted article.
+        context: Text appended after the article, such as the content analysis.
+        max_tokens: The token budget of the whole prompt.
+        original_tokens: The size of the uncompacted prompt, for reporting savings.
+
+    Returns:
+        The prompt and its token accounting.
+    """
+    header = f"Title: {title}\n\nArticle text:\n"
+    remaining_tokens = max_tokens - count_tokens(header + context)
+    separator_tokens = count_tokens("\n")
+    parts: list[str] = []
+    truncated = False
+
+    for heading, text in split_article_sections(article.content, article.subsections):
+        section = f"\n## {heading}\n" if heading else "\n"
+        section_tokens = count_tokens(section)
+        for paragraph in text.split("\n\n"):
+            line = f"{paragraph}\n"
+            tokens = section_tokens + count_tokens(line)
+            if tokens > remaining_tokens:
+                truncated = True
+                break
+            parts += [section, line]
+            remaining_tokens -= tokens
+            section = "\n"
+            section_tokens = separator_tokens
+        if truncated:
+            break
+
+    prompt = f"{header}{''.join(parts)}{context}"
+    return SummarizerPrompt(
+        text=prompt,
+        tokens=count_tokens(prompt),
+        original_tokens=original_tokens,
+        truncated=truncated,
+    )
+
+
+def uncompacted_prompt_tokens(
+    title: str, content: str, subsections: list[dict[str, str]], context: str
+) -> int:
+    """
+    Estimate the size of the prompt without compaction: the full text, then every subsection.
+
+    Args:
+        title: The article title.
+        content: The article text.
+        subsections: The article's subsections.
+        context: Text appended after the article.
+
+    Returns:
+        The token count.
+    """
+    prompt = f"Title: {title}\n\nArticle text:\n\n{content}"
+    if subsections:
+        prompt += "\n\nArticle subsections:\n"
+        prompt += "".join(f"\n## {s['heading']}\n{s['content']}\n" for s in subsections)
+    return count_tokens(prompt + context)
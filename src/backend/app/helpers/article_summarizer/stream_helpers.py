@@ -0,0 +1,132 @@
+"""Helper functions for consuming streamed agent output."""
+
+import re
+
+from backend.app.helpers.article_summarizer.audio_helpers import PARAGRAPH_BREAK, SENTENCE_END
+
+JSON_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+def partial_json_string(buffer: str, field: str) -> tuple[str, bool] | None:
+    """
+    Read a string field from the beginning of a JSON object that is still being written.
+
+    Args:
+        buffer: The JSON text received so far.
+        field: The name of a top-level string field.
+
+    Returns:
+        The decoded value so far and whether its closing quote has arrived, or None if
+        the field's value has not started yet.
+    """
+    match = re.search(rf'"{re.escape(field)}"\s*:\s*"', buffer)
+    if not match:
+        return None
+
+    chars: list[str] = []
+    index = match.end()
+    while index < len(buffer):
+        char = buffer[index]
+        if char == '"':
+            return "".join(chars), True
+        if char != "\\":
+            chars.append(char)
+            index += 1
+            continue
+        # Stop before an escape sequence that has not fully arrived.
+        if index + 1 >= len(buffer):
+            break
+        code = buffer[index + 1]
+        if code == "u":
+            digits = buffer[index + 2 : index + 6]
+            if len(digits) < 4:
+                break
+            code_point = int(digits, 16)
+            index += 6
+            if 0xD800 <= code_point < 0xDC00:
+                # A character outside the BMP arrives as a pair of escaped surrogates.
+                low = buffer[index : index + 6]
+                if len(low) < 6:
+                    break
+                code_point = 0x10000 + ((code_point - 0xD800) << 10) + (int(low[2:], 16) - 0xDC00)
+                index += 6
+            chars.append(chr(code_point))
+        else:
+            chars.append(JSON_ESCAPES.get(code, code))
+            index += 2
+    return "".join(chars), False
+
+
+class IncrementalSplitter:
+    """Splits a growing text into pieces as soon as each piece is known to be complete.
+
+    A piece is complete once a boundary (such as a blank line or the whitespace after a
+    full stop) follows it. Pieces shorter than `min_chars` are merged with the next one.
+    """
+
+    def __init__(self, boundary: re.Pattern[str], min_chars: int = 0) -> None:
+        """
+        Initialize the splitter.
+
+        Args:
+            boundary: The pattern separating pieces.
+            min_chars: The minimum length of a piece, except for the last one.
+        """
+        self._boundary = boundary
+        self._min_chars = min_chars
+        self._consumed = 0
+
+    def feed(self, text: str) -> list[str]:
+        """
+        Return the pieces completed since the last call.
+
+        Args:
+            text: The whole text received so far; it must extend the previous text.
+
+        Returns:
+            The newly completed pieces, in order.
+        """
+        pieces: list[str] = []
+        for match in self._boundary.finditer(text, self._consumed):
+            if match.end() == len(text):
+                # The boundary may still be growing, e.g. more blank lines.
+                break
+            piece = text[self._consumed : match.start()].strip()
+            if len(piece) >= self._min_chars:
+                pieces.append(piece)
+                self._consumed = match.end()
+        return pieces
+
+    def flush(self, text: str) -> list[str]:
+        """
+        Return every remaining piece once the text is complete.
+
+        Args:
+            text: The complete text.
+
+        Returns:
+            The remaining pieces, in order.
+        """
+        pieces = self.feed(text)
+        rest = text[self._consumed :].strip()
+        self._consumed = len(text)
+        return [*pieces, rest] if rest else pieces
+
+
+def paragraph_splitter(min_chars: int = 0) -> IncrementalSplitter:
+    """Return a splitter that emits paragraphs separated by blank lines."""
+    return IncrementalSplitter(PARAGRAPH_BREAK, min_chars)
+
+
+def sentence_splitter(min_chars: int = 0) -> IncrementalSplitter:
+    """Return a splitter that emits sentences, grouped to at least `min_chars` characters."""
+    return IncrementalSplitter(SENTENCE_END, min_chars)
@@ -0,0 +1,103 @@
+"""Helper functions for splitting articles into token-budgeted chunks."""
+
+from backend.app.helpers.article_summarizer.audio_helpers import split_narration
+from backend.app.helpers.article_summarizer.token_helpers import count_tokens
+from backend.app.types.article_summarizer.summary_types import ArticleChunk
+
+# Characters per token of English prose, the first guess when splitting oversized text.
+# Denser text, such as CJK at about one token per character, is split further.
+CHARS_PER_TOKEN = 4
+
+
+def split_article_sections(
+    content: str, subsections: list[dict[str, str]]
+) -> list[tuple[str, str]]:
+    """
+    Split article text into sections, using the subsections to label its paragraphs.
+
+    Each paragraph of `content` appears exactly once, under the heading of the
+    subsection that contains it. Paragraphs outside every subsection (such as a lead
+    before the first heading) are kept under an empty heading.
+
+    Args:
+        content: The article text, with paragraphs separated by blank lines.
+        subsections: The article's subsections, each with a heading and content.
+
+    Returns:
+        (heading, text) pairs in article order.
+    """
+    # A paragraph can occur more than once, so map each one to a queue of headings.
+    headings_by_paragraph: dict[str, list[str]] = {}
+    for subsection in subsections:
+        for paragraph in subsection["content"].split("\n\n"):
+            headings_by_paragraph.setdefault(paragraph.strip(), []).append(subsection["heading"])
+
+    sections: list[tuple[str, list[str]]] = []
+    for paragraph in content.split("\n\n"):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        queue = headings_by_paragraph.get(paragraph)
+        heading = queue.pop(0) if queue else ""
+        if sections and sections[-1][0] == heading:
+            sections[-1][1].append(paragraph)
+        else:
+            sections.append((heading, [paragraph]))
+
+    return [(heading, "\n\n".join(paragraphs)) for heading, paragraphs in sections]
+
+
+def chunk_article(
+    content: str, subsections: list[dict[str, str]], max_tokens: int
+) -> list[ArticleChunk]:
+    """
+    Pack an article into chunks of at most `max_tokens` tokens, counted with `count_tokens`.
+
+    Whole sections are kept together and adjacent sections share a chunk when they fit.
+    Sections larger than the budget are split at paragraph, then sentence boundaries.
+
+    Args:
+        content: The article text, with paragraphs separated by blank lines.
+        subsections: The article's subsections, each with a heading and content.
+        max_tokens: The token budget of a chunk.
+
+    Returns:
+        The chunks, in article order.
+    """
+    pieces: list[tuple[str, str]] = []
+    for heading, text in split_article_sections(content, subsections):
+        body_tokens = max(max_tokens - count_tokens(_section_header(heading)), 1)
+        pieces.extend(
+            (heading, piece)
+            for piece in _split_to_tokens(text, body_tokens, body_tokens * CHARS_PER_TOKEN)
+        )
+
+    chunks: list[ArticleChunk] = []
+    for heading, piece in pieces:
+        section_text = f"{_section_header(heading)}{piece}"
+        if chunks and count_tokens(f"{chunks[-1].text}\n\n{section_text}") <= max_tokens:
+            chunk = chunks[-1]
+            chunk.text = f"{chunk.text}\n\n{section_text}"
+            if heading and heading not in chunk.headings:
+                chunk.headings.append(heading)
+        else:
+            chunk = ArticleChunk(headings=[heading] if heading else [], text=section_text)
+            chunks.append(chunk)
+        chunk.tokens = count_tokens(chunk.text)
+    return chunks
+
+
+def _split_to_tokens(text: str, max_tokens: int, max_chars: int) -> list[str]:
+    """Split text at paragraph, sentence or word boundaries into pieces of at most `max_tokens`."""
+    pieces: list[str] = []
+    for piece in split_narration(text, max(max_chars, 1)):
+        if count_tokens(piece) > max_tokens and max_chars > 1:
+            pieces.extend(_split_to_tokens(piece, max_tokens, max_chars // 2))
+        else:
+            pieces.append(piece)
+    return pieces
+
+
+def _section_header(heading: str) -> str:
+    """Return the markdown heading line that introduces a section, if it has a heading."""
+    return f"## {heading}\n" if heading else ""
@@ -0,0 +1,108 @@
+"""Helper functions for counting and trimming tokens offline."""
+
+import importlib.util
+import math
+import re
+from functools import lru_cache
+from typing import Any
+
+DEFAULT_MODEL = "gpt-4o"
+FALLBACK_TOKENIZER = "approximate"
+
+# Chinese, Japanese and Korean characters, which GPT tokenizers encode at about one
+# token per character rather than merging them into words.
+CJK_CHARS = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+# Approximates the pre-tokenization of GPT BPE tokenizers: single CJK characters, words
+# with their leading space, digit groups of up to three, punctuation runs and whitespace
+# runs.
+TOKEN_PIECES = re.compile(rf" ?[{CJK_CHARS}]| ?[^\W\d_{CJK_CHARS}]+| ?\d{{1,3}}| ?[^\s\w]+|\s+|_+")
+# Characters per token inside long words, which BPE splits into several pieces.
+CHARS_PER_WORD_TOKEN = 5
+SHORT_WORD_CHARS = 8
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str) -> Any | None:
+    """Return the tiktoken encoding for a model, or None if tiktoken cannot provide one."""
+    if importlib.util.find_spec("tiktoken") is None:
+        return None
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # The encoding files are downloaded on first use; offline, fall back.
+        return None
+
+
+def tokenizer_name(model: str = DEFAULT_MODEL) -> str:
+    """
+    Name the tokenizer used for a model.
+
+    Args:
+        model: The model name.
+
+    Returns:
+        "tiktoken:<encoding>" when tiktoken is available, otherwise "approximate".
+    """
+    encoding = _get_encoding(model)
+    return f"tiktoken:{encoding.name}" if encoding is not None else FALLBACK_TOKENIZER
+
+
+def count_tokens(text: str, model: str = DEFAULT_MODEL) -> int:
+    """
+    Count the tokens of a text for a model, without network access.
+
+    Uses tiktoken when it is installed with its encoding files; otherwise a bundled
+    approximation of GPT tokenization, typically within 10% for English prose and
+    counting CJK text at one token per character. This is the one token estimator of
+    the pipeline: budgets, chunking and the token ledger all count with it.
+
+    Args:
+        text: The text to count.
+        model: The model name.
+
+    Returns:
+        The number of tokens.
+    """
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return sum(_piece_tokens(piece) for piece in TOKEN_PIECES.findall(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = DEFAULT_MODEL) -> str:
+    """
+    Cut a text to at most `max_tokens` tokens.
+
+    Args:
+        text: The text to cut.
+        max_tokens: The maximum number of tokens to keep.
+        model: The model name.
+
+    Returns:
+        The longest prefix of the text that fits.
+    """
+    encoding = _get_encoding(model)
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        return text if len(tokens) <= max_tokens else encoding.decode(tokens[:max_tokens])
+
+    used = 0
+    for match in TOKEN_PIECES.finditer(text):
+        used += _piece_tokens(match.group())
+        if used > max_tokens:
+            return text[: match.start()]
+    return text
+
+
+def _piece_tokens(piece: str) -> int:
+    """Approximate the number of tokens in one pre-tokenized piece."""
+    length = len(piece.strip()) or len(piece)
+    if piece[-1:].isalpha() and length <= SHORT_WORD_CHARS:
+        return 1
+    if piece[-1:].isdigit() or piece.isspace():
+        return 1
+    return math.ceil(length / CHARS_PER_WORD_TOKEN) if piece[-1:].isalpha() else length
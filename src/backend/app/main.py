@@ -1,26 +1,325 @@
 """
 Main application for the Article Audio Converter.
 
-This module provides the FastAPI application for the Article Audio Converter.
+This module provides the FastAPI application for the Article Audio Converter. Articles
+are submitted as jobs to an in-process queue served by a fixed pool of workers:
+
+    POST /jobs                 {"url": "..."} → 202 with the queued job, 429 when full
+    GET  /jobs/{job_id}        → the job's status
+    GET  /jobs/{job_id}/audio  → the narration MP3, once the job succeeded
+    GET  /jobs/{job_id}/audio/live → the narration MP3 while it is synthesized
+    GET  /jobs/{job_id}/text   → the narration text, once the job succeeded
+    GET  /jobs/{job_id}/events → the job's progress as Server-Sent Events
+    GET  /audio/{run_name}     → the narration MP3 of any run in the outputs directory
+
+Audio is streamed from disk with Range, ETag and Last-Modified support, so players can
+seek before the whole file has downloaded and revalidate their cached copies.
 """
 
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Annotated, TypeVar
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, HTTPException, Request, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from backend.app.custom_agents.article_summarizer.audio import OUTPUTS_DIR
+from backend.app.custom_agents.article_summarizer.job_queue import JobQueue, QueueFullError
+from backend.app.custom_agents.article_summarizer.live_audio import LIVE_AUDIO_NAME, tail_audio
+from backend.app.types.article_summarizer.job_types import Job, JobRequest, JobResponse
+
+ItemT = TypeVar("ItemT")
+
+# Seconds a client is asked to wait before resubmitting to a full queue.
+RETRY_AFTER_SECONDS = 30
+# Fields of a job response added to the final event of a succeeded job.
+JOB_FILE_URLS = {"audio_url", "text_url"}
+# A run's final.mp3 never changes once written; its URL names the run or the job.
+AUDIO_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Seconds without progress after which an event stream sends a comment, so proxies and
+# load balancers do not close it as idle while a long stage runs.
+KEEP_ALIVE_SECONDS = 15.0
+
+
+def create_app(queue: JobQueue | None = None) -> FastAPI:
+    """
+    Create the FastAPI application.
+
+    Args:
+        queue: The job queue to serve; by default one with default settings. The
+            application starts it on startup and closes it on shutdown.
+
+    Returns:
+        The application.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        async with queue or JobQueue() as job_queue:
+            app.state.job_queue = job_queue
+            yield
+
+    app = FastAPI(title="Article Audio Converter", lifespan=lifespan)
+
+    @app.get("/health")
+    async def health_check() -> dict[str, str]:
+        """Health check endpoint."""
+        return {"status": "ok"}
+
+    @app.post("/jobs", status_code=status.HTTP_202_ACCEPTED)
+    async def submit_job(job_request: JobRequest, request: Request) -> JobResponse:
+        """Queue an article for summarization."""
+        try:
+            job = await _job_queue(request).submit(job_request.url)
+        except QueueFullError as e:
+            raise HTTPException(
+                status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=str(e),
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            ) from e
+        return _job_response(job, request)
+
+    @app.get("/jobs/{job_id}")
+    async def get_job(job_id: str, request: Request) -> JobResponse:
+        """Report the status of a job."""
+        return _job_response(await _find_job(job_id, request), request)
+
+    @app.api_route("/jobs/{job_id}/audio", methods=["GET", "HEAD"], response_class=FileResponse)
+    async def get_job_audio(job_id: str, request: Request) -> Response:
+        """Stream the narration audio of a finished job."""
+        job = await _finished_job(job_id, request)
+        return await _audio_response(_output_file(job, job.audio_path), request)
+
+    @app.get("/jobs/{job_id}/audio/live", response_class=StreamingResponse)
+    async def stream_job_live_audio(job_id: str, request: Request) -> Response:
+        """
+        Stream a job's narration audio as it is synthesized, from its first bytes to its end.
+
+        The response waits for the job to start synthesizing, so clients can request it
+        right after submitting the job. Once the job succeeded this is its final audio.
+        """
+        job = await _find_job(job_id, request)
+        event_log = _job_queue(request).events(job_id)
+        run_name = None
+        if event_log and job.status != "succeeded":
+            async for _, event in event_log.follow():
+                if event.type == "audio_started":
+                    run_name = event.data["run"]
+                    break
+
+        run_dir = OUTPUTS_DIR / run_name if run_name else None
+        if not run_dir or not (
+            (run_dir / LIVE_AUDIO_NAME).exists() or (run_dir / "final.mp3").exists()
+        ):
+            job = await _finished_job(job_id, request)
+            return await _audio_response(_output_file(job, job.audio_path), request)
+        return StreamingResponse(
+            tail_audio(run_dir),
+            media_type="audio/mpeg",
+            headers={"Cache-Control": "no-store", "X-Accel-Buffering": "no"},
+        )
+
+    @app.get("/jobs/{job_id}/text", response_class=FileResponse)
+    async def get_job_text(job_id: str, request: Request) -> FileResponse:
+        """Download the narration text of a finished job."""
+        job = await _finished_job(job_id, request)
+        return FileResponse(
+            _output_file(job, job.final_text_path), media_type="text/plain; charset=utf-8"
+        )
+
+    @app.get("/jobs/{job_id}/events", response_class=StreamingResponse)
+    async def stream_job_events(
+        job_id: str,
+        request: Request,
+        last_event_id: Annotated[str | None, Header()] = None,
+    ) -> StreamingResponse:
+        """
+        Stream a job's progress as Server-Sent Events, from its submission to its end.
+
+        Events already sent are replayed first, so late clients see the whole run. A
+        reconnecting client's Last-Event-ID header resumes after the last event it got.
+        While no event arrives, a ": keep-alive" comment is sent every
+        `KEEP_ALIVE_SECONDS`.
+        """
+        job = await _find_job(job_id, request)
+        event_log = _job_queue(request).events(job_id)
+        if event_log is None:
+            raise HTTPException(status.HTTP_404_NOT_FOUND, detail=f"Unknown job {job_id}")
+        start = int(last_event_id) + 1 if last_event_id and last_event_id.isdigit() else 0
+
+        async def stream() -> AsyncIterator[str]:
+            async for item in _with_keep_alive(event_log.follow(start)):
+                if item is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                index, event = item
+                data = {"at": event.at, **event.data}
+                if event.type == "succeeded":
+                    # The job captured above may be a stale copy from before it finished
+                    finished = await _job_queue(request).get(job_id) or job
+                    data.update(_job_response(finished, request).model_dump(include=JOB_FILE_URLS))
+                yield f"id: {index}\nevent: {event.type}\ndata: {json.dumps(data)}\n\n"
+
+        return StreamingResponse(
+            stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.api_route("/audio/{run_name}", methods=["GET", "HEAD"], response_class=FileResponse)
+    async def get_run_audio(run_name: str, request: Request) -> Response:
+        """Stream the narration audio of a run in the outputs directory."""
+        run_dir = OUTPUTS_DIR / run_name
+        audio_path = run_dir / "final.mp3"
+        if run_dir.resolve().parent != OUTPUTS_DIR.resolve() or not audio_path.is_file():
+            raise HTTPException(status.HTTP_404_NOT_FOUND, detail=f"Unknown run {run_name}")
+        return await _audio_response(audio_path, request)
+
+    return app
+
+
+async def _audio_response(path: Path, request: Request) -> Response:
+    """
+    Build the response that streams an MP3 file from disk.
+
+    The file is sent in chunks, or handed to the server to send itself where it supports
+    the ASGI path send extension, so it is never read into memory. A Range header gets a
+    206 response with just the requested bytes, and a request whose If-None-Match or
+    If-Modified-Since header matches the file gets an empty 304 response.
+
+    Args:
+        path: The MP3 file.
+        request: The request, for its conditional headers.
+
+    Returns:
+        The file response, or a 304 response.
+    """
+    stat_result = await asyncio.to_thread(path.stat)
+    response = FileResponse(
+        path,
+        media_type="audio/mpeg",
+        headers={"Cache-Control": AUDIO_CACHE_CONTROL},
+        stat_result=stat_result,
+    )
+    if _not_modified(request, response):
+        validators = ("etag", "last-modified", "cache-control")
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={name: response.headers[name] for name in validators},
+        )
+    return response
+
+
+def _not_modified(request: Request, response: Response) -> bool:
+    """Return whether a conditional request's cached copy is still current (RFC 9110)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = response.headers["etag"]
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        return parsedate_to_datetime(response.headers["last-modified"]) <= parsedate_to_datetime(
+            if_modified_since
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+async def _with_keep_alive(events: AsyncIterator[ItemT]) -> AsyncIterator[ItemT | None]:
+    """
+    Yield the items of an async iterator, and None whenever it is idle for a while.
+
+    Args:
+        events: The iterator.
+
+    Yields:
+        Each item, or None after `KEEP_ALIVE_SECONDS` without one.
+    """
+    pending: asyncio.Future[ItemT] | None = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(events))
+            # Waiting on the future rather than the iterator, so a timeout leaves it running
+            done, _ = await asyncio.wait({pending}, timeout=KEEP_ALIVE_SECONDS)
+            if not done:
+                yield None
+                continue
+            try:
+                item = pending.result()
+            except StopAsyncIteration:
+                return
+            pending = None
+            yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _job_queue(request: Request) -> JobQueue:
+    """Return the application's job queue."""
+    job_queue: JobQueue = request.app.state.job_queue
+    return job_queue
+
+
+async def _find_job(job_id: str, request: Request) -> Job:
+    """Return a job, or raise a 404 error if it is unknown."""
+    job = await _job_queue(request).get(job_id)
+    if not job:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail=f"Unknown job {job_id}")
+    return job
+
+
+async def _finished_job(job_id: str, request: Request) -> Job:
+    """Return a succeeded job, or raise a 404 or 409 error."""
+    job = await _find_job(job_id, request)
+    if job.status != "succeeded":
+        raise HTTPException(
+            status.HTTP_409_CONFLICT, detail=f"Job {job_id} is {job.status}, not succeeded"
+        )
+    return job
+
+
+def _output_file(job: Job, path: Path | None) -> Path:
+    """Return an output file of a job, or raise a 404 error if it no longer exists."""
+    if path is None or not path.exists():
+        raise HTTPException(
+            status.HTTP_404_NOT_FOUND, detail=f"The output of job {job.id} is no longer available"
+        )
+    return path
 
-# TODO: Complete this
 
-app = FastAPI(title="Article Audio Converter")
+def _job_response(job: Job, request: Request) -> JobResponse:
+    """Describe a job for API clients, linking to its files once it succeeded."""
+    succeeded = job.status == "succeeded"
+    return JobResponse(
+        id=job.id,
+        url=job.url,
+        status=job.status,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        error=job.error,
+        audio_url=str(request.url_for("get_job_audio", job_id=job.id)) if succeeded else None,
+        text_url=str(request.url_for("get_job_text", job_id=job.id)) if succeeded else None,
+    )
 
 
-@app.get("/health")
-async def health_check() -> dict[str, str]:
-    """Health check endpoint."""
-    return {"status": "ok"}
+app = create_app()
 
 
 def run_app() -> None:
     """Run the FastAPI application."""
-    uvicorn.run("src.main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run("backend.app.main:app", host="0.0.0.0", port=8000, reload=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,51 @@
+"""Type definitions for local content analysis."""
+
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+
+class ContentAnalysisResult(BaseModel):
+    """Result of the content analysis step."""
+
+    key_topics: list[str] = []
+    """Key topics identified in the article."""
+
+    sentiment: str = ""
+    """Overall sentiment of the article."""
+
+    complexity_score: float = 0.0
+    """Readability/complexity score of the article."""
+
+    main_entities: list[str] = []
+    """Main entities mentioned in the article."""
+
+    sentiment_score: float = 0.0
+    """Lexicon sentiment from -1 (negative) to 1 (positive)."""
+
+    reading_ease: float = 0.0
+    """Flesch reading ease; higher is easier to read."""
+
+
+class DocumentFrequencies(BaseModel):
+    """How many analyzed articles contain each word, for weighting key topics by IDF."""
+
+    documents: int = 0
+    """The number of articles counted."""
+
+    words: dict[str, int] = {}
+    """The number of counted articles each lowercase word appears in."""
+
+
+class CorpusSettings(BaseModel):
+    """Settings for the word document frequencies kept across runs."""
+
+    enabled: bool = True
+    """Whether key topics are weighted by the articles analyzed before, not just the batch."""
+
+    path: Path = Path("cache/corpus.json")
+    """Location of the saved document frequencies."""
+
+    max_words: int = Field(default=20_000, ge=1)
+    """Maximum number of words kept; the rarest are dropped first, which leaves their IDF
+    at its highest, as for unseen words."""
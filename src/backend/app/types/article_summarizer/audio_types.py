@@ -0,0 +1,38 @@
+"""Type definitions for audio generation."""
+
+from pydantic import BaseModel, Field
+
+
+class TtsSettings(BaseModel):
+    """Text-to-speech settings used to synthesize narrations."""
+
+    model: str = "tts-1"
+    """The OpenAI text-to-speech model."""
+
+    voice: str = "alloy"
+    """The voice used for narration."""
+
+    stream: bool = True
+    """Stream audio to disk as it arrives instead of buffering the whole response."""
+
+    stream_chunk_size: int = Field(default=64 * 1024, ge=1)
+    """Size in bytes of the chunks written while streaming."""
+
+    max_chunk_chars: int = Field(default=4000, ge=1)
+    """Narrations longer than this are split and synthesized as parallel chunks."""
+
+    chunk_concurrency: int = Field(default=4, ge=1)
+    """Maximum number of narration chunks synthesized at the same time."""
+
+
+class SpeechStreamStats(BaseModel):
+    """Measurements taken while streaming synthesized speech to disk."""
+
+    bytes_written: int = 0
+    """Total number of audio bytes written."""
+
+    time_to_first_byte: float = 0.0
+    """Seconds between sending the request and receiving the first audio bytes."""
+
+    duration: float = 0.0
+    """Seconds between sending the request and the audio file being complete."""
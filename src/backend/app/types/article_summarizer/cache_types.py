@@ -0,0 +1,115 @@
+"""Type definitions for the article summarizer caches."""
+
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+
+class FetchCacheSettings(BaseModel):
+    """Settings for the on-disk cache of fetched article HTML."""
+
+    enabled: bool = True
+    """Whether fetched pages are cached at all."""
+
+    directory: Path = Path("cache/fetch")
+    """Directory holding the cached pages."""
+
+    max_bytes: int = Field(default=256 * 1024 * 1024, ge=0)
+    """Maximum total size of the cache on disk; least recently used pages are evicted first."""
+
+    max_age: float = Field(default=3600.0, ge=0)
+    """Seconds a cached page is served without revalidating it with the origin server."""
+
+
+class FetchCacheStats(BaseModel):
+    """Counters describing how fetches were served."""
+
+    hits: int = 0
+    """Pages served from the cache without a request."""
+
+    revalidated: int = 0
+    """Pages served from the cache after the server answered 304 Not Modified."""
+
+    misses: int = 0
+    """Pages downloaded in full."""
+
+
+class CachedPage(BaseModel):
+    """A fetched page stored in the cache."""
+
+    url: str
+    """The normalized URL of the page."""
+
+    body: str
+    """The HTML content of the page."""
+
+    etag: str = ""
+    """The ETag header returned with the page, if any."""
+
+    last_modified: str = ""
+    """The Last-Modified header returned with the page, if any."""
+
+    validated_at: float = 0.0
+    """When the page was last downloaded or revalidated (Unix time)."""
+
+
+class AgentMemoSettings(BaseModel):
+    """Settings for the persistent memo store of agent outputs."""
+
+    enabled: bool = True
+    """Whether agent outputs are memoized at all."""
+
+    path: Path = Path("cache/agent_memo.sqlite3")
+    """Location of the SQLite database."""
+
+    ttl: float = Field(default=7 * 24 * 3600.0, ge=0)
+    """Seconds a memoized output stays valid."""
+
+    max_entries: int = Field(default=10_000, ge=1)
+    """Maximum number of memoized outputs; least recently used entries are evicted first,
+    in batches, so the store may briefly exceed it by up to 10%."""
+
+
+class AudioCacheSettings(BaseModel):
+    """Settings for the content-addressed store of synthesized audio."""
+
+    enabled: bool = True
+    """Whether synthesized audio is cached at all."""
+
+    directory: Path = Path("cache/audio")
+    """Directory holding the cached audio files."""
+
+    max_bytes: int = Field(default=2 * 1024 * 1024 * 1024, ge=0)
+    """Maximum total size of the store; least recently used files are evicted first."""
+
+
+class DuplicateIndexSettings(BaseModel):
+    """Settings for the persistent index of near-duplicate articles."""
+
+    enabled: bool = True
+    """Whether near-duplicate articles reuse an earlier narration."""
+
+    path: Path = Path("cache/duplicates.sqlite3")
+    """Location of the SQLite database."""
+
+    min_similarity: float = Field(default=0.8, ge=0, le=1)
+    """Estimated Jaccard similarity of word shingles above which two articles are duplicates."""
+
+    max_entries: int = Field(default=100_000, ge=1)
+    """Maximum number of indexed articles; the oldest entries are evicted first."""
+
+
+class DuplicateMatch(BaseModel):
+    """An indexed article that is a near-duplicate of a new one."""
+
+    url: str
+    """The URL the indexed article was summarized from."""
+
+    audio_path: Path
+    """The narration audio of the indexed article."""
+
+    final_text_path: Path
+    """The narration text of the indexed article."""
+
+    similarity: float
+    """Estimated Jaccard similarity of the two articles' word shingles."""
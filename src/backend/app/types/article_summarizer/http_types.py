@@ -0,0 +1,25 @@
+"""Type definitions for the shared article HTTP client."""
+
+from pydantic import BaseModel, Field
+
+
+class HttpClientSettings(BaseModel):
+    """Connection pool settings for fetching articles."""
+
+    timeout: float = 30.0
+    """Request timeout in seconds."""
+
+    max_connections: int = Field(default=100, ge=1)
+    """Maximum number of open connections across all hosts."""
+
+    max_keepalive_connections: int = Field(default=20, ge=0)
+    """Maximum number of idle connections kept alive for reuse."""
+
+    keepalive_expiry: float = 30.0
+    """Seconds an idle connection is kept alive before being closed."""
+
+    max_connections_per_host: int = Field(default=6, ge=1)
+    """Maximum number of concurrent requests to a single host."""
+
+    http2: bool = True
+    """Negotiate HTTP/2 when the optional `h2` package is installed."""
@@ -0,0 +1,132 @@
+"""Type definitions for the summarization job queue."""
+
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from backend.app.types.article_summarizer.metrics_types import RunMetrics
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+"""The lifecycle of a summarization job."""
+
+CheckpointStage = Literal["content", "summary", "audio_format", "audio"]
+"""The pipeline stages whose outputs are saved so an interrupted run can resume."""
+
+
+class JobQueueSettings(BaseModel):
+    """Settings for the in-process summarization job queue."""
+
+    workers: int = Field(default=4, ge=1)
+    """Number of articles summarized at once. Each worker runs one job at a time through
+    the shared manager, whose per-stage limits still apply across workers."""
+
+    max_queue_depth: int = Field(default=100, ge=1)
+    """Maximum number of jobs waiting for a worker; further submissions are refused."""
+
+    max_finished_jobs: int = Field(default=1000, ge=1)
+    """Number of finished jobs kept for status queries; the oldest are forgotten first."""
+
+
+class JobStoreSettings(BaseModel):
+    """Settings for the persistent store of jobs and stage checkpoints."""
+
+    enabled: bool = True
+    """Whether jobs and the stage outputs of unfinished runs are saved at all."""
+
+    path: Path = Path("cache/jobs.sqlite3")
+    """Location of the SQLite database."""
+
+    checkpoint_ttl: float = Field(default=24 * 3600.0, ge=0)
+    """Seconds the stage outputs of an unfinished run stay usable for resuming it."""
+
+    max_finished_jobs: int = Field(default=10_000, ge=1)
+    """Number of finished jobs kept in the store; the oldest are removed first."""
+
+
+class AudioCheckpoint(BaseModel):
+    """The output files of a run whose audio was generated."""
+
+    audio_path: Path
+    """The narration audio."""
+
+    raw_text_path: Path
+    """The extracted article text."""
+
+    final_text_path: Path
+    """The narration text."""
+
+
+class Job(BaseModel):
+    """A request to summarize one article."""
+
+    id: str
+    """The job's identifier."""
+
+    url: str
+    """The URL of the article."""
+
+    status: JobStatus = "queued"
+    """Where the job is in its lifecycle."""
+
+    created_at: float
+    """When the job was submitted (Unix time)."""
+
+    started_at: float | None = None
+    """When a worker picked the job up (Unix time)."""
+
+    finished_at: float | None = None
+    """When the job succeeded or failed (Unix time)."""
+
+    error: str = ""
+    """A description of the failure, if the job failed."""
+
+    audio_path: Path | None = None
+    """The narration audio, once the job succeeded."""
+
+    raw_text_path: Path | None = None
+    """The extracted article text, once the job succeeded."""
+
+    final_text_path: Path | None = None
+    """The narration text, once the job succeeded."""
+
+    metrics: RunMetrics | None = None
+    """Per-stage metrics of the run, once the job finished."""
+
+
+class JobRequest(BaseModel):
+    """Body of a job submission."""
+
+    url: str = Field(min_length=1)
+    """The URL of the article to summarize."""
+
+
+class JobResponse(BaseModel):
+    """The status of a job as reported by the API."""
+
+    id: str
+    """The job's identifier."""
+
+    url: str
+    """The URL of the article."""
+
+    status: JobStatus
+    """Where the job is in its lifecycle."""
+
+    created_at: float
+    """When the job was submitted (Unix time)."""
+
+    started_at: float | None = None
+    """When a worker picked the job up (Unix time)."""
+
+    finished_at: float | None = None
+    """When the job succeeded or failed (Unix time)."""
+
+    error: str = ""
+    """A description of the failure, if the job failed."""
+
+    audio_url: str | None = None
+    """Where to download the narration audio, once the job succeeded."""
+
+    text_url: str | None = None
+    """Where to download the narration text, once the job succeeded."""
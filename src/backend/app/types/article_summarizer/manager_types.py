@@ -0,0 +1,54 @@
+"""Type definitions for the article summarizer manager."""
+
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from backend.app.types.article_summarizer.metrics_types import RunMetrics
+
+
+class StageConcurrencyLimits(BaseModel):
+    """Maximum number of articles allowed in each pipeline stage at the same time."""
+
+    fetch: int = Field(default=16, ge=1)
+    """Concurrent HTTP fetches."""
+
+    parse: int = Field(default=4, ge=1)
+    """Concurrent HTML extractions."""
+
+    llm: int = Field(default=8, ge=1)
+    """Concurrent summarizer and audio formatter agent runs."""
+
+    tts: int = Field(default=4, ge=1)
+    """Concurrent text-to-speech requests."""
+
+    articles: int = Field(default=32, ge=1)
+    """Articles a batch run works on at once, across all stages. Each holds its text and
+    tasks in memory, so this bounds a batch's memory; the default keeps every stage busy."""
+
+
+class SummarizationResult(BaseModel):
+    """The outcome of summarizing a single URL as part of a batch."""
+
+    url: str
+    """The URL of the article."""
+
+    audio_path: Path | None = None
+    """The path to the generated audio file, if summarization succeeded."""
+
+    raw_text_path: Path | None = None
+    """The path to the raw article text, if summarization succeeded."""
+
+    final_text_path: Path | None = None
+    """The path to the narration text, if summarization succeeded."""
+
+    error: str = ""
+    """A description of the failure, if summarization failed."""
+
+    metrics: RunMetrics | None = None
+    """Time, bytes, tokens and cache results per stage, including for failed articles."""
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the article was summarized successfully."""
+        return self.audio_path is not None
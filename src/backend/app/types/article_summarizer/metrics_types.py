@@ -0,0 +1,83 @@
+"""Type definitions for per-stage run metrics."""
+
+import time
+from typing import Literal
+
+from pydantic import BaseModel, Field, computed_field
+
+CacheResult = Literal["hit", "miss", "revalidated"]
+"""How a cache, memo store or index answered for a stage."""
+
+
+class StageMetric(BaseModel):
+    """Measurements of one pipeline stage of one article."""
+
+    stage: str
+    """The pipeline stage, e.g. "fetch", "summarizer" or "tts"."""
+
+    seconds: float = 0.0
+    """Wall time spent in the stage, from a monotonic clock."""
+
+    bytes: int = 0
+    """Bytes the stage read or wrote: HTML for fetch and parse, files for tts and write."""
+
+    tokens: int = 0
+    """Input and output tokens of the stage's agent calls."""
+
+    cache: CacheResult | None = None
+    """How the stage's cache answered, if the stage has one."""
+
+
+class RunMetrics(BaseModel):
+    """Measurements of every stage of one article's run."""
+
+    url: str
+    """The URL of the article."""
+
+    started: float = Field(default_factory=time.perf_counter, exclude=True)
+    """Monotonic clock reading when the run started."""
+
+    seconds: float = 0.0
+    """Wall time of the whole run."""
+
+    stages: list[StageMetric] = []
+    """One entry per measured stage, in completion order. Stages that run more than once,
+    such as map-reduce summarizer calls or TTS parts, have an entry per run."""
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def stage_seconds(self) -> dict[str, float]:
+        """Total seconds per stage, summed over repeated entries."""
+        totals: dict[str, float] = {}
+        for metric in self.stages:
+            totals[metric.stage] = totals.get(metric.stage, 0.0) + metric.seconds
+        return totals
+
+
+class StagePercentiles(BaseModel):
+    """Latency distribution of one stage across a batch."""
+
+    stage: str
+    """The pipeline stage, or "total" for whole runs."""
+
+    count: int
+    """Number of articles that went through the stage."""
+
+    p50: float
+    """Median seconds per article."""
+
+    p95: float
+    """95th percentile seconds per article."""
+
+    p99: float
+    """99th percentile seconds per article."""
+
+
+class BatchMetricsSummary(BaseModel):
+    """Per-stage latency percentiles of a batch of runs."""
+
+    runs: int
+    """Number of runs summarized."""
+
+    stages: list[StagePercentiles] = []
+    """Percentiles per stage, whole runs first and then stages in order of first use."""
@@ -1,6 +1,14 @@
 """Type definitions for article parser module."""
 
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+ParserBackend = Literal["auto", "lxml", "html.parser"]
+"""HTML parsers supported by the extraction engine."""
+
+ParseExecutor = Literal["process", "thread"]
+"""Where article extraction runs: worker processes or worker threads."""
 
 
 class ArticleSubsection(BaseModel):
@@ -91,6 +99,34 @@ class ArticleStructureResult(BaseModel):
     """Tables in the article."""
 
 
+class ExtractionQuality(BaseModel):
+    """Readability signals measured while extracting an article, and the resulting confidence."""
+
+    text_chars: int = 0
+    """Characters of visible text on the page, outside scripts, navigation and footers."""
+
+    paragraph_chars: int = 0
+    """Characters of paragraph text."""
+
+    paragraph_count: int = 0
+    """The number of non-empty paragraphs."""
+
+    text_density: float = 0.0
+    """The share of the page's visible text that is in paragraphs."""
+
+    link_density: float = 0.0
+    """The share of paragraph text that is link text."""
+
+    container_share: float = 0.0
+    """The share of paragraph text inside the element holding the most of it."""
+
+    depth_share: float = 0.0
+    """The share of paragraph text at the DOM depth holding the most of it."""
+
+    confidence: float = 0.0
+    """How likely the paragraphs are the article's main content, from 0 to 1."""
+
+
 class ExtractedArticleContent(BaseModel):
     """The complete extracted content from an article."""
 
@@ -105,3 +141,47 @@ class ExtractedArticleContent(BaseModel):
 
     structure: ArticleStructureResult = ArticleStructureResult()
     """Structural elements of the article."""
+
+    quality: ExtractionQuality = ExtractionQuality()
+    """How confident the local extraction is that it found the main content."""
+
+
+class ParseSettings(BaseModel):
+    """Settings for the worker pool that runs article extraction off the event loop."""
+
+    executor: ParseExecutor = "process"
+    """Run extraction in worker processes (uses every core) or in worker threads."""
+
+    max_workers: int = Field(default=4, ge=1)
+    """The maximum number of extraction workers."""
+
+    parser_backend: ParserBackend = "auto"
+    """The HTML parser used by the workers."""
+
+    streaming: bool = False
+    """Parse pages incrementally while they download instead of on the worker pool."""
+
+    max_html_bytes: int = Field(default=5 * 1024 * 1024, ge=1)
+    """Streamed pages are cut off after this many bytes of HTML."""
+
+    llm_fallback: bool = True
+    """Clean up pages with the LLM content extractor when the local extraction is unsure."""
+
+    min_confidence: float = Field(default=0.5, ge=0.0, le=1.0)
+    """Local extractions below this confidence fall back to the LLM content extractor."""
+
+
+class StreamedArticle(BaseModel):
+    """An article that was extracted while it downloaded."""
+
+    html: str
+    """The HTML that was read, up to the byte limit."""
+
+    content: ExtractedArticleContent
+    """The content extracted from the HTML."""
+
+    bytes_read: int = 0
+    """The number of HTML bytes read from the response."""
+
+    truncated: bool = False
+    """Whether the page was cut off at the byte limit."""
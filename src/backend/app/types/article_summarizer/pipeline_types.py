@@ -0,0 +1,72 @@
+"""Type definitions for running the summarization pipeline."""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+PipelineMode = Literal["sequential", "streamed", "combined"]
+
+
+class PipelineSettings(BaseModel):
+    """How the summarizer, audio formatter and TTS stages are scheduled for an article."""
+
+    mode: PipelineMode = "sequential"
+    """"sequential" runs each stage on the previous stage's complete output. "streamed"
+    narrates the detailed summary while it is still being written and sends finished
+    narration sentences to TTS while later ones are still being formatted. "combined"
+    writes the summary and its narration in a single agent call."""
+
+    min_segment_chars: int = Field(default=600, ge=1)
+    """In streamed mode, the minimum length of the summary paragraphs narrated together
+    in one formatter call."""
+
+    min_speech_chars: int = Field(default=200, ge=1)
+    """In streamed mode, the minimum length of the narration sentences synthesized
+    together in one TTS request."""
+
+
+class PipelineBenchmarkResult(BaseModel):
+    """Latency and token use of the agent stages for one article in one pipeline mode."""
+
+    url: str
+    """The URL of the article."""
+
+    mode: PipelineMode
+    """The pipeline mode that was measured."""
+
+    seconds: float = 0.0
+    """Wall-clock time from the first agent call to the narration text."""
+
+    llm_calls: int = 0
+    """The number of agent calls, including memoized ones."""
+
+    input_tokens: int = 0
+    """Input tokens sent to the models, as reported by the model provider."""
+
+    output_tokens: int = 0
+    """Output tokens received from the models, as reported by the model provider."""
+
+    error: str = ""
+    """A description of the failure, if the run failed."""
+
+
+class PipelineBenchmarkSummary(BaseModel):
+    """Aggregated benchmark results of one pipeline mode."""
+
+    mode: PipelineMode
+    """The pipeline mode."""
+
+    runs: int = 0
+    """The number of successful runs."""
+
+    failures: int = 0
+    """The number of failed runs."""
+
+    median_seconds: float = 0.0
+    """The median latency of the successful runs."""
+
+    mean_input_tokens: float = 0.0
+    """The mean input tokens per successful run."""
+
+    mean_output_tokens: float = 0.0
+    """The mean output tokens per successful run."""
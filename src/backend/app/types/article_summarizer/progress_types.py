@@ -0,0 +1,38 @@
+"""Type definitions for summarization progress events."""
+
+import time
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+ProgressEventType = Literal[
+    "queued",
+    "started",
+    "fetched",
+    "parsed",
+    "summary_delta",
+    "summary_ready",
+    "narration_ready",
+    "audio_started",
+    "audio_chunk",
+    "audio_ready",
+    "succeeded",
+    "failed",
+]
+"""The kinds of progress event, roughly in the order a run emits them."""
+
+TERMINAL_EVENTS: frozenset[ProgressEventType] = frozenset({"succeeded", "failed"})
+"""Events after which a run emits nothing more."""
+
+
+class ProgressEvent(BaseModel):
+    """Something that happened while summarizing an article."""
+
+    type: ProgressEventType
+    """What happened."""
+
+    data: dict[str, Any] = {}
+    """Details of the event, e.g. the title for "parsed" or the new text for "summary_delta"."""
+
+    at: float = Field(default_factory=time.time)
+    """When it happened (Unix time)."""
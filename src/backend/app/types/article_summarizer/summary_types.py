@@ -0,0 +1,80 @@
+"""Type definitions for article summarization."""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+SummarizationMode = Literal["auto", "single", "map_reduce"]
+"""How an article is summarized: in one agent call, or chunk by chunk and then merged."""
+
+
+class SummarizationSettings(BaseModel):
+    """Settings that choose between single-call and map-reduce summarization."""
+
+    mode: SummarizationMode = "auto"
+    """The summarization mode. "auto" uses map-reduce for articles above the threshold."""
+
+    map_reduce_threshold_tokens: int = Field(default=6000, ge=1)
+    """Articles with more estimated tokens than this are summarized with map-reduce."""
+
+    chunk_tokens: int = Field(default=3000, ge=1)
+    """The token budget of each chunk summarized in the map step."""
+
+    map_concurrency: int = Field(default=4, ge=1)
+    """Maximum number of chunks of one article summarized at the same time."""
+
+    remove_boilerplate: bool = True
+    """Drop short cookie, subscription, sharing and copyright paragraphs from the prompt."""
+
+    prompt_max_tokens: int = Field(default=12000, ge=1)
+    """Single-call prompts are cut at a paragraph boundary to fit this budget."""
+
+
+class ArticleChunk(BaseModel):
+    """A token-budgeted slice of an article, made of whole sections where possible."""
+
+    headings: list[str] = []
+    """The headings of the sections in the chunk, in order."""
+
+    text: str
+    """The chunk text, with each section introduced by its heading."""
+
+    tokens: int = 0
+    """The estimated number of tokens in the text."""
+
+
+class CompactedArticle(BaseModel):
+    """Article text with repeated and boilerplate paragraphs removed."""
+
+    content: str
+    """The remaining paragraphs, separated by blank lines."""
+
+    subsections: list[dict[str, str]] = []
+    """The subsections, restricted to the remaining paragraphs."""
+
+    boilerplate_removed: int = 0
+    """The number of boilerplate paragraphs removed."""
+
+    duplicates_removed: int = 0
+    """The number of repeated paragraphs removed."""
+
+
+class SummarizerPrompt(BaseModel):
+    """The input sent to the summarizer agent, with its token accounting."""
+
+    text: str
+    """The prompt text."""
+
+    tokens: int
+    """The estimated number of tokens in the prompt."""
+
+    original_tokens: int
+    """The estimated tokens of the uncompacted prompt (full text followed by subsections)."""
+
+    truncated: bool = False
+    """Whether paragraphs were left out to fit the token budget."""
+
+    @property
+    def tokens_saved(self) -> int:
+        """The estimated number of tokens saved by compaction."""
+        return max(self.original_tokens - self.tokens, 0)
@@ -0,0 +1,95 @@
+"""Type definitions for token accounting."""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field, computed_field
+
+TokenBudgetAction = Literal["truncate", "chunk", "reject"]
+"""What to do with an agent input that exceeds its stage's token budget."""
+
+
+class StageTokenBudget(BaseModel):
+    """The input token budget of one pipeline stage."""
+
+    max_input_tokens: int = Field(ge=1)
+    """The maximum number of input tokens sent to the stage's agent."""
+
+    action: TokenBudgetAction = "truncate"
+    """Cut the input to fit, split it into chunks (the summarizer switches to map-reduce;
+    other stages truncate), or fail the article."""
+
+
+class TokenBudgetSettings(BaseModel):
+    """Input token budgets per agent stage."""
+
+    extractor: StageTokenBudget = StageTokenBudget(max_input_tokens=32000)
+    """Budget of the LLM content extractor."""
+
+    summarizer: StageTokenBudget = StageTokenBudget(max_input_tokens=16000, action="chunk")
+    """Budget of the summarizer, including each map and reduce call."""
+
+    audio_formatter: StageTokenBudget = StageTokenBudget(max_input_tokens=8000)
+    """Budget of the audio formatter."""
+
+
+class TokenUsage(BaseModel):
+    """Token counts of one agent call."""
+
+    stage: str
+    """The pipeline stage, e.g. "summarizer" or "summarizer_map"."""
+
+    agent: str
+    """The name of the agent."""
+
+    input_tokens: int
+    """Tokens in the input sent to the agent."""
+
+    output_tokens: int
+    """Tokens in the agent's structured output."""
+
+    provider_input_tokens: int | None = None
+    """Input tokens the model provider reported, summed over the call's model requests;
+    None for memoized calls and providers that report no usage."""
+
+    provider_output_tokens: int | None = None
+    """Output tokens the model provider reported, summed over the call's model requests."""
+
+    memoized: bool = False
+    """Whether the output came from the memo store instead of a model call."""
+
+    truncated: bool = False
+    """Whether the input was cut to fit the stage's budget."""
+
+
+class TokenLedger(BaseModel):
+    """Token counts of every agent call made for one article."""
+
+    tokenizer: str
+    """The tokenizer used for counting, e.g. "tiktoken:o200k_base" or "approximate"."""
+
+    calls: list[TokenUsage] = []
+    """One entry per agent call, in completion order."""
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def input_tokens(self) -> int:
+        """Input tokens sent to models, excluding memoized calls."""
+        return sum(call.input_tokens for call in self.calls if not call.memoized)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def output_tokens(self) -> int:
+        """Output tokens produced by models, excluding memoized calls."""
+        return sum(call.output_tokens for call in self.calls if not call.memoized)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def provider_input_tokens(self) -> int:
+        """Input tokens the model provider reported across the calls."""
+        return sum(call.provider_input_tokens or 0 for call in self.calls)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def provider_output_tokens(self) -> int:
+        """Output tokens the model provider reported across the calls."""
+        return sum(call.provider_output_tokens or 0 for call in self.calls)
@@ -0,0 +1,93 @@
+"""Tests for the content analysis helpers."""
+
+from backend.app.helpers.article_summarizer.analysis_helpers import (
+    analyze_texts,
+    candidate_phrases,
+    count_syllables,
+    entity_candidates,
+    key_topics,
+    reading_ease,
+    sentiment_label,
+    sentiment_score,
+)
+
+ARTICLE = (
+    "The Bank of England raised interest rates again on Thursday. "
+    "Economists said higher interest rates would slow inflation. "
+    "Mortgage holders face higher monthly payments, and the Bank of England expects "
+    "inflation to fall next spring. Andrew Bailey gave clear guidance."
+)
+
+
+def test_candidate_phrases_split_on_stopwords_and_punctuation():
+    """Test that candidate phrases are runs of content words."""
+    assert candidate_phrases("The interest rates rose, and inflation fell.") == [
+        ("interest", "rates", "rose"),
+        ("inflation", "fell"),
+    ]
+
+
+def test_key_topics_rank_recurring_phrases_first():
+    """Test that phrases repeated in the text outrank phrases seen once."""
+    topics = key_topics(ARTICLE, lambda word: 1.0, limit=6)
+
+    assert topics[0] == "interest rates"
+    assert set(topics[1:5]) == {"bank", "england", "higher", "inflation"}
+    assert "rates" not in topics
+    assert "england expects inflation" not in topics
+
+
+def test_analyze_texts_weights_topics_by_batch_idf():
+    """Test that words common to every article in a batch rank below distinctive ones."""
+    shared = "Market report. "
+    texts = [
+        shared * 3 + "Copper prices climbed. Copper prices climbed.",
+        shared * 3 + "Wheat harvest failed. Wheat harvest failed.",
+    ]
+
+    results = analyze_texts(texts)
+
+    assert results[0].key_topics[0] == "copper prices climbed"
+    assert results[1].key_topics[0] == "wheat harvest failed"
+
+
+def test_sentiment_score_flips_negated_words():
+    """Test that words shortly after a negation count with the opposite polarity."""
+    assert sentiment_score(["the", "plan", "is", "good", "and", "helpful"]) > 0
+    assert sentiment_score(["the", "plan", "is", "not", "good"]) < 0
+    assert sentiment_score(["the", "plan", "was", "announced"]) == 0
+    assert sentiment_label(0.5) == "positive"
+    assert sentiment_label(-0.5) == "negative"
+    assert sentiment_label(0.05) == "neutral"
+
+
+def test_reading_ease_prefers_short_words_and_sentences():
+    """Test that the Flesch reading ease drops for long words and sentences."""
+    easy = "The cat sat. The dog ran."
+    hard = "Institutional considerations necessitate comprehensive organizational restructuring."
+
+    assert count_syllables("cat") == 1
+    assert count_syllables("table") == 2
+    assert reading_ease(easy, easy.split()) > 90
+    assert reading_ease(hard, hard.split()) < 0
+
+
+def test_entity_candidates_skip_sentence_initial_words():
+    """Test that multi-word names are found and capitalized sentence openers are not."""
+    entities = entity_candidates(ARTICLE, limit=5)
+
+    assert entities[0] == "Bank of England"
+    assert "Andrew Bailey" in entities
+    assert "Thursday" in entities
+    assert "Economists" not in entities
+    assert "The Bank of England" not in entities
+
+
+def test_analyze_texts_fills_every_field():
+    """Test that a single text gets topics, sentiment, complexity and entities."""
+    (result,) = analyze_texts([ARTICLE])
+
+    assert result.key_topics
+    assert result.main_entities[0] == "Bank of England"
+    assert 0 <= result.complexity_score <= 1
+    assert result.sentiment in {"positive", "negative", "neutral"}
@@ -0,0 +1,74 @@
+"""Tests for audio helpers."""
+
+from backend.app.helpers.article_summarizer.audio_helpers import (
+    concat_mp3_files,
+    mp3_frames,
+    mp3_header_length,
+    split_narration,
+)
+
+# MPEG-1 Layer III, 128 kbit/s, 44.1 kHz, no padding: 417-byte frames.
+FRAME_HEADER = b"\xff\xfb\x90\x00"
+FRAME_LENGTH = 417
+
+
+def _frame(fill: bytes) -> bytes:
+    return FRAME_HEADER + fill * (FRAME_LENGTH - len(FRAME_HEADER))
+
+
+def test_split_narration_keeps_short_text_whole():
+    """Test that text within the limit is returned as one chunk."""
+    assert split_narration("One.\n\nTwo.", 100) == ["One.\n\nTwo."]
+
+
+def test_split_narration_respects_paragraphs_and_sentences():
+    """Test that chunks break at paragraph, then sentence, boundaries."""
+    text = "First paragraph here.\n\nSecond one. It has two sentences."
+    chunks = split_narration(text, 30)
+
+    assert chunks == ["First paragraph here.", "Second one.", "It has two sentences."]
+    assert all(len(chunk) <= 30 for chunk in chunks)
+
+
+def test_split_narration_splits_overlong_sentences_between_words():
+    """Test that a sentence longer than the limit is split between words."""
+    chunks = split_narration("alpha beta gamma delta epsilon", 12)
+
+    assert chunks == ["alpha beta", "gamma delta", "epsilon"]
+
+
+def test_mp3_frames_strips_tags_and_vbr_header():
+    """Test that ID3 tags and the Xing header frame are removed."""
+    id3v2 = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"x" * 5
+    xing = FRAME_HEADER + b"\x00" * 32 + b"Xing" + b"\x00" * (FRAME_LENGTH - 40)
+    audio = _frame(b"a") + _frame(b"b")
+    id3v1 = b"TAG" + b"\x00" * 125
+
+    assert mp3_frames(id3v2 + xing + audio + id3v1) == audio
+    assert mp3_frames(audio) == audio
+
+
+def test_mp3_header_length_waits_for_the_whole_header():
+    """Test that the header of a stream is only measured once all of it has arrived."""
+    id3v2 = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"x" * 5
+    xing = FRAME_HEADER + b"\x00" * 32 + b"Xing" + b"\x00" * (FRAME_LENGTH - 40)
+    stream = id3v2 + xing + _frame(b"a")
+
+    assert mp3_header_length(stream[:2]) is None
+    assert mp3_header_length(stream[:12]) is None
+    assert mp3_header_length(stream[: len(id3v2) + 100]) is None
+    assert mp3_header_length(stream) == len(id3v2) + FRAME_LENGTH
+    assert mp3_header_length(_frame(b"a")) == 0
+
+
+def test_concat_mp3_files_joins_frames_in_order(tmp_path):
+    """Test that parts are joined frame by frame in the given order."""
+    first = tmp_path / "0.mp3"
+    second = tmp_path / "1.mp3"
+    first.write_bytes(_frame(b"a"))
+    second.write_bytes(b"ID3\x04\x00\x00\x00\x00\x00\x00" + _frame(b"b"))
+    destination = tmp_path / "joined.mp3"
+
+    concat_mp3_files([first, second], destination)
+
+    assert destination.read_bytes() == _frame(b"a") + _frame(b"b")
@@ -0,0 +1,29 @@
+"""Tests for cache helpers."""
+
+from backend.app.helpers.article_summarizer.cache_helpers import (
+    atomic_write_bytes,
+    content_key,
+    normalize_url,
+)
+
+
+def test_normalize_url():
+    """Test that equivalent URL spellings normalize to the same string."""
+    assert normalize_url("HTTPS://Example.com:443/a?b=2&a=1#top") == "https://example.com/a?a=1&b=2"
+    assert normalize_url("http://example.com") == "http://example.com/"
+    assert normalize_url("http://example.com:8080/x") == "http://example.com:8080/x"
+
+
+def test_content_key_separates_parts():
+    """Test that keys are stable and that part boundaries matter."""
+    assert content_key("a", "bc") == content_key("a", "bc")
+    assert content_key("a", "bc") != content_key("ab", "c")
+
+
+def test_atomic_write_bytes(tmp_path):
+    """Test that the file is written without leaving a temporary file behind."""
+    path = tmp_path / "out.bin"
+    atomic_write_bytes(path, b"data")
+
+    assert path.read_bytes() == b"data"
+    assert list(tmp_path.iterdir()) == [path]
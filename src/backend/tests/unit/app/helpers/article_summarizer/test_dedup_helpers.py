@@ -0,0 +1,36 @@
+"""Tests for the near-duplicate detection helpers."""
+
+from backend.app.helpers.article_summarizer.dedup_helpers import (
+    LSH_BANDS,
+    estimate_similarity,
+    lsh_band_keys,
+    minhash_signature,
+)
+
+STORY = " ".join(
+    f"Paragraph {i} reports that the council approved budget item {i} after a long debate."
+    for i in range(40)
+)
+
+
+def test_minhash_signature_estimates_similarity_of_edited_copies():
+    """Test that a lightly edited copy scores high and an unrelated text scores low."""
+    syndicated = "Reprinted from the Daily Gazette. " + STORY + " Subscribe for more news."
+    unrelated = " ".join(f"Recipe step {i}: whisk the eggs and fold in flour." for i in range(40))
+
+    original = minhash_signature(STORY)
+
+    assert estimate_similarity(original, minhash_signature(STORY)) == 1.0
+    assert estimate_similarity(original, minhash_signature(syndicated)) > 0.8
+    assert estimate_similarity(original, minhash_signature(unrelated)) < 0.2
+
+
+def test_lsh_band_keys_match_for_shared_bands():
+    """Test that near-duplicates share band keys and empty bands are left out."""
+    keys = lsh_band_keys(minhash_signature(STORY))
+    edited_keys = lsh_band_keys(minhash_signature(STORY + " Updated at noon."))
+    short_keys = lsh_band_keys(minhash_signature("Short note"))
+
+    assert len(keys) == LSH_BANDS
+    assert sum(keys[band] == edited_keys.get(band) for band in keys) >= LSH_BANDS // 2
+    assert len(short_keys) == 1
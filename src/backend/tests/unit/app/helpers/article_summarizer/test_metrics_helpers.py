@@ -0,0 +1,16 @@
+"""Tests for the run metrics helpers."""
+
+import pytest
+
+from backend.app.helpers.article_summarizer.metrics_helpers import percentile
+
+
+def test_percentile_interpolates_between_ranks():
+    """Test that percentiles interpolate linearly and do not need sorted input."""
+    values = [4.0, 1.0, 3.0, 2.0, 5.0]
+
+    assert percentile(values, 0.5) == 3.0
+    assert percentile(values, 0.95) == pytest.approx(4.8)
+    assert percentile(values, 1.0) == 5.0
+    assert percentile([7.0], 0.99) == 7.0
+    assert percentile([], 0.5) == 0.0
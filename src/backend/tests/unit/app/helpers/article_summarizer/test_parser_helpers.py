@@ -1,8 +1,15 @@
 """Tests for parser helpers."""
 
+from unittest.mock import patch
+
 from backend.app.helpers.article_summarizer.parser_helpers import (
     convert_to_article_content,
+    decode_extracted_content,
+    encode_extracted_content,
     extract_title_from_html,
+    extraction_confidence,
+    resolve_parser_backend,
+    strip_non_content_markup,
 )
 from backend.app.types.article_summarizer.parser_types import (
     ArticleHeading,
@@ -66,3 +73,57 @@ def test_convert_to_article_content():
     assert len(article_content.structure.headings) == 2
     assert article_content.structure.headings[0]["text"] == "First Section"
     assert article_content.structure.headings[1]["text"] == "Second Section"
+
+
+def test_resolve_parser_backend():
+    """Test that lxml is preferred when installed and html.parser is the fallback."""
+    with patch("importlib.util.find_spec", return_value=object()):
+        assert resolve_parser_backend("auto") == "lxml"
+        assert resolve_parser_backend("lxml") == "lxml"
+        assert resolve_parser_backend("html.parser") == "html.parser"
+
+    with patch("importlib.util.find_spec", return_value=None):
+        assert resolve_parser_backend("auto") == "html.parser"
+        assert resolve_parser_backend("lxml") == "html.parser"
+
+
+def test_extracted_content_payload_round_trip():
+    """Test that extracted content survives encoding to a compressed payload."""
+    extracted_content = ExtractedArticleContent(
+        text="Paragraph one.\n\nParagraph two.",
+        subsections=[ArticleSubsection(heading="Heading", content="Paragraph two.")],
+        metadata=ArticleMetadataResult(title="Title", tags=["a", "b"]),
+        structure=ArticleStructureResult(
+            headings=[ArticleHeading(text="Heading", level=2)],
+            images=[ArticleImage(url="/a.png", alt="A", caption="")],
+            links=[ArticleLink(url="/b", text="B", context="")],
+            tables=[ArticleTable(content="x y")],
+        ),
+    )
+
+    payload = encode_extracted_content(extracted_content)
+
+    assert isinstance(payload, bytes)
+    assert len(payload) < len(extracted_content.model_dump_json())
+    assert decode_extracted_content(payload) == extracted_content
+
+
+def test_extraction_confidence():
+    """Test that long, dense, concentrated paragraphs score high and link lists score zero."""
+    assert extraction_confidence(0, 0.0, 0.0, 0.0, 0.0) == 0.0
+    assert extraction_confidence(5000, 0.95, 0.02, 0.9, 1.0) > 0.9
+    assert extraction_confidence(5000, 0.95, 1.0, 0.9, 1.0) == 0.0
+    assert extraction_confidence(200, 0.95, 0.0, 1.0, 1.0) < extraction_confidence(
+        2000, 0.95, 0.0, 1.0, 1.0
+    )
+    assert extraction_confidence(2000, 0.9, 0.0, 0.05, 0.5) < 0.8
+
+
+def test_strip_non_content_markup():
+    """Test that scripts, styles and comments are removed but text is kept."""
+    html = (
+        "<p>Keep</p><SCRIPT type='x'>var a = '<p>';</SCRIPT><style>p {}</style>"
+        "<!-- note --><svg><path/></svg><p>this</p>"
+    )
+
+    assert strip_non_content_markup(html) == "<p>Keep</p><p>this</p>"
@@ -0,0 +1,126 @@
+"""Tests for prompt helpers."""
+
+from unittest.mock import patch
+
+from backend.app.helpers.article_summarizer import prompt_helpers
+from backend.app.helpers.article_summarizer.prompt_helpers import (
+    build_summarizer_prompt,
+    compact_article,
+    is_boilerplate,
+    uncompacted_prompt_tokens,
+)
+
+CONTENT = "\n\n".join(
+    [
+        "We use cookies to improve your experience. Accept all cookies?",
+        "The council approved the new budget on Monday.",
+        "Spending on transit rises by ten percent.",
+        "Subscribe to our newsletter for daily updates.",
+        "The council approved the new budget on Monday.",
+        "Critics say the plan ignores housing.",
+        "© 2024 Example News. All rights reserved.",
+    ]
+)
+SUBSECTIONS = [
+    {
+        "heading": "Transit",
+        "content": "Spending on transit rises by ten percent.\n\n"
+        "Subscribe to our newsletter for daily updates.",
+    },
+    {"heading": "Reaction", "content": "Critics say the plan ignores housing."},
+]
+
+
+def test_is_boilerplate():
+    """Test that notices are detected while long or ordinary paragraphs are kept."""
+    assert is_boilerplate("Subscribe now and get 50% off")
+    assert is_boilerplate("This site uses cookies. See our cookie policy.")
+    assert is_boilerplate("Share this article")
+    assert not is_boilerplate("The council approved the new budget on Monday.")
+    assert not is_boilerplate("Subscription revenue grew. " * 20)
+
+
+def test_is_boilerplate_keeps_article_sentences_that_mention_notice_words():
+    """Test that ordinary sentences using cookie, share or subscriber wording are kept."""
+    assert not is_boilerplate("Share prices fell after the cookie maker missed its forecast.")
+    assert not is_boilerplate("Subscribers to the service doubled, the company said.")
+    assert not is_boilerplate("The court ruled the copyright claim invalid in 2019.")
+    assert not is_boilerplate("Readers were asked to accept cookies before the vote. Few did.")
+    assert not is_boilerplate(
+        "The newsletter, which critics call partisan, lost half its readers. Sign up now."
+    )
+
+
+def test_compact_article_removes_boilerplate_and_repeats():
+    """Test that each remaining paragraph appears once and subsections follow suit."""
+    compacted = compact_article(CONTENT, SUBSECTIONS)
+
+    assert compacted.content.split("\n\n") == [
+        "The council approved the new budget on Monday.",
+        "Spending on transit rises by ten percent.",
+        "Critics say the plan ignores housing.",
+    ]
+    assert compacted.subsections == [
+        {"heading": "Transit", "content": "Spending on transit rises by ten percent."},
+        {"heading": "Reaction", "content": "Critics say the plan ignores housing."},
+    ]
+    assert compacted.boilerplate_removed == 3
+    assert compacted.duplicates_removed == 1
+
+
+def test_compact_article_can_keep_boilerplate():
+    """Test that boilerplate removal can be turned off."""
+    compacted = compact_article(CONTENT, SUBSECTIONS, remove_boilerplate=False)
+
+    assert compacted.boilerplate_removed == 0
+    assert compacted.duplicates_removed == 1
+    assert "Subscribe to our newsletter" in compacted.content
+
+
+def test_build_summarizer_prompt_lists_each_paragraph_once():
+    """Test that subsection text is not repeated and the savings are reported."""
+    compacted = compact_article(CONTENT, SUBSECTIONS)
+    original_tokens = uncompacted_prompt_tokens("Budget", CONTENT, SUBSECTIONS, "\n\nBy: Jo")
+
+    prompt = build_summarizer_prompt(
+        "Budget", compacted, "\n\nBy: Jo", max_tokens=1000, original_tokens=original_tokens
+    )
+
+    assert prompt.text == (
+        "Title: Budget\n\nArticle text:\n"
+        "\nThe council approved the new budget on Monday.\n"
+        "\n## Transit\nSpending on transit rises by ten percent.\n"
+        "\n## Reaction\nCritics say the plan ignores housing.\n"
+        "\n\nBy: Jo"
+    )
+    assert not prompt.truncated
+    assert prompt.tokens_saved > prompt.tokens / 2
+
+
+def test_build_summarizer_prompt_enforces_token_budget():
+    """Test that paragraphs past the budget are dropped while the context is kept."""
+    compacted = compact_article(CONTENT, SUBSECTIONS)
+
+    prompt = build_summarizer_prompt("Budget", compacted, "\n\nBy: Jo", max_tokens=30)
+
+    assert prompt.truncated
+    assert prompt.tokens <= 30
+    assert "The council approved" in prompt.text
+    assert "Critics say" not in prompt.text
+    assert prompt.text.endswith("By: Jo")
+
+
+def test_build_summarizer_prompt_counts_each_paragraph_once():
+    """Test that the budget is kept with a running total, not by recounting the prompt."""
+    paragraphs = [f"Paragraph {index} of the article." for index in range(200)]
+    compacted = compact_article("\n\n".join(paragraphs), [])
+
+    with patch.object(
+        prompt_helpers, "count_tokens", wraps=prompt_helpers.count_tokens
+    ) as count_tokens:
+        prompt = build_summarizer_prompt("Long", compacted, "", max_tokens=100_000)
+
+    assert not prompt.truncated
+    assert all(paragraph in prompt.text for paragraph in paragraphs)
+    counted = sum(len(call.args[0]) for call in count_tokens.call_args_list)
+    assert counted < 3 * len(prompt.text)
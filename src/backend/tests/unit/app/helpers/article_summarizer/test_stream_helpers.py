@@ -0,0 +1,57 @@
+"""Tests for stream helpers."""
+
+import json
+
+import pytest
+
+from backend.app.helpers.article_summarizer.stream_helpers import (
+    paragraph_splitter,
+    partial_json_string,
+    sentence_splitter,
+)
+
+
+def test_partial_json_string_decodes_every_prefix():
+    """Test that each prefix of a JSON document decodes to a prefix of the field value."""
+    value = 'Line one.\n\nShe said "hi" \\ café \U0001f600 done.'
+    document = json.dumps({"title": "T", "detailed_summary": value, "key_points": []})
+
+    assert partial_json_string(document[:10], "detailed_summary") is None
+    for end in range(document.index(': "', 14) + 3, len(document) + 1):
+        partial = partial_json_string(document[:end], "detailed_summary")
+        assert partial is not None
+        text, complete = partial
+        assert value.startswith(text)
+        if complete:
+            assert text == value
+    assert partial_json_string(document, "detailed_summary") == (value, True)
+
+
+@pytest.mark.parametrize("step", [1, 5, 1000])
+def test_sentence_splitter_emits_complete_sentences(step):
+    """Test that sentences are emitted once complete and grouped to a minimum length."""
+    text = "Hi. This is the first sentence. Second one! And a third?  Tail"
+    splitter = sentence_splitter(min_chars=10)
+
+    pieces = []
+    for end in range(step, len(text) + step, step):
+        pieces += splitter.feed(text[:end])
+    pieces += splitter.flush(text)
+
+    assert pieces == [
+        "Hi. This is the first sentence.",
+        "Second one!",
+        "And a third?",
+        "Tail",
+    ]
+
+
+def test_paragraph_splitter_waits_for_the_next_paragraph():
+    """Test that a paragraph is held back while its trailing break may still grow."""
+    splitter = paragraph_splitter()
+
+    assert splitter.feed("One.\n") == []
+    assert splitter.feed("One.\n\n") == []
+    assert splitter.feed("One.\n\nTwo") == ["One."]
+    assert splitter.flush("One.\n\nTwo.") == ["Two."]
+    assert splitter.flush("One.\n\nTwo.") == []
@@ -0,0 +1,68 @@
+"""Tests for summary helpers."""
+
+from unittest.mock import patch
+
+from backend.app.helpers.article_summarizer import token_helpers
+from backend.app.helpers.article_summarizer.summary_helpers import (
+    chunk_article,
+    split_article_sections,
+)
+from backend.app.helpers.article_summarizer.token_helpers import count_tokens
+
+CONTENT = "Lead paragraph.\n\nFirst A.\n\nSecond A.\n\nOnly B.\n\nClosing remark."
+SUBSECTIONS = [
+    {"heading": "Section A", "content": "First A.\n\nSecond A."},
+    {"heading": "Section B", "content": "Only B."},
+]
+
+
+def test_split_article_sections_uses_each_paragraph_once():
+    """Test that sections follow the article order without repeating subsection text."""
+    sections = split_article_sections(CONTENT, SUBSECTIONS)
+
+    assert sections == [
+        ("", "Lead paragraph."),
+        ("Section A", "First A.\n\nSecond A."),
+        ("Section B", "Only B."),
+        ("", "Closing remark."),
+    ]
+
+
+def test_chunk_article_packs_sections_within_budget():
+    """Test that adjacent sections share chunks and no chunk exceeds the budget."""
+    sections = [{"heading": f"Part {i}", "content": f"Paragraph {i}. " * 20} for i in range(6)]
+    content = "\n\n".join(section["content"] for section in sections)
+
+    chunks = chunk_article(content, sections, max_tokens=200)
+
+    assert 1 < len(chunks) < 6
+    assert all(chunk.tokens <= 200 for chunk in chunks)
+    assert [heading for chunk in chunks for heading in chunk.headings] == [
+        f"Part {i}" for i in range(6)
+    ]
+    assert chunks[0].text.startswith("## Part 0\nParagraph 0.")
+
+
+def test_chunk_article_splits_oversized_sections():
+    """Test that a section larger than the budget is split at sentence boundaries."""
+    content = " ".join(f"Sentence number {i} is here." for i in range(100))
+
+    chunks = chunk_article(content, [{"heading": "Long", "content": content}], max_tokens=50)
+
+    assert len(chunks) > 1
+    assert all(chunk.tokens <= 50 for chunk in chunks)
+    assert all(chunk.headings == ["Long"] for chunk in chunks)
+    rejoined = " ".join(chunk.text.removeprefix("## Long\n") for chunk in chunks)
+    assert rejoined == content
+
+
+def test_chunk_article_keeps_cjk_text_within_budget():
+    """Test that text with about one token per character is split finer than English."""
+    content = "市议会周一批准了新的交通预算。" * 40
+
+    with patch.object(token_helpers, "_get_encoding", return_value=None):
+        chunks = chunk_article(content, [], max_tokens=100)
+        assert all(count_tokens(chunk.text) <= 100 for chunk in chunks)
+
+    assert len(chunks) >= len(content) // 100
+    assert "".join(chunk.text for chunk in chunks).replace(" ", "") == content
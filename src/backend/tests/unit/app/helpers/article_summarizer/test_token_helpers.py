@@ -0,0 +1,60 @@
+"""Tests for token helpers."""
+
+from unittest.mock import MagicMock, patch
+
+from backend.app.helpers.article_summarizer import token_helpers
+from backend.app.helpers.article_summarizer.token_helpers import (
+    count_tokens,
+    tokenizer_name,
+    truncate_to_tokens,
+)
+
+PROSE = (
+    "The city council approved the new transit budget on Monday, raising spending by "
+    "ten percent. Critics said the plan ignores housing, while supporters pointed to "
+    "record ridership in 2023."
+)
+
+
+def test_count_tokens_approximation_without_tiktoken():
+    """Test that the bundled approximation lands in the usual range of 3-6 characters per token."""
+    with patch.object(token_helpers, "_get_encoding", return_value=None):
+        tokens = count_tokens(PROSE)
+        assert tokenizer_name() == "approximate"
+
+    assert len(PROSE) / 6 < tokens < len(PROSE) / 3
+    with patch.object(token_helpers, "_get_encoding", return_value=None):
+        assert count_tokens("") == 0
+        assert count_tokens("hello world") == 2
+
+
+def test_count_tokens_approximation_counts_cjk_per_character():
+    """Test that CJK text is counted at one token per character, not per word."""
+    with patch.object(token_helpers, "_get_encoding", return_value=None):
+        assert count_tokens("市议会批准了预算") == 8
+        assert count_tokens("東京の天気") == 5
+        assert count_tokens("Tokyo 東京") == 3
+
+
+def test_truncate_to_tokens_keeps_a_prefix_within_budget():
+    """Test that truncation returns the longest fitting prefix."""
+    with patch.object(token_helpers, "_get_encoding", return_value=None):
+        truncated = truncate_to_tokens(PROSE, 10)
+
+        assert PROSE.startswith(truncated)
+        assert count_tokens(truncated) <= 10
+        assert count_tokens(PROSE[: len(truncated) + 8]) > 10
+        assert truncate_to_tokens(PROSE, 1000) == PROSE
+
+
+def test_count_tokens_uses_tiktoken_when_available():
+    """Test that an available tiktoken encoding is used for counting and truncation."""
+    encoding = MagicMock()
+    encoding.name = "o200k_base"
+    encoding.encode.side_effect = lambda text, disallowed_special: text.split()
+    encoding.decode.side_effect = " ".join
+
+    with patch.object(token_helpers, "_get_encoding", return_value=encoding):
+        assert tokenizer_name() == "tiktoken:o200k_base"
+        assert count_tokens("one two three") == 3
+        assert truncate_to_tokens("one two three", 2) == "one two"
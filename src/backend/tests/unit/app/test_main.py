@@ -0,0 +1,223 @@
+"""Tests for the job queue HTTP API."""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from backend.app.custom_agents.article_summarizer.job_queue import JobQueue
+from backend.app.custom_agents.article_summarizer.live_audio import LiveAudio
+from backend.app.custom_agents.article_summarizer.progress import emit_progress
+from backend.app.main import create_app
+from backend.app.types.article_summarizer.job_types import JobQueueSettings
+
+
+def _client(tmp_path, summarize: AsyncMock, settings: JobQueueSettings | None = None):
+    """Build a test client for an app whose queue uses the given summarize mock."""
+    manager = MagicMock()
+    manager.summarize_article = summarize
+    manager.aclose = AsyncMock()
+    manager.job_store = None
+    return TestClient(create_app(JobQueue(settings, manager)))
+
+
+def _poll(client: TestClient, job_id: str) -> dict:
+    """Poll a job until it is finished."""
+    for _ in range(500):
+        job = client.get(f"/jobs/{job_id}").json()
+        if job["status"] not in ("queued", "running"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_submit_poll_and_download(tmp_path):
+    """Test that a submitted job can be polled and its files downloaded."""
+    audio_path = tmp_path / "final.mp3"
+    final_text_path = tmp_path / "final.txt"
+    audio_path.write_bytes(b"mp3 data")
+    final_text_path.write_text("# Title\n\nNarration.", encoding="utf-8")
+    summarize = AsyncMock(return_value=(audio_path, tmp_path / "raw.txt", final_text_path))
+
+    with _client(tmp_path, summarize) as client:
+        response = client.post("/jobs", json={"url": "https://example.com/a"})
+        assert response.status_code == 202
+        assert response.json()["status"] == "queued"
+
+        job = _poll(client, response.json()["id"])
+        assert job["status"] == "succeeded"
+        assert job["audio_url"].endswith(f"/jobs/{job['id']}/audio")
+
+        audio = client.get(f"/jobs/{job['id']}/audio")
+        assert audio.content == b"mp3 data"
+        assert audio.headers["content-type"] == "audio/mpeg"
+        assert client.get(f"/jobs/{job['id']}/text").text == "# Title\n\nNarration."
+
+    summarize.assert_awaited_once_with("https://example.com/a")
+
+
+def test_full_queue_returns_429(tmp_path):
+    """Test that submissions beyond the queue depth are refused with Retry-After."""
+
+    async def block(url: str) -> None:
+        await asyncio.Event().wait()
+
+    settings = JobQueueSettings(workers=1, max_queue_depth=1)
+    with _client(tmp_path, AsyncMock(side_effect=block), settings) as client:
+        running = client.post("/jobs", json={"url": "https://example.com/1"}).json()
+        while client.get(f"/jobs/{running['id']}").json()["status"] != "running":
+            time.sleep(0.01)
+        queued = client.post("/jobs", json={"url": "https://example.com/2"})
+        refused = client.post("/jobs", json={"url": "https://example.com/3"})
+
+        assert queued.status_code == 202
+        assert refused.status_code == 429
+        assert refused.headers["retry-after"] == "30"
+        assert client.get(f"/jobs/{running['id']}/audio").status_code == 409
+
+
+def test_unknown_job_returns_404(tmp_path):
+    """Test that unknown job ids are reported as not found."""
+    with _client(tmp_path, AsyncMock(return_value=None)) as client:
+        assert client.get("/jobs/missing").status_code == 404
+        assert client.get("/jobs/missing/audio").status_code == 404
+
+
+def _sse_events(body: str) -> list[tuple[str, str, dict]]:
+    """Parse a Server-Sent Events body into (id, event, data) tuples, skipping comments."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        if block.startswith(":"):
+            continue
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["id"], fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_events_stream_progress_until_the_job_ends(tmp_path):
+    """Test that the event stream replays and follows a job's progress."""
+    audio_path = tmp_path / "final.mp3"
+    audio_path.write_bytes(b"mp3 data")
+
+    async def summarize(url: str):
+        emit_progress("parsed", title="Title")
+        emit_progress("summary_delta", text="The council")
+        emit_progress("summary_ready", title="Title", short_summary="Short.", key_points=[])
+        return audio_path, tmp_path / "raw.txt", tmp_path / "final.txt"
+
+    with _client(tmp_path, AsyncMock(side_effect=summarize)) as client:
+        job = client.post("/jobs", json={"url": "https://example.com/a"}).json()
+        with client.stream("GET", f"/jobs/{job['id']}/events") as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            events = _sse_events(response.read().decode())
+
+        resumed = client.get(f"/jobs/{job['id']}/events", headers={"Last-Event-ID": "3"})
+
+    assert [event for _, event, _ in events] == [
+        "queued",
+        "started",
+        "parsed",
+        "summary_delta",
+        "summary_ready",
+        "succeeded",
+    ]
+    assert events[3][2]["text"] == "The council"
+    assert events[-1][2]["audio_url"].endswith(f"/jobs/{job['id']}/audio")
+    assert [event for _, event, _ in _sse_events(resumed.text)] == [
+        "summary_ready",
+        "succeeded",
+    ]
+
+
+def test_events_stream_sends_keep_alive_comments_while_idle(tmp_path):
+    """Test that a stream without progress for a while sends comments to stay open."""
+    audio_path = tmp_path / "final.mp3"
+    audio_path.write_bytes(b"mp3 data")
+
+    async def summarize(url: str):
+        await asyncio.sleep(0.2)
+        return audio_path, tmp_path / "raw.txt", tmp_path / "final.txt"
+
+    with (
+        patch("backend.app.main.KEEP_ALIVE_SECONDS", 0.02),
+        _client(tmp_path, AsyncMock(side_effect=summarize)) as client,
+    ):
+        job = client.post("/jobs", json={"url": "https://example.com/a"}).json()
+        body = client.get(f"/jobs/{job['id']}/events").text
+
+    assert ": keep-alive\n\n" in body
+    events = _sse_events(body)
+    assert [event for _, event, _ in events] == ["queued", "started", "succeeded"]
+    assert events[-1][2]["audio_url"].endswith(f"/jobs/{job['id']}/audio")
+
+
+def test_events_of_unknown_job_return_404(tmp_path):
+    """Test that streaming events of an unknown job is refused."""
+    with _client(tmp_path, AsyncMock(return_value=None)) as client:
+        assert client.get("/jobs/missing/events").status_code == 404
+
+
+def test_run_audio_supports_ranges_and_revalidation(tmp_path):
+    """Test that run audio is served in ranges and revalidated with its ETag."""
+    run_dir = tmp_path / "Title_2025-01-01_00-00-00"
+    run_dir.mkdir()
+    (run_dir / "final.mp3").write_bytes(bytes(range(256)) * 4)
+
+    with (
+        patch("backend.app.main.OUTPUTS_DIR", tmp_path),
+        _client(tmp_path, AsyncMock(return_value=None)) as client,
+    ):
+        full = client.get(f"/audio/{run_dir.name}")
+        partial = client.get(f"/audio/{run_dir.name}", headers={"Range": "bytes=256-511"})
+        head = client.head(f"/audio/{run_dir.name}")
+        cached = client.get(
+            f"/audio/{run_dir.name}", headers={"If-None-Match": full.headers["etag"]}
+        )
+        unsatisfiable = client.get(f"/audio/{run_dir.name}", headers={"Range": "bytes=5000-"})
+        missing = client.get("/audio/..")
+
+    assert full.status_code == 200
+    assert full.headers["accept-ranges"] == "bytes"
+    assert full.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert len(full.content) == 1024
+    assert partial.status_code == 206
+    assert partial.headers["content-range"] == "bytes 256-511/1024"
+    assert partial.content == bytes(range(256))
+    assert head.headers["content-length"] == "1024"
+    assert not head.content
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == full.headers["etag"]
+    assert unsatisfiable.status_code == 416
+    assert missing.status_code == 404
+
+
+def test_live_audio_streams_while_synthesizing(tmp_path):
+    """Test that a job's audio can be played before its synthesis is complete."""
+    run_dir = tmp_path / "Title_2025-01-01_00-00-00"
+    run_dir.mkdir()
+
+    async def summarize(url: str):
+        live = LiveAudio(run_dir)
+        live.writer(0)(b"first ")
+        await asyncio.sleep(0.2)
+        live.writer(0)(b"second")
+        live.finish(0)
+        (run_dir / "final.mp3").write_bytes(b"first second")
+        live.close()
+        return run_dir / "final.mp3", run_dir / "raw.txt", run_dir / "final.txt"
+
+    with (
+        patch("backend.app.main.OUTPUTS_DIR", tmp_path),
+        _client(tmp_path, AsyncMock(side_effect=summarize)) as client,
+    ):
+        job = client.post("/jobs", json={"url": "https://example.com/a"}).json()
+        with client.stream("GET", f"/jobs/{job['id']}/audio/live") as response:
+            assert response.headers["content-type"] == "audio/mpeg"
+            live_audio = response.read()
+        finished = client.get(f"/jobs/{job['id']}/audio/live")
+
+    assert live_audio == b"first second"
+    assert finished.content == b"first second"
+    assert finished.headers["accept-ranges"] == "bytes"
@@ -0,0 +1,35 @@
+"""Tests for the article summarizer agents."""
+
+import pytest
+from agents import AgentOutputSchema
+
+from backend.app.custom_agents.article_summarizer.agents import (
+    audio_formatter_agent,
+    chunk_summarizer_agent,
+    content_extractor_agent,
+    narration_segment_agent,
+    summarizer_agent,
+    summary_narrator_agent,
+    summary_reducer_agent,
+)
+
+
+@pytest.mark.parametrize(
+    "agent",
+    [
+        content_extractor_agent,
+        summarizer_agent,
+        chunk_summarizer_agent,
+        summary_reducer_agent,
+        audio_formatter_agent,
+        narration_segment_agent,
+        summary_narrator_agent,
+    ],
+    ids=lambda agent: agent.name,
+)
+def test_agent_output_types_have_strict_schemas(agent):
+    """Test that the SDK accepts every agent's output type as a strict JSON schema."""
+    schema = AgentOutputSchema(agent.output_type)
+
+    assert schema.is_strict_json_schema()
+    assert schema.json_schema()["additionalProperties"] is False
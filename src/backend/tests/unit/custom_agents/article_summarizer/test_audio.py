@@ -1,16 +1,23 @@
 """Tests for audio generation."""
 
+import asyncio
 import os
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from backend.app.custom_agents.article_summarizer.audio import generate_audio
+from backend.app.custom_agents.article_summarizer.audio import (
+    create_run_directory,
+    generate_audio,
+)
+from backend.app.custom_agents.article_summarizer.audio_cache import AudioCache
+from backend.app.types.article_summarizer.audio_types import TtsSettings
+from backend.app.types.article_summarizer.cache_types import AudioCacheSettings
 
 
 @pytest.mark.asyncio
-async def test_generate_audio():
+async def test_generate_audio(tmp_path):
     """Test audio generation."""
     mock_response = MagicMock()
     mock_response.content = b"audio data"
@@ -25,6 +32,7 @@ async def test_generate_audio():
     mock_client.audio = mock_audio
 
     with (
+        patch("backend.app.custom_agents.article_summarizer.audio.OUTPUTS_DIR", tmp_path),
         patch(
             "backend.app.custom_agents.article_summarizer.audio.AsyncOpenAI",
             return_value=mock_client,
@@ -33,7 +41,12 @@ async def test_generate_audio():
         patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}),
     ):
         result = await generate_audio(
-            "Test text", "test_output", "Test Article", "Test article content", "Formatted text"
+            "Test text",
+            "test_output",
+            "Test Article",
+            "Test article content",
+            "Formatted text",
+            settings=TtsSettings(stream=False),
         )
 
         audio_path, raw_text_path, final_text_path = result
@@ -54,4 +67,184 @@ async def test_generate_audio():
         mock_file = mock_open.return_value.__enter__.return_value
         mock_file.write.assert_any_call("Test article content")
         mock_file.write.assert_any_call("Formatted text")
-        mock_file.write.assert_any_call(b"audio data")
+        assert audio_path.read_bytes() == b"audio data"
+
+
+@pytest.mark.asyncio
+async def test_generate_audio_reuses_cached_narration(tmp_path):
+    """Test that a narration synthesized before is linked instead of re-synthesized."""
+    cache = AudioCache(AudioCacheSettings(directory=tmp_path / "audio"))
+    cached_path = cache.path_for("tts-1", "alloy", "Test text")
+    cached_path.parent.mkdir()
+    cached_path.write_bytes(b"cached audio")
+
+    with (
+        patch("backend.app.custom_agents.article_summarizer.audio.OUTPUTS_DIR", tmp_path),
+        patch("backend.app.custom_agents.article_summarizer.audio.AsyncOpenAI") as mock_openai,
+    ):
+        audio_path, _, _ = await generate_audio(
+            "Test text", "test_output", "Test Article", "content", "Formatted", cache=cache
+        )
+
+    mock_openai.assert_not_called()
+    assert audio_path.read_bytes() == b"cached audio"
+
+
+class _FakeStreamedResponse:
+    """Minimal stand-in for the OpenAI streamed binary response."""
+
+    def __init__(self, chunks: list[bytes]) -> None:
+        self.chunks = chunks
+
+    async def __aenter__(self) -> "_FakeStreamedResponse":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def iter_bytes(self, chunk_size: int | None = None):
+        for chunk in self.chunks:
+            yield chunk
+
+
+@pytest.mark.asyncio
+async def test_generate_audio_streams_to_disk(tmp_path):
+    """Test that streamed chunks are written in order and renamed into place."""
+    mock_client = MagicMock()
+    mock_client.audio.speech.with_streaming_response.create = MagicMock(
+        return_value=_FakeStreamedResponse([b"chunk-1 ", b"chunk-2"])
+    )
+
+    with (
+        patch("backend.app.custom_agents.article_summarizer.audio.OUTPUTS_DIR", tmp_path),
+        patch(
+            "backend.app.custom_agents.article_summarizer.audio.AsyncOpenAI",
+            return_value=mock_client,
+        ),
+    ):
+        audio_path, _, _ = await generate_audio(
+            "Test text", "test_output", "Test Article", "content", "Formatted"
+        )
+
+    assert audio_path.read_bytes() == b"chunk-1 chunk-2"
+    assert not list(audio_path.parent.glob("*.part"))
+    mock_client.audio.speech.with_streaming_response.create.assert_called_once_with(
+        model="tts-1", voice="alloy", input="Test text", response_format="mp3"
+    )
+
+
+@pytest.mark.asyncio
+async def test_generate_audio_joins_parallel_chunks_in_order(tmp_path):
+    """Test that long narrations are synthesized in chunks and joined in narration order."""
+
+    async def fake_create(*, model: str, voice: str, input: str, response_format: str):
+        # Earlier chunks finish last, so ordering must not depend on completion order.
+        await asyncio.sleep(0.03 if input.startswith("First") else 0.0)
+        response = MagicMock()
+        response.content = f"<{input.split()[0]}>".encode()
+        return response
+
+    mock_client = MagicMock()
+    mock_client.audio.speech.create = fake_create
+
+    with (
+        patch("backend.app.custom_agents.article_summarizer.audio.OUTPUTS_DIR", tmp_path),
+        patch(
+            "backend.app.custom_agents.article_summarizer.audio.AsyncOpenAI",
+            return_value=mock_client,
+        ),
+    ):
+        audio_path, _, _ = await generate_audio(
+            "First chunk.\n\nSecond chunk.\n\nThird chunk.",
+            "test_output",
+            "Test Article",
+            "content",
+            "Formatted",
+            settings=TtsSettings(stream=False, max_chunk_chars=15),
+        )
+
+    assert audio_path.read_bytes() == b"<First><Second><Third>"
+    assert not list(audio_path.parent.glob("*.chunks"))
+    assert not audio_path.with_name("live.mp3").exists()
+
+
+@pytest.mark.asyncio
+async def test_generate_audio_concurrent_runs_of_one_cached_narration(tmp_path):
+    """Test that runs synthesizing the same narration into the cache do not share files."""
+
+    async def fake_create(*, model: str, voice: str, input: str, response_format: str):
+        await asyncio.sleep(0.01)
+        response = MagicMock()
+        response.content = f"<{input.split()[0]}>".encode()
+        return response
+
+    mock_client = MagicMock()
+    mock_client.audio.speech.create = fake_create
+    cache = AudioCache(AudioCacheSettings(directory=tmp_path / "audio"))
+    text = "First chunk.\n\nSecond chunk.\n\nThird chunk."
+
+    with (
+        patch("backend.app.custom_agents.article_summarizer.audio.OUTPUTS_DIR", tmp_path),
+        patch(
+            "backend.app.custom_agents.article_summarizer.audio.AsyncOpenAI",
+            return_value=mock_client,
+        ),
+    ):
+        results = await asyncio.gather(
+            *(
+                generate_audio(
+                    text,
+                    "test_output",
+                    "Test Article",
+                    "content",
+                    "Formatted",
+                    settings=TtsSettings(stream=False, max_chunk_chars=15),
+                    cache=cache,
+                )
+                for _ in range(2)
+            )
+        )
+
+    for audio_path, _, _ in results:
+        assert audio_path.read_bytes() == b"<First><Second><Third>"
+    assert [path.name for path in (tmp_path / "audio").iterdir()] == [
+        cache.path_for("tts-1", "alloy", text).name
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generate_audio_keeps_a_narration_larger_than_the_cache(tmp_path):
+    """Test that a narration over the cache budget still reaches the run directory."""
+    mock_response = MagicMock()
+    mock_response.content = b"audio data"
+    mock_client = MagicMock()
+    mock_client.audio.speech.create = AsyncMock(return_value=mock_response)
+    cache = AudioCache(AudioCacheSettings(directory=tmp_path / "audio", max_bytes=5))
+
+    with (
+        patch("backend.app.custom_agents.article_summarizer.audio.OUTPUTS_DIR", tmp_path),
+        patch(
+            "backend.app.custom_agents.article_summarizer.audio.AsyncOpenAI",
+            return_value=mock_client,
+        ),
+    ):
+        audio_path, _, _ = await generate_audio(
+            "Test text",
+            "test_output",
+            "Test Article",
+            "content",
+            "Formatted",
+            settings=TtsSettings(stream=False),
+            cache=cache,
+        )
+
+    assert audio_path.read_bytes() == b"audio data"
+
+
+def test_create_run_directory_never_reuses_a_directory(tmp_path):
+    """Test that runs of same-titled articles started together get their own directories."""
+    with patch("backend.app.custom_agents.article_summarizer.audio.OUTPUTS_DIR", tmp_path):
+        run_dirs = {create_run_directory("Same Title") for _ in range(5)}
+
+    assert len(run_dirs) == 5
+    assert all(run_dir.is_dir() and run_dir.name.startswith("Same_Title_") for run_dir in run_dirs)
@@ -0,0 +1,72 @@
+"""Tests for the audio cache."""
+
+import os
+from pathlib import Path
+
+from backend.app.custom_agents.article_summarizer.audio_cache import AudioCache
+from backend.app.types.article_summarizer.cache_types import AudioCacheSettings
+
+
+def _synthesize(cache: AudioCache, text: str, audio_data: bytes) -> Path:
+    """Write audio where a run synthesizes a narration into the cache, then evict."""
+    path = cache.path_for("tts-1", "alloy", text)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(audio_data)
+    cache.evict(keep=path)
+    return path
+
+
+def test_audio_cache_lookup_and_link(tmp_path):
+    """Test that synthesized audio is found again and linked into a run directory."""
+    cache = AudioCache(AudioCacheSettings(directory=tmp_path / "audio"))
+    assert cache.lookup("tts-1", "alloy", "Hello.") is None
+
+    stored = _synthesize(cache, "Hello.", b"mp3 bytes")
+    assert cache.lookup("tts-1", "alloy", "Hello.") == stored
+    assert cache.lookup("tts-1", "echo", "Hello.") is None
+
+    destination = tmp_path / "run" / "final.mp3"
+    destination.parent.mkdir()
+    cache.link(stored, destination)
+
+    assert destination.read_bytes() == b"mp3 bytes"
+    assert os.path.samefile(stored, destination)
+
+
+def test_audio_cache_evicts_least_recently_used(tmp_path):
+    """Test that the oldest files are removed once the store exceeds its budget."""
+    cache = AudioCache(AudioCacheSettings(directory=tmp_path, max_bytes=2500))
+    old = _synthesize(cache, "old", b"x" * 1000)
+    os.utime(old, (0, 0))
+    recent = _synthesize(cache, "recent", b"x" * 1000)
+    new = _synthesize(cache, "new", b"x" * 1000)
+
+    assert not old.exists()
+    assert recent.exists()
+    assert new.exists()
+
+
+def test_audio_cache_never_evicts_the_kept_file(tmp_path):
+    """Test that a narration larger than the whole budget survives its own eviction."""
+    cache = AudioCache(AudioCacheSettings(directory=tmp_path, max_bytes=10))
+    old = _synthesize(cache, "old", b"x" * 5)
+    large = _synthesize(cache, "large", b"x" * 1000)
+
+    assert large.exists()
+    assert not old.exists()
+
+
+def test_audio_cache_hits_leave_linked_files_unmodified(tmp_path):
+    """Test that reuse counts as recent for eviction without touching the linked audio."""
+    cache = AudioCache(AudioCacheSettings(directory=tmp_path, max_bytes=2500))
+    reused = _synthesize(cache, "reused", b"x" * 1000)
+    os.utime(reused, (0, 0))
+    other = _synthesize(cache, "other", b"x" * 1000)
+    os.utime(other, (1, 1))
+
+    assert cache.lookup("tts-1", "alloy", "reused") == reused
+    assert reused.stat().st_mtime == 0
+    _synthesize(cache, "new", b"x" * 1000)
+
+    assert reused.exists()
+    assert not other.exists()
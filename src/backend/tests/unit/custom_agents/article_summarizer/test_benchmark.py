@@ -0,0 +1,86 @@
+"""Tests for the pipeline benchmark."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from agents import Usage
+
+from backend.app.custom_agents.article_summarizer.agents import (
+    AudioFormat,
+    SummaryData,
+    SummaryWithNarration,
+    audio_formatter_agent,
+    summarizer_agent,
+)
+from backend.app.custom_agents.article_summarizer.benchmark import (
+    benchmark_pipeline_modes,
+    summarize_benchmark,
+)
+from backend.app.types.article_summarizer.pipeline_types import PipelineBenchmarkResult
+
+SUMMARY = SummaryData(
+    title="Title", short_summary="Short.", detailed_summary="Detailed.", key_points=["One"]
+)
+AUDIO_FORMAT = AudioFormat(title="Title", narration_text="Narration.", filename="title")
+HTML = "<html><head><title>Title</title></head><body><p>Body text.</p></body></html>"
+
+
+@pytest.mark.asyncio
+async def test_benchmark_pipeline_modes_counts_calls_and_tokens():
+    """Test that each mode is run on the same article and its agent calls are counted."""
+
+    async def fake_run(agent, input_data):
+        result = MagicMock()
+        result.context_wrapper.usage = Usage(
+            requests=1, input_tokens=100, output_tokens=20, total_tokens=120
+        )
+        if agent is summarizer_agent:
+            result.final_output_as.return_value = SUMMARY
+        elif agent is audio_formatter_agent:
+            result.final_output_as.return_value = AUDIO_FORMAT
+        else:
+            result.final_output_as.return_value = SummaryWithNarration(
+                summary=SUMMARY, audio_format=AUDIO_FORMAT
+            )
+        return result
+
+    with (
+        patch(
+            "backend.app.custom_agents.article_summarizer.benchmark.fetch_article_content",
+            AsyncMock(return_value=HTML),
+        ) as mock_fetch,
+        patch("backend.app.custom_agents.article_summarizer.pipeline.Runner.run", fake_run),
+    ):
+        results = await benchmark_pipeline_modes(["https://example.com/a"], repeat=2)
+
+    mock_fetch.assert_called_once()
+    assert [result.mode for result in results] == ["sequential", "combined"] * 2
+    assert all(not result.error for result in results)
+    assert [result.llm_calls for result in results[:2]] == [2, 1]
+    # Token counts are the provider's, not local estimates of the prompt size
+    assert [(r.input_tokens, r.output_tokens) for r in results[:2]] == [(200, 40), (100, 20)]
+
+
+@pytest.mark.asyncio
+async def test_benchmark_pipeline_modes_rejects_streamed_mode():
+    """Test that the streamed mode, which includes TTS, cannot be benchmarked."""
+    with pytest.raises(ValueError):
+        await benchmark_pipeline_modes(["https://example.com/a"], modes=["streamed"])
+
+
+def test_summarize_benchmark_aggregates_per_mode():
+    """Test the per-mode medians and means, excluding failed runs."""
+    results = [
+        PipelineBenchmarkResult(url="a", mode="sequential", seconds=4.0, input_tokens=100),
+        PipelineBenchmarkResult(url="a", mode="combined", seconds=2.0, input_tokens=60),
+        PipelineBenchmarkResult(url="a", mode="sequential", seconds=6.0, input_tokens=200),
+        PipelineBenchmarkResult(url="a", mode="sequential", seconds=99.0, error="Timed out"),
+    ]
+
+    sequential, combined = summarize_benchmark(results)
+
+    assert sequential.mode == "sequential"
+    assert (sequential.runs, sequential.failures) == (2, 1)
+    assert sequential.median_seconds == 5.0
+    assert sequential.mean_input_tokens == 150
+    assert (combined.runs, combined.median_seconds) == (1, 2.0)
@@ -0,0 +1,88 @@
+"""Tests for the near-duplicate article index."""
+
+from backend.app.custom_agents.article_summarizer.duplicate_index import DuplicateIndex
+from backend.app.helpers.article_summarizer.dedup_helpers import minhash_signature
+from backend.app.types.article_summarizer.cache_types import DuplicateIndexSettings
+
+STORY = " ".join(
+    f"Sentence {i} says the river flooded district {i} overnight and crews responded."
+    for i in range(40)
+)
+VOICE = "tts-1:alloy"
+
+
+def _narration(tmp_path, name):
+    """Create a narration's audio and text files."""
+    audio_path = tmp_path / f"{name}.mp3"
+    final_text_path = tmp_path / f"{name}.txt"
+    audio_path.write_bytes(b"audio")
+    final_text_path.write_text("# Title\n\nNarration.", encoding="utf-8")
+    return audio_path, final_text_path
+
+
+def test_duplicate_index_finds_near_duplicates_across_instances(tmp_path):
+    """Test that indexed articles persist and only near-duplicates are found."""
+    settings = DuplicateIndexSettings(path=tmp_path / "duplicates.sqlite3")
+    audio_path, final_text_path = _narration(tmp_path, "flood")
+    index = DuplicateIndex(settings)
+    index.add(
+        minhash_signature(STORY), "https://example.com/flood", audio_path, final_text_path, VOICE
+    )
+    index.close()
+
+    reopened = DuplicateIndex(settings)
+    match = reopened.find(minhash_signature("Wire report. " + STORY), VOICE)
+    miss = reopened.find(minhash_signature("An unrelated story about a chess tournament."), VOICE)
+    reopened.close()
+
+    assert match is not None
+    assert match.url == "https://example.com/flood"
+    assert match.audio_path == audio_path
+    assert match.similarity > 0.8
+    assert miss is None
+
+
+def test_duplicate_index_drops_entries_without_narration(tmp_path):
+    """Test that entries whose files were deleted are not returned and are removed."""
+    index = DuplicateIndex(DuplicateIndexSettings(path=tmp_path / "duplicates.sqlite3"))
+    audio_path, final_text_path = _narration(tmp_path, "flood")
+    signature = minhash_signature(STORY)
+    index.add(signature, "https://example.com/flood", audio_path, final_text_path, VOICE)
+    audio_path.unlink()
+
+    assert index.find(signature, VOICE) is None
+    assert index._connect().execute("SELECT COUNT(*) FROM bands").fetchone() == (0,)
+    index.close()
+
+
+def test_duplicate_index_evicts_oldest_entries(tmp_path):
+    """Test that the index keeps at most max_entries articles."""
+    index = DuplicateIndex(
+        DuplicateIndexSettings(path=tmp_path / "duplicates.sqlite3", max_entries=1)
+    )
+    audio_path, final_text_path = _narration(tmp_path, "flood")
+    index.add(
+        minhash_signature(STORY), "https://example.com/old", audio_path, final_text_path, VOICE
+    )
+    index.add(
+        minhash_signature(STORY), "https://example.com/new", audio_path, final_text_path, VOICE
+    )
+
+    match = index.find(minhash_signature(STORY), VOICE)
+    assert match is not None
+    assert match.url == "https://example.com/new"
+    assert index._connect().execute("SELECT COUNT(*) FROM articles").fetchone() == (1,)
+    index.close()
+
+
+def test_duplicate_index_only_matches_the_same_voice(tmp_path):
+    """Test that a narration spoken in another TTS model or voice is not reused."""
+    index = DuplicateIndex(DuplicateIndexSettings(path=tmp_path / "duplicates.sqlite3"))
+    audio_path, final_text_path = _narration(tmp_path, "flood")
+    signature = minhash_signature(STORY)
+    index.add(signature, "https://example.com/flood", audio_path, final_text_path, VOICE)
+
+    assert index.find(signature, "tts-1:nova") is None
+    assert index.find(signature, "tts-1-hd:alloy") is None
+    assert index.find(signature, VOICE) is not None
+    index.close()
@@ -0,0 +1,246 @@
+"""Parity tests for the single-pass extraction engine."""
+
+import pytest
+
+from backend.app.custom_agents.article_summarizer.extractor import (
+    StreamingArticleParser,
+    extract_single_pass,
+)
+from backend.app.custom_agents.article_summarizer.parser import extract_article_text
+from backend.tests.unit.custom_agents.article_summarizer.linear_grouping_extractor import (
+    extract_article_text_reference,
+)
+
+FULL_ARTICLE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Full Article | Example News</title>
+    <meta property="og:title" content="Full Article">
+    <meta name="author" content="Jane Doe">
+    <meta property="article:published_time" content="2024-05-01T10:00:00Z">
+    <meta property="og:site_name" content="Example News">
+    <meta name="keywords" content="science, space , research">
+    <style>body { color: red; }</style>
+</head>
+<body>
+    <header><a href="/home">Home</a><h1>Site banner</h1></header>
+    <nav><a href="/news">News</a><p>Navigation paragraph</p></nav>
+    <article>
+        <h1>Full Article</h1>
+        <p>Lead paragraph with a <a href="https://example.com/ref">reference</a>.</p>
+        <figure>
+            <img src="/img/rocket.jpg" alt="Rocket">
+            <figcaption>A rocket on the pad.</figcaption>
+        </figure>
+        <h2>Background</h2>
+        <p>Background paragraph one.</p>
+        <!-- an editorial comment -->
+        <p>Background paragraph <em>two</em>.</p>
+        <p>   </p>
+        <h2></h2>
+        <p>Paragraph after an empty heading.</p>
+        <h3>Data</h3>
+        <table>
+            <tr><th>Year</th><th>Launches</th></tr>
+            <tr><td>2023</td><td>12</td></tr>
+        </table>
+        <p>Closing paragraph.</p>
+        <img src="/img/late.jpg">
+        <script>console.log("tracking");</script>
+    </article>
+    <footer><p>Copyright paragraph</p></footer>
+</body>
+</html>
+"""
+
+NESTED_STRUCTURE = """
+<html><body>
+    <div class="content">
+        <h2>Outer section</h2>
+        <p>Outer one.</p>
+        <div class="inner">
+            <h3>Inner section</h3>
+            <p>Inner paragraph.</p>
+        </div>
+        <p>Outer two.</p>
+        <table>
+            <tr><td>a</td><td><table><tr><td>x</td></tr></table></td></tr>
+            <tr></tr>
+        </table>
+        <table><tr></tr></table>
+        <p><a href="#one">One</a> and <a>two</a></p>
+    </div>
+</body></html>
+"""
+
+TWITTER_METADATA = """
+<html><head>
+    <meta name="twitter:title" content="Ignored name attribute">
+    <meta property="twitter:title" content="Twitter Title">
+    <meta property="article:author" content="Fallback Author">
+    <meta name="date" content="2024-01-01">
+</head><body><p>Body.</p></body></html>
+"""
+
+EMPTY_OG_TITLE = """
+<html><head>
+    <meta property="og:title" content="">
+    <meta property="twitter:title" content="Not used">
+</head><body><p>Body.</p></body></html>
+"""
+
+NO_PARAGRAPHS = """
+<html><body>
+    <div>Some text <span>without</span> paragraphs.</div>
+    <main>Main container text.</main>
+</body></html>
+"""
+
+BODY_FALLBACK = "<html><body><div>Only <b>body</b> text</div></body></html>"
+
+WELL_FORMED_DOCUMENTS = [
+    FULL_ARTICLE,
+    NESTED_STRUCTURE,
+    TWITTER_METADATA,
+    EMPTY_OG_TITLE,
+    NO_PARAGRAPHS,
+    BODY_FALLBACK,
+]
+
+TOKENIZER_EDGE_CASES = [
+    "<p>Fish &amp; chips &copy 2024 &#8212; &#x41;&nosuch; done</p>",
+    "<p><ruby>漢<rp>(</rp><rt>kan <b>ji</b></rt><rp>)</rp></ruby> word</p>",
+    "<pre>  keep   </pre><p>a<b></b>   <i>b</i>\n  <i>c</i></p>",
+    "<p>line<br>break<br/>two</br> <img src=a.png></img>end</p><figcaption>cap</figcaption>",
+    "<div/><p>after a self-closed div</p><template><p>template text</p></template>",
+    "<p>cdata <![CDATA[inside]]> and <!-- comment --> more</p>",
+    "<table><tr><td>a<td>b</tr><tr><th>c</table><p>x</p>",
+]
+
+MALFORMED_DOCUMENTS = [
+    "<p>Unclosed <b>bold<p>nested paragraph</p></b>",
+    "<div><h2>Stray</h2><p>text</div></span><p>after</p>",
+    "plain text with no markup at all",
+    "",
+]
+
+
+@pytest.mark.parametrize("html_content", WELL_FORMED_DOCUMENTS + MALFORMED_DOCUMENTS)
+def test_single_pass_matches_reference_extractor(html_content):
+    """Test that the single-pass engine reproduces the reference extractor exactly."""
+    single_pass = extract_article_text(html_content, parser_backend="html.parser")
+    reference = extract_article_text_reference(html_content)
+
+    # The reference extractor does not score extraction quality
+    assert single_pass.model_dump(exclude={"quality"}) == reference.model_dump(exclude={"quality"})
+
+
+@pytest.mark.parametrize(
+    "html_content", WELL_FORMED_DOCUMENTS + MALFORMED_DOCUMENTS + TOKENIZER_EDGE_CASES
+)
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_streaming_parser_matches_tree_walk(html_content, chunk_size):
+    """Test that feeding HTML in chunks gives the same result as parsing it whole."""
+    parser = StreamingArticleParser()
+    for start in range(0, len(html_content), chunk_size):
+        parser.feed(html_content[start : start + chunk_size])
+    parser.close()
+
+    assert parser.result() == extract_single_pass(html_content, "html.parser")
+
+
+def test_streaming_parser_reports_metadata_before_body():
+    """Test that head metadata and early paragraphs are available mid-download."""
+    reported = []
+    parser = StreamingArticleParser(on_metadata=reported.append)
+
+    parser.feed(FULL_ARTICLE[: FULL_ARTICLE.index("</head>")])
+    assert reported == []
+
+    parser.feed("</head>")
+    assert len(reported) == 1
+    assert reported[0].title == "Full Article"
+    assert reported[0].author == "Jane Doe"
+
+    parser.feed("<body><article><p>First paragraph.</p><p>Second")
+    assert parser.collector.paragraphs == ["First paragraph."]
+
+    parser.feed(" paragraph.</p></article></body></html>")
+    parser.close()
+    assert len(reported) == 1
+    assert parser.result().text == "First paragraph.\n\nSecond paragraph."
+
+
+@pytest.mark.parametrize("html_content", WELL_FORMED_DOCUMENTS)
+def test_lxml_backend_matches_reference_extractor(html_content):
+    """Test that the lxml backend agrees with the reference extractor on well-formed HTML."""
+    pytest.importorskip("lxml")
+
+    single_pass = extract_article_text(html_content, parser_backend="lxml")
+    reference = extract_article_text_reference(html_content)
+
+    # The reference extractor does not score extraction quality
+    assert single_pass.model_dump(exclude={"quality"}) == reference.model_dump(exclude={"quality"})
+
+
+def test_single_pass_extracts_full_article():
+    """Test the extracted content of a realistic article."""
+    result = extract_article_text(FULL_ARTICLE, parser_backend="html.parser")
+
+    assert result.metadata.title == "Full Article"
+    assert result.metadata.tags == ["science", "space", "research"]
+    assert "Navigation paragraph" not in result.text
+    assert "Copyright paragraph" not in result.text
+    assert [s.heading for s in result.subsections] == ["Full Article", "Background", "Data"]
+    assert result.structure.images[0].caption == "A rocket on the pad."
+    assert result.structure.images[1].caption == ""
+    assert result.structure.tables[0].content == "Year Launches, 2023 12"
+
+
+def test_subsections_end_at_the_next_sibling_heading():
+    """Test the intended change from the baseline engine's subsection grouping."""
+    html_content = (
+        "<h2>A</h2><p>one</p><div><h2>B</h2><p>two</p></div><p>three</p>"
+        "<h3>C</h3><p>four</p><h2>D</h2><p>five</p>"
+    )
+
+    result = extract_article_text(html_content, parser_backend="html.parser")
+
+    # The baseline engine let A run until B, which is not a sibling, so it collected
+    # "one\n\nthree\n\nfour\n\nfive"; now A ends at C, its next sibling heading
+    assert [(s.heading, s.content) for s in result.subsections] == [
+        ("A", "one\n\nthree"),
+        ("B", "two"),
+        ("C", "four"),
+        ("D", "five"),
+    ]
+
+
+def test_quality_separates_articles_from_link_lists():
+    """Test that an article scores high confidence and a page of teaser links does not."""
+    paragraph = "This sentence explains a finding of the study in some detail. " * 4
+    article = (
+        "<html><body><nav><a href='/'>Home</a></nav><article><h1>Title</h1>"
+        + f"<p>{paragraph}</p>" * 8
+        + "</article><aside><p><a href='/a'>Related story</a></p></aside></body></html>"
+    )
+    index = (
+        "<html><body>"
+        + "".join(
+            f"<div><h3>Story {i}</h3><p><a href='/{i}'>Teaser headline {i}</a></p></div>"
+            for i in range(30)
+        )
+        + "</body></html>"
+    )
+
+    article_quality = extract_article_text(article, parser_backend="html.parser").quality
+    index_quality = extract_article_text(index, parser_backend="html.parser").quality
+
+    assert article_quality.paragraph_count == 9
+    assert article_quality.link_density < 0.02
+    assert article_quality.container_share > 0.95
+    assert article_quality.confidence > 0.9
+    assert index_quality.link_density == 1.0
+    assert index_quality.confidence == 0.0
+    assert extract_article_text(NO_PARAGRAPHS, parser_backend="html.parser").quality.confidence == 0
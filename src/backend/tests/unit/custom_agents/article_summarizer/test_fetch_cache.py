@@ -0,0 +1,98 @@
+"""Tests for the fetch cache."""
+
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from backend.app.custom_agents.article_summarizer.fetch_cache import FetchCache
+from backend.app.custom_agents.article_summarizer.parser import fetch_article_content
+from backend.app.types.article_summarizer.cache_types import FetchCacheSettings
+
+
+def _response(status_code: int, text: str = "", headers: dict[str, str] | None = None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    response.headers = httpx.Headers(headers or {})
+    return response
+
+
+def test_fetch_cache_round_trip(tmp_path):
+    """Test storing and loading a page with its validators."""
+    cache = FetchCache(FetchCacheSettings(directory=tmp_path))
+    cache.put("https://Example.com/a#frag", "<p>Hi</p>", etag='"v1"', last_modified="yesterday")
+
+    page = cache.get("https://example.com/a")
+
+    assert page is not None
+    assert page.body == "<p>Hi</p>"
+    assert page.etag == '"v1"'
+    assert page.last_modified == "yesterday"
+    assert cache.is_fresh(page)
+
+
+def test_fetch_cache_evicts_least_recently_used(tmp_path):
+    """Test that the oldest entries are evicted once the size budget is exceeded."""
+    cache = FetchCache(FetchCacheSettings(directory=tmp_path, max_bytes=10_000))
+    body = os.urandom(3000).hex()  # incompressible, ~3 KB once gzipped
+
+    cache.put("https://example.com/old", body)
+    cache.put("https://example.com/recent", body)
+    old_meta = next(p for p in tmp_path.glob("*.json") if "old" in p.read_text())
+    os.utime(old_meta, (0, 0))
+    cache.put("https://example.com/new", body)
+
+    assert cache.get("https://example.com/old") is None
+    assert cache.get("https://example.com/recent") is not None
+    assert cache.get("https://example.com/new") is not None
+
+
+@pytest.mark.asyncio
+async def test_fetch_article_content_serves_fresh_cache_without_request(tmp_path):
+    """Test that a fresh cache entry is served without touching the network."""
+    cache = FetchCache(FetchCacheSettings(directory=tmp_path))
+    cache.put("https://example.com", "<p>Cached</p>")
+    client = MagicMock()
+    client.get = AsyncMock()
+
+    result = await fetch_article_content("https://example.com", client, cache)
+
+    assert result == "<p>Cached</p>"
+    client.get.assert_not_called()
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_article_content_revalidates_stale_cache(tmp_path):
+    """Test that a stale entry is revalidated and reused on 304 Not Modified."""
+    cache = FetchCache(FetchCacheSettings(directory=tmp_path, max_age=0))
+    cache.put("https://example.com", "<p>Cached</p>", etag='"v1"')
+    client = MagicMock()
+    client.get = AsyncMock(return_value=_response(304))
+
+    result = await fetch_article_content("https://example.com", client, cache)
+
+    assert result == "<p>Cached</p>"
+    client.get.assert_called_once_with("https://example.com", headers={"If-None-Match": '"v1"'})
+    assert cache.stats.revalidated == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_article_content_stores_misses(tmp_path):
+    """Test that a downloaded page is stored together with its validators."""
+    cache = FetchCache(FetchCacheSettings(directory=tmp_path))
+    client = MagicMock()
+    client.get = AsyncMock(
+        return_value=_response(200, "<p>Fresh</p>", {"ETag": '"v2"', "Last-Modified": "today"})
+    )
+
+    result = await fetch_article_content("https://example.com", client, cache)
+
+    assert result == "<p>Fresh</p>"
+    assert cache.stats.misses == 1
+    page = cache.get("https://example.com")
+    assert page is not None
+    assert page.etag == '"v2"'
+    assert page.last_modified == "today"
@@ -0,0 +1,54 @@
+"""Tests for the pooled HTTP client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.app.custom_agents.article_summarizer.http_client import PooledHttpClient
+from backend.app.types.article_summarizer.http_types import HttpClientSettings
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_reuses_one_connection_pool():
+    """Test that every request goes through the same underlying client until closed."""
+    mock_client = AsyncMock()
+    mock_client.get = AsyncMock(return_value=MagicMock())
+
+    with patch("httpx.AsyncClient", return_value=mock_client) as mock_client_class:
+        client = PooledHttpClient()
+        await client.get("https://example.com/a")
+        await client.get("https://example.com/b", headers={"Accept": "text/html"})
+        await client.aclose()
+
+    mock_client_class.assert_called_once()
+    assert mock_client.get.call_count == 2
+    mock_client.get.assert_called_with("https://example.com/b", headers={"Accept": "text/html"})
+    mock_client.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_limits_requests_per_host():
+    """Test that concurrent requests to one host are capped while other hosts proceed."""
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def fake_get(url: str, headers: dict[str, str] | None = None) -> MagicMock:
+        host = url.split("/")[2]
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return MagicMock()
+
+    mock_client = AsyncMock()
+    mock_client.get = fake_get
+
+    with patch("httpx.AsyncClient", return_value=mock_client):
+        async with PooledHttpClient(HttpClientSettings(max_connections_per_host=2)) as client:
+            await asyncio.gather(
+                *(client.get(f"https://a.example/{i}") for i in range(6)),
+                *(client.get(f"https://b.example/{i}") for i in range(2)),
+            )
+
+    assert peak == {"a.example": 2, "b.example": 2}
@@ -0,0 +1,132 @@
+"""Tests for the summarization job queue."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.app.custom_agents.article_summarizer.job_queue import JobQueue, QueueFullError
+from backend.app.custom_agents.article_summarizer.job_store import JobStore
+from backend.app.custom_agents.article_summarizer.progress import emit_progress
+from backend.app.types.article_summarizer.job_types import Job, JobQueueSettings, JobStoreSettings
+
+RESULT = (Path("outputs/a/final.mp3"), Path("outputs/a/raw.txt"), Path("outputs/a/final.txt"))
+
+
+def _manager(summarize: AsyncMock, job_store: JobStore | None = None) -> MagicMock:
+    """Build a stand-in manager whose summarize_article is the given mock."""
+    manager = MagicMock()
+    manager.summarize_article = summarize
+    manager.aclose = AsyncMock()
+    manager.job_store = job_store
+    return manager
+
+
+async def _wait_until_finished(queue: JobQueue, job_id: str) -> None:
+    """Wait for a job to succeed or fail."""
+    while (await queue.get(job_id)).status in ("queued", "running"):
+        await asyncio.sleep(0.001)
+
+
+@pytest.mark.asyncio
+async def test_job_queue_runs_jobs_and_records_results():
+    """Test that workers run submitted jobs and record paths, errors and metrics."""
+
+    async def summarize(url: str):
+        if url.endswith("raises"):
+            raise RuntimeError("boom")
+        return RESULT if url.endswith("ok") else None
+
+    manager = _manager(AsyncMock(side_effect=summarize))
+    async with JobQueue(JobQueueSettings(workers=2), manager) as queue:
+        jobs = [
+            await queue.submit(f"https://example.com/{name}") for name in ("ok", "none", "raises")
+        ]
+        for job in jobs:
+            await _wait_until_finished(queue, job.id)
+
+    ok, none, raises = [await queue.get(job.id) for job in jobs]
+    assert ok.status == "succeeded"
+    assert ok.audio_path == RESULT[0]
+    assert ok.metrics is not None
+    assert ok.metrics.url == "https://example.com/ok"
+    assert none.status == "failed"
+    assert none.error == "Summarization failed"
+    assert raises.error == "boom"
+    manager.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_job_queue_refuses_jobs_beyond_max_depth():
+    """Test that submissions fail fast once the queue is full."""
+    release = asyncio.Event()
+
+    async def summarize(url: str):
+        await release.wait()
+        return RESULT
+
+    settings = JobQueueSettings(workers=1, max_queue_depth=1)
+    async with JobQueue(settings, _manager(AsyncMock(side_effect=summarize))) as queue:
+        running = await queue.submit("https://example.com/1")
+        while (await queue.get(running.id)).status != "running":
+            await asyncio.sleep(0.001)
+        await queue.submit("https://example.com/2")
+
+        with pytest.raises(QueueFullError):
+            await queue.submit("https://example.com/3")
+        assert queue.depth == 1
+        release.set()
+
+
+@pytest.mark.asyncio
+async def test_job_queue_forgets_oldest_finished_jobs():
+    """Test that only the most recent finished jobs are kept."""
+    settings = JobQueueSettings(workers=1, max_finished_jobs=1)
+    async with JobQueue(settings, _manager(AsyncMock(return_value=RESULT))) as queue:
+        first = await queue.submit("https://example.com/1")
+        await _wait_until_finished(queue, first.id)
+        second = await queue.submit("https://example.com/2")
+        await _wait_until_finished(queue, second.id)
+
+        assert await queue.get(first.id) is None
+        assert (await queue.get(second.id)).status == "succeeded"
+
+
+@pytest.mark.asyncio
+async def test_job_queue_logs_progress_events():
+    """Test that a job's event log holds its progress from queued to its final event."""
+
+    async def summarize(url: str):
+        emit_progress("parsed", title="Title")
+        return RESULT
+
+    async with JobQueue(manager=_manager(AsyncMock(side_effect=summarize))) as queue:
+        job = await queue.submit("https://example.com/a")
+        followed = [(index, event.type) async for index, event in queue.events(job.id).follow()]
+        resumed = [event.type async for _, event in queue.events(job.id).follow(start=2)]
+
+    assert followed == [(0, "queued"), (1, "started"), (2, "parsed"), (3, "succeeded")]
+    assert resumed == ["parsed", "succeeded"]
+    assert queue.events("unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_job_queue_recovers_unfinished_jobs_from_store(tmp_path):
+    """Test that jobs interrupted by a restart run again and finished jobs stay queryable."""
+    store = JobStore(JobStoreSettings(path=tmp_path / "jobs.sqlite3"))
+    store.save_job(Job(id="interrupted", url="https://example.com/a", created_at=1.0))
+    store.save_job(Job(id="done", url="https://example.com/b", status="succeeded", created_at=0.5))
+    summarize = AsyncMock(return_value=RESULT)
+
+    async with JobQueue(manager=_manager(summarize, store)) as queue:
+        await _wait_until_finished(queue, "interrupted")
+        events = [event async for _, event in queue.events("interrupted").follow()]
+
+        assert (await queue.get("interrupted")).status == "succeeded"
+        assert (await queue.get("done")).status == "succeeded"
+        assert store.get_job("interrupted").audio_path == RESULT[0]
+        assert store.unfinished_jobs() == []
+    summarize.assert_awaited_once_with("https://example.com/a")
+    assert events[0].data == {"url": "https://example.com/a", "resumed": True}
+    store.close()
@@ -0,0 +1,83 @@
+"""Tests for the persistent job store."""
+
+import sqlite3
+import time
+from unittest.mock import patch
+
+from backend.app.custom_agents.article_summarizer.agents import ArticleContent, SummaryData
+from backend.app.custom_agents.article_summarizer.job_store import JobStore, RunCheckpoints
+from backend.app.types.article_summarizer.job_types import Job, JobStoreSettings
+
+URL = "https://example.com/a"
+VARIANT = "sequential:tts-1:alloy"
+CONTENT = ArticleContent(title="Title", content="Body text.", url=URL)
+
+
+def test_checkpoints_round_trip_until_cleared(tmp_path):
+    """Test that stage outputs survive a reopen and are removed per URL and variant."""
+    store = JobStore(JobStoreSettings(path=tmp_path / "jobs.sqlite3"))
+    store.save_checkpoint(URL, VARIANT, "content", CONTENT)
+    store.save_checkpoint(URL, "combined:tts-1:alloy", "content", CONTENT)
+    store.save_checkpoint("https://example.com/b", VARIANT, "content", CONTENT)
+    store.close()
+
+    reopened = JobStore(JobStoreSettings(path=tmp_path / "jobs.sqlite3"))
+    assert reopened.load_checkpoint(URL, VARIANT, "content", ArticleContent) == CONTENT
+    assert reopened.load_checkpoint(URL, VARIANT, "summary", SummaryData) is None
+    assert reopened.load_checkpoint(URL, "sequential:tts-1:nova", "content", ArticleContent) is None
+
+    reopened.clear_checkpoints(URL, VARIANT)
+    assert reopened.load_checkpoint(URL, VARIANT, "content", ArticleContent) is None
+    assert reopened.load_checkpoint(URL, "combined:tts-1:alloy", "content", ArticleContent)
+    assert reopened.load_checkpoint("https://example.com/b", VARIANT, "content", ArticleContent)
+    reopened.close()
+
+
+def test_expired_and_unreadable_checkpoints_are_discarded(tmp_path):
+    """Test that stale checkpoints and checkpoints of another type are not resumed from."""
+    store = JobStore(JobStoreSettings(path=tmp_path / "jobs.sqlite3", checkpoint_ttl=60))
+    store.save_checkpoint(URL, VARIANT, "content", CONTENT)
+    store.save_checkpoint(URL, VARIANT, "summary", CONTENT)
+
+    assert store.load_checkpoint(URL, VARIANT, "summary", SummaryData) is None
+    with patch("time.time", return_value=time.time() + 120):
+        assert store.load_checkpoint(URL, VARIANT, "content", ArticleContent) is None
+    assert store.load_checkpoint(URL, VARIANT, "content", ArticleContent) is None
+    store.close()
+
+
+def test_jobs_are_saved_in_a_wal_database(tmp_path):
+    """Test that jobs are saved, unfinished jobs listed and old finished jobs removed."""
+    path = tmp_path / "jobs.sqlite3"
+    store = JobStore(JobStoreSettings(path=path, max_finished_jobs=1))
+    queued = Job(id="queued", url=URL, created_at=1.0)
+    running = Job(id="running", url=URL, status="running", created_at=2.0, started_at=3.0)
+    for index, job_id in enumerate(["old", "new"]):
+        store.save_job(Job(id=job_id, url=URL, status="succeeded", created_at=4.0 + index))
+    store.save_job(running)
+    store.save_job(queued)
+
+    assert store.unfinished_jobs() == [queued, running]
+    assert store.get_job("running") == running
+    assert store.get_job("old") is None
+    assert store.get_job("new").status == "succeeded"
+    store.close()
+
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+async def test_run_checkpoints_are_cleared_by_the_last_run(tmp_path):
+    """Test that overlapping runs of a URL keep its checkpoints until the last one ends."""
+    store = JobStore(JobStoreSettings(path=tmp_path / "jobs.sqlite3"))
+    checkpoints = RunCheckpoints(store, VARIANT)
+
+    with checkpoints.active_run(URL):
+        await checkpoints.save(URL, "content", CONTENT)
+        with checkpoints.active_run(URL):
+            await checkpoints.clear(URL)
+        assert await checkpoints.load(URL, "content", ArticleContent) == CONTENT
+        await checkpoints.clear(URL)
+    assert await checkpoints.load(URL, "content", ArticleContent) is None
+    assert await RunCheckpoints(None, VARIANT).load(URL, "content", ArticleContent) is None
+    store.close()
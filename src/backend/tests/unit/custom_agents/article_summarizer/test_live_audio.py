@@ -0,0 +1,89 @@
+"""Tests for publishing and tailing narration audio in progress."""
+
+import asyncio
+
+import pytest
+
+from backend.app.custom_agents.article_summarizer.live_audio import (
+    LiveAudio,
+    LiveAudioFailed,
+    tail_audio,
+)
+from backend.app.custom_agents.article_summarizer.progress import track_progress
+
+FRAME_HEADER = b"\xff\xfb\x90\x00"
+FRAME_LENGTH = 417
+ID3V2 = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"x" * 5
+XING = FRAME_HEADER + b"\x00" * 32 + b"Xing" + b"\x00" * (FRAME_LENGTH - 40)
+ID3V1 = b"TAG" + b"\x00" * 125
+
+
+def _frame(fill: bytes) -> bytes:
+    return FRAME_HEADER + fill * (FRAME_LENGTH - len(FRAME_HEADER))
+
+
+async def _read_all(run_dir) -> bytes:
+    """Collect everything a reader tailing a run receives."""
+    return b"".join([chunk async for chunk in tail_audio(run_dir)])
+
+
+@pytest.mark.asyncio
+async def test_live_audio_publishes_parts_in_order_to_readers(tmp_path):
+    """Test that parts finishing out of order reach readers in narration order."""
+    events = []
+    with track_progress(events.append):
+        live = LiveAudio(tmp_path)
+    reader = asyncio.create_task(_read_all(tmp_path))
+
+    live.writer(1)(_frame(b"c"))
+    live.writer(0)(_frame(b"a"))
+    assert live.path.read_bytes() == _frame(b"a")[:-128]
+
+    live.finish(1)
+    live.writer(0)(_frame(b"b"))
+    live.finish(0)
+    assert live.path.read_bytes() == _frame(b"a") + _frame(b"b") + _frame(b"c")
+
+    await asyncio.sleep(0.05)
+    live.close()
+
+    assert await asyncio.wait_for(reader, 1) == _frame(b"a") + _frame(b"b") + _frame(b"c")
+    assert not live.path.exists()
+    assert events[0].type == "audio_started"
+    assert events[0].data == {"run": tmp_path.name}
+
+
+def test_live_audio_leaves_out_the_tags_and_vbr_header_of_each_part(tmp_path):
+    """Test that only audio frames are published, however the part's bytes are split."""
+    live = LiveAudio(tmp_path)
+    part = ID3V2 + XING + _frame(b"a") + ID3V1
+    for index in range(2):
+        write = live.writer(index)
+        for start in range(0, len(part), 7):
+            write(part[start : start + 7])
+        live.finish(index)
+
+    assert live.path.read_bytes() == _frame(b"a") * 2
+    live.close()
+
+
+@pytest.mark.asyncio
+async def test_tail_audio_fails_when_synthesis_is_aborted(tmp_path):
+    """Test that a reader gets an error instead of truncated audio if synthesis fails."""
+    live = LiveAudio(tmp_path)
+    reader = asyncio.create_task(_read_all(tmp_path))
+    live.writer(0)(_frame(b"a") * 2)
+    await asyncio.sleep(0.05)
+    live.abort()
+
+    with pytest.raises(LiveAudioFailed):
+        await asyncio.wait_for(reader, 1)
+    assert not live.path.exists()
+
+
+@pytest.mark.asyncio
+async def test_tail_audio_reads_final_audio_of_finished_run(tmp_path):
+    """Test that tailing a finished run yields its final audio."""
+    (tmp_path / "final.mp3").write_bytes(b"finished audio")
+
+    assert await _read_all(tmp_path) == b"finished audio"
@@ -0,0 +1,382 @@
+"""Tests for the article summarizer manager."""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.app.custom_agents.article_summarizer.agents import (
+    ArticleContent,
+    AudioFormat,
+    SummaryData,
+)
+from backend.app.custom_agents.article_summarizer.audio import read_summary, write_summary
+from backend.app.custom_agents.article_summarizer.corpus import DocumentCorpus
+from backend.app.custom_agents.article_summarizer.manager import ArticleSummarizerManager
+from backend.app.helpers.article_summarizer.dedup_helpers import minhash_signature
+from backend.app.types.article_summarizer.analysis_types import CorpusSettings
+from backend.app.types.article_summarizer.cache_types import (
+    DuplicateIndexSettings,
+    FetchCacheSettings,
+)
+from backend.app.types.article_summarizer.job_types import JobStoreSettings
+from backend.app.types.article_summarizer.manager_types import StageConcurrencyLimits
+from backend.app.types.article_summarizer.parser_types import ParseSettings
+
+ARTICLE_HTML = (
+    "<html><head><title>Local</title></head><body><article>"
+    + "<p>A long paragraph of article text that explains the story in detail.</p>" * 30
+    + "</article></body></html>"
+)
+SCRIPT_HTML = "<html><head><title>App</title></head><body><div id='app'>Story</div></body></html>"
+
+
+@pytest.mark.asyncio
+async def test_summarize_many_yields_results_in_completion_order():
+    """Test that batch results stream out as each article finishes."""
+    delays = {"https://example.com/slow": 0.05, "https://example.com/fast": 0.0}
+
+    async def fake_summarize(url: str) -> tuple[Path, Path, Path] | None:
+        await asyncio.sleep(delays[url])
+        run_dir = Path("outputs") / url.rsplit("/", 1)[-1]
+        return run_dir / "final.mp3", run_dir / "raw.txt", run_dir / "final.txt"
+
+    manager = ArticleSummarizerManager()
+    with patch.object(manager, "summarize_article", side_effect=fake_summarize):
+        results = [result async for result in manager.summarize_many(list(delays))]
+
+    assert [result.url for result in results] == [
+        "https://example.com/fast",
+        "https://example.com/slow",
+    ]
+    assert [result.error for result in results] == ["", ""]
+    assert results[0].audio_path == Path("outputs/fast/final.mp3")
+
+
+@pytest.mark.asyncio
+async def test_summarize_many_bounds_the_articles_in_flight():
+    """Test that a batch starts new articles only as earlier ones finish."""
+    running = 0
+    peak = 0
+    read = []
+
+    async def fake_summarize(url: str) -> tuple[Path, Path, Path] | None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return None
+
+    def urls():
+        for i in range(10):
+            read.append(i)
+            yield f"https://example.com/{i}"
+
+    manager = ArticleSummarizerManager(limits=StageConcurrencyLimits(articles=3))
+    with patch.object(manager, "summarize_article", side_effect=fake_summarize):
+        batch = manager.summarize_many(urls())
+        await anext(batch)
+        assert len(read) == 4
+        results = [result async for result in batch]
+
+    assert len(results) == 9
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_summarize_many_reports_failures():
+    """Test that failed and raising articles are reported without stopping the batch."""
+
+    async def fake_summarize(url: str) -> tuple[Path, Path, Path] | None:
+        if url.endswith("raises"):
+            raise RuntimeError("boom")
+        return None
+
+    manager = ArticleSummarizerManager()
+    with patch.object(manager, "summarize_article", side_effect=fake_summarize):
+        results = {
+            result.url: result
+            async for result in manager.summarize_many(
+                ["https://example.com/fails", "https://example.com/raises"]
+            )
+        }
+
+    assert not results["https://example.com/fails"].succeeded
+    assert results["https://example.com/fails"].error == "Summarization failed"
+    assert results["https://example.com/raises"].error == "boom"
+
+
+@pytest.mark.parametrize(
+    ("html_content", "expected_title", "llm_calls"),
+    [(ARTICLE_HTML, "Local", 0), (SCRIPT_HTML, "Cleaned", 1)],
+)
+@pytest.mark.asyncio
+async def test_extract_content_falls_back_to_llm_only_when_unsure(
+    html_content, expected_title, llm_calls
+):
+    """Test that the content extractor agent only runs for low-confidence extractions."""
+    cleaned = ArticleContent(title="Cleaned", content="Story text.", url="")
+    manager = ArticleSummarizerManager(
+        parse_settings=ParseSettings(executor="thread"),
+        fetch_cache_settings=FetchCacheSettings(enabled=False),
+    )
+
+    with (
+        patch(
+            "backend.app.custom_agents.article_summarizer.manager.fetch_article_content",
+            AsyncMock(return_value=html_content),
+        ),
+        patch(
+            "backend.app.custom_agents.article_summarizer.manager.run_content_extractor",
+            AsyncMock(return_value=cleaned),
+        ) as mock_extractor,
+    ):
+        article_content = await manager._extract_content("https://example.com/a")
+    await manager.aclose()
+
+    assert article_content is not None
+    assert article_content.title == expected_title
+    assert mock_extractor.call_count == llm_calls
+
+
+@pytest.mark.asyncio
+async def test_summarize_article_reuses_narration_of_near_duplicate(tmp_path):
+    """Test that a syndicated copy of an indexed article skips the agents and TTS."""
+    story = " ".join(f"Sentence {i} of the syndicated story about the harbor." for i in range(40))
+    original_dir = tmp_path / "original"
+    original_dir.mkdir()
+    audio_path = original_dir / "final.mp3"
+    final_text_path = original_dir / "final.txt"
+    audio_path.write_bytes(b"audio")
+    final_text_path.write_text(
+        "# Harbor\n\nNarration.\n\nGenerated from: https://example.com/original",
+        encoding="utf-8",
+    )
+    summary = SummaryData(
+        title="Harbor", short_summary="Short.", detailed_summary="Detailed.", key_points=[]
+    )
+    write_summary(original_dir, summary)
+    manager = ArticleSummarizerManager(
+        duplicate_index_settings=DuplicateIndexSettings(path=tmp_path / "duplicates.sqlite3"),
+        job_store_settings=JobStoreSettings(path=tmp_path / "jobs.sqlite3"),
+    )
+    manager._duplicates.index.add(
+        minhash_signature(story),
+        "https://example.com/original",
+        audio_path,
+        final_text_path,
+        manager._voice,
+    )
+    copy = ArticleContent(title="Harbor", content="Via wire. " + story, url="")
+
+    with (
+        patch("backend.app.custom_agents.article_summarizer.audio.OUTPUTS_DIR", tmp_path),
+        patch.object(manager, "_extract_content", AsyncMock(return_value=copy)),
+        patch(
+            "backend.app.custom_agents.article_summarizer.manager.run_summarizer", AsyncMock()
+        ) as mock_summarizer,
+    ):
+        result = await manager.summarize_article("https://example.com/copy")
+    await manager.aclose()
+
+    assert result is not None
+    new_audio_path, raw_text_path, new_final_text_path = result
+    mock_summarizer.assert_not_called()
+    assert new_audio_path.read_bytes() == b"audio"
+    assert raw_text_path.read_text(encoding="utf-8") == copy.content
+    assert new_final_text_path.read_text(encoding="utf-8") == (
+        "# Harbor\n\nNarration.\n\nGenerated from: https://example.com/copy"
+    )
+    assert read_summary(new_audio_path.parent) == summary
+    metrics = json.loads((new_audio_path.parent / "metrics.json").read_text(encoding="utf-8"))
+    assert [stage["stage"] for stage in metrics["stages"]] == ["dedup"]
+    assert metrics["stages"][0]["cache"] == "hit"
+
+
+@pytest.mark.asyncio
+async def test_summarize_many_narrates_near_duplicates_in_a_batch_once(tmp_path):
+    """Test that a near-duplicate waits for the in-flight narration of its original."""
+    story = " ".join(f"Sentence {i} of the syndicated story about the harbor." for i in range(40))
+    contents = {
+        "https://example.com/original": ArticleContent(title="Harbor", content=story, url=""),
+        "https://example.com/copy": ArticleContent(
+            title="Harbor", content="Via wire. " + story, url=""
+        ),
+    }
+    summary = SummaryData(
+        title="Harbor", short_summary="Short.", detailed_summary="Detailed.", key_points=[]
+    )
+    audio_format = AudioFormat(title="Harbor", narration_text="Narration.", filename="harbor")
+
+    async def fake_generate_audio(*args, **kwargs) -> tuple[Path, Path, Path]:
+        await asyncio.sleep(0.05)
+        run_dir = tmp_path / "original"
+        run_dir.mkdir()
+        audio_path = run_dir / "final.mp3"
+        audio_path.write_bytes(b"audio")
+        final_text_path = run_dir / "final.txt"
+        final_text_path.write_text(args[4], encoding="utf-8")
+        return audio_path, run_dir / "raw.txt", final_text_path
+
+    module = "backend.app.custom_agents.article_summarizer.manager"
+    manager = ArticleSummarizerManager(
+        duplicate_index_settings=DuplicateIndexSettings(path=tmp_path / "duplicates.sqlite3"),
+        job_store_settings=JobStoreSettings(enabled=False),
+    )
+    with (
+        patch("backend.app.custom_agents.article_summarizer.audio.OUTPUTS_DIR", tmp_path),
+        patch.object(manager, "_extract_content", AsyncMock(side_effect=contents.get)),
+        patch(f"{module}.analyze_content", AsyncMock(return_value=None)),
+        patch(f"{module}.run_summarizer", AsyncMock(return_value=summary)) as mock_summarizer,
+        patch(f"{module}.run_audio_formatter", AsyncMock(return_value=audio_format)),
+        patch(f"{module}.generate_audio", side_effect=fake_generate_audio) as mock_audio,
+    ):
+        results = [result async for result in manager.summarize_many(contents)]
+    await manager.aclose()
+
+    assert [result.error for result in results] == ["", ""]
+    mock_summarizer.assert_awaited_once()
+    mock_audio.assert_called_once()
+    copy = next(result for result in results if result.url.endswith("/copy"))
+    assert copy.audio_path.read_bytes() == b"audio"
+    assert copy.final_text_path.read_text(encoding="utf-8").endswith("https://example.com/copy")
+    assert read_summary(copy.audio_path.parent) == summary
+
+
+@pytest.mark.asyncio
+async def test_summarize_article_resumes_from_stage_checkpoints(tmp_path):
+    """Test that a retried URL skips its completed stages and clears them on success."""
+    url = "https://example.com/a"
+    content = ArticleContent(title="Title", content="Body text.", url=url)
+    summary = SummaryData(
+        title="Title", short_summary="Short.", detailed_summary="Detailed.", key_points=[]
+    )
+    audio_format = AudioFormat(title="Title", narration_text="Narration.", filename="title")
+    manager = ArticleSummarizerManager(
+        duplicate_index_settings=DuplicateIndexSettings(enabled=False),
+        job_store_settings=JobStoreSettings(path=tmp_path / "jobs.sqlite3"),
+        corpus_settings=CorpusSettings(enabled=False),
+    )
+    outputs = (tmp_path / "final.mp3", tmp_path / "raw.txt", tmp_path / "final.txt")
+    module = "backend.app.custom_agents.article_summarizer.manager"
+
+    with (
+        patch.object(manager, "_extract_content", AsyncMock(return_value=content)) as mock_extract,
+        patch(f"{module}.run_summarizer", AsyncMock(return_value=summary)) as mock_summarizer,
+        patch(f"{module}.run_audio_formatter", AsyncMock(return_value=None)),
+    ):
+        assert await manager.summarize_article(url) is None
+
+    with (
+        patch.object(manager, "_extract_content", AsyncMock()) as mock_extract_again,
+        patch(f"{module}.run_summarizer", AsyncMock()) as mock_summarizer_again,
+        patch(f"{module}.run_audio_formatter", AsyncMock(return_value=audio_format)),
+        patch(f"{module}.generate_audio", AsyncMock(return_value=outputs)) as mock_audio,
+    ):
+        result = await manager.summarize_article(url)
+
+    assert result == outputs
+    mock_extract.assert_awaited_once()
+    mock_summarizer.assert_awaited_once()
+    mock_extract_again.assert_not_called()
+    mock_summarizer_again.assert_not_called()
+    assert mock_audio.call_args.args[0] == "Narration."
+    variant = "sequential:tts-1:alloy"
+    assert manager.job_store.load_checkpoint(url, variant, "content", ArticleContent) is None
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_summarize_article_keeps_checkpoints_used_by_another_run(tmp_path):
+    """Test that a run finishing first leaves the checkpoints of a concurrent run of its URL."""
+    url = "https://example.com/a"
+    content = ArticleContent(title="Title", content="Body text.", url=url)
+    summary = SummaryData(
+        title="Title", short_summary="Short.", detailed_summary="Detailed.", key_points=[]
+    )
+    audio_format = AudioFormat(title="Title", narration_text="Narration.", filename="title")
+    manager = ArticleSummarizerManager(
+        duplicate_index_settings=DuplicateIndexSettings(enabled=False),
+        job_store_settings=JobStoreSettings(path=tmp_path / "jobs.sqlite3"),
+        corpus_settings=CorpusSettings(enabled=False),
+    )
+    outputs = (tmp_path / "final.mp3", tmp_path / "raw.txt", tmp_path / "final.txt")
+    release_second = asyncio.Event()
+    first_done = asyncio.Event()
+    variant = "sequential:tts-1:alloy"
+
+    async def generate(*args, **kwargs):
+        if first_done.is_set():
+            await release_second.wait()
+        first_done.set()
+        return outputs
+
+    module = "backend.app.custom_agents.article_summarizer.manager"
+    with (
+        patch.object(manager, "_extract_content", AsyncMock(return_value=content)),
+        patch(f"{module}.run_summarizer", AsyncMock(return_value=summary)),
+        patch(f"{module}.run_audio_formatter", AsyncMock(return_value=audio_format)),
+        patch(f"{module}.generate_audio", AsyncMock(side_effect=generate)),
+    ):
+        runs = {asyncio.create_task(manager.summarize_article(url)) for _ in range(2)}
+        done, running = await asyncio.wait(runs, return_when=asyncio.FIRST_COMPLETED)
+        assert [run.result() for run in done] == [outputs]
+        assert manager.job_store.load_checkpoint(url, variant, "content", ArticleContent)
+
+        release_second.set()
+        assert [await run for run in running] == [outputs]
+    assert manager.job_store.load_checkpoint(url, variant, "content", ArticleContent) is None
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_summarize_article_weights_topics_by_articles_analyzed_before(tmp_path):
+    """Test that words common to earlier articles, even from past runs, rank lower as topics."""
+    earlier = [
+        "Example Gazette reports. The city council approved the transit budget. "
+        "Example Gazette readers cheered the transit budget.",
+        "Example Gazette reports. The city council debated school funding. "
+        "Example Gazette readers wrote about school funding.",
+    ]
+    new = (
+        "Example Gazette reports. Example Gazette readers asked about harbor dredging. "
+        "The harbor dredging starts in May. Example Gazette will follow the harbor dredging."
+    )
+    module = "backend.app.custom_agents.article_summarizer.manager"
+    corpus_settings = CorpusSettings(path=tmp_path / "corpus.json")
+
+    async def summarize(manager: ArticleSummarizerManager, content: str) -> AsyncMock:
+        article = ArticleContent(title="Title", content=content, url="")
+        with (
+            patch.object(manager, "_extract_content", AsyncMock(return_value=article)),
+            patch(f"{module}.run_summarizer", AsyncMock(return_value=None)) as mock_summarizer,
+        ):
+            await manager.summarize_article(f"https://example.com/{len(content)}")
+        return mock_summarizer
+
+    def manager() -> ArticleSummarizerManager:
+        return ArticleSummarizerManager(
+            parse_settings=ParseSettings(executor="thread"),
+            duplicate_index_settings=DuplicateIndexSettings(enabled=False),
+            job_store_settings=JobStoreSettings(enabled=False),
+            corpus_settings=corpus_settings,
+        )
+
+    first_run = manager()
+    for content in earlier:
+        await summarize(first_run, content)
+    await first_run.aclose()
+
+    second_run = manager()
+    mock_summarizer = await summarize(second_run, new)
+    await second_run.aclose()
+
+    assert mock_summarizer.call_args.kwargs["analysis"].key_topics[0] == "harbor dredging"
+    assert DocumentCorpus(corpus_settings).frequencies().documents == 3
+    assert DocumentCorpus(corpus_settings).frequencies({"gazette", "dredging", "unseen"}).words == {
+        "gazette": 3,
+        "dredging": 1,
+    }
@@ -0,0 +1,81 @@
+"""Tests for the agent memo store."""
+
+import itertools
+import sqlite3
+import time
+from unittest.mock import patch
+
+from agents import Agent
+
+from backend.app.custom_agents.article_summarizer.agents import SummaryData
+from backend.app.custom_agents.article_summarizer.memo_store import AgentMemoStore, memo_key
+from backend.app.types.article_summarizer.cache_types import AgentMemoSettings
+
+SUMMARY = SummaryData(
+    title="Title", short_summary="Short.", detailed_summary="Detailed.", key_points=["One"]
+)
+
+
+def _agent(instructions: str = "Summarize.") -> Agent:
+    return Agent(
+        name="Summarizer", instructions=instructions, model="gpt-4o", output_type=SummaryData
+    )
+
+
+def test_memo_store_round_trip(tmp_path):
+    """Test that a memoized output is returned for the same agent and input."""
+    store = AgentMemoStore(AgentMemoSettings(path=tmp_path / "memo.sqlite3"))
+    store.put(_agent(), "input", SUMMARY)
+
+    assert store.get(_agent(), "input", SummaryData) == SUMMARY
+    assert store.get(_agent(), "other input", SummaryData) is None
+    store.close()
+
+
+def test_memo_key_depends_on_agent_config():
+    """Test that changing the agent's instructions changes the key."""
+    assert memo_key(_agent(), "input") == memo_key(_agent(), "input")
+    assert memo_key(_agent(), "input") != memo_key(_agent("Be brief."), "input")
+
+
+def test_memo_store_expires_entries(tmp_path):
+    """Test that entries older than the TTL are not returned."""
+    store = AgentMemoStore(AgentMemoSettings(path=tmp_path / "memo.sqlite3", ttl=60))
+    store.put(_agent(), "input", SUMMARY)
+
+    with patch("time.time", return_value=time.time() + 120):
+        assert store.get(_agent(), "input", SummaryData) is None
+    store.close()
+
+
+def test_memo_store_evicts_least_recently_used(tmp_path):
+    """Test that the store keeps at most max_entries entries."""
+    store = AgentMemoStore(AgentMemoSettings(path=tmp_path / "memo.sqlite3", max_entries=2))
+    clock = itertools.count(1000.0)
+    with patch("time.time", side_effect=lambda: next(clock)):
+        store.put(_agent(), "first", SUMMARY)
+        store.put(_agent(), "second", SUMMARY)
+        store.get(_agent(), "first", SummaryData)
+        store.put(_agent(), "third", SUMMARY)
+
+        assert store.get(_agent(), "first", SummaryData) == SUMMARY
+        assert store.get(_agent(), "second", SummaryData) is None
+        assert store.get(_agent(), "third", SummaryData) == SUMMARY
+    store.close()
+
+
+def test_memo_store_saves_access_times_in_batches(tmp_path):
+    """Test that hits are not written one by one, but are saved by the store's close."""
+    path = tmp_path / "memo.sqlite3"
+    store = AgentMemoStore(AgentMemoSettings(path=path))
+    with patch("time.time", return_value=1000.0):
+        store.put(_agent(), "input", SUMMARY)
+    with patch("time.time", return_value=2000.0):
+        store.get(_agent(), "input", SummaryData)
+
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+        assert connection.execute("SELECT accessed_at FROM memo").fetchone() == (1000.0,)
+    store.close()
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT accessed_at FROM memo").fetchone() == (2000.0,)
@@ -0,0 +1,63 @@
+"""Tests for the extraction worker pool."""
+
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.app.custom_agents.article_summarizer.parse_pool import ParsePool
+from backend.app.custom_agents.article_summarizer.parser import extract_article_text
+from backend.app.helpers.article_summarizer.analysis_helpers import analyze_texts
+from backend.app.types.article_summarizer.parser_types import ParseSettings
+
+HTML_CONTENT = """
+<html>
+    <head><meta property="og:title" content="Pool Article"></head>
+    <body><article><h2>Section</h2><p>First paragraph.</p><p>Second paragraph.</p></article></body>
+</html>
+"""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["thread", "process"])
+async def test_parse_pool_matches_inline_extraction(executor):
+    """Test that extraction on the pool gives the same result as running it inline."""
+    pool = ParsePool(ParseSettings(executor=executor, max_workers=1))
+    try:
+        result = await pool.extract(HTML_CONTENT)
+    finally:
+        await pool.aclose()
+
+    assert result == extract_article_text(HTML_CONTENT)
+    assert result.metadata.title == "Pool Article"
+
+
+@pytest.mark.asyncio
+async def test_parse_pool_restarts_after_broken_pool():
+    """Test that a broken process pool is discarded so the next call starts a new one."""
+    pool = ParsePool(ParseSettings(executor="process", max_workers=1))
+    broken_executor = MagicMock()
+    broken_executor.submit.side_effect = BrokenProcessPool("worker died")
+    pool._executor = broken_executor
+
+    with pytest.raises(BrokenProcessPool):
+        await pool.extract(HTML_CONTENT)
+
+    broken_executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+    assert pool._executor is None
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["thread", "process"])
+async def test_parse_pool_analyzes_texts(executor):
+    """Test that content analysis on the pool matches running it inline."""
+    texts = ["Solar power growth is strong. Solar power is cheap.", "The storm caused damage."]
+    pool = ParsePool(ParseSettings(executor=executor, max_workers=1))
+    try:
+        results = await pool.analyze(texts)
+    finally:
+        await pool.aclose()
+
+    assert results == analyze_texts(texts)
+    assert results[0].key_topics[0] == "solar power"
@@ -1,17 +1,61 @@
 """Tests for article parser."""
 
+import threading
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
+from backend.app.custom_agents.article_summarizer.extractor import StreamingArticleParser
+from backend.app.custom_agents.article_summarizer.fetch_cache import FetchCache
+from backend.app.custom_agents.article_summarizer.http_client import PooledHttpClient
 from backend.app.custom_agents.article_summarizer.parser import (
     extract_article_text,
     fetch_article_content,
+    stream_article_content,
 )
+from backend.app.types.article_summarizer.cache_types import FetchCacheSettings
 from backend.app.types.article_summarizer.parser_types import (
     ArticleMetadataResult,
     ArticleStructureResult,
 )
+from backend.tests.unit.custom_agents.article_summarizer.linear_grouping_extractor import (
+    extract_article_text_reference,
+)
+
+STREAMED_PAGE = (
+    '<html><head><meta property="og:title" content="Streamed"></head><body>'
+    + "".join(f"<p>Paragraph {i}.</p>" for i in range(200))
+    + "</body></html>"
+)
+
+
+class _ChunkedStream(httpx.AsyncByteStream):
+    """A response body delivered in fixed-size chunks."""
+
+    def __init__(self, data: bytes, chunk_size: int) -> None:
+        self.data = data
+        self.chunk_size = chunk_size
+
+    async def __aiter__(self):
+        for start in range(0, len(self.data), self.chunk_size):
+            yield self.data[start : start + self.chunk_size]
+
+
+def _streaming_client(html_content: str, headers: dict[str, str] | None = None):
+    """Build a pooled client whose requests are answered with a chunked HTML page."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/html; charset=utf-8", **(headers or {})},
+            stream=_ChunkedStream(html_content.encode("utf-8"), chunk_size=256),
+        )
+
+    client = PooledHttpClient()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
 
 
 @pytest.mark.asyncio
@@ -34,6 +78,23 @@ async def test_fetch_article_content_success():
     mock_client.get.assert_called_once_with("https://example.com")
 
 
+@pytest.mark.asyncio
+async def test_fetch_article_content_uses_shared_client():
+    """Test that a shared pooled client is used instead of a one-off client."""
+    mock_response = MagicMock()
+    mock_response.text = "<html><body><p>Pooled</p></body></html>"
+
+    shared_client = MagicMock()
+    shared_client.get = AsyncMock(return_value=mock_response)
+
+    with patch("httpx.AsyncClient") as mock_client_class:
+        result = await fetch_article_content("https://example.com", shared_client)
+
+    assert result == "<html><body><p>Pooled</p></body></html>"
+    shared_client.get.assert_called_once_with("https://example.com")
+    mock_client_class.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_fetch_article_content_failure():
     """Test failed article content fetching."""
@@ -112,3 +173,130 @@ def test_extract_article_text_with_subsections():
     assert isinstance(result.metadata, ArticleMetadataResult)
     assert isinstance(result.structure, ArticleStructureResult)
     assert result.structure.headings[0].text == "Main Heading"
+
+
+@pytest.mark.parametrize("extract", [extract_article_text, extract_article_text_reference])
+def test_extract_article_text_subsections_stop_at_next_sibling_heading(extract):
+    """Test that a section ends at the next heading among its siblings."""
+    html_content = """
+    <html><body><article>
+        <h2>Overview</h2>
+        <p>Overview content.</p>
+        <section><h3>Aside</h3><p>Aside content.</p></section>
+        <p>More overview content.</p>
+        <h2>Notes</h2>
+        <p>First notes content.</p>
+        <h2>Notes</h2>
+        <p>Second notes content.</p>
+    </article></body></html>
+    """
+
+    result = extract(html_content)
+
+    assert [(s.heading, s.content) for s in result.subsections] == [
+        ("Overview", "Overview content.\n\nMore overview content."),
+        ("Aside", "Aside content."),
+        ("Notes", "First notes content."),
+        ("Notes", "Second notes content."),
+    ]
+
+
+def _heading_dense_page(sections: int) -> str:
+    """Build a page with one heading and one paragraph per section, plus a nested heading."""
+    body = "".join(
+        f"<h2>Section {i}</h2><p>Paragraph {i}.</p><div><h3>Note {i}</h3></div>"
+        for i in range(sections)
+    )
+    return f"<html><body><article>{body}</article></body></html>"
+
+
+def _best_time(extract, html_content: str, runs: int = 3) -> float:
+    """Return the fastest of several extraction timings, in seconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        extract(html_content)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("extract", [extract_article_text, extract_article_text_reference])
+def test_extract_article_text_scales_linearly_with_headings(extract):
+    """Benchmark: quadrupling the number of headings should roughly quadruple the time.
+
+    Wall-clock ratios depend on the machine's load, so this only runs with `-m benchmark`.
+    """
+    small = _heading_dense_page(500)
+    large = _heading_dense_page(2000)
+
+    assert len(extract(large).subsections) == 2000
+
+    ratio = _best_time(extract, large) / _best_time(extract, small)
+
+    # Linear scaling gives a ratio near 4; the previous sibling walk was closer to 16.
+    assert ratio < 8
+
+
+@pytest.mark.asyncio
+async def test_stream_article_content_extracts_while_downloading(tmp_path):
+    """Test that a streamed page is extracted and stored in the fetch cache."""
+    client = _streaming_client(STREAMED_PAGE, headers={"etag": '"v1"'})
+    cache = FetchCache(FetchCacheSettings(directory=tmp_path))
+    reported = []
+
+    streamed = await stream_article_content(
+        "https://example.com/a", client, cache, on_metadata=reported.append
+    )
+    await client.aclose()
+
+    assert streamed is not None
+    assert not streamed.truncated
+    assert streamed.html == STREAMED_PAGE
+    assert streamed.content == extract_article_text(STREAMED_PAGE, parser_backend="html.parser")
+    assert [metadata.title for metadata in reported] == ["Streamed"]
+    cached_page = cache.get("https://example.com/a")
+    assert cached_page is not None
+    assert cached_page.etag == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_stream_article_content_parses_off_the_event_loop():
+    """Test that streamed chunks are parsed in a worker thread, not on the event loop."""
+    client = _streaming_client(STREAMED_PAGE)
+    loop_thread = threading.get_ident()
+    parse_threads = set()
+    feed = StreamingArticleParser.feed
+
+    def recording_feed(parser, data):
+        parse_threads.add(threading.get_ident())
+        return feed(parser, data)
+
+    with patch.object(StreamingArticleParser, "feed", recording_feed):
+        streamed = await stream_article_content("https://example.com/a", client)
+    await client.aclose()
+
+    assert streamed is not None
+    assert streamed.content == extract_article_text(STREAMED_PAGE, parser_backend="html.parser")
+    assert parse_threads
+    assert loop_thread not in parse_threads
+
+
+@pytest.mark.asyncio
+async def test_stream_article_content_cuts_off_oversized_pages(tmp_path):
+    """Test that reading stops at the byte limit and truncated pages are not cached."""
+    client = _streaming_client(STREAMED_PAGE)
+    cache = FetchCache(FetchCacheSettings(directory=tmp_path))
+
+    streamed = await stream_article_content(
+        "https://example.com/big", client, cache, max_bytes=1000
+    )
+    await client.aclose()
+
+    assert streamed is not None
+    assert streamed.truncated
+    assert streamed.bytes_read == 1000
+    assert streamed.html == STREAMED_PAGE[:1000]
+    assert streamed.content.metadata.title == "Streamed"
+    assert 0 < len(streamed.content.text.split("\n\n")) < 200
+    assert cache.get("https://example.com/big") is None
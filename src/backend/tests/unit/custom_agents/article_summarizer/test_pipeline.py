@@ -0,0 +1,369 @@
+"""Tests for the agent pipeline."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from agents import Usage
+
+from backend.app.custom_agents.article_summarizer.agents import (
+    ArticleContent,
+    AudioFormat,
+    ChunkSummary,
+    CleanedArticle,
+    SummaryData,
+    SummaryWithNarration,
+    chunk_summarizer_agent,
+    summary_narrator_agent,
+    summary_reducer_agent,
+)
+from backend.app.custom_agents.article_summarizer.memo_store import AgentMemoStore
+from backend.app.custom_agents.article_summarizer.pipeline import (
+    run_audio_formatter,
+    run_content_extractor,
+    run_summarizer,
+    run_summary_narrator,
+)
+from backend.app.custom_agents.article_summarizer.token_ledger import track_tokens
+from backend.app.types.article_summarizer.analysis_types import ContentAnalysisResult
+from backend.app.types.article_summarizer.cache_types import AgentMemoSettings
+from backend.app.types.article_summarizer.summary_types import SummarizationSettings
+from backend.app.types.article_summarizer.token_types import StageTokenBudget
+
+SUMMARY = SummaryData(
+    title="Title", short_summary="Short.", detailed_summary="Detailed.", key_points=["One"]
+)
+AUDIO_FORMAT = AudioFormat(title="Title", narration_text="Narration.", filename="title")
+
+
+@pytest.mark.asyncio
+async def test_run_summarizer_reuses_memoized_summary(tmp_path):
+    """Test that a second run on the same article is served from the memo store."""
+    article = ArticleContent(title="Title", content="Body text.", url="https://example.com")
+    memo = AgentMemoStore(AgentMemoSettings(path=tmp_path / "memo.sqlite3"))
+    run_result = MagicMock()
+    run_result.final_output_as.return_value = SUMMARY
+
+    with patch(
+        "backend.app.custom_agents.article_summarizer.pipeline.Runner.run",
+        AsyncMock(return_value=run_result),
+    ) as mock_run:
+        first = await run_summarizer(article, memo)
+        second = await run_summarizer(article, memo)
+
+    assert first == SUMMARY
+    assert second == SUMMARY
+    mock_run.assert_called_once()
+    memo.close()
+
+
+def _long_article() -> ArticleContent:
+    """Build an article with four sizable subsections."""
+    subsections = [
+        {"heading": f"Section {i}", "content": f"Section {i} sentence. " * 40} for i in range(4)
+    ]
+    return ArticleContent(
+        title="Long Article",
+        content="\n\n".join(section["content"].strip() for section in subsections),
+        url="https://example.com/long",
+        subsections=[{**s, "content": s["content"].strip()} for s in subsections],
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_summarizer_map_reduce_merges_chunk_summaries():
+    """Test that long articles are summarized per chunk and merged in a reduce step."""
+    calls = []
+
+    async def fake_run(agent, input_data):
+        calls.append((agent, input_data))
+        result = MagicMock()
+        if agent is chunk_summarizer_agent:
+            part = input_data.split("Part ")[1].split(" of")[0]
+            chunk_summary = ChunkSummary(summary=f"Summary {part}.", key_points=[f"Point {part}"])
+            result.final_output_as.return_value = chunk_summary
+        else:
+            result.final_output_as.return_value = SUMMARY
+        return result
+
+    settings = SummarizationSettings(mode="auto", map_reduce_threshold_tokens=300, chunk_tokens=250)
+    with patch("backend.app.custom_agents.article_summarizer.pipeline.Runner.run", fake_run):
+        summary = await run_summarizer(_long_article(), settings=settings)
+
+    assert summary == SUMMARY
+    map_calls = [data for agent, data in calls if agent is chunk_summarizer_agent]
+    reduce_calls = [data for agent, data in calls if agent is summary_reducer_agent]
+    assert len(map_calls) == 4
+    assert len(reduce_calls) == 1
+    assert calls[-1][0] is summary_reducer_agent
+    for part in range(1, 5):
+        assert f"Summary {part}." in reduce_calls[0]
+        assert f"- Point {part}" in reduce_calls[0]
+    assert sum(data.count("Section 0 sentence.") for data in map_calls) == 40
+
+
+@pytest.mark.asyncio
+async def test_run_summarizer_auto_mode_keeps_short_articles_in_one_call():
+    """Test that articles under the threshold are summarized with a single agent run."""
+    run_result = MagicMock()
+    run_result.final_output_as.return_value = SUMMARY
+
+    with patch(
+        "backend.app.custom_agents.article_summarizer.pipeline.Runner.run",
+        AsyncMock(return_value=run_result),
+    ) as mock_run:
+        summary = await run_summarizer(_long_article(), settings=SummarizationSettings())
+
+    assert summary == SUMMARY
+    mock_run.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_run_summarizer_sends_each_paragraph_once():
+    """Test that subsection text already in the body is not repeated in the prompt."""
+    article = ArticleContent(
+        title="Title",
+        content="Lead.\n\nSection text.\n\nSubscribe to our newsletter!",
+        url="https://example.com",
+        subsections=[{"heading": "Section", "content": "Section text."}],
+    )
+    run_result = MagicMock()
+    run_result.final_output_as.return_value = SUMMARY
+
+    with patch(
+        "backend.app.custom_agents.article_summarizer.pipeline.Runner.run",
+        AsyncMock(return_value=run_result),
+    ) as mock_run:
+        await run_summarizer(article)
+
+    prompt = mock_run.call_args.args[1]
+    assert prompt.count("Section text.") == 1
+    assert "## Section\nSection text." in prompt
+    assert "Subscribe" not in prompt
+
+
+@pytest.mark.asyncio
+async def test_run_summarizer_records_tokens_per_call(tmp_path):
+    """Test that model and memoized calls are recorded in the token ledger."""
+    article = ArticleContent(title="Title", content="Body text.", url="https://example.com")
+    memo = AgentMemoStore(AgentMemoSettings(path=tmp_path / "memo.sqlite3"))
+    run_result = MagicMock()
+    run_result.final_output_as.return_value = SUMMARY
+    run_result.context_wrapper.usage = Usage(
+        requests=1, input_tokens=120, output_tokens=30, total_tokens=150
+    )
+
+    with (
+        patch(
+            "backend.app.custom_agents.article_summarizer.pipeline.Runner.run",
+            AsyncMock(return_value=run_result),
+        ),
+        track_tokens() as ledger,
+    ):
+        await run_summarizer(article, memo)
+        await run_summarizer(article, memo)
+    memo.close()
+
+    assert [(call.stage, call.memoized) for call in ledger.calls] == [
+        ("summarizer", False),
+        ("summarizer", True),
+    ]
+    assert ledger.calls[0].input_tokens == ledger.calls[1].input_tokens > 0
+    assert ledger.input_tokens == ledger.calls[0].input_tokens
+    assert ledger.output_tokens > 0
+    assert [call.provider_input_tokens for call in ledger.calls] == [120, None]
+    assert (ledger.provider_input_tokens, ledger.provider_output_tokens) == (120, 30)
+
+
+@pytest.mark.asyncio
+async def test_run_summarizer_rejects_prompts_over_budget():
+    """Test that the "reject" action fails the article without calling the model."""
+    article = ArticleContent(title="Title", content="Word " * 500, url="https://example.com")
+
+    with patch(
+        "backend.app.custom_agents.article_summarizer.pipeline.Runner.run", AsyncMock()
+    ) as mock_run:
+        summary = await run_summarizer(
+            article, budget=StageTokenBudget(max_input_tokens=100, action="reject")
+        )
+
+    assert summary is None
+    mock_run.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_summarizer_chunks_prompts_over_budget():
+    """Test that the "chunk" action switches over-budget prompts to map-reduce."""
+    article = ArticleContent(
+        title="Title",
+        content="\n\n".join(f"Paragraph {i} sentence. " * 20 for i in range(4)),
+        url="https://example.com",
+    )
+    run_result = MagicMock()
+    run_result.final_output_as.side_effect = lambda output_type: (
+        SUMMARY if output_type is SummaryData else ChunkSummary(summary="S.", key_points=[])
+    )
+
+    with patch(
+        "backend.app.custom_agents.article_summarizer.pipeline.Runner.run",
+        AsyncMock(return_value=run_result),
+    ) as mock_run:
+        summary = await run_summarizer(
+            article, budget=StageTokenBudget(max_input_tokens=150, action="chunk")
+        )
+
+    assert summary == SUMMARY
+    agents = [call.args[0] for call in mock_run.call_args_list]
+    assert agents.count(summary_reducer_agent) == 1
+    assert agents.count(chunk_summarizer_agent) > 1
+
+
+@pytest.mark.asyncio
+async def test_run_audio_formatter_truncates_input_over_budget():
+    """Test that the "truncate" action cuts the formatter input to the budget."""
+    summary = SUMMARY.model_copy(update={"detailed_summary": "Detail sentence. " * 500})
+    run_result = MagicMock()
+    run_result.final_output_as.return_value = AUDIO_FORMAT
+
+    with (
+        patch(
+            "backend.app.custom_agents.article_summarizer.pipeline.Runner.run",
+            AsyncMock(return_value=run_result),
+        ) as mock_run,
+        track_tokens() as ledger,
+    ):
+        audio_format = await run_audio_formatter(
+            summary, budget=StageTokenBudget(max_input_tokens=200)
+        )
+
+    assert audio_format == AUDIO_FORMAT
+    prompt = mock_run.call_args.args[1]
+    assert prompt.startswith("Title: Title")
+    assert len(prompt) < len("Detail sentence. " * 500)
+    assert ledger.calls[0].truncated
+    assert ledger.calls[0].input_tokens <= 200
+
+
+@pytest.mark.asyncio
+async def test_run_summary_narrator_makes_one_call():
+    """Test that the combined mode summarizes and narrates with a single agent run."""
+    combined = SummaryWithNarration(
+        summary=SUMMARY, audio_format=AUDIO_FORMAT.model_copy(update={"filename": "a title!"})
+    )
+    run_result = MagicMock()
+    run_result.final_output_as.return_value = combined
+    article = ArticleContent(title="Title", content="Body text.", url="https://example.com")
+
+    with (
+        patch(
+            "backend.app.custom_agents.article_summarizer.pipeline.Runner.run",
+            AsyncMock(return_value=run_result),
+        ) as mock_run,
+        track_tokens() as ledger,
+    ):
+        result = await run_summary_narrator(article)
+
+    assert result is not None
+    assert result.summary == SUMMARY
+    assert result.audio_format.filename == "a_title_"
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args[0] is summary_narrator_agent
+    assert "Body text." in mock_run.call_args.args[1]
+    assert [call.stage for call in ledger.calls] == ["summary_narrator"]
+
+
+@pytest.mark.asyncio
+async def test_run_summary_narrator_reduces_chunk_summaries():
+    """Test that long articles are mapped per chunk and reduced by the combined agent."""
+    calls = []
+
+    async def fake_run(agent, input_data):
+        calls.append(agent)
+        result = MagicMock()
+        if agent is chunk_summarizer_agent:
+            result.final_output_as.return_value = ChunkSummary(summary="Part.", key_points=[])
+        else:
+            result.final_output_as.return_value = SummaryWithNarration(
+                summary=SUMMARY, audio_format=AUDIO_FORMAT
+            )
+        return result
+
+    settings = SummarizationSettings(mode="map_reduce", chunk_tokens=250)
+    with patch("backend.app.custom_agents.article_summarizer.pipeline.Runner.run", fake_run):
+        result = await run_summary_narrator(_long_article(), settings=settings)
+
+    assert result is not None
+    assert calls.count(chunk_summarizer_agent) == 4
+    assert calls[-1] is summary_narrator_agent
+    assert summary_reducer_agent not in calls
+
+
+@pytest.mark.asyncio
+async def test_run_content_extractor_sends_html_without_scripts():
+    """Test that the LLM extractor gets cleaned HTML and its call is budgeted as "extractor"."""
+    run_result = MagicMock()
+    run_result.final_output_as.return_value = CleanedArticle(title="Title", content="Story.")
+    html = "<html><script>track()</script><body><div>Story.</div></body></html>"
+
+    with (
+        patch(
+            "backend.app.custom_agents.article_summarizer.pipeline.Runner.run",
+            AsyncMock(return_value=run_result),
+        ) as mock_run,
+        track_tokens() as ledger,
+    ):
+        article = await run_content_extractor(html, "https://example.com/a")
+
+    assert article is not None
+    assert article.url == "https://example.com/a"
+    assert article.content == "Story."
+    prompt = mock_run.call_args.args[1]
+    assert "<div>Story.</div>" in prompt
+    assert "track()" not in prompt
+    assert [call.stage for call in ledger.calls] == ["extractor"]
+
+
+@pytest.mark.asyncio
+async def test_run_summarizer_sends_local_content_analysis():
+    """Test that the summarizer prompt carries the topics and entities found locally."""
+    article = ArticleContent(
+        title="Rates",
+        content="The Bank of England raised interest rates. Higher interest rates slow inflation.",
+        url="https://example.com/rates",
+    )
+    run_result = MagicMock()
+    run_result.final_output_as.return_value = SUMMARY
+
+    with patch(
+        "backend.app.custom_agents.article_summarizer.pipeline.Runner.run",
+        AsyncMock(return_value=run_result),
+    ) as mock_run:
+        await run_summarizer(article)
+
+    prompt = mock_run.call_args.args[1]
+    assert "- Key Topics: interest rates" in prompt
+    assert "- Main Entities: Bank of England" in prompt
+
+
+@pytest.mark.asyncio
+async def test_run_summarizer_reuses_given_analysis():
+    """Test that an analysis computed by the caller is not recomputed."""
+    article = ArticleContent(title="Title", content="Body text.", url="https://example.com")
+    analysis = ContentAnalysisResult(
+        key_topics=["given topic"], sentiment="neutral", complexity_score=0.5, main_entities=[]
+    )
+    run_result = MagicMock()
+    run_result.final_output_as.return_value = SUMMARY
+
+    with (
+        patch(
+            "backend.app.custom_agents.article_summarizer.pipeline.Runner.run",
+            AsyncMock(return_value=run_result),
+        ) as mock_run,
+        patch(
+            "backend.app.custom_agents.article_summarizer.pipeline.analyze_content"
+        ) as mock_analyze,
+    ):
+        await run_summarizer(article, analysis=analysis)
+
+    mock_analyze.assert_not_called()
+    assert "- Key Topics: given topic" in mock_run.call_args.args[1]
@@ -0,0 +1,47 @@
+"""Tests for summarization progress events."""
+
+import asyncio
+
+import pytest
+
+from backend.app.custom_agents.article_summarizer.progress import (
+    emit_progress,
+    is_tracking_progress,
+    summary_delta_emitter,
+    track_progress,
+)
+
+
+@pytest.mark.asyncio
+async def test_track_progress_receives_events_of_spawned_tasks():
+    """Test that events emitted in child tasks reach the block's listener."""
+    events = []
+
+    async def synthesize(index: int) -> None:
+        emit_progress("audio_chunk", index=index)
+
+    with track_progress(events.append):
+        assert is_tracking_progress()
+        emit_progress("fetched", bytes=10)
+        await asyncio.gather(synthesize(0), synthesize(1))
+
+    assert [event.type for event in events] == ["fetched", "audio_chunk", "audio_chunk"]
+    assert events[0].data == {"bytes": 10}
+    assert not is_tracking_progress()
+    emit_progress("fetched")
+
+
+@pytest.mark.asyncio
+async def test_summary_delta_emitter_sends_only_new_text():
+    """Test that partial summaries become deltas and repeats are not sent again."""
+    events = []
+    on_summary = summary_delta_emitter()
+
+    with track_progress(events.append):
+        await on_summary("The council", False)
+        await on_summary("The council voted", False)
+        await on_summary("The council voted", False)
+        await on_summary("The council voted.", True)
+
+    assert [event.data["text"] for event in events] == ["The council", " voted", "."]
+    assert {event.type for event in events} == {"summary_delta"}
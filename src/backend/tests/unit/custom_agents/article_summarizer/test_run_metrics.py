@@ -0,0 +1,121 @@
+"""Tests for per-article stage metrics."""
+
+import asyncio
+import json
+
+import pytest
+
+from backend.app.custom_agents.article_summarizer.run_metrics import (
+    METRICS_FILENAME,
+    measure_stage,
+    record_cache_result,
+    record_stage_tokens,
+    summarize_run_metrics,
+    track_metrics,
+    write_run_metrics,
+)
+from backend.app.types.article_summarizer.metrics_types import RunMetrics, StageMetric
+
+
+@pytest.mark.asyncio
+async def test_track_metrics_collects_stages_of_spawned_tasks():
+    """Test that stages measured in child tasks land in the article's metrics."""
+
+    async def call_agent(stage: str) -> None:
+        with measure_stage(stage):
+            record_stage_tokens(10)
+            record_cache_result("miss")
+
+    with track_metrics("https://example.com/a") as metrics:
+        with measure_stage("fetch") as fetch_metric:
+            fetch_metric.bytes = 2048
+            record_cache_result("hit")
+        await asyncio.gather(call_agent("summarizer_map"), call_agent("summarizer_map"))
+
+    assert [metric.stage for metric in metrics.stages] == [
+        "fetch",
+        "summarizer_map",
+        "summarizer_map",
+    ]
+    assert metrics.stages[0].bytes == 2048
+    assert metrics.stages[0].cache == "hit"
+    assert all(metric.tokens == 10 for metric in metrics.stages[1:])
+    assert set(metrics.stage_seconds) == {"fetch", "summarizer_map"}
+    assert metrics.seconds >= sum(metrics.stage_seconds.values()) / 2
+
+
+def test_track_metrics_shares_collector_for_same_url():
+    """Test that a nested block for the same URL reuses the enclosing metrics."""
+    with track_metrics("https://example.com/a") as outer:
+        with track_metrics("https://example.com/a") as inner, measure_stage("parse"):
+            pass
+        with track_metrics("https://example.com/b") as other, measure_stage("parse"):
+            pass
+
+    assert inner is outer
+    assert len(outer.stages) == 1
+    assert len(other.stages) == 1
+
+
+def test_measure_stage_records_failed_stages():
+    """Test that a stage is recorded even when it raises."""
+    with (
+        track_metrics("https://example.com/a") as metrics,
+        pytest.raises(RuntimeError),
+        measure_stage("tts"),
+    ):
+        raise RuntimeError("boom")
+
+    assert [metric.stage for metric in metrics.stages] == ["tts"]
+
+
+def test_record_outside_a_stage_is_ignored():
+    """Test that recording with no stage or metrics being collected is a no-op."""
+    record_stage_tokens(5)
+    record_cache_result("hit")
+    with measure_stage("fetch") as metric:
+        pass
+
+    assert metric.seconds >= 0
+
+
+def test_write_run_metrics(tmp_path):
+    """Test that metrics.json holds the stages and per-stage totals."""
+    with track_metrics("https://example.com/a") as metrics, measure_stage("write"):
+        pass
+
+    path = write_run_metrics(metrics, tmp_path)
+
+    assert path == tmp_path / METRICS_FILENAME
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved["url"] == "https://example.com/a"
+    assert saved["stages"][0]["stage"] == "write"
+    assert "write" in saved["stage_seconds"]
+    assert "started" not in saved
+
+
+def test_summarize_run_metrics_reports_percentiles_per_stage():
+    """Test that repeated stages count once per article and percentiles are per stage."""
+    runs = [
+        RunMetrics(
+            url=f"https://example.com/{i}",
+            seconds=float(i + 2),
+            stages=[
+                StageMetric(stage="fetch", seconds=float(i)),
+                StageMetric(stage="tts", seconds=0.5),
+                StageMetric(stage="tts", seconds=0.5),
+            ],
+        )
+        for i in range(5)
+    ]
+    runs.append(RunMetrics(url="https://example.com/failed", seconds=1.0))
+
+    summary = summarize_run_metrics(runs)
+    stages = {stage.stage: stage for stage in summary.stages}
+
+    assert summary.runs == 6
+    assert [stage.stage for stage in summary.stages] == ["total", "fetch", "tts"]
+    assert stages["fetch"].count == 5
+    assert stages["fetch"].p50 == 2.0
+    assert stages["tts"].p99 == 1.0
+    assert stages["total"].count == 6
@@ -0,0 +1,175 @@
+"""Tests for the streamed summarization pipeline."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from agents.stream_events import RawResponsesStreamEvent
+from openai.types.responses import ResponseTextDeltaEvent
+
+from backend.app.custom_agents.article_summarizer.agents import (
+    ArticleContent,
+    NarrationSegment,
+    SummaryData,
+    narration_segment_agent,
+    summarizer_agent,
+)
+from backend.app.custom_agents.article_summarizer.streamed_pipeline import (
+    run_streamed_pipeline,
+)
+from backend.app.custom_agents.article_summarizer.token_ledger import track_tokens
+from backend.app.types.article_summarizer.pipeline_types import PipelineSettings
+
+PARAGRAPHS = [f"Paragraph {i} of the summary. It has two sentences." for i in range(3)]
+SUMMARY = SummaryData(
+    title="Streamed Title",
+    short_summary="Short.",
+    detailed_summary="\n\n".join(PARAGRAPHS),
+    key_points=["One"],
+)
+
+
+def _streamed_result(output, events, name):
+    """Build a fake streamed run that emits the output's JSON a few characters at a time."""
+    document = output.model_dump_json()
+
+    async def stream_events():
+        for start in range(0, len(document), 7):
+            delta = ResponseTextDeltaEvent.model_construct(
+                delta=document[start : start + 7], type="response.output_text.delta"
+            )
+            yield RawResponsesStreamEvent(data=delta)
+            await asyncio.sleep(0)
+        events.append(f"{name} done")
+
+    result = MagicMock()
+    result.stream_events = stream_events
+    result.final_output_as.return_value = output
+    return result
+
+
+@pytest.mark.asyncio
+async def test_streamed_pipeline_overlaps_stages(tmp_path):
+    """Test that narration and TTS start before the summary is complete."""
+    events = []
+    article = ArticleContent(title="Title", content="Body text.", url="https://example.com/a")
+
+    def fake_run_streamed(agent, input_data):
+        if agent is summarizer_agent:
+            return _streamed_result(SUMMARY, events, "summary")
+        assert agent is narration_segment_agent
+        segment = input_data.split("Next part of the summary:\n")[1]
+        events.append(f"narrate {segment[:11]}")
+        narration = NarrationSegment(narration_text=f"Now {segment}")
+        return _streamed_result(narration, events, "narration")
+
+    async def fake_synthesize(client, text, destination, settings, on_audio=None):
+        events.append(f"tts {text}")
+        destination.write_bytes(text.encode())
+        on_audio(text.encode())
+
+    with (
+        patch("backend.app.custom_agents.article_summarizer.audio.OUTPUTS_DIR", tmp_path),
+        patch("backend.app.custom_agents.article_summarizer.streamed_pipeline.AsyncOpenAI"),
+        patch(
+            "backend.app.custom_agents.article_summarizer.pipeline.Runner.run_streamed",
+            side_effect=fake_run_streamed,
+        ),
+        patch(
+            "backend.app.custom_agents.article_summarizer.streamed_pipeline.synthesize_to_file",
+            side_effect=fake_synthesize,
+        ),
+        track_tokens() as ledger,
+    ):
+        result = await run_streamed_pipeline(
+            article, settings=PipelineSettings(min_segment_chars=1, min_speech_chars=1)
+        )
+
+    assert result is not None
+    audio_path, raw_text_path, final_text_path = result
+    narration = "\n\n".join(f"Now {paragraph}" for paragraph in PARAGRAPHS)
+    assert final_text_path.read_text() == (
+        f"# Streamed Title\n\n{narration}\n\nGenerated from: https://example.com/a"
+    )
+    assert raw_text_path.read_text() == "Body text."
+    assert audio_path.read_bytes() == narration.replace("\n\n", "").replace(". ", ".").encode()
+    assert not (audio_path.parent / "final.chunks").exists()
+    assert not (audio_path.parent / "live.mp3").exists()
+
+    summary_done = events.index("summary done")
+    assert events.index("narrate Paragraph 0") < summary_done
+    assert events.index("tts Now Paragraph 0 of the summary.") < summary_done
+    assert sorted(call.stage for call in ledger.calls) == ["audio_formatter"] * 3 + ["summarizer"]
+
+
+@pytest.mark.asyncio
+async def test_streamed_pipeline_returns_none_when_summarizer_fails(tmp_path):
+    """Test that a failed summary stops the run without synthesizing audio."""
+    article = ArticleContent(title="Title", content="Body text.", url="https://example.com/a")
+
+    with (
+        patch("backend.app.custom_agents.article_summarizer.audio.OUTPUTS_DIR", tmp_path),
+        patch("backend.app.custom_agents.article_summarizer.streamed_pipeline.AsyncOpenAI"),
+        patch(
+            "backend.app.custom_agents.article_summarizer.pipeline.Runner.run_streamed",
+            side_effect=RuntimeError("model unavailable"),
+        ),
+        patch(
+            "backend.app.custom_agents.article_summarizer.streamed_pipeline.synthesize_to_file"
+        ) as mock_synthesize,
+    ):
+        result = await run_streamed_pipeline(article)
+
+    assert result is None
+    mock_synthesize.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_streamed_pipeline_takes_a_slot_per_agent_run_and_tts_request(tmp_path):
+    """Test that shared LLM and TTS limits bound the overlapping stages of one article."""
+    events = []
+    article = ArticleContent(title="Title", content="Body text.", url="https://example.com/a")
+    llm_slots = asyncio.Semaphore(1)
+    tts_slots = asyncio.Semaphore(1)
+    speaking = 0
+    most_speaking = 0
+
+    def fake_run_streamed(agent, input_data):
+        if agent is summarizer_agent:
+            return _streamed_result(SUMMARY, events, "summary")
+        segment = input_data.split("Next part of the summary:\n")[1]
+        events.append(f"narrate {segment[:11]}")
+        return _streamed_result(NarrationSegment(narration_text=segment), events, "narration")
+
+    async def fake_synthesize(client, text, destination, settings, on_audio=None):
+        nonlocal speaking, most_speaking
+        speaking += 1
+        most_speaking = max(most_speaking, speaking)
+        await asyncio.sleep(0)
+        destination.write_bytes(text.encode())
+        speaking -= 1
+
+    with (
+        patch("backend.app.custom_agents.article_summarizer.audio.OUTPUTS_DIR", tmp_path),
+        patch("backend.app.custom_agents.article_summarizer.streamed_pipeline.AsyncOpenAI"),
+        patch(
+            "backend.app.custom_agents.article_summarizer.pipeline.Runner.run_streamed",
+            side_effect=fake_run_streamed,
+        ),
+        patch(
+            "backend.app.custom_agents.article_summarizer.streamed_pipeline.synthesize_to_file",
+            side_effect=fake_synthesize,
+        ),
+    ):
+        result = await run_streamed_pipeline(
+            article,
+            settings=PipelineSettings(min_segment_chars=1, min_speech_chars=1),
+            llm_slots=llm_slots,
+            tts_slots=tts_slots,
+        )
+
+    assert result is not None
+    # With one LLM slot, the narrator waits for the summarizer stream to release it
+    assert events.index("summary done") < events.index("narrate Paragraph 0")
+    assert most_speaking == 1
+    assert not llm_slots.locked() and not tts_slots.locked()
@@ -0,0 +1,55 @@
+"""Tests for per-article token accounting."""
+
+import asyncio
+import json
+
+import pytest
+
+from backend.app.custom_agents.article_summarizer.token_ledger import (
+    record_token_usage,
+    track_tokens,
+    write_token_ledger,
+)
+from backend.app.types.article_summarizer.token_types import TokenUsage
+
+
+def _usage(stage: str, input_tokens: int, memoized: bool = False) -> TokenUsage:
+    return TokenUsage(
+        stage=stage, agent="Agent", input_tokens=input_tokens, output_tokens=10, memoized=memoized
+    )
+
+
+@pytest.mark.asyncio
+async def test_track_tokens_keeps_concurrent_articles_apart():
+    """Test that each article's ledger only sees its own calls, including from subtasks."""
+
+    async def agent_call(stage: str) -> None:
+        await asyncio.sleep(0)
+        record_token_usage(_usage(stage, 1))
+
+    async def article(stage: str) -> list[str]:
+        with track_tokens() as ledger:
+            await asyncio.gather(agent_call(stage), asyncio.create_task(agent_call(stage)))
+        return [call.stage for call in ledger.calls]
+
+    first, second = await asyncio.gather(article("first"), article("second"))
+
+    assert first == ["first", "first"]
+    assert second == ["second", "second"]
+    record_token_usage(_usage("outside", 1))  # no ledger bound: ignored
+
+
+def test_write_token_ledger_saves_totals(tmp_path):
+    """Test that tokens.json holds every call and totals that skip memoized calls."""
+    with track_tokens() as ledger:
+        record_token_usage(_usage("summarizer", 100))
+        record_token_usage(_usage("audio_formatter", 50, memoized=True))
+
+    path = write_token_ledger(ledger, tmp_path)
+
+    data = json.loads(path.read_text())
+    assert path.name == "tokens.json"
+    assert [call["stage"] for call in data["calls"]] == ["summarizer", "audio_formatter"]
+    assert data["input_tokens"] == 100
+    assert data["output_tokens"] == 10
+    assert data["tokenizer"]